@@ -12,6 +12,8 @@ from eurika.storage import ProjectMemory
 from architecture_planner import ArchitecturePlan, build_plan, build_action_plan, build_patch_plan
 from eurika.analysis.self_map import build_graph_from_self_map, load_self_map
 
+_PATCH_PLAN_RATIONALE = 'Patch plan derived from prioritized modules and their smells. Intended as a human-reviewable set of patch suggestions before any automated refactoring is attempted.'
+
 class ArchReviewAgentCore:
     """
     Minimal, domain-specific AgentCore-like layer for architecture review.
@@ -22,8 +24,16 @@ class ArchReviewAgentCore:
     - Purely read-only aggregation of existing v0.1 engine artifacts.
     """
 
-    def __init__(self, project_root: Path) -> None:
+    def __init__(self, project_root: Path, context: Optional[Any]=None) -> None:
         self.project_root = project_root
+        # Optional core.cycle_context.CycleContext: reuse the cycle's graph/smells/history.
+        self.context = context
+
+    def _context_for(self, root: Path) -> Optional[Any]:
+        ctx = self.context
+        if ctx is not None and ctx.root == Path(root).resolve():
+            return ctx
+        return None
 
     def handle(self, event: InputEvent) -> Result:
         """
@@ -105,10 +115,13 @@ class ArchReviewAgentCore:
 
     def _load_structure(self, root: Path) -> tuple[Dict[str, Any], List[ArchSmell], 'ProjectGraph']:
         """Load self_map and derive graph, smells + summary."""
+        ctx = self._context_for(root)
+        if ctx is not None:
+            graph, smells, summary = ctx.structure()
+            return (summary, smells, graph)
         self_map_path = root / 'self_map.json'
         if not self_map_path.exists():
             raise FileNotFoundError(f'self_map.json not found at {self_map_path}')
-        load_self_map(self_map_path)
         graph = build_graph_from_self_map(self_map_path)
         smells = detect_architecture_smells(graph)
         summary = build_summary(graph, smells)
@@ -116,6 +129,9 @@ class ArchReviewAgentCore:
 
     def _load_history(self, root: Path, window: int) -> Dict[str, Any]:
         """Load architecture history and compute trends/regressions/report."""
+        ctx = self._context_for(root)
+        if ctx is not None:
+            return dict(ctx.history_info(window))
         memory = ProjectMemory(root)
         history = memory.history
         evolution_report = history.evolution_report(window=window)
@@ -125,7 +141,8 @@ class ArchReviewAgentCore:
 
     def _load_observations(self, root: Path) -> Dict[str, Any]:
         """Load last observation snapshot if eurika_observations.json exists."""
-        memory = ProjectMemory(root)
+        ctx = self._context_for(root)
+        memory = ctx.memory if ctx is not None else ProjectMemory(root)
         observations_info: Dict[str, Any] = {'available': False}
         records = memory.observations.snapshot()
         if records:
@@ -219,11 +236,15 @@ class ArchReviewAgentCore:
         """
         learning_stats: Dict[str, Any] | None = None
         learned_signals: Dict[str, Any] = {}
+        ctx = self._context_for(root)
         try:
-            from eurika.storage.global_memory import get_merged_learning_stats
-            raw = get_merged_learning_stats(root)
+            if ctx is not None:
+                raw = ctx.learning_stats()
+            else:
+                from eurika.storage.global_memory import get_merged_learning_stats
+                raw = get_merged_learning_stats(root)
             if not raw:
-                raw = ProjectMemory(root).learning.aggregate_by_action_kind()
+                raw = (ctx.memory if ctx is not None else ProjectMemory(root)).learning.aggregate_by_action_kind()
             if raw:
                 for key, d in raw.items():
                     total = d.get('total', 0)
@@ -250,17 +271,21 @@ class ArchReviewAgentCore:
         """
         learning_stats: Dict[str, Any] | None = None
         self_map: Dict[str, Any] | None = None
+        ctx = self._context_for(root)
         try:
-            from eurika.storage.global_memory import get_merged_learning_stats
-            learning_stats = get_merged_learning_stats(root)
+            if ctx is not None:
+                learning_stats = ctx.learning_stats()
+            else:
+                from eurika.storage.global_memory import get_merged_learning_stats
+                learning_stats = get_merged_learning_stats(root)
             if not learning_stats:
                 learning_stats = None
         except Exception:
             pass
         try:
-            self_map = load_self_map(root / 'self_map.json')
+            self_map = ctx.self_map if ctx is not None else load_self_map(root / 'self_map.json')
         except (FileNotFoundError, OSError):
             self_map = None
         plan = build_patch_plan(project_root=str(root), summary=summary, smells=smells, history_info=history_info, priorities=priority_modules, learning_stats=learning_stats, graph=graph, self_map=self_map)
         arguments: Dict[str, Any] = {'patch_plan': plan.to_dict()}
-        return DecisionProposal(action='suggest_patch_plan', arguments=arguments, confidence=0.6, rationale='Patch plan derived from prioritized modules and their smells. Intended as a human-reviewable set of patch suggestions before any automated refactoring is attempted.')
+        return DecisionProposal(action='suggest_patch_plan', arguments=arguments, confidence=0.6, rationale=_PATCH_PLAN_RATIONALE)
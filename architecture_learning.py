@@ -11,24 +11,13 @@ import json
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-
-DEFAULT_LEARNING_FILE = "architecture_learning.json"
+if TYPE_CHECKING:
+    from eurika.storage.learning_index import LearningIndex
 
 
-def _resolve_learning_outcome(op: Dict[str, Any], verify_success: Optional[bool]) -> str:
-    """Resolve per-operation learning outcome for aggregation."""
-    outcome = str(op.get("execution_outcome") or "").strip()
-    if outcome in {"not_applied", "verify_success", "verify_fail"}:
-        return outcome
-    if op.get("applied") is False:
-        return "not_applied"
-    if verify_success is True:
-        return "verify_success"
-    if verify_success is False:
-        return "verify_fail"
-    return "not_applied"
+DEFAULT_LEARNING_FILE = "architecture_learning.json"
 
 
 @dataclass
@@ -65,35 +54,30 @@ class LearningStore:
     """
     Append-only storage for learning records.
 
-    v0.1: used for analysis + simple action-kind statistics.
+    Records are JSON lines in `<storage_path stem>.jsonl`; aggregates come from
+    the shared eurika.storage.learning_index backend, which reads only lines
+    appended since the last lookup. A legacy {"learning": [...]} file at
+    storage_path is imported once and renamed to *.migrated.
     """
 
     def __init__(self, storage_path: Optional[Path] = None) -> None:
         self.storage_path = storage_path or Path(DEFAULT_LEARNING_FILE)
-        self._records: List[LearningRecord] = []
-        self._load()
+        self.log_path = self.storage_path.with_suffix(".jsonl")
+        self._migrate_legacy()
 
     # Internal persistence --------------------------------------------
-    def _load(self) -> None:
-        if not self.storage_path.exists():
+    def _migrate_legacy(self) -> None:
+        if not self.storage_path.is_file() or self.storage_path == self.log_path:
             return
+        from eurika.storage.learning_index import append_learning_log
+
         try:
             raw = json.loads(self.storage_path.read_text(encoding="utf-8"))
-            self._records = [
-                LearningRecord.from_dict(item) for item in raw.get("learning", [])
-            ]
+            items = raw.get("learning", []) if isinstance(raw, dict) else []
+            for item in items:
+                append_learning_log(self.log_path, LearningRecord.from_dict(item).to_dict())
+            self.storage_path.replace(self.storage_path.with_name(self.storage_path.name + ".migrated"))
         except (json.JSONDecodeError, OSError):
-            self._records = []
-
-    def _save(self) -> None:
-        data = {"learning": [r.to_dict() for r in self._records]}
-        try:
-            self.storage_path.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
-        except OSError:
-            # Learning is non-critical; ignore save failures.
             pass
 
     # Public API ------------------------------------------------------
@@ -105,7 +89,7 @@ class LearningStore:
         risks: List[str],
         verify_success: Optional[bool],
     ) -> None:
-        """Append a new learning record and persist it."""
+        """Append a new learning record and persist it (one JSON line)."""
         record = LearningRecord(
             timestamp=time.time(),
             project_root=str(project_root),
@@ -114,12 +98,26 @@ class LearningStore:
             risks=list(risks),
             verify_success=verify_success,
         )
-        self._records.append(record)
-        self._save()
+        from eurika.storage.learning_index import append_learning_log
+
+        try:
+            append_learning_log(self.log_path, record.to_dict())
+        except OSError:
+            # Learning is non-critical; ignore save failures.
+            pass
 
     def all(self) -> List[LearningRecord]:
         """Return a snapshot of all learning records."""
-        return list(self._records)
+        from eurika.storage.learning_index import read_learning_log
+
+        records, _ = read_learning_log(self.log_path)
+        return [LearningRecord.from_dict(item) for item in records]
+
+    def index(self) -> "LearningIndex":
+        """Outcome counters over all records (cached, advanced incrementally)."""
+        from eurika.storage.learning_index import file_learning_index
+
+        return file_learning_index(self.log_path)
 
     def aggregate_by_action_kind(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -127,37 +125,11 @@ class LearningStore:
 
         Returns:
             {
-              "refactor_module": {"total": N, "success": M, "fail": K},
+              "refactor_module": {"total": N, "success": M, "fail": K, ...},
               ...
             }
         """
-        stats: Dict[str, Dict[str, Any]] = {}
-        for r in self._records:
-            for op in r.operations:
-                kind = op.get("kind", "unknown")
-                by_kind = stats.setdefault(
-                    kind,
-                    {
-                        "total": 0,
-                        "success": 0,
-                        "fail": 0,
-                        "verify_success": 0,
-                        "verify_fail": 0,
-                        "not_applied": 0,
-                    },
-                )
-                by_kind["total"] += 1
-                outcome = _resolve_learning_outcome(op, r.verify_success)
-                if outcome == "verify_success":
-                    by_kind["verify_success"] += 1
-                    if _is_strong_refactor_code_smell_success(op):
-                        by_kind["success"] += 1
-                elif outcome == "verify_fail":
-                    by_kind["verify_fail"] += 1
-                    by_kind["fail"] += 1
-                else:
-                    by_kind["not_applied"] += 1
-        return stats
+        return self.index().aggregate_by_action_kind()
 
     def aggregate_by_smell_action(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -165,49 +137,9 @@ class LearningStore:
 
         Returns:
             {
-              "god_module|refactor_module": {"total": N, "success": M, "fail": K},
+              "god_module|refactor_module": {"total": N, "success": M, "fail": K, ...},
               "bottleneck|introduce_facade": {...},
               ...
             }
         """
-        sep = "|"
-        stats: Dict[str, Dict[str, Any]] = {}
-        for r in self._records:
-            for op in r.operations:
-                kind = op.get("kind", "unknown")
-                smell = op.get("smell_type") or "unknown"
-                key = f"{smell}{sep}{kind}"
-                by_key = stats.setdefault(
-                    key,
-                    {
-                        "total": 0,
-                        "success": 0,
-                        "fail": 0,
-                        "verify_success": 0,
-                        "verify_fail": 0,
-                        "not_applied": 0,
-                    },
-                )
-                by_key["total"] += 1
-                outcome = _resolve_learning_outcome(op, r.verify_success)
-                if outcome == "verify_success":
-                    by_key["verify_success"] += 1
-                    if _is_strong_refactor_code_smell_success(op):
-                        by_key["success"] += 1
-                elif outcome == "verify_fail":
-                    by_key["verify_fail"] += 1
-                    by_key["fail"] += 1
-                else:
-                    by_key["not_applied"] += 1
-        return stats
-
-
-def _is_strong_refactor_code_smell_success(op: Dict[str, Any]) -> bool:
-    """Do not treat TODO-marker smell ops as strong success."""
-    if (op.get("kind") or "") != "refactor_code_smell":
-        return True
-    diff = str(op.get("diff") or "")
-    if "# TODO (eurika): refactor " in diff:
-        return False
-    return True
-
+        return self.index().aggregate_by_smell_action()
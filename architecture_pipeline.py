@@ -23,7 +23,7 @@ from eurika.storage import ProjectMemory
 from eurika.smells.rules import build_summary, summary_to_text
 from eurika.analysis.graph import ProjectGraph
 from eurika.analysis.scanner import semantic_summary
-from eurika.analysis.self_map import build_graph_from_self_map, load_self_map
+from eurika.analysis.self_map import build_graph_from_self_map
 from eurika.analysis.topology import central_modules_for_topology, topology_summary
 
 def run_architecture_pipeline(path: Path) -> None:
@@ -86,7 +86,6 @@ def _build_graph_and_summary(path: Path) -> tuple[ProjectGraph, List[ArchSmell],
 
 def _build_graph_and_summary_from_self_map(self_map_path: Path) -> tuple[ProjectGraph, List[ArchSmell], Dict]:
     """Build graph, smells, summary from a self_map.json file (exact path)."""
-    _ = load_self_map(self_map_path)
     graph = build_graph_from_self_map(self_map_path)
     smells = detect_architecture_smells(graph)
     summary = build_summary(graph, smells)
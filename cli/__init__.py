@@ -1,25 +1,10 @@
-"""CLI layer: handlers for Eurika commands."""
+"""CLI layer: handlers for Eurika commands.
 
-from cli.handlers import (
-    handle_arch_diff,
-    handle_arch_history,
-    handle_arch_summary,
-    handle_help,
-    handle_scan,
-    handle_self_check,
-    handle_agent_arch_evolution,
-    handle_agent_arch_review,
-    handle_agent_action_apply,
-    handle_agent_action_dry_run,
-    handle_agent_action_simulate,
-    handle_agent_cycle,
-    handle_agent_feedback_summary,
-    handle_agent_learning_summary,
-    handle_agent_patch_apply,
-    handle_agent_patch_plan,
-    handle_agent_patch_rollback,
-    handle_agent_prioritize_modules,
-)
+handle_* names resolve lazily through cli.handlers, so importing the package
+(e.g. for cli.wiring) loads no handler modules.
+"""
+
+from typing import Any
 
 __all__ = [
     "handle_help",
@@ -41,3 +26,11 @@ __all__ = [
     "handle_agent_cycle",
     "handle_agent_learning_summary",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from cli.handlers import load_handler
+
+        return load_handler(name)
+    raise AttributeError(f"module 'cli' has no attribute {name!r}")
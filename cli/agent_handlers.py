@@ -378,10 +378,13 @@ def handle_agent_patch_rollback(args: Any) -> int:
         print(json.dumps(info, indent=2, ensure_ascii=False))
         return 0
     run_id = getattr(args, 'run_id', None)
-    report = rollback(path, run_id=run_id)
+    report = rollback(path, run_id=run_id, force=getattr(args, 'force', False))
     print(json.dumps(report, indent=2, ensure_ascii=False))
     if report.get('errors'):
         return 1
+    if report.get('conflicts') and not getattr(args, 'force', False):
+        print('eurika: files edited after the run were left as is; re-run with --force to overwrite them.', file=sys.stderr)
+        return 1
     return 0
 
 def handle_agent_learning_summary(args: Any) -> int:
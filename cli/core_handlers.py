@@ -16,6 +16,8 @@ from typing import Any
 from cli.orchestrator import _knowledge_topics_from_env_or_summary
 from architecture_pipeline import print_arch_diff, print_arch_history, print_arch_summary
 from runtime_scan import run_scan
+from eurika.utils.git_changes import changed_since_env
+from cli.core_handlers_handle_help import handle_help  # noqa: F401  (re-export)
 
 
 _WHITELIST_DRAFT_ALLOWED_KINDS = frozenset(
@@ -39,24 +41,6 @@ def _err(msg: str) -> None:
     """Print unified error message to stderr."""
     print(f'eurika: {msg}', file=sys.stderr)
 
-def handle_help(parser: Any) -> int:
-    """Print high-level command overview and detailed argparse help (ROADMAP этап 5: 4 product modes)."""
-    print('Eurika — architecture analysis and refactoring assistant (v1.2.6)')
-    print()
-    print('Product (4 modes):')
-    print('  scan [path]              full scan, update artifacts, report')
-    print('  doctor [path]           diagnostics: report + architect (no patches)')
-    print('  fix [path]              full cycle: scan → plan → patch → verify')
-    print('  explain <module> [path] role and risks of a module')
-    print()
-    print('Other: report, report-snapshot, campaign-undo, architect, suggest-plan, arch-summary, arch-history, history, arch-diff, self-check, clean-imports, serve')
-    print('Advanced: eurika agent <cmd>  (patch-plan, patch-apply, patch-rollback, cycle, ...)')
-    print()
-    print('  --help after any command for details.')
-    print()
-    parser.print_help()
-    return 0
-
 def _paths_from_args(args: Any) -> list[Path]:
     """Normalize path(s) from args (ROADMAP 3.0.1 multi-repo). Returns list of resolved Paths."""
     raw = getattr(args, 'path', None)
@@ -78,7 +62,9 @@ def handle_scan(args: Any) -> int:
             continue
         fmt = getattr(args, 'format', 'text')
         color = getattr(args, 'color', None)
-        if run_scan(path, format=fmt, color=color) != 0:
+        sharded = bool(getattr(args, 'sharded', False))
+        changed_since = getattr(args, 'changed_since', None)
+        if run_scan(path, format=fmt, color=color, sharded=sharded, changed_since=changed_since) != 0:
             exit_code = 1
     return exit_code
 
@@ -231,8 +217,7 @@ def handle_whitelist_draft(args: Any) -> int:
         return 1
 
     mem = SessionMemory(path)
-    raw = mem._load()
-    campaign = raw.get("campaign") or {}
+    campaign = mem.campaign()
     success_keys = [str(k) for k in (campaign.get("verify_success_keys") or [])]
     fail_keys = [str(k) for k in (campaign.get("verify_fail_keys") or [])]
     success_counts = Counter(success_keys)
@@ -361,6 +346,12 @@ def handle_doctor(args: Any) -> int:
             print()
             print('Operational metrics (last 10 fix runs):')
             print(f'  apply_rate={ar}, rollback_rate={rr}, median_verify_time={med_str}')
+        config_problems = data.get('config_problems') or []
+        if config_problems:
+            print()
+            print('Config problems (ignored settings):')
+            for problem in config_problems:
+                print(f'  {problem}')
         if campaign_checkpoint:
             cp_id = campaign_checkpoint.get('checkpoint_id', 'N/A')
             cp_status = campaign_checkpoint.get('status', 'unknown')
@@ -435,8 +426,9 @@ def handle_fix(args: Any) -> int:
             approve_ops=getattr(args, 'approve_ops', None),
             reject_ops=getattr(args, 'reject_ops', None),
         )
-        if handle_agent_cycle(fix_args) != 0:
-            exit_code = 1
+        with changed_since_env(getattr(args, 'changed_since', None)):  # scope scan/smells/imports/planner ops
+            if handle_agent_cycle(fix_args) != 0:
+                exit_code = 1
     return exit_code
 
 def handle_cycle(args: Any) -> int:
@@ -471,8 +463,9 @@ def handle_cycle(args: Any) -> int:
             approve_ops=getattr(args, 'approve_ops', None),
             reject_ops=getattr(args, 'reject_ops', None),
         )
-        if _run_cycle_with_mode(cycle_args, mode='full') != 0:
-            exit_code = 1
+        with changed_since_env(getattr(args, 'changed_since', None)):  # scope scan/smells/imports/planner ops
+            if _run_cycle_with_mode(cycle_args, mode='full') != 0:
+                exit_code = 1
     return exit_code
 
 def handle_architect(args: Any) -> int:
@@ -496,13 +489,14 @@ def handle_architect(args: Any) -> int:
     online = getattr(args, 'online', False)
     ttl = float(os.environ.get('EURIKA_KNOWLEDGE_TTL', '86400'))
     rate_limit = float(os.environ.get('EURIKA_KNOWLEDGE_RATE_LIMIT', '1.0' if online else '0'))
+    deadline = float(os.environ.get('EURIKA_KNOWLEDGE_TIMEOUT', '30')) or None
     knowledge_provider = CompositeKnowledgeProvider([
         LocalKnowledgeProvider(path / 'eurika_knowledge.json'),
         OSSPatternProvider(path / '.eurika' / 'pattern_library.json'),
         PEPProvider(cache_dir=cache_dir, ttl_seconds=ttl, force_online=online, rate_limit_seconds=rate_limit),
         OfficialDocsProvider(cache_dir=cache_dir, ttl_seconds=ttl, force_online=online, rate_limit_seconds=rate_limit),
         ReleaseNotesProvider(cache_dir=cache_dir, ttl_seconds=ttl, force_online=online, rate_limit_seconds=rate_limit),
-    ])
+    ], timeout=deadline)
     knowledge_topic = _knowledge_topics_from_env_or_summary(summary)
     text = interpret_architecture(summary, history, use_llm=use_llm, patch_plan=patch_plan, knowledge_provider=knowledge_provider, knowledge_topic=knowledge_topic, recent_events=recent_events)
     print(text)
@@ -0,0 +1,20 @@
+"""Extracted from parent module so `eurika help` needs no handler imports."""
+from typing import Any
+
+def handle_help(parser: Any) -> int:
+    """Print high-level command overview and detailed argparse help (ROADMAP этап 5: 4 product modes)."""
+    print('Eurika — architecture analysis and refactoring assistant (v1.2.6)')
+    print()
+    print('Product (4 modes):')
+    print('  scan [path]              full scan, update artifacts, report')
+    print('  doctor [path]           diagnostics: report + architect (no patches)')
+    print('  fix [path]              full cycle: scan → plan → patch → verify')
+    print('  explain <module> [path] role and risks of a module')
+    print()
+    print('Other: report, report-snapshot, campaign-undo, architect, suggest-plan, arch-summary, arch-history, history, arch-diff, self-check, clean-imports, serve')
+    print('Advanced: eurika agent <cmd>  (patch-plan, patch-apply, patch-rollback, cycle, ...)')
+    print()
+    print('  --help after any command for details.')
+    print()
+    parser.print_help()
+    return 0
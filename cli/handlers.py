@@ -7,8 +7,34 @@ v0.9: thin wrapper that re-exports concrete handler implementations from:
 This keeps the public `cli.handlers.handle_*` API stable while reducing
 this module's fan-in/fan-out and aligning with the target Architecture.md
 layout (separate cli/core vs agent responsibilities).
+
+Re-exports are lazy (PEP 562): a handler module is imported on first access
+to one of its names, so CLI startup does not pay for commands it never runs.
 """
 from __future__ import annotations
-from .core_handlers import handle_arch_history, handle_arch_summary, handle_arch_diff, handle_architect, handle_campaign_undo, handle_clean_imports, handle_cycle, handle_doctor, handle_explain, handle_fix, handle_help, handle_learn_github, handle_report, handle_report_snapshot, handle_scan, handle_self_check, handle_serve, handle_suggest_plan, handle_watch, handle_whitelist_draft
-from .agent_handlers import handle_agent_action_apply, handle_agent_action_dry_run, handle_agent_action_simulate, handle_agent_arch_evolution, handle_agent_arch_review, handle_agent_cycle, handle_agent_feedback_summary, handle_agent_learning_summary, handle_agent_patch_apply, handle_agent_patch_rollback, handle_agent_patch_plan, handle_agent_prioritize_modules
-__all__ = ['handle_help', 'handle_scan', 'handle_self_check', 'handle_arch_summary', 'handle_arch_history', 'handle_report', 'handle_report_snapshot', 'handle_whitelist_draft', 'handle_campaign_undo', 'handle_explain', 'handle_arch_diff', 'handle_architect', 'handle_doctor', 'handle_fix', 'handle_cycle', 'handle_watch', 'handle_suggest_plan', 'handle_clean_imports', 'handle_learn_github', 'handle_serve', 'handle_agent_arch_review', 'handle_agent_arch_evolution', 'handle_agent_prioritize_modules', 'handle_agent_feedback_summary', 'handle_agent_action_dry_run', 'handle_agent_action_simulate', 'handle_agent_action_apply', 'handle_agent_patch_plan', 'handle_agent_patch_apply', 'handle_agent_patch_rollback', 'handle_agent_cycle', 'handle_agent_learning_summary']
\ No newline at end of file
+import importlib
+from typing import Any, Callable
+_CORE = 'cli.core_handlers'
+_AGENT = 'cli.agent_handlers'
+# handler name -> defining module
+HANDLER_MODULES: dict[str, str] = {
+    'handle_help': 'cli.core_handlers_handle_help',
+    **{name: _CORE for name in ('handle_scan', 'handle_self_check', 'handle_arch_summary', 'handle_arch_history', 'handle_report', 'handle_report_snapshot', 'handle_whitelist_draft', 'handle_campaign_undo', 'handle_explain', 'handle_arch_diff', 'handle_architect', 'handle_doctor', 'handle_fix', 'handle_cycle', 'handle_watch', 'handle_suggest_plan', 'handle_clean_imports', 'handle_learn_github', 'handle_serve')},
+    **{name: _AGENT for name in ('handle_agent_arch_review', 'handle_agent_arch_evolution', 'handle_agent_prioritize_modules', 'handle_agent_feedback_summary', 'handle_agent_action_dry_run', 'handle_agent_action_simulate', 'handle_agent_action_apply', 'handle_agent_patch_plan', 'handle_agent_patch_apply', 'handle_agent_patch_rollback', 'handle_agent_cycle', 'handle_agent_learning_summary')},
+}
+__all__ = list(HANDLER_MODULES)
+
+def load_handler(name: str) -> Callable[..., int]:
+    """Import the module defining handler `name` and return the handler."""
+    module = HANDLER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'cli.handlers' has no attribute {name!r}")
+    handler = getattr(importlib.import_module(module), name)
+    globals()[name] = handler
+    return handler
+
+def __getattr__(name: str) -> Any:
+    return load_handler(name)
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(HANDLER_MODULES))
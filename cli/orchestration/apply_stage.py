@@ -8,6 +8,8 @@ from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Any
 
+from eurika.utils.config import Settings, load_settings
+
 from .contracts import FixReport, OperationRecord, PatchPlan, SafetyGatesPayload, TelemetryPayload
 from .logging import get_logger
 
@@ -132,6 +134,8 @@ def enrich_report_with_rescan(
                 "done": True,
                 "run_id": report["run_id"],
                 "restored": rb.get("restored", []),
+                "removed": rb.get("removed", []),
+                "conflicts": rb.get("conflicts", []),
                 "errors": rb.get("errors", []),
                 "reason": "metrics_worsened",
             }
@@ -220,24 +224,11 @@ def write_fix_report(path: Path, report: FixReport, quiet: bool) -> None:
 
 
 def _median_verify_time_ms(path: Path, current_ms: int) -> int | None:
-    """Compute median verify_duration_ms from last 10 patch events (ROADMAP 2.7.8)."""
+    """Median verify_duration_ms over the last 10 patch events plus this run (ROADMAP 2.7.8)."""
     try:
-        from eurika.storage import ProjectMemory
+        from eurika.storage.operational_metrics import patch_metrics
 
-        memory = ProjectMemory(path)
-        events = memory.events.recent_events(limit=10, types=("patch",))
-        durations = []
-        for e in events:
-            out = (e.output or {}) if hasattr(e, "output") else {}
-            ms = out.get("verify_duration_ms")
-            if isinstance(ms, (int, float)) and ms is not None:
-                durations.append(int(ms))
-        durations.append(current_ms)
-        if not durations:
-            return None
-        durations.sort()
-        mid = len(durations) // 2
-        return int(durations[mid] if len(durations) % 2 else (durations[mid - 1] + durations[mid]) / 2)
+        return patch_metrics(path).median_verify_time_ms(10, extra=int(current_ms))
     except Exception:
         return None
 
@@ -310,11 +301,13 @@ def execute_fix_apply_stage(
     metrics_from_graph: Any,
     rollback_patch: Any,
     result: Any,
+    settings: Settings | None = None,
 ) -> tuple[FixReport, list[str], Any]:
     """Apply patch plan, enrich with rescan metrics, append memory, and persist report.
 
     Safety (ROADMAP 2.7.7): mandatory verify-gate, auto_rollback on verify fail,
     backup=True so no partially-applied invalid sessions.
+    settings: the cycle's resolved settings (FixCycleContext.settings()); loaded here when omitted.
     """
     if not quiet:
         _LOG.info("--- Step 3/4: patch & verify ---")
@@ -331,10 +324,18 @@ def execute_fix_apply_stage(
     except Exception:
         checkpoint = None
         checkpoint_id = None
-    from patch_engine_verify_patch import get_verify_timeout
-
-    resolved_timeout = get_verify_timeout(path, override=verify_timeout)
-    report = apply_and_verify(path, patch_plan, backup=True, verify=True, verify_timeout=resolved_timeout, verify_cmd=verify_cmd, auto_rollback=True)
+    if settings is None:
+        settings = load_settings(path, overrides={"verify_timeout": verify_timeout or None, "verify_cmd": verify_cmd})
+    report = apply_and_verify(
+        path,
+        patch_plan,
+        backup=True,
+        verify=True,
+        verify_timeout=settings.verify_timeout,
+        verify_cmd=verify_cmd,
+        auto_rollback=True,
+        settings=settings,
+    )
     verify_outcome = report["verify"].get("success")
     expls = []
     op_results = []
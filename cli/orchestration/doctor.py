@@ -141,6 +141,7 @@ def run_doctor_cycle(
     cache_dir = path / ".eurika" / "knowledge_cache"
     ttl = float(os.environ.get("EURIKA_KNOWLEDGE_TTL", "86400"))
     rate_limit = float(os.environ.get("EURIKA_KNOWLEDGE_RATE_LIMIT", "1.0" if online else "0"))
+    deadline = float(os.environ.get("EURIKA_KNOWLEDGE_TIMEOUT", "30")) or None
     oss_path = path / ".eurika" / "pattern_library.json"
     knowledge_provider = CompositeKnowledgeProvider([
         LocalKnowledgeProvider(path / "eurika_knowledge.json"),
@@ -148,7 +149,7 @@ def run_doctor_cycle(
         PEPProvider(cache_dir=cache_dir, ttl_seconds=ttl, force_online=online, rate_limit_seconds=rate_limit),
         OfficialDocsProvider(cache_dir=cache_dir, ttl_seconds=ttl, force_online=online, rate_limit_seconds=rate_limit),
         ReleaseNotesProvider(cache_dir=cache_dir, ttl_seconds=ttl, force_online=online, rate_limit_seconds=rate_limit),
-    ])
+    ], timeout=deadline)
     knowledge_topic = knowledge_topics_from_env_or_summary(summary)
     architect_text, architect_meta = interpret_architecture_with_meta(
         summary, history, use_llm=use_llm, patch_plan=patch_plan,
@@ -174,6 +175,11 @@ def run_doctor_cycle(
     ops_metrics = _operational_metrics_from_events(path, window=10)
     if ops_metrics:
         out["operational_metrics"] = ops_metrics
+    from eurika.utils.config import load_settings
+
+    config_problems = list(load_settings(path).problems)
+    if config_problems:
+        out["config_problems"] = config_problems
     try:
         from eurika.storage.campaign_checkpoint import latest_campaign_checkpoint
 
@@ -181,7 +181,7 @@ def run_fix_cycle_impl(
     execute_fix_apply_stage: Callable[..., tuple[FixReport, list[str], bool]],
 ) -> dict[str, Any]:
     """Core implementation for run_fix_cycle; callbacks keep orchestrator patchability in tests."""
-    _ = FixCycleContext(
+    ctx = FixCycleContext(
         path=path,
         runtime_mode=runtime_mode,
         non_interactive=non_interactive,
@@ -196,6 +196,10 @@ def run_fix_cycle_impl(
         verify_timeout=verify_timeout,
         allow_campaign_retry=allow_campaign_retry,
     )
+    # Resolved once per cycle and handed down to apply_and_verify / verify_patch.
+    settings = ctx.settings()
+    for problem in settings.problems:
+        _LOG.warning(f"eurika config: {problem}")
     deps = fix_cycle_deps()
     run_scan = deps["run_scan"]
     patch_plan: PatchPlan | None = None
@@ -278,6 +282,7 @@ def run_fix_cycle_impl(
             quiet=quiet,
             verify_cmd=verify_cmd,
             verify_timeout=verify_timeout,
+            settings=settings,
             backup_dir=deps["BACKUP_DIR"],
             apply_and_verify=deps["apply_and_verify"],
             run_scan=run_scan,
@@ -477,6 +482,7 @@ def run_fix_cycle_impl(
         quiet=quiet,
         verify_cmd=verify_cmd,
         verify_timeout=verify_timeout,
+        settings=settings,
         backup_dir=deps["BACKUP_DIR"],
         apply_and_verify=deps["apply_and_verify"],
         run_scan=run_scan,
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+from eurika.utils.config import Settings, load_settings
+
 
 @dataclass(slots=True)
 class FixCycleContext:
@@ -23,3 +25,10 @@ class FixCycleContext:
     verify_cmd: str | None = None
     verify_timeout: int | None = None
     allow_campaign_retry: bool = False
+
+    def settings(self) -> Settings:
+        """Project settings with this run's CLI overrides applied (cached per project)."""
+        return load_settings(
+            self.path,
+            overrides={"verify_cmd": self.verify_cmd, "verify_timeout": self.verify_timeout or None},
+        )
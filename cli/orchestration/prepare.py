@@ -31,11 +31,23 @@ def prepend_fix_operations(
     no_clean_imports: bool,
     no_code_smells: bool,
 ) -> tuple[PatchPlan, list[OperationRecord]]:
-    """Prepend clean-imports and code-smell operations to patch plan."""
+    """
+    Prepend clean-imports and code-smell operations to patch plan.
+
+    Under EURIKA_CHANGED_SINCE (--changed-since) planner ops are limited to
+    changed files and the file-level builders scan only those files.
+    """
+    from eurika.utils.git_changes import resolve_scope
+
+    scope = resolve_scope(path)
+    if scope is not None:
+        operations = _scope_operations(operations, scope)
+        patch_plan = dict(patch_plan, operations=operations)
+
     if not no_clean_imports:
         from eurika.api import get_clean_imports_operations
 
-        clean_ops = get_clean_imports_operations(path)
+        clean_ops = get_clean_imports_operations(path, only_files=scope)
         if clean_ops:
             operations = clean_ops + operations
             patch_plan = dict(patch_plan, operations=operations)
@@ -43,7 +55,7 @@ def prepend_fix_operations(
     if not no_code_smells:
         from eurika.api import get_code_smell_operations
 
-        code_smell_ops = get_code_smell_operations(path)
+        code_smell_ops = get_code_smell_operations(path, only_files=scope)
         if code_smell_ops:
             operations = code_smell_ops + operations
             patch_plan = dict(patch_plan, operations=operations)
@@ -51,6 +63,14 @@ def prepend_fix_operations(
     return patch_plan, operations
 
 
+def _scope_operations(operations: list[OperationRecord], scope: set[str]) -> list[OperationRecord]:
+    """Keep operations whose target_file is in scope (relative POSIX paths)."""
+    return [
+        op for op in operations
+        if str(op.get("target_file") or "").replace("\\", "/") in scope
+    ]
+
+
 def _drop_noop_append_ops(
     operations: list[OperationRecord],
     path: Path,
@@ -213,22 +233,16 @@ def apply_runtime_policy(
     runtime_mode: str,
 ) -> tuple[PatchPlan, list[OperationRecord], list[dict[str, Any]]]:
     """Evaluate operations via policy engine and attach explainability metadata."""
-    from eurika.agent import evaluate_operation, load_policy_config
+    from eurika.agent import PolicyContext, evaluate_operations, load_policy_config
+    from eurika.agent.policy import policy_keeps
 
     runtime_mode_lit = cast(Literal["assist", "hybrid", "auto"], runtime_mode)
     cfg = load_policy_config(runtime_mode_lit)
-    seen_files: set[str] = set()
+    results = evaluate_operations(operations, PolicyContext.load(path), config=cfg)
     kept: list[OperationRecord] = []
     decisions: list[dict[str, Any]] = []
-    for idx, op in enumerate(operations, start=1):
+    for idx, (op, res) in enumerate(zip(operations, results), start=1):
         target_file = str(op.get("target_file") or "")
-        res = evaluate_operation(
-            op,
-            config=cfg,
-            index=idx,
-            seen_files=seen_files,
-            project_root=path,
-        )
         op_with_meta = dict(op)
         op_with_meta["explainability"] = res.explainability
         op_with_meta["policy_decision"] = res.decision
@@ -246,15 +260,8 @@ def apply_runtime_policy(
                 "risk": res.risk,
             }
         )
-        keep = (
-            runtime_mode == "assist"
-            or res.decision == "allow"
-            or (res.decision == "review" and runtime_mode == "hybrid")
-        )
-        if keep:
+        if policy_keeps(res.decision, runtime_mode):
             kept.append(op_with_meta)
-            if target_file:
-                seen_files.add(target_file)
     patch_plan = dict(patch_plan, operations=kept)
     return patch_plan, kept, decisions
 
@@ -334,14 +341,14 @@ def apply_campaign_memory(
     return dict(patch_plan, operations=kept), kept, skipped
 
 
-def run_fix_diagnose_stage(path: Path, window: int, quiet: bool) -> Any:
-    """Run diagnose stage via ArchReviewAgentCore."""
+def run_fix_diagnose_stage(path: Path, window: int, quiet: bool, context: Any = None) -> Any:
+    """Run diagnose stage via ArchReviewAgentCore (context: CycleContext shared with the scan stage)."""
     from agent_core import InputEvent
     from agent_core_arch_review import ArchReviewAgentCore
 
     if not quiet:
         _LOG.info("--- Step 2/4: diagnose ---")
-    agent = ArchReviewAgentCore(project_root=path)
+    agent = ArchReviewAgentCore(project_root=path, context=context)
     event = InputEvent(
         type="arch_review",
         payload={"path": str(path), "window": window},
@@ -416,15 +423,24 @@ def prepare_fix_cycle_operations(
     allow_campaign_retry: bool = False,
     allow_low_risk_campaign: bool = False,
 ) -> tuple[dict[str, Any] | None, Any, PatchPlan | None, list[OperationRecord]]:
-    """Prepare diagnose result, patch plan and operations; return early payload on stop conditions."""
-    if not skip_scan:
-        if not run_fix_scan_stage(path, quiet, run_scan):
-            return _early_exit(
-                1, {"operations": [], "modified": [], "verify_success": False},
-                None, None, [],
-            )
-
-    result = run_fix_diagnose_stage(path, window, quiet)
+    """
+    Prepare diagnose result, patch plan and operations; return early payload on stop conditions.
+
+    Scan and diagnose share one CycleContext, so graph, smells, summary and
+    history info are computed once per cycle.
+    """
+    from core.cycle_context import CycleContext
+
+    context = CycleContext(path, window=window)
+    with context.activate():
+        if not skip_scan:
+            if not run_fix_scan_stage(path, quiet, run_scan):
+                return _early_exit(
+                    1, {"operations": [], "modified": [], "verify_success": False},
+                    None, None, [],
+                )
+
+        result = run_fix_diagnose_stage(path, window, quiet, context=context)
     if not result.success:
         return _early_exit(1, result.output, result, None, [])
     _attach_llm_hint_runtime(result)
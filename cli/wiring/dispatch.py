@@ -1,66 +1,65 @@
-"""CLI command dispatch wiring extracted from eurika_cli."""
+"""CLI command dispatch wiring extracted from eurika_cli.
+
+Commands map to handler names in a static registry; the handler module is
+imported only when its command is dispatched (cli.handlers.load_handler), so
+`eurika --version`, `eurika help` and argument errors import no handler code.
+"""
 
 from __future__ import annotations
 
 import argparse
-from typing import Any, Callable
-
-from cli import handlers
-
-
-def dispatch_command(parser: argparse.ArgumentParser, args: Any) -> int:
-    """Dispatch parsed CLI args to the matching command handler."""
-    if args.command is None:
-        return handlers.handle_help(parser)
+from typing import Any
 
-    dispatch: dict[str, Callable[[], int]] = {
-        "help": lambda: handlers.handle_help(parser),
-        "scan": lambda: handlers.handle_scan(args),
-        "arch-summary": lambda: handlers.handle_arch_summary(args),
-        "arch-history": lambda: handlers.handle_arch_history(args),
-        "history": lambda: handlers.handle_arch_history(args),
-        "report": lambda: handlers.handle_report(args),
-        "report-snapshot": lambda: handlers.handle_report_snapshot(args),
-        "whitelist-draft": lambda: handlers.handle_whitelist_draft(args),
-        "campaign-undo": lambda: handlers.handle_campaign_undo(args),
-        "explain": lambda: handlers.handle_explain(args),
-        "arch-diff": lambda: handlers.handle_arch_diff(args),
-        "self-check": lambda: handlers.handle_self_check(args),
-        "doctor": lambda: handlers.handle_doctor(args),
-        "fix": lambda: handlers.handle_fix(args),
-        "cycle": lambda: handlers.handle_cycle(args),
-        "architect": lambda: handlers.handle_architect(args),
-        "suggest-plan": lambda: handlers.handle_suggest_plan(args),
-        "clean-imports": lambda: handlers.handle_clean_imports(args),
-        "watch": lambda: handlers.handle_watch(args),
-        "serve": lambda: handlers.handle_serve(args),
-        "learn-github": lambda: handlers.handle_learn_github(args),
-    }
-    if args.command == "help":
-        return dispatch["help"]()
-    if args.command in dispatch:
-        return dispatch[args.command]()
+from cli.handlers import load_handler
 
-    if args.command == "agent":
-        agent_dispatch: dict[str, Callable[[Any], int]] = {
-            "arch-review": handlers.handle_agent_arch_review,
-            "arch-evolution": handlers.handle_agent_arch_evolution,
-            "prioritize-modules": handlers.handle_agent_prioritize_modules,
-            "feedback-summary": handlers.handle_agent_feedback_summary,
-            "action-dry-run": handlers.handle_agent_action_dry_run,
-            "action-simulate": handlers.handle_agent_action_simulate,
-            "action-apply": handlers.handle_agent_action_apply,
-            "patch-plan": handlers.handle_agent_patch_plan,
-            "patch-apply": handlers.handle_agent_patch_apply,
-            "patch-rollback": handlers.handle_agent_patch_rollback,
-            "cycle": handlers.handle_agent_cycle,
-            "learning-summary": handlers.handle_agent_learning_summary,
-        }
-        handler = agent_dispatch.get(args.agent_command)
-        if handler:
-            return handler(args)
+# command -> handler name (cli.handlers); handlers take the parsed args
+COMMANDS: dict[str, str] = {
+    "scan": "handle_scan",
+    "arch-summary": "handle_arch_summary",
+    "arch-history": "handle_arch_history",
+    "history": "handle_arch_history",
+    "report": "handle_report",
+    "report-snapshot": "handle_report_snapshot",
+    "whitelist-draft": "handle_whitelist_draft",
+    "campaign-undo": "handle_campaign_undo",
+    "explain": "handle_explain",
+    "arch-diff": "handle_arch_diff",
+    "self-check": "handle_self_check",
+    "doctor": "handle_doctor",
+    "fix": "handle_fix",
+    "cycle": "handle_cycle",
+    "architect": "handle_architect",
+    "suggest-plan": "handle_suggest_plan",
+    "clean-imports": "handle_clean_imports",
+    "watch": "handle_watch",
+    "serve": "handle_serve",
+    "learn-github": "handle_learn_github",
+}
 
-    return 0
+# `eurika agent <command>` -> handler name
+AGENT_COMMANDS: dict[str, str] = {
+    "arch-review": "handle_agent_arch_review",
+    "arch-evolution": "handle_agent_arch_evolution",
+    "prioritize-modules": "handle_agent_prioritize_modules",
+    "feedback-summary": "handle_agent_feedback_summary",
+    "action-dry-run": "handle_agent_action_dry_run",
+    "action-simulate": "handle_agent_action_simulate",
+    "action-apply": "handle_agent_action_apply",
+    "patch-plan": "handle_agent_patch_plan",
+    "patch-apply": "handle_agent_patch_apply",
+    "patch-rollback": "handle_agent_patch_rollback",
+    "cycle": "handle_agent_cycle",
+    "learning-summary": "handle_agent_learning_summary",
+}
 
 
-# TODO (eurika): refactor long_function 'dispatch_command' — consider extracting helper
+def dispatch_command(parser: argparse.ArgumentParser, args: Any) -> int:
+    """Dispatch parsed CLI args to the matching command handler."""
+    if args.command is None or args.command == "help":
+        return load_handler("handle_help")(parser)
+    name = COMMANDS.get(args.command)
+    if name is None and args.command == "agent":
+        name = AGENT_COMMANDS.get(args.agent_command)
+    if name is None:
+        return 0
+    return load_handler(name)(args)
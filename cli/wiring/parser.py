@@ -32,6 +32,8 @@ def _add_product_commands(subparsers: argparse._SubParsersAction) -> None:
     scan_parser.add_argument("--format", "-f", choices=["text", "markdown"], default="text", help="Output format (default: text)")
     scan_parser.add_argument("--color", action="store_true", default=None, dest="color", help="Force color output (default: auto from TTY)")
     scan_parser.add_argument("--no-color", action="store_false", dest="color", help="Disable color output")
+    scan_parser.add_argument("--sharded", action="store_true", help="Also write one self_map shard per top-level package (.eurika/self_map_shards/)")
+    scan_parser.add_argument("--changed-since", type=str, default=None, metavar="REF", help="Analyze only .py files changed since git REF (graph context from cached self_map)")
 
     doctor_parser = subparsers.add_parser("doctor", help="Diagnostics only: report + architect (no patches) (3.0.1: multi-repo)")
     doctor_parser.add_argument("path", nargs="*", type=Path, default=[Path(".")], metavar="PATH", help="Project root(s); default: .")
@@ -61,6 +63,7 @@ def _add_product_commands(subparsers: argparse._SubParsersAction) -> None:
     fix_parser.add_argument("--apply-approved", action="store_true", help="Apply only ops with team_decision=approve from pending_plan.json (ROADMAP 3.0.4)")
     fix_parser.add_argument("--approve-ops", type=str, default=None, metavar="IDX[,IDX...]", help="Explicitly approve operation indexes (1-based), e.g. --approve-ops 1,3,5")
     fix_parser.add_argument("--reject-ops", type=str, default=None, metavar="IDX[,IDX...]", help="Explicitly reject operation indexes (1-based), e.g. --reject-ops 2,4")
+    fix_parser.add_argument("--changed-since", type=str, default=None, metavar="REF", help="Limit scan, smells, clean-imports and planner ops to .py files changed since git REF")
 
     cycle_parser = subparsers.add_parser("cycle", help="Full ritual: scan → doctor → fix (3.0.1: multi-repo)")
     cycle_parser.add_argument("path", nargs="*", type=Path, default=[Path(".")], metavar="PATH", help="Project root(s); default: .")
@@ -84,6 +87,7 @@ def _add_product_commands(subparsers: argparse._SubParsersAction) -> None:
     cycle_parser.add_argument("--apply-approved", action="store_true", help="Apply only approved ops from pending_plan.json (ROADMAP 3.0.4)")
     cycle_parser.add_argument("--approve-ops", type=str, default=None, metavar="IDX[,IDX...]", help="Explicitly approve operation indexes (1-based), e.g. --approve-ops 1,3,5")
     cycle_parser.add_argument("--reject-ops", type=str, default=None, metavar="IDX[,IDX...]", help="Explicitly reject operation indexes (1-based), e.g. --reject-ops 2,4")
+    cycle_parser.add_argument("--changed-since", type=str, default=None, metavar="REF", help="Limit scan, smells, clean-imports and planner ops to .py files changed since git REF")
 
     explain_parser = subparsers.add_parser("explain", help="Explain role and risks of a module")
     explain_parser.add_argument("module", type=str, help="Module path or name (e.g. architecture_diff.py or cli/handlers.py)")
@@ -285,6 +289,7 @@ def _add_agent_patch_rollback_command(agent_subparsers: argparse._SubParsersActi
     p.add_argument("path", nargs="?", default=".", type=Path, help="Project root (default: .)")
     p.add_argument("--run-id", type=str, default=None, metavar="ID", help="Restore from this run_id (default: latest)")
     p.add_argument("--list", action="store_true", help="List available backup run_ids and exit")
+    p.add_argument("--force", action="store_true", help="Also restore files edited after the run (reported as conflicts)")
 
 
 def _add_agent_cycle_command(agent_subparsers: argparse._SubParsersAction) -> None:
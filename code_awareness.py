@@ -6,13 +6,20 @@ SPEC: scan project, AST analysis, find smells, self_map.json.
 """
 import ast
 import json
+import os
 from pathlib import Path
 from code_awareness_extracted import FileInfo, Smell
 from code_awareness_codeawarenessextracted import CodeAwarenessExtracted
-from typing import Any, Dict, List, Optional
+from eurika.analysis.near_duplicates import NearDuplicateIndex
+from self_map_binary import default_binary_path, write_self_map_binary
+from self_map_io import load_self_map
+from self_map_shards import write_sharded_self_map
+from self_map_stream import SelfMapWriter, iter_self_map_dependencies, iter_self_map_modules
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 MAX_FUNCTION_LINES = 50
 MAX_NESTING_DEPTH = 4
 MIN_DUPLICATE_LINES = 5
+DUPLICATE_SIMILARITY = 0.8
 
 class CodeAwareness:
     """
@@ -20,10 +27,21 @@ class CodeAwareness:
     Domain: own project only (Eurika).
     """
 
-    def __init__(self, root: Optional[Path]=None):
+    def __init__(self, root: Optional[Path]=None, scope: Optional[Iterable[str]]=None):
         self.root = root or Path(__file__).resolve().parent
+        # relative POSIX paths; when set, file-level analysis covers only these files
+        self.scope = None if scope is None else {str(s).replace('\\', '/') for s in scope}
 
     def scan_python_files(self) -> List[Path]:
+        """
+        List .py files in scope (all project files when scope is None).
+        """
+        files = self._all_python_files()
+        if self.scope is None:
+            return files
+        return [p for p in files if self._path_to_file_str(p) in self.scope]
+
+    def _all_python_files(self) -> List[Path]:
         """
         List all .py files in project, excluding __pycache__ and shelved agent runtime stack.
 
@@ -106,48 +124,57 @@ class CodeAwareness:
 
     def find_smells(self, path: Path) -> List[Smell]:
         """Find code smells: long functions, deep nesting."""
-        smells = []
         try:
             content = self.read_file(path)
             tree = ast.parse(content)
-            lines = content.splitlines()
-            rel = path.relative_to(self.root) if path.is_relative_to(self.root) else path
-            file_str = str(rel)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    loc = node.name
-                    nlines = self._function_lines(node, lines)
-                    if nlines > MAX_FUNCTION_LINES:
-                        smells.append(Smell(file=file_str, location=loc, kind='long_function', message=f'Function has {nlines} lines (>{MAX_FUNCTION_LINES})', metric=nlines))
-                    depth = self._nesting_depth(node)
-                    if depth > MAX_NESTING_DEPTH:
-                        smells.append(Smell(file=file_str, location=loc, kind='deep_nesting', message=f'Nesting depth {depth} (>{MAX_NESTING_DEPTH})', metric=depth))
         except (SyntaxError, OSError):
-            pass
+            return []
+        rel = path.relative_to(self.root) if path.is_relative_to(self.root) else path
+        return self.smells_in_tree(tree, content.splitlines(), str(rel))
+
+    def smells_in_tree(self, tree: ast.AST, lines: List[str], file_str: str) -> List[Smell]:
+        """find_smells on an already parsed module (lines = source lines)."""
+        smells = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                loc = node.name
+                nlines = self._function_lines(node, lines)
+                if nlines > MAX_FUNCTION_LINES:
+                    smells.append(Smell(file=file_str, location=loc, kind='long_function', message=f'Function has {nlines} lines (>{MAX_FUNCTION_LINES})', metric=nlines))
+                depth = self._nesting_depth(node)
+                if depth > MAX_NESTING_DEPTH:
+                    smells.append(Smell(file=file_str, location=loc, kind='deep_nesting', message=f'Nesting depth {depth} (>{MAX_NESTING_DEPTH})', metric=depth))
         return smells
 
-    def find_duplicates(self) -> List[Dict[str, Any]]:
-        """Find functions with identical normalized bodies (copy-paste)."""
-        body_to_locations: Dict[str, List[Dict[str, str]]] = {}
+    def find_duplicates(self, threshold: float=DUPLICATE_SIMILARITY) -> List[Dict[str, Any]]:
+        """
+        Find near-duplicate functions (copy-paste, incl. copy-paste-with-tweaks).
+
+        MinHash signatures over token shingles + LSH banding (eurika.analysis.near_duplicates);
+        functions whose estimated Jaccard similarity is >= threshold are clustered.
+        threshold=1.0 keeps only exact token clones.
+        """
+        index = NearDuplicateIndex(threshold=threshold)
         for p in self.scan_python_files():
-            self._collect_file_duplicates(p, body_to_locations)
+            self._collect_file_duplicates(p, index)
         duplicates = []
-        for body, locs in body_to_locations.items():
-            if len(locs) >= 2:
-                duplicates.append({'locations': locs, 'count': len(locs)})
+        for cluster in index.clusters():
+            locs = cluster['members']
+            duplicates.append({'locations': locs, 'count': len(locs), 'similarity': cluster['similarity']})
         return duplicates
 
-    def _collect_file_duplicates(self, path: Path, body_to_locations: Dict[str, List[Dict[str, str]]]) -> None:
-        """Update body_to_locations with duplicate candidates from a single file."""
+    def _collect_file_duplicates(self, path: Path, index: NearDuplicateIndex) -> None:
+        """Add duplicate candidates from a single file to the MinHash index."""
         try:
             content = self.read_file(path)
             tree = ast.parse(content)
             file_str = self._path_to_file_str(path)
+            source_lines = content.splitlines(keepends=True)
             for node in ast.walk(tree):
-                candidate = self._function_duplicate_candidate(content, node, file_str)
+                candidate = self._function_duplicate_candidate(source_lines, node, file_str)
                 if candidate:
-                    normalized, loc = candidate
-                    body_to_locations.setdefault(normalized, []).append(loc)
+                    segment, loc = candidate
+                    index.add_source(segment, loc, mask_name=loc['function'])
         except (SyntaxError, OSError):
             pass
 
@@ -159,15 +186,38 @@ class CodeAwareness:
         """Return path relative to project root when possible."""
         return path.relative_to(self.root) if path.is_relative_to(self.root) else path
 
-    def _collect_internal_dependencies(self, imports: List[Dict[str, Any]]) -> List[str]:
-        """Keep only imports that resolve to project-internal modules."""
+    def build_module_index(self) -> Dict[str, str]:
+        """
+        Map top-level module and package names under the root to their files.
+
+        "mod" -> "mod.py", "pkg" -> "pkg/__init__.py". Only the root directory is
+        listed (one scandir), since dependency resolution checks the first dotted
+        component only; nested trees such as .tox/, build/ or backups are never walked.
+        """
+        index: Dict[str, str] = {}
+        try:
+            entries = list(os.scandir(self.root))
+        except OSError:
+            return index
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if os.path.isfile(os.path.join(entry.path, '__init__.py')):
+                        index[entry.name] = f'{entry.name}/__init__.py'
+                elif entry.name.endswith('.py') and entry.name != '__init__.py':
+                    index[entry.name[:-3]] = entry.name
+            except OSError:
+                continue
+        return index
+
+    def _collect_internal_dependencies(self, imports: List[Dict[str, Any]], module_index: Dict[str, str]) -> List[str]:
+        """Keep only imports whose top-level name is a project module or package (root level)."""
         internal: List[str] = []
         for imp in imports:
             mod = imp.get('module', '')
             if not mod or mod.startswith('_'):
                 continue
-            stem = mod.split('.')[0]
-            if (self.root / f'{stem}.py').exists() or (self.root / stem / '__init__.py').exists():
+            if mod.split('.')[0] in module_index:
                 internal.append(mod)
         return list(dict.fromkeys(internal))
 
@@ -181,8 +231,8 @@ class CodeAwareness:
             'classes': info.classes,
         }
 
-    def _function_duplicate_candidate(self, content: str, node: ast.AST, file_str: str) -> Optional[tuple[str, Dict[str, Any]]]:
-        """Extract normalized body and location if function qualifies as duplicate candidate. Returns None to skip."""
+    def _function_duplicate_candidate(self, source_lines: List[str], node: ast.AST, file_str: str) -> Optional[tuple[str, Dict[str, Any]]]:
+        """Extract source segment and location if function qualifies as duplicate candidate. Returns None to skip."""
         if not isinstance(node, ast.FunctionDef):
             return None
         if not (node.lineno and node.end_lineno):
@@ -190,47 +240,117 @@ class CodeAwareness:
         nlines = node.end_lineno - node.lineno + 1
         if nlines < MIN_DUPLICATE_LINES:
             return None
-        segment = ast.get_source_segment(content, node) or ''
+        segment = ''.join(source_lines[node.lineno - 1:node.end_lineno])
         normalized = self._normalize_body(segment)
         if len(normalized) < 50:
             return None
         loc = {'file': file_str, 'function': node.name, 'lines': int(nlines)}
-        return (normalized, loc)
+        return (segment, loc)
 
     def build_self_map(self) -> dict:
-        """Build formalized self-map: modules, files, dependencies."""
+        """
+        Build formalized self-map: modules, files, dependencies.
+
+        With a scope and an existing self_map.json, only scoped files are re-parsed
+        and merged into the cached map; otherwise the whole project is mapped.
+        """
+        if self.scope is not None:
+            cached = self._load_cached_self_map()
+            if cached is not None:
+                return self._merge_scoped_self_map(cached)
+        return self._self_map_for(self._all_python_files())
+
+    def _load_cached_self_map(self) -> Optional[dict]:
+        path = self.root / 'self_map.json'
+        if not path.is_file():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) and 'modules' in data else None
+
+    def _merge_scoped_self_map(self, cached: dict) -> dict:
+        """Replace scoped entries of cached (changed or deleted files) with fresh ones."""
+        fresh = self._self_map_for(self.scan_python_files())
+        scope = self.scope or set()
+        modules = [m for m in cached.get('modules', []) if m.get('path', '').replace('\\', '/') not in scope]
+        modules.extend(fresh['modules'])
+        modules.sort(key=lambda m: m['path'])
+        dependencies = {k: v for k, v in (cached.get('dependencies') or {}).items() if k not in scope}
+        dependencies.update(fresh['dependencies'])
+        return {'modules': modules, 'dependencies': dependencies, 'summary': {'files': len(modules), 'total_lines': sum((m['lines'] for m in modules))}}
+
+    def _self_map_for(self, files: List[Path]) -> dict:
         modules = []
         dependencies: Dict[str, List[str]] = {}
-        for p in self.scan_python_files():
-            rel_str = str(self._relative_path(p)).replace('\\', '/')
-            info = self.analyze_file(p)
-            imports = self.extract_imports(p)
-            if info:
-                modules.append(self._file_info_dict(info))
-            internal = self._collect_internal_dependencies(imports)
+        for module, rel_str, internal in self._iter_self_map_entries(files):
+            if module is not None:
+                modules.append(module)
             if internal:
                 dependencies[rel_str] = internal
         return {'modules': modules, 'dependencies': dependencies, 'summary': {'files': len(modules), 'total_lines': sum((m['lines'] for m in modules))}}
 
-    def write_self_map(self, output_path: Optional[Path]=None) -> Path:
-        """Write self_map.json to project root."""
-        path = (output_path or self.root) / 'self_map.json'
-        data = self.build_self_map()
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+    def _iter_self_map_entries(self, files: List[Path]) -> Iterator[tuple[Optional[Dict[str, Any]], str, List[str]]]:
+        """(module dict or None, relative path, internal dependencies) per file, as each is analysed."""
+        module_index = self.build_module_index()
+        for p in files:
+            rel_str = str(self._relative_path(p)).replace('\\', '/')
+            info = self.analyze_file(p)
+            imports = self.extract_imports(p)
+            yield (self._file_info_dict(info) if info else None), rel_str, self._collect_internal_dependencies(imports, module_index)
+
+    def write_self_map(self, output_path: Optional[Path]=None, compact: bool=True, sharded: bool=False) -> Path:
+        """
+        Write self_map.json to project root (plus .eurika/self_map.bin companion when compact).
+
+        A full scan streams modules to disk as files are analysed (self_map_stream),
+        so the map is never held in memory; scoped scans merge into the cached map.
+        sharded=True also writes per-package shards + manifest (.eurika/self_map_shards/).
+        """
+        out_dir = output_path or self.root
+        path = out_dir / 'self_map.json'
+        cached = self._load_cached_self_map() if self.scope is not None else None
+        with SelfMapWriter(path) as writer:
+            if cached is not None:
+                data = self._merge_scoped_self_map(cached)
+                for module in data['modules']:
+                    writer.add_module(module)
+                for src, internal in data['dependencies'].items():
+                    writer.add_dependencies(src, internal)
+            else:
+                for module, rel_str, internal in self._iter_self_map_entries(self._all_python_files()):
+                    if module is not None:
+                        writer.add_module(module)
+                    if internal:
+                        writer.add_dependencies(rel_str, internal)
+            summary = writer.summary()
+        if sharded:
+            write_sharded_self_map(load_self_map(path), out_dir, source=path)
+        if compact:
+            # Encoded straight from the file: modules are decoded one at a time.
+            streamed = {'modules': iter_self_map_modules(path), 'dependencies': dict(iter_self_map_dependencies(path)), 'summary': summary}
+            try:
+                write_self_map_binary(streamed, default_binary_path(path), source=path)
+            except OSError:
+                pass
         return path
 
-    def analyze_project(self) -> dict:
+    def analyze_project(self, include_self_map: bool=True) -> dict:
         """
         Full analysis: structure + smells + self_map.
         Returns dict suitable for report and memory.
+
+        include_self_map=False skips the in-memory self_map (callers that stream
+        it to disk with write_self_map).
         """
         infos = self.scan_project()
         all_smells: List[Smell] = []
         for p in self.scan_python_files():
             all_smells.extend(self.find_smells(p))
         duplicates = self.find_duplicates()
-        self_map = self.build_self_map()
-        return {
+        self_map = self.build_self_map() if include_self_map else None
+        result = {
             'structure': [self._file_info_dict(i) for i in infos],
             'smells': [
                 {
@@ -242,7 +362,6 @@ class CodeAwareness:
                 }
                 for s in all_smells
             ],
-            'self_map': self_map,
             'duplicates': duplicates,
             'summary': {
                 'files': len(infos),
@@ -251,6 +370,9 @@ class CodeAwareness:
                 'duplicates_count': len(duplicates),
             },
         }
+        if self_map is not None:
+            result['self_map'] = self_map
+        return result
 
     def read_file(self, path: Path):
         return CodeAwarenessExtracted.read_file(path)
@@ -0,0 +1,188 @@
+"""Per-cycle pipeline state shared by scan, diagnose and planning stages.
+
+One `eurika fix` touches the same artifacts several times (scan's full
+analysis, the arch-review diagnose, patch planning, explain). CycleContext
+computes each of them once and hands the same objects to every stage:
+
+- self_map dict, graph, smells, summary (keyed by self_map.json stamp);
+- history info per window (keyed by history file stamp);
+- graph priorities and merged learning stats;
+- a single ProjectMemory instance.
+
+Cached values are dropped automatically when self_map.json or the history
+file change on disk, or explicitly via invalidate(). Stages receive the
+context explicitly; code behind injected callables (the scan stage) finds
+it via CycleContext.current(root) while activate() is in effect.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.snapshot import ArchitectureSnapshot
+
+_STRUCTURE_KEYS = ("self_map", "structure", "priorities")
+_CURRENT: ContextVar[Optional["CycleContext"]] = ContextVar("eurika_cycle_context", default=None)
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class CycleContext:
+    """Lazily computed, stamp-invalidated architecture state for one project cycle."""
+
+    def __init__(self, project_root: Path, window: int = 5) -> None:
+        self.root = Path(project_root).resolve()
+        self.window = window
+        self.self_map_path = self.root / "self_map.json"
+        self._cache: Dict[str, Any] = {}
+        self._self_map_stamp: Optional[Tuple[int, int]] = None
+        self._history_stamp: Optional[Tuple[int, int]] = None
+        self._memory: Any = None
+
+    # --- activation -------------------------------------------------------
+
+    @classmethod
+    def current(cls, project_root: Path) -> Optional["CycleContext"]:
+        """Active context for project_root, if any."""
+        ctx = _CURRENT.get()
+        if ctx is None or ctx.root != Path(project_root).resolve():
+            return None
+        return ctx
+
+    @contextmanager
+    def activate(self) -> Iterator["CycleContext"]:
+        """Make this context visible to CycleContext.current() for the block."""
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+    # --- invalidation -----------------------------------------------------
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop cached values (all when no keys): self_map, structure, priorities, history, learning_stats."""
+        if not keys:
+            self._cache.clear()
+            return
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def _check_self_map(self) -> None:
+        stamp = _file_stamp(self.self_map_path)
+        if stamp != self._self_map_stamp:
+            self.invalidate(*_STRUCTURE_KEYS)
+            self._self_map_stamp = stamp
+
+    def _check_history(self) -> None:
+        stamp = _file_stamp(self.memory.history.storage_path)
+        if stamp != self._history_stamp:
+            self.invalidate("history")
+            self._history_stamp = stamp
+
+    # --- artifacts --------------------------------------------------------
+
+    @property
+    def memory(self) -> Any:
+        """Single ProjectMemory for the cycle."""
+        if self._memory is None:
+            from eurika.storage import ProjectMemory
+
+            self._memory = ProjectMemory(self.root)
+        return self._memory
+
+    @property
+    def self_map(self) -> Dict[str, Any]:
+        """Parsed self_map (FileNotFoundError if the project was not scanned)."""
+        self._check_self_map()
+        if "self_map" not in self._cache:
+            from self_map_io import load_self_map
+
+            self._cache["self_map"] = load_self_map(self.self_map_path)
+        return self._cache["self_map"]
+
+    def structure(self) -> Tuple[Any, List[Any], Dict[str, Any]]:
+        """(graph, smells, summary) derived from self_map.json."""
+        self._check_self_map()
+        if "structure" not in self._cache:
+            if self._self_map_stamp is None:
+                raise FileNotFoundError(f"self_map.json not found at {self.self_map_path}")
+            from architecture_pipeline import _build_graph_and_summary_from_self_map
+
+            self._cache["structure"] = _build_graph_and_summary_from_self_map(self.self_map_path)
+        return self._cache["structure"]
+
+    def seed_structure(self, graph: Any, smells: List[Any], summary: Dict[str, Any]) -> None:
+        """Record structure computed elsewhere from the current self_map.json."""
+        self._check_self_map()
+        self._cache["structure"] = (graph, smells, summary)
+
+    @property
+    def graph(self) -> Any:
+        return self.structure()[0]
+
+    @property
+    def smells(self) -> List[Any]:
+        return self.structure()[1]
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        return self.structure()[2]
+
+    def history_info(self, window: Optional[int] = None) -> Dict[str, Any]:
+        """Trends, regressions and evolution report over the last `window` snapshots."""
+        window = self.window if window is None else window
+        self._check_history()
+        per_window = self._cache.setdefault("history", {})
+        if window not in per_window:
+            history = self.memory.history
+            per_window[window] = {
+                "trends": history.trend(window=window),
+                "regressions": history.detect_regressions(window=window),
+                "evolution_report": history.evolution_report(window=window),
+            }
+        return per_window[window]
+
+    def priorities(self, top_n: int = 8) -> List[Dict[str, Any]]:
+        """Graph-based module priorities (planner input)."""
+        graph, smells, summary = self.structure()
+        per_n = self._cache.setdefault("priorities", {})
+        if top_n not in per_n:
+            from eurika.reasoning.graph_ops import priority_from_graph
+
+            per_n[top_n] = priority_from_graph(graph, smells, summary_risks=summary.get("risks"), top_n=top_n)
+        return per_n[top_n]
+
+    def learning_stats(self) -> Optional[Dict[str, Any]]:
+        """Merged (project + global) learning stats, or None when empty/unavailable."""
+        if "learning_stats" not in self._cache:
+            stats = None
+            try:
+                from eurika.storage.global_memory import get_merged_learning_stats
+
+                stats = get_merged_learning_stats(self.root) or None
+            except Exception:
+                stats = None
+            self._cache["learning_stats"] = stats
+        return self._cache["learning_stats"]
+
+    def snapshot(self, window: Optional[int] = None) -> ArchitectureSnapshot:
+        """ArchitectureSnapshot of the current state (read-only; history is not appended)."""
+        graph, smells, summary = self.structure()
+        return ArchitectureSnapshot(
+            root=self.root,
+            graph=graph,
+            smells=smells,
+            summary=summary,
+            history=self.history_info(window),
+            diff=None,
+        )
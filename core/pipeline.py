@@ -9,12 +9,13 @@ wiring runtime_scan / architecture_* modules manually.
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from eurika.storage import ProjectMemory
 from architecture_pipeline import _build_graph_and_summary, _build_graph_and_summary_from_self_map
 from eurika.core.snapshot import ArchitectureSnapshot
+from core.cycle_context import CycleContext
 
-def run_full_analysis(path: Path, *, history_window: int=5, update_artifacts: bool=True) -> ArchitectureSnapshot:
+def run_full_analysis(path: Path, *, history_window: int=5, update_artifacts: bool=True, context: Optional[CycleContext]=None) -> ArchitectureSnapshot:
     """Run the full architecture-awareness pipeline and return a snapshot.
 
     v0.5 skeleton implementation:
@@ -22,12 +23,21 @@ def run_full_analysis(path: Path, *, history_window: int=5, update_artifacts: bo
     - when update_artifacts=False: reads existing artifacts only (read-only mode);
     - builds graph, smells, summary using existing helpers;
     - attaches trend info and evolution report to snapshot.
+
+    With a CycleContext (passed or active for path) graph/smells/summary and
+    history info come from, and are kept in, the context instead of being rebuilt.
     """
     root = Path(path).resolve()
     if update_artifacts and not (root / "self_map.json").exists():
         raise FileNotFoundError(
             "self_map.json not found. Run scan first (or call run_full_analysis(..., update_artifacts=False))."
         )
+    ctx = context if context is not None and context.root == root else CycleContext.current(root)
+    if ctx is not None:
+        graph, smells, summary = ctx.structure()
+        if update_artifacts:
+            ctx.memory.history.append(graph, smells, summary)
+        return ArchitectureSnapshot(root=root, graph=graph, smells=smells, summary=summary, history=dict(ctx.history_info(history_window)), diff=None)
     graph, smells, summary = _build_graph_and_summary(root)
     memory = ProjectMemory(root)
     history = memory.history
@@ -2,7 +2,7 @@
 
 from .config import PolicyConfig, load_policy_config
 from .models import AgentCycleResult, AgentMode, AgentStage, ToolResult
-from .policy import OperationPolicyResult, evaluate_operation
+from .policy import OperationPolicyResult, PolicyContext, evaluate_operation, evaluate_operations
 from .runtime import run_agent_cycle
 from .tool_contract_extracted import DefaultToolContract
 
@@ -13,8 +13,10 @@ __all__ = [
     "AgentStage",
     "PolicyConfig",
     "OperationPolicyResult",
+    "PolicyContext",
     "ToolResult",
     "evaluate_operation",
+    "evaluate_operations",
     "load_policy_config",
     "run_agent_cycle",
 ]
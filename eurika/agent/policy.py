@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterable, Literal
 
 from .config import PolicyConfig, RiskLevel
 
@@ -62,34 +63,18 @@ def _weak_pair_policy(
     op: dict[str, Any],
     *,
     mode: str,
+    weak_pairs: frozenset[tuple[str, str]] = WEAK_SMELL_ACTION_PAIRS,
 ) -> tuple[PolicyDecision | None, str | None]:
     """Return policy override for historically weak smell|action pairs."""
     kind = (op.get("kind") or "").strip()
     smell = (op.get("smell_type") or "").strip()
-    if (smell, kind) not in WEAK_SMELL_ACTION_PAIRS:
+    if (smell, kind) not in weak_pairs:
         return None, None
     if mode == "hybrid":
         return "review", f"historically weak pair requires manual approval: {smell}|{kind}"
     return "deny", f"historically weak pair blocked in auto mode: {smell}|{kind}"
 
 
-def _target_verify_fail_count(project_root: Path | None, op: dict[str, Any]) -> int:
-    """Return verify_fail count for operation key from campaign memory."""
-    if project_root is None:
-        return 0
-    try:
-        from collections import Counter
-        from eurika.storage import SessionMemory, operation_key
-
-        mem = SessionMemory(project_root)
-        data = mem._load()  # best-effort read of existing campaign data
-        fail_keys = ((data.get("campaign") or {}).get("verify_fail_keys") or [])
-        counts = Counter(str(k) for k in fail_keys)
-        return int(counts.get(operation_key(op), 0))
-    except Exception:
-        return 0
-
-
 def _load_operation_whitelist(project_root: Path | None) -> list[dict[str, Any]]:
     """Load optional operation whitelist from .eurika/operation_whitelist.json."""
     if project_root is None:
@@ -123,14 +108,55 @@ def _op_matches_whitelist_entry(op: dict[str, Any], entry: dict[str, Any]) -> bo
     return True
 
 
+@dataclass(slots=True)
+class PolicyContext:
+    """
+    Per-plan policy inputs, loaded once and shared by every evaluated operation.
+
+    verify_fail_counts: campaign verify failures per operation key;
+    whitelist: operation_whitelist.json entries indexed by (kind, target_file);
+    weak_pairs: smell|action pairs that need review (auto: deny).
+    """
+
+    verify_fail_counts: Counter[str] = field(default_factory=Counter)
+    whitelist: dict[tuple[str, str], list[dict[str, Any]]] = field(default_factory=dict)
+    weak_pairs: frozenset[tuple[str, str]] = WEAK_SMELL_ACTION_PAIRS
+
+    @classmethod
+    def load(cls, project_root: Path | None) -> "PolicyContext":
+        """Read campaign memory and the whitelist of project_root (empty context for None)."""
+        if project_root is None:
+            return cls()
+        counts: Counter[str] = Counter()
+        try:
+            from eurika.storage import SessionMemory
+
+            counts = Counter(SessionMemory(project_root).campaign()["verify_fail_keys"])
+        except Exception:
+            pass
+        whitelist: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for entry in _load_operation_whitelist(project_root):
+            key = (str(entry.get("kind") or ""), str(entry.get("target_file") or ""))
+            whitelist.setdefault(key, []).append(entry)
+        return cls(verify_fail_counts=counts, whitelist=whitelist)
+
+    def verify_fail_count(self, op: dict[str, Any]) -> int:
+        from eurika.storage import operation_key
+
+        return int(self.verify_fail_counts.get(operation_key(op), 0))
+
+    def whitelist_entries(self, op: dict[str, Any]) -> list[dict[str, Any]]:
+        return self.whitelist.get((str(op.get("kind") or ""), str(op.get("target_file") or "")), [])
+
+
 def _whitelist_policy_override(
     op: dict[str, Any],
     *,
     mode: str,
-    project_root: Path | None,
+    context: PolicyContext,
 ) -> tuple[PolicyDecision | None, str | None]:
     """Return optional decision override when operation is explicitly whitelisted."""
-    for entry in _load_operation_whitelist(project_root):
+    for entry in context.whitelist_entries(op):
         if not _op_matches_whitelist_entry(op, entry):
             continue
         allow_hybrid = bool(entry.get("allow_in_hybrid", True))
@@ -179,20 +205,26 @@ def evaluate_operation(
     index: int,
     seen_files: set[str],
     project_root: Path | None = None,
+    context: PolicyContext | None = None,
 ) -> OperationPolicyResult:
-    """Evaluate one patch operation against configured policy and produce explainability metadata."""
+    """Evaluate one patch operation against configured policy and produce explainability metadata.
+
+    context: preloaded PolicyContext; when omitted it is loaded from project_root.
+    """
+    if context is None:
+        context = PolicyContext.load(project_root)
     risk = _estimate_risk(op)
     decision, reason = _apply_core_rules(
         op, config=config, index=index, seen_files=seen_files, risk=risk
     )
 
     if decision in {"allow", "review"}:
-        weak_decision, weak_reason = _weak_pair_policy(op, mode=config.mode)
+        weak_decision, weak_reason = _weak_pair_policy(op, mode=config.mode, weak_pairs=context.weak_pairs)
         if weak_decision is not None and weak_reason is not None:
             decision = weak_decision
             reason = weak_reason
 
-    fail_count = _target_verify_fail_count(project_root, op)
+    fail_count = context.verify_fail_count(op)
     if fail_count >= 2:
         if config.mode == "auto":
             decision = "deny"
@@ -201,9 +233,7 @@ def evaluate_operation(
             decision = "review"
             reason = f"target has repeated verify failures (count={fail_count})"
 
-    wl_decision, wl_reason = _whitelist_policy_override(
-        op, mode=config.mode, project_root=project_root
-    )
+    wl_decision, wl_reason = _whitelist_policy_override(op, mode=config.mode, context=context)
     if wl_decision is not None and wl_reason is not None:
         # Whitelist only relaxes conservative denies/reviews, never escalates.
         if decision == "deny" and wl_decision in {"review", "allow"}:
@@ -228,3 +258,33 @@ def evaluate_operation(
         reason=reason,
         explainability=explainability,
     )
+
+
+def policy_keeps(decision: PolicyDecision, mode: str) -> bool:
+    """Whether an operation with this decision stays in the plan for the runtime mode."""
+    return mode == "assist" or decision == "allow" or (decision == "review" and mode == "hybrid")
+
+
+def evaluate_operations(
+    ops: Iterable[dict[str, Any]],
+    ctx: PolicyContext | None = None,
+    *,
+    config: PolicyConfig,
+    seen_files: set[str] | None = None,
+) -> list[OperationPolicyResult]:
+    """
+    Evaluate a plan's operations in order with one shared PolicyContext.
+
+    Indices start at 1; seen_files (updated in place when given) collects targets
+    of operations the policy keeps, as the file-scope limit expects.
+    """
+    ctx = ctx if ctx is not None else PolicyContext()
+    seen = seen_files if seen_files is not None else set()
+    results: list[OperationPolicyResult] = []
+    for idx, op in enumerate(ops, start=1):
+        res = evaluate_operation(op, config=config, index=idx, seen_files=seen, context=ctx)
+        results.append(res)
+        target_file = str(op.get("target_file") or "")
+        if target_file and policy_keeps(res.decision, config.mode):
+            seen.add(target_file)
+    return results
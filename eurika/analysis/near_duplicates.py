@@ -0,0 +1,178 @@
+"""
+Near-duplicate function detection via MinHash + LSH banding (stdlib-only).
+
+Each function body is reduced to a set of hashed token shingles and then to a
+fixed MinHash signature (NUM_PERM ints; the i-th min-wise hash is the shingle
+hash XOR a fixed mask, which keeps signing at C speed via map()), so memory
+per function is bounded and bodies are not retained. Signatures are split into
+bands; functions that share a band bucket become candidate pairs, and only
+candidates are compared. Pairs whose estimated Jaccard similarity reaches the threshold are
+merged into clusters (union-find).
+
+Identifier and literal values are kept, the function's own name is masked, so
+renamed copies and copies with small edits still land in one cluster.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import tokenize
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+NUM_PERM = 64
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.8
+
+_MAX_HASH = (1 << 32) - 1
+_SKIP_TOKENS = {
+    tokenize.COMMENT,
+    tokenize.NL,
+    tokenize.NEWLINE,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+    tokenize.ENCODING,
+    tokenize.ENDMARKER,
+}
+
+
+def _masks(num_perm: int) -> List[int]:
+    """Deterministic 32-bit masks; h_i(x) = x XOR mask_i over pre-mixed shingle hashes."""
+    out: List[int] = []
+    for i in range(num_perm):
+        digest = hashlib.blake2b(f"eurika-minhash-{i}".encode(), digest_size=4).digest()
+        out.append(int.from_bytes(digest, "little"))
+    return out
+
+
+_MASKS = _masks(NUM_PERM)
+
+
+def code_tokens(source: str, mask_name: Optional[str] = None) -> List[str]:
+    """Significant tokens of source (comments/layout dropped); mask_name becomes '_'."""
+    tokens: List[str] = []
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.type in _SKIP_TOKENS:
+                continue
+            tokens.append("_" if mask_name and tok.string == mask_name else tok.string)
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        return tokens
+    return tokens
+
+
+def shingles(tokens: Sequence[str], k: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed k-token shingles (32-bit)."""
+    if len(tokens) < k:
+        k = max(1, len(tokens))
+    out: Set[int] = set()
+    for i in range(len(tokens) - k + 1):
+        raw = "\x00".join(tokens[i:i + k]).encode("utf-8")
+        out.add(int.from_bytes(hashlib.blake2b(raw, digest_size=4).digest(), "little"))
+    return out
+
+
+def minhash_signature(shingle_set: Iterable[int]) -> Tuple[int, ...]:
+    """MinHash signature of a shingle set (NUM_PERM values)."""
+    values = list(shingle_set)
+    if not values:
+        return tuple([_MAX_HASH] * NUM_PERM)
+    return tuple(min(map(mask.__xor__, values)) for mask in _MASKS)
+
+
+def estimated_similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity: fraction of agreeing signature slots."""
+    same = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return same / max(1, len(sig_a))
+
+
+def lsh_bands(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows == num_perm whose S-curve midpoint
+    (1/bands) ** (1/rows) is closest to, but not above, the threshold.
+    """
+    best = (num_perm, 1)
+    best_gap = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        midpoint = (1.0 / bands) ** (1.0 / rows)
+        gap = threshold - midpoint
+        if 0 <= gap < best_gap:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    LSH index over MinHash signatures.
+
+    add() keeps only the signature and the caller's payload; clusters() returns
+    groups of payloads whose estimated similarity to a group member is >= threshold.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.bands, self.rows = lsh_bands(threshold)
+        self._signatures: List[Tuple[int, ...]] = []
+        self._payloads: List[Any] = []
+        self._buckets: Dict[Tuple[int, Hashable], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, signature: Tuple[int, ...], payload: Any) -> None:
+        idx = len(self._signatures)
+        self._signatures.append(signature)
+        self._payloads.append(payload)
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            self._buckets.setdefault((band, chunk), []).append(idx)
+
+    def add_source(self, source: str, payload: Any, mask_name: Optional[str] = None) -> None:
+        self.add(minhash_signature(shingles(code_tokens(source, mask_name))), payload)
+
+    def _candidate_pairs(self) -> Set[Tuple[int, int]]:
+        pairs: Set[Tuple[int, int]] = set()
+        for members in self._buckets.values():
+            if len(members) < 2:
+                continue
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    pairs.add((a, b))
+        return pairs
+
+    def clusters(self) -> List[Dict[str, Any]]:
+        """[{'members': [payload, ...], 'similarity': min pairwise estimate among merged pairs}]."""
+        parent = list(range(len(self._signatures)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        link_sim: Dict[int, float] = {}
+        for a, b in sorted(self._candidate_pairs()):
+            sim = estimated_similarity(self._signatures[a], self._signatures[b])
+            if sim < self.threshold:
+                continue
+            ra, rb = find(a), find(b)
+            low = min(sim, link_sim.get(ra, 1.0), link_sim.get(rb, 1.0))
+            if ra != rb:
+                parent[rb] = ra
+                link_sim.pop(rb, None)
+            link_sim[ra] = low
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(parent)):
+            groups.setdefault(find(i), []).append(i)
+        out: List[Dict[str, Any]] = []
+        for root, members in groups.items():
+            if len(members) < 2:
+                continue
+            out.append({
+                "members": [self._payloads[i] for i in members],
+                "similarity": round(link_sim.get(root, 1.0), 2),
+            })
+        return out
@@ -1,5 +1,19 @@
 """Facade for self_map I/O with explicit exports."""
 
+from self_map_binary import SelfMapReader, write_self_map_binary
 from self_map_io import build_graph_from_self_map, load_self_map
+from self_map_shards import build_graph_from_shards, load_shards, write_sharded_self_map
+from self_map_stream import SelfMapWriter, iter_self_map_dependencies, iter_self_map_modules
 
-__all__ = ["load_self_map", "build_graph_from_self_map"]
+__all__ = [
+    "load_self_map",
+    "build_graph_from_self_map",
+    "SelfMapReader",
+    "write_self_map_binary",
+    "write_sharded_self_map",
+    "load_shards",
+    "build_graph_from_shards",
+    "SelfMapWriter",
+    "iter_self_map_modules",
+    "iter_self_map_dependencies",
+]
@@ -120,7 +120,7 @@ def get_operational_metrics(project_root: Path, window: int = 10) -> Dict[str, A
 
 def get_history(project_root: Path, window: int = 5) -> Dict[str, Any]:
     """
-    Read architecture history from project_root/architecture_history.json.
+    Read architecture history from project_root/.eurika/history.jsonl.
     Returns dict with keys: trends, regressions, evolution_report, points.
     points are the last `window` history points (each as dict).
     """
@@ -130,7 +130,7 @@ def get_history(project_root: Path, window: int = 5) -> Dict[str, Any]:
     root = Path(project_root).resolve()
     memory = ProjectMemory(root)
     history = memory.history
-    points: List[HistoryPoint] = history._window(window)
+    points: List[HistoryPoint] = history.points(window)
     return {
         "trends": history.trend(window=window),
         "regressions": history.detect_regressions(window=window),
@@ -139,16 +139,35 @@ def get_history(project_root: Path, window: int = 5) -> Dict[str, Any]:
     }
 
 
+def _history_info(root: Path, window: int) -> Dict[str, Any]:
+    """Trends / regressions / evolution report from project history (patch-plan input)."""
+    from eurika.storage import ProjectMemory
+
+    history = ProjectMemory(root).history
+    return {
+        "trends": history.trend(window=window),
+        "regressions": history.detect_regressions(window=window),
+        "evolution_report": history.evolution_report(window=window),
+    }
+
+
 def _build_patch_plan_inputs(
     root: Path,
     window: int,
+    context: Any = None,
 ) -> tuple[Any, Any, Dict[str, Any], Dict[str, Any], Any] | None:
     """Build graph/smells/summary/history/priorities inputs for patch planning."""
+    if context is not None:
+        try:
+            graph, smells, summary = context.structure()
+        except Exception:
+            return None
+        return graph, smells, summary, dict(context.history_info(window)), context.priorities(top_n=8)
+
     from eurika.analysis.self_map import build_graph_from_self_map
     from eurika.reasoning.graph_ops import priority_from_graph
     from eurika.smells.detector import detect_architecture_smells
     from eurika.smells.rules import build_summary
-    from eurika.storage import ProjectMemory
 
     self_map_path = root / "self_map.json"
     if not self_map_path.exists():
@@ -160,13 +179,7 @@ def _build_patch_plan_inputs(
     except Exception:
         return None
 
-    memory = ProjectMemory(root)
-    history = memory.history
-    history_info = {
-        "trends": history.trend(window=window),
-        "regressions": history.detect_regressions(window=window),
-        "evolution_report": history.evolution_report(window=window),
-    }
+    history_info = _history_info(root, window)
     priorities = priority_from_graph(
         graph,
         smells,
@@ -194,22 +207,32 @@ def _optional_learning_and_self_map(memory: Any, self_map_path: Path) -> tuple[A
     return learning_stats, self_map
 
 
-def get_patch_plan(project_root: Path, window: int = 5) -> Dict[str, Any] | None:
+def get_patch_plan(project_root: Path, window: int = 5, context: Any = None) -> Dict[str, Any] | None:
     """
     Build patch plan from diagnostics (summary, smells, history, graph).
     Returns operations dict or None on error. Used by architect and explain.
+    context: CycleContext to reuse (default: the one active for project_root, if any).
     """
     from architecture_planner import build_patch_plan
+    from core.cycle_context import CycleContext
     from eurika.storage import ProjectMemory
 
     root = Path(project_root).resolve()
     self_map_path = root / "self_map.json"
-    inputs = _build_patch_plan_inputs(root, window)
+    ctx = context if context is not None else CycleContext.current(root)
+    inputs = _build_patch_plan_inputs(root, window, ctx)
     if inputs is None:
         return None
     graph, smells, summary, history_info, priorities = inputs
-    memory = ProjectMemory(root)
-    learning_stats, self_map = _optional_learning_and_self_map(memory, self_map_path)
+    if ctx is not None:
+        learning_stats = ctx.learning_stats()
+        try:
+            self_map = ctx.self_map
+        except Exception:
+            self_map = None
+    else:
+        memory = ProjectMemory(root)
+        learning_stats, self_map = _optional_learning_and_self_map(memory, self_map_path)
 
     plan = build_patch_plan(
         project_root=str(root),
@@ -275,20 +298,34 @@ def _truncate_on_word_boundary(raw: str, max_len: int = 200) -> str:
     return (truncated[:cut] if cut >= 0 else truncated) + "..."
 
 
-def explain_module(project_root: Path, module_arg: str, window: int = 5) -> tuple[str | None, str | None]:
+def explain_module(
+    project_root: Path, module_arg: str, window: int = 5, context: Any = None
+) -> tuple[str | None, str | None]:
     """
     Explain role and risks of a module (ROADMAP 3.1-arch.5).
 
+    context: CycleContext to reuse instead of rerunning the full analysis.
+    Without one, a fresh sharded self_map is used when present: role, smells and
+    planned operations then all come from the module's neighbour shards only.
+
     Returns (formatted_text, error_message). If error_message is not None, use it for stderr and return 1.
     """
+    from core.cycle_context import CycleContext
     from eurika.core.pipeline import run_full_analysis
     from eurika.smells.detector import get_remediation_hint, severity_to_level
 
     root = Path(project_root).resolve()
-    try:
-        snapshot = run_full_analysis(root, update_artifacts=False)
-    except Exception as exc:
-        return None, str(exc)
+    ctx = context if context is not None else CycleContext.current(root)
+    scoped = _shard_scoped_snapshot(root, module_arg) if ctx is None else None
+    snapshot = scoped[0] if scoped is not None else None
+    if ctx is None and scoped is None:
+        # shared by the analysis below and get_patch_plan: one graph/smells build
+        ctx = CycleContext(root, window=window)
+    if snapshot is None:
+        try:
+            snapshot = run_full_analysis(root, update_artifacts=False, context=ctx)
+        except Exception as exc:
+            return None, str(exc)
     nodes = list(snapshot.graph.nodes)
     target, resolve_error = _resolve_module_arg(module_arg, root, nodes)
     if resolve_error:
@@ -330,7 +367,10 @@ def explain_module(project_root: Path, module_arg: str, window: int = 5) -> tupl
         for risk in module_risks:
             lines.append(f"- {risk}")
 
-    patch_plan = get_patch_plan(root, window=window)
+    if scoped is not None:
+        patch_plan = _shard_scoped_patch_plan(root, snapshot, scoped[1], target, window)
+    else:
+        patch_plan = get_patch_plan(root, window=window, context=ctx)
     if patch_plan and patch_plan.get("operations"):
         module_ops = [o for o in patch_plan["operations"] if o.get("target_file") == target]
         if module_ops:
@@ -394,6 +434,81 @@ def _resolve_module_arg(module_arg: str, path: Path, nodes: list[str]) -> tuple[
     return None, f"module '{module_arg}' not in graph (run 'eurika scan .' to refresh self_map.json)"
 
 
+def _shard_scoped_snapshot(root: Path, module_arg: str) -> tuple[Any, Dict[str, Any]] | None:
+    """
+    (snapshot, self_map) over the module's shard and its neighbour shards (sharded self_map only).
+
+    Fan-in/fan-out of the module are exact (every importer lives in a neighbour
+    shard); smells and centrality are computed on that neighbourhood. Returns
+    None when no fresh shard manifest exists or the module cannot be resolved.
+    """
+    from eurika.core.snapshot import ArchitectureSnapshot
+    from eurika.smells.detector import detect_architecture_smells
+    from eurika.smells.rules import build_summary
+    from self_map_shards import (
+        build_graph_from_shards,
+        fresh_manifest_for,
+        load_manifest,
+        load_shards,
+        manifest_module_paths,
+        shards_for_module,
+    )
+
+    manifest_path = fresh_manifest_for(root / "self_map.json")
+    if manifest_path is None:
+        return None
+    try:
+        manifest = load_manifest(manifest_path)
+        target, error = _resolve_module_arg(module_arg, root, manifest_module_paths(manifest))
+        if error or not target:
+            return None
+        scope = shards_for_module(manifest, target)
+        graph = build_graph_from_shards(manifest_path, scope)
+        self_map = load_shards(manifest_path, scope)
+    except (OSError, ValueError, KeyError):
+        return None
+    smells = detect_architecture_smells(graph)
+    summary = build_summary(graph, smells)
+    snapshot = ArchitectureSnapshot(root=root, graph=graph, smells=smells, summary=summary, history=None, diff=None)
+    return snapshot, self_map
+
+
+def _shard_scoped_patch_plan(
+    root: Path, snapshot: Any, self_map: Dict[str, Any], target: str, window: int
+) -> Dict[str, Any] | None:
+    """Patch plan for target alone, built from the shard-scoped snapshot (no full-project graph)."""
+    from architecture_planner import build_patch_plan
+    from eurika.reasoning.graph_ops import priority_from_graph
+    from eurika.storage.global_memory import get_merged_learning_stats
+
+    graph, smells, summary = snapshot.graph, snapshot.smells, snapshot.summary or {}
+    # Ranking within a neighbourhood says nothing about the project: keep the target only.
+    priorities = [
+        p
+        for p in priority_from_graph(graph, smells, summary_risks=summary.get("risks"), top_n=len(graph.nodes))
+        if p["name"] == target
+    ]
+    try:
+        learning_stats = get_merged_learning_stats(root)
+    except Exception:
+        learning_stats = None
+    history_info = _history_info(root, window)
+    try:
+        plan = build_patch_plan(
+            project_root=str(root),
+            summary=summary,
+            smells=smells,
+            history_info=history_info,
+            priorities=priorities,
+            learning_stats=learning_stats or None,
+            graph=graph,
+            self_map=self_map,
+        )
+    except Exception:
+        return None
+    return plan.to_dict()
+
+
 def get_suggest_plan_text(project_root: Path, window: int = 5) -> str:
     """
     Build suggest-plan text (ROADMAP 3.1-arch.5).
@@ -429,17 +544,19 @@ def clean_imports_scan_apply(project_root: Path, apply_changes: bool) -> list[st
     """
     from code_awareness import CodeAwareness
     from eurika.refactor.remove_unused_import import remove_unused_imports
+    from eurika.refactor.unused_import_index import find_unused_imports
 
     root = Path(project_root).resolve()
     aw = CodeAwareness(root=root)
     files = aw.scan_python_files()
     files = [f for f in files if f.name != "__init__.py" and not f.name.endswith("_api.py")]
+    rels = [f.relative_to(root).as_posix() for f in files]
     modified: list[str] = []
-    for fpath in files:
+    for rel in find_unused_imports(root, rels):
+        fpath = root / rel
         new_content = remove_unused_imports(fpath)
         if new_content is None:
             continue
-        rel = str(fpath.relative_to(root)) if root in fpath.parents else fpath.name
         modified.append(rel)
         if apply_changes:
             try:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 
 _EXTRACT_NESTED_INTERNAL_SKIP: dict[str, set[str]] = {
@@ -208,50 +208,65 @@ def _emit_code_smell_todo() -> bool:
     )
 
 
-def get_code_smell_operations(project_root: Path) -> List[Dict[str, Any]]:
+def _resolve_only_files(root: Path, only_files: Optional[Iterable[str]]) -> Optional[set[str]]:
+    """Explicit file scope, else EURIKA_CHANGED_SINCE git scope, else None (all files)."""
+    if only_files is not None:
+        return {str(f).replace("\\", "/") for f in only_files}
+    from eurika.utils.git_changes import resolve_scope
+
+    return resolve_scope(root)
+
+
+def get_code_smell_operations(
+    project_root: Path, only_files: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
     """
     Build patch operations for code-level smells (long_function, deep_nesting).
 
-    Uses CodeAwareness.find_smells. For long_function: tries extract_nested_function first;
+    only_files (relative paths) limits the scan; by default it follows EURIKA_CHANGED_SINCE.
+
+    Each file is parsed once; smells and extract suggestions share the tree via
+    SuggestionService (memoised by content hash; overlapping suggestions dropped).
+    For long_function: tries extract_nested_function first;
     if no nested def, tries suggest_extract_block (if/for/while body); else TODO if emit_todo.
     For deep_nesting: suggest_extract_block when EURIKA_DEEP_NESTING_MODE in (heuristic, hybrid).
     """
     from code_awareness import CodeAwareness
-    from eurika.refactor.extract_function import (
-        suggest_extract_block,
-        suggest_extract_nested_function,
-    )
+    from eurika.refactor.suggestions import SuggestionService
 
     root = Path(project_root).resolve()
-    analyzer = CodeAwareness(root)
+    analyzer = CodeAwareness(root, scope=_resolve_only_files(root, only_files))
     allow_extract_nested = _should_try_extract_nested(_load_smell_action_learning_stats(root))
     emit_todo = _emit_code_smell_todo()
     ops: List[Dict[str, Any]] = []
     deep_mode = _deep_nesting_mode()
     fixed_locations: set[tuple[str, str]] = set()
+    suggestions = SuggestionService()
     for file_path in analyzer.scan_python_files():
         rel = str(file_path.relative_to(root)).replace("\\", "/")
-        for smell in analyzer.find_smells(file_path):
+        parsed = suggestions.parsed(file_path)
+        if parsed is None:
+            continue
+        for smell in analyzer.smells_in_tree(parsed.tree, parsed.lines, str(file_path.relative_to(root))):
             loc_key = (rel, smell.location)
             if smell.kind == "long_function":
                 if allow_extract_nested:
-                    suggestion = suggest_extract_nested_function(file_path, smell.location)
-                    if suggestion:
+                    suggestion = suggestions.extract_nested(file_path, smell.location)
+                    if suggestion and not _should_skip_extract_nested_candidate(rel, suggestion[0]):
                         nested_name, line_count, extra_params = (
                             suggestion[0],
                             suggestion[1],
                             (suggestion[2] if len(suggestion) > 2 else []),
                         )
-                        if _should_skip_extract_nested_candidate(rel, nested_name):
-                            continue
                         ops.append(
                             _build_extract_nested_op(
                                 rel, smell.location, nested_name, line_count, extra_params or None
                             )
                         )
+                        suggestions.claim(file_path)
                         fixed_locations.add(loc_key)
                         continue
-                block_suggestion = suggest_extract_block(file_path, smell.location, min_lines=5)
+                block_suggestion = suggestions.extract_block(file_path, smell.location, min_lines=5)
                 if block_suggestion and not _should_skip_extract_block_target(rel):
                     helper_name, block_line, line_count, extra = block_suggestion
                     ops.append(
@@ -265,13 +280,14 @@ def get_code_smell_operations(project_root: Path) -> List[Dict[str, Any]]:
                             smell_type="long_function",
                         )
                     )
+                    suggestions.claim(file_path)
                     fixed_locations.add(loc_key)
                     continue
             if smell.kind == "deep_nesting":
                 if deep_mode == "skip" or loc_key in fixed_locations:
                     continue
                 if deep_mode in ("heuristic", "hybrid"):
-                    block_suggestion = suggest_extract_block(file_path, smell.location)
+                    block_suggestion = suggestions.extract_block(file_path, smell.location)
                     if block_suggestion and not _should_skip_extract_block_target(rel):
                         helper_name, block_line, line_count, extra = block_suggestion
                         ops.append(
@@ -279,6 +295,7 @@ def get_code_smell_operations(project_root: Path) -> List[Dict[str, Any]]:
                                 rel, smell.location, helper_name, block_line, line_count, extra or None
                             )
                         )
+                        suggestions.claim(file_path)
                         fixed_locations.add(loc_key)
                         continue
             if not emit_todo:
@@ -294,20 +311,30 @@ _REMOVE_UNUSED_IMPORT_SKIP: frozenset[str] = frozenset({
 })
 
 
-def get_clean_imports_operations(project_root: Path) -> List[Dict[str, Any]]:
+def get_clean_imports_operations(
+    project_root: Path, only_files: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
     """
     Build patch operations to remove unused imports (ROADMAP 2.4.2).
 
-    Scans Python files (excludes __init__.py, *_api.py, venv, .git).
+    Scans Python files (excludes __init__.py, *_api.py, venv, .git); only_files
+    (relative paths) limits the scan, by default following EURIKA_CHANGED_SINCE.
+    Detection goes through the stamp-keyed unused-import index (no rewrite/unparse
+    at planning time; unchanged files are not re-parsed).
     Returns list of op dicts for patch_apply (kind="remove_unused_import").
     """
-    from eurika.refactor.remove_unused_import import remove_unused_imports
+    from eurika.refactor.unused_import_index import find_unused_imports
 
     root = Path(project_root).resolve()
     skip_dirs = {"venv", ".venv", "node_modules", ".git", "__pycache__", ".eurika_backups"}
     facade_modules = {"patch_engine.py", "patch_apply.py"}
-    ops: List[Dict[str, Any]] = []
-    for p in sorted(root.rglob("*.py")):
+    scope = _resolve_only_files(root, only_files)
+    if scope is None:
+        candidates = sorted(root.rglob("*.py"))
+    else:
+        candidates = [root / rel for rel in sorted(scope)]
+    targets: List[str] = []
+    for p in candidates:
         if any(skip in p.parts for skip in skip_dirs):
             continue
         if p.name == "__init__.py" or p.name.endswith("_api.py"):
@@ -321,15 +348,14 @@ def get_clean_imports_operations(project_root: Path) -> List[Dict[str, Any]]:
             continue
         if rel.startswith("tests/"):
             continue
-        if remove_unused_imports(p) is None:
-            continue
-        ops.append(
-            {
-                "target_file": rel,
-                "kind": "remove_unused_import",
-                "description": f"Remove unused imports from {rel}",
-                "diff": "# Removed unused imports.",
-                "smell_type": None,
-            }
-        )
-    return ops
+        targets.append(rel)
+    return [
+        {
+            "target_file": rel,
+            "kind": "remove_unused_import",
+            "description": f"Remove unused imports from {rel}",
+            "diff": "# Removed unused imports.",
+            "smell_type": None,
+        }
+        for rel in find_unused_imports(root, targets)
+    ]
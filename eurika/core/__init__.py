@@ -1,11 +1,11 @@
 """Core orchestration layer (facade).
 
 For now this package re-exports the existing flat-core modules
-(`core.pipeline`, `core.snapshot`) to match the target layout without
+(`core.pipeline`, `core.snapshot`, `core.cycle_context`) to match the target layout without
 changing behaviour.
 """
 
-from . import pipeline, snapshot  # noqa: F401
+from . import cycle_context, pipeline, snapshot  # noqa: F401
 
-__all__ = ["pipeline", "snapshot"]
+__all__ = ["cycle_context", "pipeline", "snapshot"]
 
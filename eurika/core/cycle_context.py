@@ -0,0 +1,8 @@
+"""Facade to the legacy `core.cycle_context` module.
+
+    from eurika.core.cycle_context import CycleContext
+"""
+
+from core.cycle_context import CycleContext
+
+__all__ = ["CycleContext"]
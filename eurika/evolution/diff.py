@@ -4,14 +4,23 @@ Architecture Diff v0.1
 Compares two architecture snapshots (self_map + derived graph/smells)
 and produces an evolution report.
 
+Snapshots built from self_map files are cached by content hash plus a
+fingerprint of the analysis code (<project>/.eurika/snapshots/<sha256>.json,
+newest EURIKA_SNAPSHOT_CACHE_KEEP kept); diffs run on the stored summaries,
+and the dependency edge-set diff is a sorted merge.
+
 Supports both legacy ArchSnapshot (from self_map path) and core.ArchitectureSnapshot.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from eurika.analysis.metrics import summarize_graph
 from eurika.analysis.graph import ProjectGraph
@@ -28,6 +37,16 @@ if TYPE_CHECKING:
     from core.snapshot import ArchitectureSnapshot
 
 
+SNAPSHOT_CACHE_VERSION = 2
+SNAPSHOT_CACHE_DIR = Path(".eurika") / "snapshots"
+SNAPSHOT_CACHE_KEEP_ENV = "EURIKA_SNAPSHOT_CACHE_KEEP"
+DEFAULT_SNAPSHOT_CACHE_KEEP = 64
+
+# content hash -> ArchSnapshot (process-wide; snapshots are immutable per hash)
+_SNAPSHOT_MEMO: Dict[str, "ArchSnapshot"] = {}
+_SNAPSHOT_MEMO_SIZE = 32
+
+
 @dataclass
 class ArchSnapshot:
     path: Path
@@ -35,9 +54,86 @@ class ArchSnapshot:
     graph_summary: Dict
     smells: List[ArchSmell]
     summary: Dict  # eurika.smells.summary.build_summary result
+    fan: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # module -> (fan_in, fan_out)
+    edges: List[Tuple[str, str]] = field(default_factory=list)  # sorted, unique (src, dst)
+    content_hash: str = ""
+
+
+_DETECTOR_VERSION: Optional[str] = None
+
+
+def detector_version() -> str:
+    """Digest of the code that turns a self_map into a snapshot (graph, smells, summary, metrics)."""
+    global _DETECTOR_VERSION
+    if _DETECTOR_VERSION is None:
+        digest = hashlib.sha256()
+        for obj in (ProjectGraph, detect_architecture_smells, build_summary, summarize_graph):
+            source = getattr(sys.modules.get(obj.__module__), "__file__", None)
+            try:
+                digest.update(Path(source).read_bytes() if source else obj.__module__.encode())
+            except OSError:
+                digest.update(obj.__module__.encode())
+        _DETECTOR_VERSION = digest.hexdigest()[:16]
+    return _DETECTOR_VERSION
+
+
+def self_map_content_hash(self_map_path: Path) -> str:
+    """sha256 of the self_map file bytes (+ cache format and detector version)."""
+    digest = hashlib.sha256(f"v{SNAPSHOT_CACHE_VERSION}:{detector_version()}:".encode())
+    with Path(self_map_path).open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _default_cache_dir(self_map_path: Path) -> Optional[Path]:
+    """<project>/.eurika/snapshots when the self_map sits in a eurika project root; else None (memo only)."""
+    project = Path(self_map_path).resolve().parent
+    if (project / SNAPSHOT_CACHE_DIR.parent).is_dir():
+        return project / SNAPSHOT_CACHE_DIR
+    return None
+
+
+def _cache_keep() -> int:
+    try:
+        return max(0, int(os.environ.get(SNAPSHOT_CACHE_KEEP_ENV, str(DEFAULT_SNAPSHOT_CACHE_KEEP))))
+    except ValueError:
+        return DEFAULT_SNAPSHOT_CACHE_KEEP
+
+
+def prune_snapshot_cache(cache_dir: Path, *, keep: Optional[int] = None, current: str = "") -> List[str]:
+    """
+    Delete the least recently used cached snapshots beyond `keep` (0 = keep all).
+
+    current (the entry just written) is never removed. Returns removed file names.
+    """
+    keep = _cache_keep() if keep is None else keep
+    if keep <= 0:
+        return []
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.name != current:
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.name))
+                    except OSError:
+                        continue
+    except OSError:
+        return []
+    removed: List[str] = []
+    for _, name in sorted(entries)[: max(0, len(entries) + (1 if current else 0) - keep)]:
+        try:
+            (Path(cache_dir) / name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            continue
+        removed.append(name)
+    return removed
 
 
-def build_snapshot(self_map_path: Path) -> ArchSnapshot:
+def _compute_snapshot(self_map_path: Path, content_hash: str) -> ArchSnapshot:
     self_map = load_self_map(self_map_path)
     graph = ProjectGraph.from_self_map(self_map)
     smells = detect_architecture_smells(graph)
@@ -50,9 +146,106 @@ def build_snapshot(self_map_path: Path) -> ArchSnapshot:
         graph_summary=graph_sum,
         smells=smells,
         summary=summary,
+        fan=graph.fan_in_out(),
+        edges=_sorted_edges(graph),
+        content_hash=content_hash,
+    )
+
+
+def _snapshot_to_dict(snap: ArchSnapshot) -> Dict:
+    return {
+        "version": SNAPSHOT_CACHE_VERSION,
+        "modules": snap.modules,
+        "graph_summary": snap.graph_summary,
+        "smells": [asdict(s) for s in snap.smells],
+        "summary": snap.summary,
+        "fan": {m: list(v) for m, v in snap.fan.items()},
+        "edges": [list(e) for e in snap.edges],
+    }
+
+
+def _snapshot_from_dict(path: Path, content_hash: str, data: Dict) -> ArchSnapshot:
+    return ArchSnapshot(
+        path=path,
+        modules=list(data.get("modules") or []),
+        graph_summary=data.get("graph_summary") or {},
+        smells=[ArchSmell(**s) for s in data.get("smells") or []],
+        summary=data.get("summary") or {},
+        fan={m: (int(v[0]), int(v[1])) for m, v in (data.get("fan") or {}).items()},
+        edges=[(e[0], e[1]) for e in data.get("edges") or []],
+        content_hash=content_hash,
     )
 
 
+def build_snapshot(self_map_path: Path, cache_dir: Optional[Path] = None) -> ArchSnapshot:
+    """
+    Snapshot (graph metrics, smells, maturity, centrality, edge set) for a self_map.
+
+    Snapshots are memoised in process and persisted under cache_dir (default: the
+    project's .eurika/snapshots/ when the self_map sits next to an existing .eurika/;
+    self_maps elsewhere are only memoised), keyed by the self_map content hash and
+    detector_version(); an unchanged self_map (e.g. main's, diffed against every PR)
+    is analysed once. Writing a new entry prunes the cache to EURIKA_SNAPSHOT_CACHE_KEEP.
+    """
+    self_map_path = Path(self_map_path)
+    content_hash = self_map_content_hash(self_map_path)
+    memo = _SNAPSHOT_MEMO.get(content_hash)
+    if memo is not None:
+        return replace(memo, path=self_map_path)
+    cache_root = Path(cache_dir) if cache_dir is not None else _default_cache_dir(self_map_path)
+    cache_file = cache_root / f"{content_hash}.json" if cache_root is not None else None
+    snap: Optional[ArchSnapshot] = None
+    if cache_file is not None and cache_file.is_file():
+        try:
+            snap = _snapshot_from_dict(self_map_path, content_hash, json.loads(cache_file.read_text(encoding="utf-8")))
+            os.utime(cache_file)  # recently used: pruned last
+        except (OSError, ValueError, TypeError, KeyError, IndexError):
+            snap = None
+    if snap is None:
+        snap = _compute_snapshot(self_map_path, content_hash)
+        if cache_root is not None and cache_file is not None:
+            try:
+                cache_root.mkdir(parents=True, exist_ok=True)
+                tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(_snapshot_to_dict(snap), ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp, cache_file)
+            except OSError:
+                pass
+            else:
+                prune_snapshot_cache(cache_root, current=cache_file.name)
+    _SNAPSHOT_MEMO[content_hash] = snap
+    if len(_SNAPSHOT_MEMO) > _SNAPSHOT_MEMO_SIZE:
+        _SNAPSHOT_MEMO.pop(next(iter(_SNAPSHOT_MEMO)))
+    return snap
+
+
+def _sorted_edges(graph: ProjectGraph) -> List[Tuple[str, str]]:
+    return sorted({(src, dst) for src, dsts in graph.edges.items() for dst in dsts})
+
+
+def diff_edge_sets(
+    old_edges: List[Tuple[str, str]], new_edges: List[Tuple[str, str]]
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """(added, removed) between two sorted, unique edge lists — single sorted merge pass."""
+    added: List[Tuple[str, str]] = []
+    removed: List[Tuple[str, str]] = []
+    i = j = 0
+    while i < len(old_edges) and j < len(new_edges):
+        a, b = old_edges[i], new_edges[j]
+        if a == b:
+            i += 1
+            j += 1
+        elif a < b:
+            removed.append(a)
+            i += 1
+        else:
+            added.append(b)
+            j += 1
+    removed.extend(old_edges[i:])
+    added.extend(new_edges[j:])
+    return added, removed
+
+
 def _smell_counts(smells: List[ArchSmell]) -> Dict[str, int]:
     counts: Dict[str, int] = {}
     for s in smells:
@@ -92,7 +285,10 @@ def diff_architecture_snapshots(
     """Diff two core.ArchitectureSnapshot instances. Same output shape as diff_snapshots."""
     old_modules = sorted(old.graph.nodes)
     new_modules = sorted(new.graph.nodes)
-    structures = _compute_structural_diff_from_modules(old_modules, new_modules)
+    structures: Dict[str, List] = dict(_compute_structural_diff_from_modules(old_modules, new_modules))
+    added, removed = diff_edge_sets(_sorted_edges(old.graph), _sorted_edges(new.graph))
+    structures["edges_added"] = [list(e) for e in added]
+    structures["edges_removed"] = [list(e) for e in removed]
 
     old_fan = old.graph.fan_in_out()
     new_fan = new.graph.fan_in_out()
@@ -168,15 +364,24 @@ def _compute_smell_diff_from_smells(
     ]
 
 
-def _compute_structural_diff(old: ArchSnapshot, new: ArchSnapshot) -> Dict[str, List[str]]:
-    return _compute_structural_diff_from_modules(old.modules, new.modules)
+def _compute_structural_diff(old: ArchSnapshot, new: ArchSnapshot) -> Dict[str, List]:
+    structures: Dict[str, List] = dict(_compute_structural_diff_from_modules(old.modules, new.modules))
+    added, removed = diff_edge_sets(old.edges, new.edges)
+    structures["edges_added"] = [list(e) for e in added]
+    structures["edges_removed"] = [list(e) for e in removed]
+    return structures
+
+
+def _snapshot_fan(snap: ArchSnapshot) -> Dict[str, Tuple[int, int]]:
+    if snap.fan or not snap.modules:
+        return snap.fan
+    # Snapshot built without stored centrality (older callers): derive from self_map.
+    return ProjectGraph.from_self_map(load_self_map(snap.path)).fan_in_out()
 
 
 def _compute_centrality_shifts(old: ArchSnapshot, new: ArchSnapshot) -> List[Dict[str, object]]:
-    old_fan = ProjectGraph.from_self_map(load_self_map(old.path)).fan_in_out()
-    new_fan = ProjectGraph.from_self_map(load_self_map(new.path)).fan_in_out()
     return _compute_centrality_shifts_from_fan(
-        old.modules, new.modules, old_fan, new_fan
+        old.modules, new.modules, _snapshot_fan(old), _snapshot_fan(new)
     )
 
 
@@ -332,6 +537,9 @@ def _append_structural_changes(lines: List[str], structures: Dict[str, List[str]
     for m in structures["modules_removed"]:
         lines.append(f"  - {m}")
     lines.append(f"~ modules unchanged: {len(structures['modules_common'])}")
+    if "edges_added" in structures:
+        lines.append(f"+ dependencies added: {len(structures['edges_added'])}")
+        lines.append(f"- dependencies removed: {len(structures['edges_removed'])}")
     lines.append("")
 
 
@@ -7,19 +7,23 @@ Stores architectural snapshots over time and derives trends:
 - smell dynamics
 - basic regression detection
 - version, git_commit (optional), risk_score
+
+v0.7: append-only JSONL rows + fixed-width metric index; O(window) queries;
+git commit read from .git/HEAD/refs without a subprocess.
 """
 from __future__ import annotations
 import json
-import re
-import subprocess
+import os
+import struct
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from eurika.analysis.graph import ProjectGraph
 from eurika.analysis.metrics import summarize_graph
 from eurika.smells.detector import ArchSmell
 from eurika.reasoning.graph_ops import metrics_from_graph
+from eurika.utils.fs import LOCK_FILE, file_lock
 
 def _ascii_bar(value: int, max_val: int=100, width: int=10) -> str:
     """Simple ASCII bar: [████░░░░░░] 40/100."""
@@ -30,28 +34,86 @@ def _ascii_bar(value: int, max_val: int=100, width: int=10) -> str:
     return f'[{bar}] {value}/{max_val}'
 
 def _read_version(project_root: Path) -> Optional[str]:
-    """Read version from pyproject.toml. Returns None if not found."""
-    path = project_root / 'pyproject.toml'
-    if not path.exists():
-        return None
-    try:
-        text = path.read_text(encoding='utf-8')
-        m = re.search('version\\s*=\\s*["\\\']([^"\\\']+)["\\\']', text)
-        return m.group(1) if m else None
-    except (OSError, UnicodeDecodeError):
-        return None
+    """Read [project] version from pyproject.toml. Returns None if not found."""
+    from eurika.utils.config import load_settings
+    return load_settings(project_root).project_version
+
+def _git_dir(project_root: Path) -> Optional[Path]:
+    """Resolve .git directory (supports worktrees where .git is a 'gitdir:' file)."""
+    dot_git = project_root / '.git'
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        try:
+            text = dot_git.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        if text.startswith('gitdir:'):
+            path = Path(text[len('gitdir:'):].strip())
+            return path if path.is_absolute() else (project_root / path).resolve()
+    return None
+
+def _read_ref(git_dir: Path, ref: str) -> Optional[str]:
+    """Resolve ref via loose ref file, then packed-refs (also checks commondir for worktrees)."""
+    dirs = [git_dir]
+    common = git_dir / 'commondir'
+    if common.is_file():
+        try:
+            dirs.append((git_dir / common.read_text(encoding='utf-8').strip()).resolve())
+        except OSError:
+            pass
+    for d in dirs:
+        loose = d / ref
+        if loose.is_file():
+            try:
+                return loose.read_text(encoding='utf-8').strip() or None
+            except OSError:
+                return None
+        packed = d / 'packed-refs'
+        if packed.is_file():
+            try:
+                for line in packed.read_text(encoding='utf-8').splitlines():
+                    if line.endswith(' ' + ref) and not line.startswith(('#', '^')):
+                        return line.split(' ', 1)[0]
+            except OSError:
+                return None
+    return None
+
+_GIT_COMMIT_CACHE: Dict[str, Tuple[Tuple[int, ...], Optional[str]]] = {}
 
 def _get_git_commit(project_root: Path) -> Optional[str]:
-    """Get current git commit hash. Returns None if not a git repo or git unavailable."""
-    if not (project_root / '.git').exists():
+    """
+    Current git commit hash (12 chars) read from .git/HEAD and refs — no subprocess.
+
+    Cached per repo; invalidated when HEAD or the checked-out ref file changes.
+    Returns None if not a git repo or HEAD cannot be resolved.
+    """
+    git_dir = _git_dir(Path(project_root))
+    if git_dir is None:
         return None
+    head = git_dir / 'HEAD'
     try:
-        r = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=project_root, capture_output=True, text=True, timeout=5)
-        if r.returncode == 0 and r.stdout:
-            return r.stdout.strip()[:12]
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
-    return None
+        head_st = head.stat()
+        head_text = head.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    ref = head_text[5:].strip() if head_text.startswith('ref:') else None
+    stamp: Tuple[int, ...] = (head_st.st_mtime_ns, head_st.st_size)
+    if ref:
+        for candidate in (git_dir / ref, git_dir / 'packed-refs'):
+            try:
+                st = candidate.stat()
+                stamp += (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamp += (0, 0)
+    key = str(git_dir)
+    cached = _GIT_COMMIT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    commit = _read_ref(git_dir, ref) if ref else head_text
+    commit = commit[:12] if commit else None
+    _GIT_COMMIT_CACHE[key] = (stamp, commit)
+    return commit
 
 @dataclass
 class HistoryPoint:
@@ -66,33 +128,166 @@ class HistoryPoint:
     git_commit: Optional[str] = None
     risk_score: Optional[int] = None
 
+def _point_from_dict(item: Dict) -> HistoryPoint:
+    return HistoryPoint(timestamp=item.get('timestamp', time.time()), modules=item.get('modules', 0), dependencies=item.get('dependencies', 0), cycles=item.get('cycles', 0), max_degree=item.get('max_degree', 0), total_smells=item.get('total_smells', 0), smell_counts=item.get('smell_counts', {}), version=item.get('version'), git_commit=item.get('git_commit'), risk_score=item.get('risk_score'))
+
+# Side index record per snapshot: row offset, row length, then the metric series
+# used by trend/regressions: timestamp, modules, dependencies, cycles,
+# max_degree, total_smells, risk_score (-1 = None).
+_INDEX_RECORD = struct.Struct('<QIdiiiiii')
+
+@dataclass
+class _IndexEntry:
+    offset: int
+    length: int
+    timestamp: float
+    modules: int
+    dependencies: int
+    cycles: int
+    max_degree: int
+    total_smells: int
+    risk_score: int
+
 class ArchitectureHistory:
     """
     Append-only history of architecture snapshots.
-    v0.1: simple JSON file in project root, trend over last N points.
+
+    Storage (v0.7): storage_path (<name>.jsonl) holds one JSON row per snapshot;
+    a fixed-width side index (<storage>.idx) keeps each row's offset and its
+    metric series. trend/detect_regressions/evolution_report seek to the last
+    `window` index records and read at most the oldest/newest rows, so query
+    cost is O(window) regardless of history length. A legacy {"history": [...]}
+    file (<name>.json) is converted on first open and kept as <name>.json.migrated.
     """
 
     def __init__(self, storage_path: Optional[Path]=None):
-        self.storage_path = storage_path or Path('architecture_history.json')
-        self._points: List[HistoryPoint] = []
-        self._load()
+        path = storage_path or Path('architecture_history.jsonl')
+        if path.suffix == '.json':
+            path = path.with_suffix('.jsonl')
+        self.storage_path = path
+        self.legacy_path = path.with_suffix('.json')
+        self.index_path = self.storage_path.with_name(self.storage_path.name + '.idx')
+        self._migrate_legacy()
 
-    def _load(self) -> None:
-        if not self.storage_path.exists():
+    def _migrate_legacy(self) -> None:
+        """Convert legacy <name>.json into <name>.jsonl + index, then rename it to .migrated."""
+        if self.storage_path.exists() or not self.legacy_path.exists():
             return
+        with file_lock(self.storage_path.parent / LOCK_FILE):
+            legacy = self.legacy_path
+            if self.storage_path.exists() or not legacy.exists():
+                return  # another process migrated it meanwhile
+            try:
+                text = legacy.read_text(encoding='utf-8')
+            except OSError:
+                return
+            try:
+                raw = json.loads(text or '{}')
+                if isinstance(raw, dict) and 'timestamp' in raw:
+                    items = [raw]  # single row written in place by an earlier v0.7 build
+                else:
+                    items = raw.get('history', []) if isinstance(raw, dict) else []
+            except ValueError:
+                # rows already rewritten in place by an earlier v0.7 build
+                items = []
+                for line in text.splitlines():
+                    try:
+                        items.append(json.loads(line))
+                    except ValueError:
+                        continue
+            points = [_point_from_dict(item) for item in items if isinstance(item, dict)]
+            tmp = self.storage_path.with_name(f'.{self.storage_path.name}.{os.getpid()}.tmp')
+            try:
+                tmp.write_text(''.join(self._row_text(p) for p in points), encoding='utf-8')
+                os.replace(tmp, self.storage_path)
+            except OSError:
+                return
+            self._rebuild_index()
+            try:
+                legacy.replace(legacy.with_name(legacy.name + '.migrated'))
+                legacy.with_name(legacy.name + '.idx').unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _row_text(point: HistoryPoint) -> str:
+        return json.dumps(asdict(point), ensure_ascii=False) + '\n'
+
+    @staticmethod
+    def _entry_bytes(offset: int, length: int, point: HistoryPoint) -> bytes:
+        risk = -1 if point.risk_score is None else int(point.risk_score)
+        return _INDEX_RECORD.pack(offset, length, float(point.timestamp), int(point.modules), int(point.dependencies), int(point.cycles), int(point.max_degree), int(point.total_smells), risk)
+
+    def _rebuild_index(self) -> None:
+        """Recreate the side index from the rows (after migration or an interrupted append)."""
+        chunks: List[bytes] = []
+        offset = 0
         try:
-            raw = json.loads(self.storage_path.read_text(encoding='utf-8'))
-            for item in raw.get('history', []):
-                self._points.append(HistoryPoint(timestamp=item.get('timestamp', time.time()), modules=item.get('modules', 0), dependencies=item.get('dependencies', 0), cycles=item.get('cycles', 0), max_degree=item.get('max_degree', 0), total_smells=item.get('total_smells', 0), smell_counts=item.get('smell_counts', {}), version=item.get('version'), git_commit=item.get('git_commit'), risk_score=item.get('risk_score')))
-        except (json.JSONDecodeError, OSError):
+            with self.storage_path.open('rb') as fh:
+                for line in fh:
+                    if line.strip():
+                        try:
+                            point = _point_from_dict(json.loads(line))
+                        except ValueError:
+                            point = None
+                        if point is not None:
+                            chunks.append(self._entry_bytes(offset, len(line), point))
+                    offset += len(line)
+        except OSError:
+            return
+        try:
+            tmp = self.index_path.with_name(self.index_path.name + '.tmp')
+            tmp.write_bytes(b''.join(chunks))
+            os.replace(tmp, self.index_path)
+        except OSError:
             pass
 
-    def _save(self) -> None:
-        data = {'history': [asdict(p) for p in self._points]}
+    def _index_count(self) -> int:
+        """Number of indexed rows; rebuilds the index if it does not match the rows file."""
         try:
-            self.storage_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+            rows_size = self.storage_path.stat().st_size
         except OSError:
-            pass
+            return 0
+        size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        count = size // _INDEX_RECORD.size
+        last_end = 0
+        if count:
+            with self.index_path.open('rb') as fh:
+                fh.seek((count - 1) * _INDEX_RECORD.size)
+                last = _INDEX_RECORD.unpack(fh.read(_INDEX_RECORD.size))
+            last_end = last[0] + last[1]
+        if size % _INDEX_RECORD.size or last_end != rows_size:
+            with file_lock(self.storage_path.parent / LOCK_FILE):
+                self._rebuild_index()
+            size = self.index_path.stat().st_size if self.index_path.exists() else 0
+            count = size // _INDEX_RECORD.size
+        return count
+
+    def _tail_entries(self, window: int) -> List[_IndexEntry]:
+        """Last `window` index records (all when window <= 0 or larger than history)."""
+        count = self._index_count()
+        if count == 0:
+            return []
+        k = count if window <= 0 or window > count else window
+        with self.index_path.open('rb') as fh:
+            fh.seek((count - k) * _INDEX_RECORD.size)
+            raw = fh.read(k * _INDEX_RECORD.size)
+        return [_IndexEntry(*rec) for rec in _INDEX_RECORD.iter_unpack(raw)]
+
+    def _read_rows(self, entries: List[_IndexEntry]) -> List[HistoryPoint]:
+        points: List[HistoryPoint] = []
+        if not entries:
+            return points
+        with self.storage_path.open('rb') as fh:
+            for e in entries:
+                fh.seek(e.offset)
+                points.append(_point_from_dict(json.loads(fh.read(e.length))))
+        return points
+
+    @property
+    def _points(self) -> List[HistoryPoint]:
+        """All snapshots (full read; queries use the index tail instead)."""
+        return self.points(0)
 
     def _smell_counts(self, smells: List[ArchSmell]) -> Dict[str, int]:
         counts: Dict[str, int] = {}
@@ -101,35 +296,47 @@ class ArchitectureHistory:
         return counts
 
     def append(self, graph: ProjectGraph, smells: List[ArchSmell], summary: Dict) -> None:
-        """Append new snapshot to history."""
+        """Append new snapshot to history (one JSONL row + one index record)."""
         project_root = self.storage_path.parent.resolve()
-        g_sum = summarize_graph(graph)
         fan = graph.fan_in_out()
         degrees = {n: fi + fo for n, (fi, fo) in fan.items()}
         max_degree = max(degrees.values()) if degrees else 0
         smell_counts = self._smell_counts(smells)
         total_smells = sum(smell_counts.values())
         sys = summary.get('system', {})
+        if all(k in sys for k in ('modules', 'dependencies', 'cycles')):
+            g_sum: Dict = {}
+        else:
+            g_sum = summarize_graph(graph)
         version = _read_version(project_root)
         git_commit = _get_git_commit(project_root)
         trends = self.trend(window=5)
         metrics = metrics_from_graph(graph, smells, trends)  # ROADMAP 3.1.3
         risk_score = int(metrics["risk_score"])
         point = HistoryPoint(timestamp=time.time(), modules=int(sys.get('modules', g_sum.get('nodes', 0))), dependencies=int(sys.get('dependencies', g_sum.get('edges', 0))), cycles=int(sys.get('cycles', len(g_sum.get('cycles', [])))), max_degree=int(max_degree), total_smells=int(total_smells), smell_counts=smell_counts, version=version, git_commit=git_commit, risk_score=risk_score)
-        self._points.append(point)
-        self._save()
+        row = self._row_text(point).encode('utf-8')
+        try:
+            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+            with file_lock(self.storage_path.parent / LOCK_FILE):
+                self._index_count()  # heal index before extending it
+                with self.storage_path.open('ab') as fh:
+                    offset = fh.tell()
+                    fh.write(row)
+                with self.index_path.open('ab') as fh:
+                    fh.write(self._entry_bytes(offset, len(row), point))
+        except OSError:
+            pass
 
-    def _window(self, window: int) -> List[HistoryPoint]:
-        if window <= 0 or window > len(self._points):
-            return list(self._points)
-        return self._points[-window:]
+    def points(self, window: int=0) -> List[HistoryPoint]:
+        """Last `window` snapshots, oldest first (all when window <= 0)."""
+        return self._read_rows(self._tail_entries(window))
 
     def trend(self, window: int=5) -> Dict[str, str]:
         """
         Compute simple trends over last N points:
         - increasing / decreasing / stable for complexity, smells, centralization.
         """
-        pts = self._window(window)
+        pts = self._tail_entries(window)
         if len(pts) < 2:
             return {'complexity': 'insufficient_data', 'smells': 'insufficient_data', 'centralization': 'insufficient_data'}
 
@@ -153,11 +360,11 @@ class ArchitectureHistory:
         - smells jump up (total and per-type: god_module, bottleneck, hub)
         - centralization grows fast
         """
-        pts = self._window(window)
+        entries = self._tail_entries(window)
         notes: List[str] = []
-        if len(pts) < 2:
+        if len(entries) < 2:
             return notes
-        oldest, newest = (pts[0], pts[-1])
+        oldest, newest = self._read_rows([entries[0], entries[-1]])
         old_counts = oldest.smell_counts
         new_counts = newest.smell_counts
         if newest.cycles > oldest.cycles:
@@ -215,11 +422,12 @@ class ArchitectureHistory:
             lines.append('Interpretation: structural issues are accumulating. Prioritize breaking emerging bottlenecks and reducing smell growth.')
 
     def evolution_report(self, window: int=5, ascii_chart: bool=True) -> str:
-        pts = self._window(window)
-        if not pts:
+        entries = self._tail_entries(window)
+        if not entries:
             return 'No architecture history yet.'
         trends = self.trend(window)
         regressions = self.detect_regressions(window)
+        pts = self._read_rows([entries[0], entries[-1]] if len(entries) >= 2 else entries)
         newest = pts[-1]
         oldest = pts[0]
         lines: List[str] = []
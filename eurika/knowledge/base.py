@@ -4,6 +4,8 @@ Knowledge Provider Layer (ROADMAP после 1.0 / review.md).
 Абстракция: KnowledgeProvider.query(topic) -> StructuredKnowledge.
 Не «поиск в интернете», а проверка через curated-источники.
 LocalKnowledgeProvider — JSON-кэш; OfficialDocsProvider — опционально запрос по фиксированному URL (stdlib).
+CompositeKnowledgeProvider опрашивает провайдеров параллельно (пул потоков, дедлайн на провайдера);
+URL-кэш держит LRU в памяти процесса поверх JSON-файлов; файловые провайдеры перечитывают файл по mtime.
 """
 
 from __future__ import annotations
@@ -11,13 +13,16 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+import threading
 import time
 import urllib.error
 import urllib.request
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -41,26 +46,53 @@ class KnowledgeProvider(ABC):
         """Вернуть знания по теме. Не выполнять произвольный поиск в интернете."""
         pass
 
+    def query_many(self, topics: List[str]) -> List[StructuredKnowledge]:
+        """Знания по нескольким темам (в порядке topics). По умолчанию — последовательно."""
+        return [self.query(t) for t in topics]
+
 
 def _topic_key(topic: str) -> str:
     """Нормализация темы для ключа кэша."""
     return topic.strip().lower().replace(" ", "_") if topic else ""
 
 
+def _file_stamp(path: Optional[Path]) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) файла или None, если файла нет."""
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 class LocalKnowledgeProvider(KnowledgeProvider):
     """Локальный кэш из JSON. Формат: {"topics": {"topic_id": [{"title": "...", "content": "..."}, ...]}}."""
 
     def __init__(self, cache_path: str | Path | None = None) -> None:
         self.cache_path = Path(cache_path) if cache_path else None
         self._cache: Dict[str, List[Dict[str, Any]]] = {}
-        if self.cache_path and self.cache_path.exists():
-            try:
-                data = json.loads(self.cache_path.read_text(encoding="utf-8"))
-                self._cache = data.get("topics", data) if isinstance(data, dict) else {}
-            except (json.JSONDecodeError, OSError):
-                self._cache = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._reload_if_changed()
+
+    def _reload_if_changed(self) -> None:
+        """Перечитать JSON, если файл изменился (mtime/size) с прошлой загрузки."""
+        stamp = _file_stamp(self.cache_path)
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp
+        self._cache = {}
+        if stamp is None:
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            self._cache = data.get("topics", data) if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            self._cache = {}
 
     def query(self, topic: str) -> StructuredKnowledge:
+        self._reload_if_changed()
         key = _topic_key(topic)
         fragments = self._cache.get(key, []) if key else []
         if not isinstance(fragments, list):
@@ -130,16 +162,57 @@ def _fetch_url(url: str, timeout: float = 5.0, max_chars: int = 8000) -> Optiona
 
 # Rate limit: min seconds between network fetches (ROADMAP 3.0.3)
 _last_fetch_time: float = 0.0
+_rate_limit_lock = threading.Lock()
 
 
 def _rate_limit_fetch(min_interval: float) -> None:
-    """Throttle network requests (ROADMAP 3.0.3)."""
+    """Throttle network requests (ROADMAP 3.0.3). Shared across provider threads.
+
+    Each caller reserves the next free slot under the lock and sleeps after
+    releasing it, so waiting threads do not hold up the reservation of others.
+    """
     global _last_fetch_time
-    now = time.time()
-    elapsed = now - _last_fetch_time
-    if min_interval > 0 and elapsed < min_interval and _last_fetch_time > 0:
-        time.sleep(min_interval - elapsed)
-    _last_fetch_time = time.time()
+    with _rate_limit_lock:
+        now = time.time()
+        slot = now
+        if min_interval > 0 and _last_fetch_time > 0:
+            slot = max(now, _last_fetch_time + min_interval)
+        _last_fetch_time = slot
+    if slot > now:
+        time.sleep(slot - now)
+
+
+# Process-wide LRU in front of the per-URL JSON cache:
+# cache_path -> (file stamp, fetched_at, content). A changed file stamp invalidates the entry.
+_URL_MEMO_MAX = 256
+_url_memo: "OrderedDict[str, Tuple[Optional[Tuple[int, int]], float, Optional[str]]]" = OrderedDict()
+_url_memo_lock = threading.Lock()
+
+
+def _url_memo_get(cache_path: Path) -> Optional[Tuple[float, Optional[str]]]:
+    key = str(cache_path)
+    with _url_memo_lock:
+        entry = _url_memo.get(key)
+        if entry is None or entry[0] != _file_stamp(cache_path):
+            return None
+        _url_memo.move_to_end(key)
+        return entry[1], entry[2]
+
+
+def _url_memo_put(cache_path: Path, fetched_at: float, content: Optional[str]) -> None:
+    key = str(cache_path)
+    stamp = _file_stamp(cache_path)
+    with _url_memo_lock:
+        _url_memo[key] = (stamp, fetched_at, content)
+        _url_memo.move_to_end(key)
+        while len(_url_memo) > _URL_MEMO_MAX:
+            _url_memo.popitem(last=False)
+
+
+def clear_url_memo() -> None:
+    """Drop the in-memory URL cache (on-disk JSON files are kept)."""
+    with _url_memo_lock:
+        _url_memo.clear()
 
 
 def _fetch_url_cached(
@@ -151,16 +224,24 @@ def _fetch_url_cached(
     force_online: bool = False,
     rate_limit_seconds: float = 0.0,
 ) -> Optional[str]:
-    """Fetch URL; use cache if fresh (within TTL) unless force_online; else fetch and write (ROADMAP 3.0.3)."""
+    """Fetch URL; use cache if fresh (within TTL) unless force_online; else fetch and write (ROADMAP 3.0.3).
+
+    Fresh entries are served from the in-process LRU first, then from the JSON file.
+    """
     now = time.time()
-    if not force_online and cache_path.exists():
-        try:
-            data = json.loads(cache_path.read_text(encoding="utf-8"))
-            fetched_at = data.get("fetched_at") or 0
-            if now - fetched_at < ttl_seconds:
-                return data.get("content")
-        except (json.JSONDecodeError, OSError):
-            pass
+    if not force_online:
+        memo = _url_memo_get(cache_path)
+        if memo is not None and now - memo[0] < ttl_seconds:
+            return memo[1]
+        if cache_path.exists():
+            try:
+                data = json.loads(cache_path.read_text(encoding="utf-8"))
+                fetched_at = data.get("fetched_at") or 0
+                if now - fetched_at < ttl_seconds:
+                    _url_memo_put(cache_path, fetched_at, data.get("content"))
+                    return data.get("content")
+            except (json.JSONDecodeError, OSError):
+                pass
     if rate_limit_seconds > 0:
         _rate_limit_fetch(rate_limit_seconds)
     text = _fetch_url(url, timeout=timeout, max_chars=max_chars)
@@ -171,6 +252,7 @@ def _fetch_url_cached(
                 json.dumps({"content": text, "url": url, "fetched_at": now}, ensure_ascii=False),
                 encoding="utf-8",
             )
+            _url_memo_put(cache_path, now, text)
         except OSError:
             pass
     return text
@@ -358,15 +440,23 @@ class OSSPatternProvider(KnowledgeProvider):
     def __init__(self, library_path: Path | None) -> None:
         self.library_path = Path(library_path) if library_path else None
         self._cache: dict[str, list] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
 
     def _load(self) -> dict:
-        if not self.library_path or not self.library_path.exists():
+        """Библиотека паттернов; файл перечитывается только при смене mtime/size."""
+        stamp = _file_stamp(self.library_path)
+        if stamp is None:
+            self._cache, self._stamp = {}, None
             return {}
+        if stamp == self._stamp:
+            return self._cache
         try:
             from eurika.learning.pattern_library import load_pattern_library
-            return load_pattern_library(self.library_path)
+            self._cache = load_pattern_library(self.library_path)
         except Exception:
-            return {}
+            self._cache = {}
+        self._stamp = stamp
+        return self._cache
 
     def query(self, topic: str) -> StructuredKnowledge:
         key = _topic_key(topic)
@@ -404,25 +494,122 @@ class OSSPatternProvider(KnowledgeProvider):
 
 
 class CompositeKnowledgeProvider(KnowledgeProvider):
-    """Объединяет несколько провайдеров: по каждой теме запрашивает всех и склеивает фрагменты."""
+    """Объединяет несколько провайдеров: по каждой теме запрашивает всех и склеивает фрагменты.
+
+    Провайдеры опрашиваются параллельно в пуле потоков (max_workers, по умолчанию до 8).
+    timeout — дедлайн в секундах на каждый запрос (тема×провайдер), отсчитываемый с момента,
+    когда запрос реально начал выполняться: ожидание в очереди пула не засчитывается.
+    Не уложившиеся провайдеры пропускаются и перечисляются в meta["timed_out"]; запросы, которые
+    так и не стартовали, потому что все потоки заняты зависшими провайдерами, — в meta["skipped"].
+    Провайдер, бросивший исключение, пропускается (meta["failed"]), остальные результаты сохраняются.
+    Порядок фрагментов — порядок провайдеров.
+    """
 
-    def __init__(self, providers: List[KnowledgeProvider]) -> None:
+    def __init__(
+        self,
+        providers: List[KnowledgeProvider],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
         self.providers = list(providers)
+        self.max_workers = max_workers
+        self.timeout = timeout
 
     def query(self, topic: str) -> StructuredKnowledge:
-        all_fragments: List[Dict[str, Any]] = []
-        for p in self.providers:
-            kn = p.query(topic)
-            if not kn.is_empty():
+        return self.query_many([topic])[0]
+
+    def query_many(self, topics: List[str]) -> List[StructuredKnowledge]:
+        """Все (тема, провайдер) запрашиваются одним пакетом; результаты — в порядке topics."""
+        results, timed_out, failed, skipped = self._fan_out(topics)
+        out: List[StructuredKnowledge] = []
+        for ti, topic in enumerate(topics):
+            all_fragments: List[Dict[str, Any]] = []
+            for pi in range(len(self.providers)):
+                kn = results.get((ti, pi))
+                if kn is None or kn.is_empty():
+                    continue
                 for f in kn.fragments:
                     frag = dict(f)
                     title = frag.get("title") or ""
                     if kn.source and not title.startswith("["):
                         frag["title"] = f"[{kn.source}] {title}"
                     all_fragments.append(frag)
-        return StructuredKnowledge(
-            topic=topic,
-            source="composite",
-            fragments=all_fragments,
-            meta={"providers": len(self.providers)},
-        )
+            meta: Dict[str, Any] = {"providers": len(self.providers)}
+            late = [type(self.providers[pi]).__name__ for pi in sorted(timed_out.get(ti, ()))]
+            if late:
+                meta["timed_out"] = late
+            broken = [type(self.providers[pi]).__name__ for pi in sorted(failed.get(ti, ()))]
+            if broken:
+                meta["failed"] = broken
+            unstarted = [type(self.providers[pi]).__name__ for pi in sorted(skipped.get(ti, ()))]
+            if unstarted:
+                meta["skipped"] = unstarted
+            out.append(StructuredKnowledge(topic=topic, source="composite", fragments=all_fragments, meta=meta))
+        return out
+
+    def _fan_out(
+        self, topics: List[str]
+    ) -> Tuple[Dict[Tuple[int, int], StructuredKnowledge], Dict[int, set], Dict[int, set], Dict[int, set]]:
+        """(results, timed out, failed, never started) providers per topic; deadlines run from each job's start."""
+        jobs = [(ti, pi) for ti in range(len(topics)) for pi in range(len(self.providers))]
+        results: Dict[Tuple[int, int], StructuredKnowledge] = {}
+        timed_out: Dict[int, set] = {}
+        failed: Dict[int, set] = {}
+        skipped: Dict[int, set] = {}
+        if not jobs:
+            return results, timed_out, failed, skipped
+        if len(jobs) == 1 and self.timeout is None:
+            ti, pi = jobs[0]
+            try:
+                results[jobs[0]] = self.providers[pi].query(topics[ti])
+            except Exception:
+                failed.setdefault(ti, set()).add(pi)
+            return results, timed_out, failed, skipped
+        workers = self.max_workers or min(len(jobs), 8)
+        started: Dict[Tuple[int, int], float] = {}
+
+        def run(job: Tuple[int, int]) -> StructuredKnowledge:
+            started[job] = time.monotonic()
+            return self.providers[job[1]].query(topics[job[0]])
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eurika-knowledge")
+        try:
+            pending: Dict[Future, Tuple[int, int]] = {pool.submit(run, job): job for job in jobs}
+            overdue: set = set()  # abandoned futures still occupying a worker
+            while pending:
+                if self.timeout is not None:
+                    now = time.monotonic()
+                    for f, (ti, pi) in list(pending.items()):
+                        start = started.get((ti, pi))
+                        if not f.done() and start is not None and now - start >= self.timeout:
+                            timed_out.setdefault(ti, set()).add(pi)
+                            overdue.add(f)
+                            del pending[f]
+                    overdue = {f for f in overdue if not f.done()}
+                    if len(overdue) >= workers:
+                        # Every worker is stuck past its deadline: the queued jobs cannot start.
+                        for f, (ti, pi) in list(pending.items()):
+                            if (ti, pi) not in started and f.cancel():
+                                skipped.setdefault(ti, set()).add(pi)
+                                del pending[f]
+                    if not pending:
+                        break
+                    deadlines = [started[job] + self.timeout for job in pending.values() if job in started]
+                    wait_for = max(0.0, min(deadlines) - now) if deadlines else self.timeout
+                    if any(job not in started for job in pending.values()):
+                        wait_for = min(wait_for, 0.05)  # pick up start times of queued jobs promptly
+                    done, _ = wait(list(pending) + list(overdue), timeout=wait_for, return_when=FIRST_COMPLETED)
+                else:
+                    done, _ = wait(list(pending))
+                for f in done:
+                    job = pending.pop(f, None)
+                    if job is None:
+                        continue
+                    try:
+                        results[job] = f.result()
+                    except Exception:
+                        failed.setdefault(job[0], set()).add(job[1])
+        finally:
+            # Do not block on providers that missed the deadline; their fetches have own timeouts.
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results, timed_out, failed, skipped
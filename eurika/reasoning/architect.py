@@ -83,11 +83,11 @@ def _resolve_knowledge_snippet(knowledge_provider: Optional['KnowledgeProvider']
         return ''
     from eurika.knowledge import StructuredKnowledge
     topics = [knowledge_topic] if isinstance(knowledge_topic, str) else knowledge_topic
+    topics = [t.strip() for t in topics if t]
+    query_many = getattr(knowledge_provider, 'query_many', None)
+    results = query_many(topics) if callable(query_many) else [knowledge_provider.query(t) for t in topics]
     all_fragments: List[Dict[str, Any]] = []
-    for t in topics:
-        if not t:
-            continue
-        kn = knowledge_provider.query(t.strip())
+    for kn in results:
         if isinstance(kn, StructuredKnowledge) and (not kn.is_empty()):
             all_fragments.extend(kn.fragments)
     return _format_knowledge_fragments(all_fragments) if all_fragments else ''
@@ -15,13 +15,11 @@ def _target_from_operation_key(raw: str) -> str | None:
     return target or None
 
 
-def _load_session_memory(project_root: Path) -> dict[str, Any]:
-    path = project_root / ".eurika" / "session_memory.json"
-    if not path.exists():
-        return {}
+def _load_campaign_memory(project_root: Path) -> dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data if isinstance(data, dict) else {}
+        from eurika.storage import SessionMemory
+
+        return SessionMemory(project_root).campaign()
     except Exception:
         return {}
 
@@ -45,61 +43,73 @@ def _recent_patch_modified(project_root: Path, limit: int = 5) -> list[str]:
         return []
 
 
-def _related_tests(project_root: Path, target_file: str, limit: int = 3) -> list[str]:
+def _test_file_index(project_root: Path) -> list[tuple[str, str]]:
+    """(stem, relative path) of every tests/**/test_*.py, in one walk (rglob order)."""
     tests_dir = project_root / "tests"
     if not tests_dir.exists():
         return []
+    return [(p.stem, str(p.relative_to(project_root))) for p in tests_dir.rglob("test_*.py")]
+
+
+def _related_tests(test_index: list[tuple[str, str]], target_file: str, limit: int = 3) -> list[str]:
+    """Test files whose stem contains the target's stem (first `limit`)."""
     stem = Path(target_file).stem
     if not stem:
         return []
     matches: list[str] = []
-    for p in tests_dir.rglob("test_*.py"):
-        ps = str(p.relative_to(project_root))
-        if stem in p.stem:
-            matches.append(ps)
-        if len(matches) >= limit:
-            break
+    for test_stem, rel in test_index:
+        if stem in test_stem:
+            matches.append(rel)
+            if len(matches) >= limit:
+                break
     return matches
 
 
-def _neighbor_modules(project_root: Path, target_file: str, limit: int = 5) -> list[str]:
+def _load_dependencies(project_root: Path) -> dict[str, Any]:
+    """self_map.json dependencies (read once per build_context_sources call)."""
     self_map = project_root / "self_map.json"
     if not self_map.exists():
-        return []
+        return {}
     try:
         data = json.loads(self_map.read_text(encoding="utf-8"))
     except Exception:
-        return []
+        return {}
     deps = data.get("dependencies") or {}
-    if not isinstance(deps, dict):
-        return []
+    return deps if isinstance(deps, dict) else {}
 
+
+def _incoming_index(deps: dict[str, Any]) -> dict[str, list[str]]:
+    """Reverse dependency map: imported name -> importing sources (self_map order)."""
+    incoming: dict[str, list[str]] = {}
+    for src, dsts in deps.items():
+        if not isinstance(dsts, list):
+            continue
+        for d in dict.fromkeys(str(d) for d in dsts):
+            incoming.setdefault(d, []).append(str(src))
+    return incoming
+
+
+def _neighbor_modules(
+    deps: dict[str, Any],
+    incoming: dict[str, list[str]],
+    target_file: str,
+    limit: int = 5,
+) -> list[str]:
     neighbors: list[str] = []
-    # outgoing
-    for v in deps.get(target_file, []) or []:
+    # outgoing, then incoming
+    for v in list(deps.get(target_file, []) or []) + incoming.get(target_file, []):
         vs = str(v)
         if vs and vs not in neighbors:
             neighbors.append(vs)
         if len(neighbors) >= limit:
             return neighbors
-    # incoming
-    for src, dsts in deps.items():
-        if not isinstance(dsts, list):
-            continue
-        if target_file in [str(d) for d in dsts]:
-            ss = str(src)
-            if ss and ss not in neighbors:
-                neighbors.append(ss)
-            if len(neighbors) >= limit:
-                return neighbors
     return neighbors
 
 
 def build_context_sources(project_root: Path, operations: list[dict[str, Any]]) -> dict[str, Any]:
     """Build semantic context payload and per-target signals for planner/reporting."""
     root = Path(project_root).resolve()
-    session = _load_session_memory(root)
-    campaign = session.get("campaign") or {}
+    campaign = _load_campaign_memory(root)
     rejected_keys = campaign.get("rejected_keys") or []
     fail_keys = campaign.get("verify_fail_keys") or []
 
@@ -115,6 +125,10 @@ def build_context_sources(project_root: Path, operations: list[dict[str, Any]])
         if t and t not in verify_fail_targets:
             verify_fail_targets.append(t)
 
+    # One self_map read and one tests walk per call, shared by all targets.
+    deps = _load_dependencies(root)
+    incoming = _incoming_index(deps)
+    test_index = _test_file_index(root)
     by_target: dict[str, dict[str, Any]] = {}
     for op in operations:
         target = str(op.get("target_file") or "")
@@ -123,8 +137,8 @@ def build_context_sources(project_root: Path, operations: list[dict[str, Any]])
         if target in by_target:
             continue
         by_target[target] = {
-            "related_tests": _related_tests(root, target),
-            "neighbor_modules": _neighbor_modules(root, target),
+            "related_tests": _related_tests(test_index, target),
+            "neighbor_modules": _neighbor_modules(deps, incoming, target),
         }
 
     return {
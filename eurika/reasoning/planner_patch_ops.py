@@ -190,11 +190,14 @@ def build_patch_operations(project_root: str, summary: Dict[str, Any], smells: L
     return operations
 
 def _success_rate_for_op(op: PatchOperation, learning_stats: Optional[Dict[str, Dict[str, Any]]]) -> float:
-    """Return success rate for (smell_type, action_kind); 0.0 if no stats."""
+    """Return success rate for (smell_type, action_kind), time-decayed when available; 0.0 if no stats."""
     if not learning_stats:
         return 0.0
     key = f"{op.smell_type or 'unknown'}{SMELL_ACTION_SEP}{op.kind}"
     d = learning_stats.get(key, {})
+    decayed_total = d.get('decayed_total') or 0
+    if decayed_total > 0:
+        return (d.get('decayed_success', 0) or 0) / decayed_total
     total = d.get('total', 0)
     if total < 1:
         return 0.0
@@ -142,23 +142,46 @@ def suggest_extract_nested_function(file_path: Path, function_name: str) -> Opti
     Prefers the largest self-contained nested function; then nested that uses only a small
     set of parent-scope vars (params or locals).
     """
+    tree = _parse_file(file_path)
+    if tree is None:
+        return None
+    found = suggest_extract_nested_in_tree(tree, function_name)
+    return found[0] if found else None
+
+def _parse_file(file_path: Path) -> Optional[ast.Module]:
     try:
         content = file_path.read_text(encoding='utf-8')
     except OSError:
         return None
     try:
-        tree = ast.parse(content)
+        return ast.parse(content)
     except SyntaxError:
         return None
-    parent_func: Optional[ast.FunctionDef] = None
+
+def _find_function(tree: ast.AST, function_name: str) -> Optional[ast.FunctionDef]:
     for node in ast.walk(tree):
         if isinstance(node, ast.FunctionDef) and node.name == function_name:
-            parent_func = node
-            break
+            return node
+    return None
+
+def _node_span(node: ast.AST) -> Tuple[int, int]:
+    start = getattr(node, 'lineno', 0) or 0
+    return (start, getattr(node, 'end_lineno', None) or start)
+
+def suggest_extract_nested_in_tree(tree: ast.Module, function_name: str, *, parent_func: Optional[ast.FunctionDef]=None, module_bound: Optional[Set[str]]=None) -> Optional[Tuple[Tuple[str, int, List[str]], Tuple[int, int]]]:
+    """
+    suggest_extract_nested_function on an already parsed tree (tree is not modified).
+
+    Returns (suggestion, (first_line, last_line) of the nested def) or None.
+    parent_func / module_bound may be passed in when the caller has them cached.
+    """
+    if parent_func is None:
+        parent_func = _find_function(tree, function_name)
     if not parent_func:
         return None
     parent_locals = _parent_locals(parent_func)
-    module_bound = _module_level_bound_names(tree)
+    if module_bound is None:
+        module_bound = _module_level_bound_names(tree)
     builtin_names = set(dir(builtins))
     candidates: List[Tuple[ast.FunctionDef, int, List[str]]] = []
     for stmt in parent_func.body:
@@ -178,7 +201,7 @@ def suggest_extract_nested_function(file_path: Path, function_name: str) -> Opti
     if not candidates:
         return None
     best = max(candidates, key=lambda x: x[1])
-    return (best[0].name, best[1], best[2])
+    return ((best[0].name, best[1], best[2]), _node_span(best[0]))
 
 def add_extra_args_to_calls(node: ast.AST, extra, nested_function_name) -> None:
     for n in ast.walk(node):
@@ -315,24 +338,26 @@ def suggest_extract_block(file_path: Path, function_name: str, *, min_lines: int
     extra_params: names from parent scope to pass as args (max max_extra_params).
     Uses only parent params; skips blocks that assign to parent params.
     """
-    try:
-        content = file_path.read_text(encoding='utf-8')
-    except OSError:
-        return None
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
+    tree = _parse_file(file_path)
+    if tree is None:
         return None
-    parent_func: Optional[ast.FunctionDef] = None
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == function_name:
-            parent_func = node
-            break
+    found = suggest_extract_block_in_tree(tree, function_name, min_lines=min_lines, max_extra_params=max_extra_params)
+    return found[0] if found else None
+
+def suggest_extract_block_in_tree(tree: ast.Module, function_name: str, *, min_lines: int=5, max_extra_params: int=3, parent_func: Optional[ast.FunctionDef]=None, module_bound: Optional[Set[str]]=None) -> Optional[Tuple[Tuple[str, int, int, List[str]], Tuple[int, int]]]:
+    """
+    suggest_extract_block on an already parsed tree (tree is not modified).
+
+    Returns (suggestion, (first_line, last_line) of the block statement) or None.
+    """
+    if parent_func is None:
+        parent_func = _find_function(tree, function_name)
     if not parent_func:
         return None
     parent_params = _parent_param_names(parent_func)
     parent_locals = _parent_locals(parent_func)
-    module_bound = _module_level_bound_names(tree)
+    if module_bound is None:
+        module_bound = _module_level_bound_names(tree)
     builtin_names = set(dir(builtins))
 
     def _nesting_depth(n: ast.AST) -> int:
@@ -378,7 +403,7 @@ def suggest_extract_block(file_path: Path, function_name: str, *, min_lines: int
     used_from_outer = (used - assigned) & parent_params
     extra_params = sorted(used_from_outer)
     helper_name = f'_extracted_block_{block_node.lineno}'
-    return (helper_name, block_node.lineno, line_count, extra_params)
+    return ((helper_name, block_node.lineno, line_count, extra_params), _node_span(block_node))
 
 def extract_block_to_helper(file_path: Path, parent_function_name: str, block_start_line: int, helper_name: str, extra_params: Optional[List[str]]=None) -> Optional[str]:
     """
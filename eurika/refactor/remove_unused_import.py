@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import ast
 from pathlib import Path
-from typing import Optional, Set
+from typing import List, Optional, Set
 
 
 def remove_unused_imports(file_path: Path) -> Optional[str]:
@@ -43,6 +43,28 @@ def remove_unused_imports(file_path: Path) -> Optional[str]:
     return ast.unparse(tree)
 
 
+def unused_import_names(tree: ast.AST) -> List[str]:
+    """
+    Bound names of imports remove_unused_imports would drop (detection only).
+
+    Same rules as the transformer, without rewriting or unparsing the tree.
+    Empty list means the file needs no change.
+    """
+    used = _collect_used_names(tree)
+    unused: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            bound_names = [a.asname or a.name.split(".")[0] for a in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.module == "__future__" or any(a.name == "*" for a in node.names):
+                continue
+            bound_names = [a.asname or a.name for a in node.names]
+        else:
+            continue
+        unused.extend(name for name in bound_names if name not in used)
+    return list(dict.fromkeys(unused))
+
+
 def _collect_used_names(tree: ast.AST) -> Set[str]:
     """Collect all names used in load context (and root of attributes)."""
     used: Set[str] = set()
@@ -0,0 +1,154 @@
+"""
+Per-run refactor suggestion service (long_function / deep_nesting).
+
+get_code_smell_operations asks for several suggestions per file; the plain
+suggest_extract_* helpers re-read and re-parse the file on every call. The
+service parses each file once per run, shares the tree, its function index and
+module-level names across all suggestions, memoises results by
+(file content hash, kind, function, options), and keeps a per-file list of
+claimed line spans so two suggestions never rewrite overlapping nodes. A
+suggestion's span is only claimed once the caller emits an op for it
+(claim()), so a candidate that is offered and then dropped does not block a
+fallback over the same lines.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from eurika.refactor.extract_function import (
+    _module_level_bound_names,
+    suggest_extract_block_in_tree,
+    suggest_extract_nested_in_tree,
+)
+
+_MEMO_SIZE = 4096
+
+# (sha256, kind, function, options) -> (suggestion, span) or None; survives runs in one
+# process (interval mode, serve) since keys change whenever file content does.
+_SUGGESTION_MEMO: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+
+
+@dataclass
+class ParsedFile:
+    """One parse of a source file, shared by smell detection and suggestions."""
+
+    path: Path
+    content: str
+    digest: str
+    tree: ast.Module
+    lines: List[str]
+    _functions: Optional[Dict[str, ast.FunctionDef]] = field(default=None, repr=False)
+    _module_bound: Optional[Set[str]] = field(default=None, repr=False)
+
+    def function(self, name: str) -> Optional[ast.FunctionDef]:
+        """First FunctionDef named name in ast.walk order (same as the file-based helpers)."""
+        if self._functions is None:
+            self._functions = {}
+            for node in ast.walk(self.tree):
+                if isinstance(node, ast.FunctionDef):
+                    self._functions.setdefault(node.name, node)
+        return self._functions.get(name)
+
+    @property
+    def module_bound(self) -> Set[str]:
+        if self._module_bound is None:
+            self._module_bound = _module_level_bound_names(self.tree)
+        return self._module_bound
+
+
+class SuggestionService:
+    """Shared-parse, memoised extract suggestions for one fix run."""
+
+    def __init__(self) -> None:
+        self._files: Dict[Path, Optional[ParsedFile]] = {}
+        self._claimed: Dict[Path, List[Tuple[int, int]]] = {}
+        self._offered: Dict[Path, Tuple[int, int]] = {}
+
+    def parsed(self, file_path: Path) -> Optional[ParsedFile]:
+        """Read and parse file_path once per run; None on read or syntax error."""
+        key = Path(file_path)
+        if key in self._files:
+            return self._files[key]
+        parsed: Optional[ParsedFile] = None
+        try:
+            content = key.read_text(encoding="utf-8")
+            tree = ast.parse(content)
+        except (OSError, SyntaxError, ValueError):
+            tree = None
+        if tree is not None:
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            parsed = ParsedFile(key, content, digest, tree, content.splitlines())
+        self._files[key] = parsed
+        return parsed
+
+    def _suggest(self, file_path: Path, kind: str, function_name: str, options: Tuple[Any, ...]) -> Any:
+        parsed = self.parsed(file_path)
+        if parsed is None:
+            return None
+        key = (parsed.digest, kind, function_name, options)
+        if key in _SUGGESTION_MEMO:
+            _SUGGESTION_MEMO.move_to_end(key)
+            return _SUGGESTION_MEMO[key]
+        parent = parsed.function(function_name)
+        found = None
+        if parent is not None:
+            if kind == "nested":
+                found = suggest_extract_nested_in_tree(
+                    parsed.tree, function_name, parent_func=parent, module_bound=parsed.module_bound
+                )
+            else:
+                min_lines, max_extra_params = options
+                found = suggest_extract_block_in_tree(
+                    parsed.tree,
+                    function_name,
+                    min_lines=min_lines,
+                    max_extra_params=max_extra_params,
+                    parent_func=parent,
+                    module_bound=parsed.module_bound,
+                )
+        _SUGGESTION_MEMO[key] = found
+        if len(_SUGGESTION_MEMO) > _MEMO_SIZE:
+            _SUGGESTION_MEMO.popitem(last=False)
+        return found
+
+    def _offer(self, file_path: Path, found: Any) -> Any:
+        """Return the suggestion if its span does not overlap a claimed one; remember the span for claim()."""
+        key = Path(file_path)
+        self._offered.pop(key, None)
+        if not found:
+            return None
+        suggestion, (start, end) = found
+        if any(start <= e and s <= end for s, e in self._claimed.get(key, ())):
+            return None
+        self._offered[key] = (start, end)
+        return suggestion
+
+    def claim(self, file_path: Path) -> None:
+        """Mark the span of the suggestion last returned for file_path as taken."""
+        key = Path(file_path)
+        span = self._offered.pop(key, None)
+        if span is not None:
+            self._claimed.setdefault(key, []).append(span)
+
+    def extract_nested(self, file_path: Path, function_name: str) -> Optional[Tuple[str, int, List[str]]]:
+        """suggest_extract_nested_function via the shared parse; None if overlapping a claimed span."""
+        return self._offer(file_path, self._suggest(file_path, "nested", function_name, ()))
+
+    def extract_block(
+        self,
+        file_path: Path,
+        function_name: str,
+        *,
+        min_lines: int = 5,
+        max_extra_params: int = 3,
+    ) -> Optional[Tuple[str, int, int, List[str]]]:
+        """suggest_extract_block via the shared parse; None if overlapping a claimed span."""
+        return self._offer(
+            file_path, self._suggest(file_path, "block", function_name, (min_lines, max_extra_params))
+        )
@@ -0,0 +1,122 @@
+"""
+Bulk unused-import detection for the clean-imports pre-pass.
+
+Per-file results (bound names of unused imports) are kept in
+.eurika/unused_imports.json keyed by path with an (mtime_ns, size) stamp, so
+files unchanged since the last fix cycle are answered without reading or
+parsing them. Stale files are parsed once (detection only, no unparse); with
+workers > 1 (or EURIKA_CLEAN_IMPORTS_WORKERS) large batches fan out across
+processes. The AST rewrite itself runs later, at apply time, and only for
+files reported here.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from eurika.refactor.remove_unused_import import unused_import_names
+
+INDEX_FILE = Path(".eurika") / "unused_imports.json"
+INDEX_VERSION = 1
+WORKERS_ENV = "EURIKA_CLEAN_IMPORTS_WORKERS"
+_MIN_FILES_PER_WORKER = 64
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _detect(path_str: str) -> Optional[List[str]]:
+    """Unused import names of one file; None when it cannot be read or parsed."""
+    try:
+        tree = ast.parse(Path(path_str).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError, UnicodeDecodeError):
+        return None
+    return unused_import_names(tree)
+
+
+def _workers_from_env() -> int:
+    try:
+        return max(1, int(os.environ.get(WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+def _load_index(index_path: Path) -> Dict[str, list]:
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_index(index_path: Path, files: Dict[str, list]) -> None:
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": files}), encoding="utf-8")
+        os.replace(tmp, index_path)
+    except OSError:
+        pass
+
+
+def find_unused_imports(
+    project_root: Path,
+    rel_paths: Iterable[str],
+    *,
+    workers: Optional[int] = None,
+) -> Dict[str, List[str]]:
+    """
+    Map rel_path -> unused import names for files that have any.
+
+    rel_paths are relative POSIX paths under project_root. Unchanged files are
+    served from the stamp-keyed index; others are parsed (in worker processes
+    when workers > 1 and the batch is large enough). Unreadable files are skipped.
+    """
+    root = Path(project_root).resolve()
+    index_path = root / INDEX_FILE
+    cached = _load_index(index_path)
+    entries: Dict[str, list] = {}
+    stale: List[Tuple[str, Tuple[int, int]]] = []
+    missing: List[str] = []
+    for rel in rel_paths:
+        stamp = _stamp(root / rel)
+        if stamp is None:
+            missing.append(rel)
+            continue
+        prev = cached.get(rel)
+        if prev and tuple(prev[:2]) == stamp:
+            entries[rel] = prev
+        else:
+            stale.append((rel, stamp))
+
+    n_workers = workers if workers is not None else _workers_from_env()
+    n_workers = min(n_workers, max(1, len(stale) // _MIN_FILES_PER_WORKER))
+    paths = [str(root / rel) for rel, _ in stale]
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(_detect, paths, chunksize=_MIN_FILES_PER_WORKER // 4))
+    else:
+        results = [_detect(p) for p in paths]
+    for (rel, stamp), names in zip(stale, results):
+        if names is not None:
+            entries[rel] = [stamp[0], stamp[1], names]
+
+    dropped = [rel for rel in missing if rel in cached]
+    if stale or dropped:
+        merged = {rel: v for rel, v in cached.items() if rel not in dropped}
+        merged.update(entries)
+        _save_index(index_path, merged)
+    return {rel: entry[2] for rel, entry in sorted(entries.items()) if entry[2]}
@@ -1,18 +1,41 @@
-"""Campaign checkpoint storage and undo helpers (ROADMAP 3.6.4)."""
+"""Campaign checkpoint storage and undo helpers (ROADMAP 3.6.4).
+
+Checkpoints live one per file in .eurika/campaign_checkpoints/. A small index
+(.eurika/campaign_checkpoints.index.json: id, created_at, status, session,
+targets, run ids; ordered by last save) is rewritten atomically on each save,
+so listing, "latest" and per-session lookups never open checkpoint files. The
+index is rebuilt from the directory when missing, corrupt, or when the
+directory changed behind its back (mtime differs from the recorded one).
+Creating a checkpoint prunes the oldest finished ones beyond the retention
+limit (EURIKA_CAMPAIGN_CHECKPOINT_KEEP, default 100; 0 keeps all).
+"""
 
 from __future__ import annotations
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any, Callable
 
+from eurika.utils.fs import project_lock
+
+INDEX_VERSION = 1
+KEEP_ENV = "EURIKA_CAMPAIGN_CHECKPOINT_KEEP"
+DEFAULT_KEEP = 100
+# Checkpoints still in progress are never pruned.
+_UNPRUNABLE_STATUSES = ("pending", "active")
+
 
 def _checkpoints_dir(project_root: Path) -> Path:
     root = Path(project_root).resolve()
     return root / ".eurika" / "campaign_checkpoints"
 
 
+def _index_path(project_root: Path) -> Path:
+    return _checkpoints_dir(project_root).with_name("campaign_checkpoints.index.json")
+
+
 def _checkpoint_path(project_root: Path, checkpoint_id: str) -> Path:
     return _checkpoints_dir(project_root) / f"{checkpoint_id}.json"
 
@@ -25,6 +48,15 @@ def _new_checkpoint_id() -> str:
     return f"{time.strftime('%Y%m%d_%H%M%S')}_{int((time.time() % 1) * 1000):03d}"
 
 
+def _unique_checkpoint_id(project_root: Path) -> str:
+    base = _new_checkpoint_id()
+    checkpoint_id, n = base, 1
+    while _checkpoint_path(project_root, checkpoint_id).exists():
+        checkpoint_id = f"{base}_{n}"
+        n += 1
+    return checkpoint_id
+
+
 def _load_json(path: Path) -> dict[str, Any] | None:
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
@@ -35,20 +67,128 @@ def _load_json(path: Path) -> dict[str, Any] | None:
 
 def _save_json(path: Path, data: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
 
 
-def _latest_checkpoint_path_for_session(project_root: Path, session_id: str) -> Path | None:
+def _dir_mtime(base: Path) -> int | None:
+    try:
+        return base.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _index_row(data: dict[str, Any], checkpoint_id: str) -> dict[str, Any]:
+    return {
+        "checkpoint_id": checkpoint_id,
+        "session_id": data.get("session_id"),
+        "status": str(data.get("status") or "unknown"),
+        "run_ids": list(data.get("run_ids") or []),
+        "operations_total": int(data.get("operations_total") or 0),
+        "targets": list(data.get("targets") or []),
+        "created_at": data.get("created_at"),
+        "updated_at": data.get("updated_at"),
+    }
+
+
+def _rebuild_index(project_root: Path) -> list[dict[str, Any]]:
+    """Index rows from checkpoint files, oldest save first (one-time scan)."""
     base = _checkpoints_dir(project_root)
     if not base.exists():
-        return None
-    for p in sorted(base.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True):
+        return []
+    stamped: list[tuple[float, str, Path]] = []
+    for p in base.glob("*.json"):
+        try:
+            stamped.append((p.stat().st_mtime, p.name, p))
+        except OSError:
+            continue
+    rows = []
+    for _, _, p in sorted(stamped):
         data = _load_json(p) or {}
-        if str(data.get("session_id") or "") != session_id:
+        rows.append(_index_row(data, str(data.get("checkpoint_id") or p.stem)))
+    return rows
+
+
+def _write_index(project_root: Path, rows: list[dict[str, Any]]) -> None:
+    try:
+        _save_json(
+            _index_path(project_root),
+            {"version": INDEX_VERSION, "dir_mtime_ns": _dir_mtime(_checkpoints_dir(project_root)), "checkpoints": rows},
+        )
+    except OSError:
+        pass
+
+
+def _read_index(project_root: Path) -> list[dict[str, Any]]:
+    """Index rows ordered by last save (oldest first); rebuilt when stale."""
+    data = _load_json(_index_path(project_root))
+    rows = (data or {}).get("checkpoints")
+    if (
+        data is not None
+        and data.get("version") == INDEX_VERSION
+        and isinstance(rows, list)
+        and data.get("dir_mtime_ns") == _dir_mtime(_checkpoints_dir(project_root))
+    ):
+        return [r for r in rows if isinstance(r, dict)]
+    rows = _rebuild_index(project_root)
+    if rows:
+        _write_index(project_root, rows)
+    return rows
+
+
+def _save_checkpoint(project_root: Path, data: dict[str, Any]) -> None:
+    """Persist checkpoint file and move its index row to the end (latest)."""
+    checkpoint_id = str(data.get("checkpoint_id") or "")
+    with project_lock(project_root):
+        rows = [r for r in _read_index(project_root) if r.get("checkpoint_id") != checkpoint_id]
+        _save_json(_checkpoint_path(project_root, checkpoint_id), data)
+        rows.append(_index_row(data, checkpoint_id))
+        _write_index(project_root, rows)
+
+
+def _retention_limit() -> int:
+    try:
+        return max(0, int(os.environ.get(KEEP_ENV, str(DEFAULT_KEEP))))
+    except ValueError:
+        return DEFAULT_KEEP
+
+
+def prune_campaign_checkpoints(project_root: Path, *, keep: int | None = None) -> list[str]:
+    """Delete the oldest finished checkpoints beyond `keep` (0 = keep all). Returns removed ids."""
+    keep = _retention_limit() if keep is None else keep
+    if keep <= 0:
+        return []
+    removed: list[str] = []
+    with project_lock(project_root):
+        rows = _read_index(project_root)
+        excess = len(rows) - keep
+        for row in rows:
+            if len(removed) >= excess:
+                break
+            if row.get("status") in _UNPRUNABLE_STATUSES:
+                continue
+            cid = str(row.get("checkpoint_id") or "")
+            try:
+                _checkpoint_path(project_root, cid).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            removed.append(cid)
+        if removed:
+            gone = set(removed)
+            _write_index(project_root, [r for r in rows if r.get("checkpoint_id") not in gone])
+    return removed
+
+
+def _latest_checkpoint_path_for_session(project_root: Path, session_id: str) -> Path | None:
+    for row in reversed(_read_index(project_root)):
+        if str(row.get("session_id") or "") != session_id:
             continue
-        if str(data.get("status") or "") == "undone":
+        if str(row.get("status") or "") == "undone":
             continue
-        return p
+        return _checkpoint_path(project_root, str(row.get("checkpoint_id") or ""))
     return None
 
 
@@ -77,10 +217,11 @@ def create_campaign_checkpoint(
                 )
             )
             existing["reused"] = True
-            _save_json(existing_path, existing)
+            existing.setdefault("checkpoint_id", existing_path.stem)
+            _save_checkpoint(project_root, existing)
             return existing
 
-    checkpoint_id = _new_checkpoint_id()
+    checkpoint_id = _unique_checkpoint_id(project_root)
     payload: dict[str, Any] = {
         "checkpoint_id": checkpoint_id,
         "created_at": _now_ts(),
@@ -95,7 +236,8 @@ def create_campaign_checkpoint(
         ],
         "reused": False,
     }
-    _save_json(_checkpoint_path(project_root, checkpoint_id), payload)
+    _save_checkpoint(project_root, payload)
+    prune_campaign_checkpoints(project_root)
     return payload
 
 
@@ -122,26 +264,26 @@ def attach_run_to_checkpoint(
     data["modified_count"] = len(modified or [])
     data["updated_at"] = _now_ts()
     data["status"] = "completed"
-    _save_json(path, data)
+    data.setdefault("checkpoint_id", checkpoint_id)
+    _save_checkpoint(project_root, data)
     return data
 
 
 def list_campaign_checkpoints(project_root: Path, *, limit: int = 20) -> dict[str, Any]:
-    """List recent campaign checkpoints."""
+    """List recent campaign checkpoints (newest save first; reads only the index)."""
     base = _checkpoints_dir(project_root)
     if not base.exists():
         return {"checkpoints": [], "path": str(base)}
     rows: list[dict[str, Any]] = []
-    for p in sorted(base.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True):
-        data = _load_json(p) or {}
+    for row in reversed(_read_index(project_root)):
         rows.append(
             {
-                "checkpoint_id": str(data.get("checkpoint_id") or p.stem),
-                "status": str(data.get("status") or "unknown"),
-                "run_ids": list(data.get("run_ids") or []),
-                "operations_total": int(data.get("operations_total") or 0),
-                "created_at": data.get("created_at"),
-                "updated_at": data.get("updated_at"),
+                "checkpoint_id": str(row.get("checkpoint_id") or ""),
+                "status": str(row.get("status") or "unknown"),
+                "run_ids": list(row.get("run_ids") or []),
+                "operations_total": int(row.get("operations_total") or 0),
+                "created_at": row.get("created_at"),
+                "updated_at": row.get("updated_at"),
             }
         )
         if len(rows) >= limit:
@@ -179,9 +321,9 @@ def undo_campaign_checkpoint(
         if p.exists():
             selected = p
     else:
-        files = sorted(base.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True)
-        if files:
-            selected = files[0]
+        rows = _read_index(root)
+        if rows:
+            selected = _checkpoint_path(root, str(rows[-1].get("checkpoint_id") or ""))
     if selected is None:
         return {"errors": [f"Checkpoint not found: {checkpoint_id or 'latest'}"], "checkpoint_id": checkpoint_id}
 
@@ -211,21 +353,25 @@ def undo_campaign_checkpoint(
         rollback_fn = rollback_patch
 
     restored: list[str] = []
+    conflicts: list[str] = []
     errors: list[str] = []
     rollback_reports: list[dict[str, Any]] = []
     for run_id in reversed(run_ids):
         rr = rollback_fn(root, run_id)
         rollback_reports.append({"run_id": run_id, "report": rr})
         restored.extend([str(x) for x in (rr.get("restored") or [])])
+        conflicts.extend([str(x) for x in (rr.get("conflicts") or [])])
         errors.extend([str(x) for x in (rr.get("errors") or [])])
 
     data["status"] = "undone" if run_ids else "noop"
     data["undone_at"] = _now_ts()
-    _save_json(selected, data)
+    data.setdefault("checkpoint_id", cid)
+    _save_checkpoint(root, data)
     return {
         "checkpoint_id": cid,
         "run_ids": run_ids,
         "restored": restored,
+        "conflicts": conflicts,
         "errors": errors,
         "status": data["status"],
         "rollback_reports": rollback_reports,
@@ -2,7 +2,8 @@
 Event as primary entity — Learning and Feedback as views over EventStore (ROADMAP 3.2.2).
 
 learning/feedback.append() writes to EventStore with type "learn" / "feedback".
-learning.all(), feedback.all() and aggregate_* derive from events.by_type(...).
+learning.all(), feedback.all() and aggregate_* derive from events.by_type(...);
+learning aggregates are served by the shared learning_index backend.
 """
 
 from __future__ import annotations
@@ -15,6 +16,7 @@ if TYPE_CHECKING:
     from architecture_feedback import FeedbackRecord
     from architecture_learning import LearningRecord
     from .event_engine import EventStore
+    from .learning_index import LearningIndex
 
 
 def _learning_record_from_event(e: Any) -> "LearningRecord":
@@ -42,34 +44,6 @@ def _feedback_record_from_event(e: Any) -> "FeedbackRecord":
     )
 
 
-def _is_strong_refactor_code_smell_success(op: Dict[str, Any]) -> bool:
-    """
-    Return True only for non-marker refactor_code_smell operations.
-
-    Marker-only TODO operations should not inflate success statistics.
-    """
-    if (op.get("kind") or "") != "refactor_code_smell":
-        return True
-    diff = str(op.get("diff") or "")
-    if "# TODO (eurika): refactor " in diff:
-        return False
-    return True
-
-
-def _resolve_learning_outcome(op: Dict[str, Any], verify_success: Optional[bool]) -> str:
-    """Resolve per-operation learning outcome for aggregation."""
-    outcome = str(op.get("execution_outcome") or "").strip()
-    if outcome in {"not_applied", "verify_success", "verify_fail"}:
-        return outcome
-    if op.get("applied") is False:
-        return "not_applied"
-    if verify_success is True:
-        return "verify_success"
-    if verify_success is False:
-        return "verify_fail"
-    return "not_applied"
-
-
 def _migrate_legacy_to_events(
     events: "EventStore",
     storage_path: Path,
@@ -148,68 +122,18 @@ class LearningView:
         from architecture_learning import LearningRecord
         return [_learning_record_from_event(e) for e in self._events.by_type("learn")]
 
-    def aggregate_by_action_kind(self) -> Dict[str, Dict[str, Any]]:
-        records = self.all()
-        stats: Dict[str, Dict[str, Any]] = {}
-        for r in records:
-            for op in r.operations:
-                kind = op.get("kind", "unknown")
-                by_kind = stats.setdefault(
-                    kind,
-                    {
-                        "total": 0,
-                        "success": 0,
-                        "fail": 0,
-                        "verify_success": 0,
-                        "verify_fail": 0,
-                        "not_applied": 0,
-                    },
-                )
-                by_kind["total"] += 1
-                outcome = _resolve_learning_outcome(op, r.verify_success)
-                if outcome == "verify_success":
-                    by_kind["verify_success"] += 1
-                    if _is_strong_refactor_code_smell_success(op):
-                        by_kind["success"] += 1
-                elif outcome == "verify_fail":
-                    by_kind["verify_fail"] += 1
-                    by_kind["fail"] += 1
-                else:
-                    by_kind["not_applied"] += 1
-        return stats
+    def index(self) -> "LearningIndex":
+        """Outcome counters over learn events (shared learning backend, cached per log)."""
+        self._ensure_migrated()
+        from .learning_index import events_learning_index
+        return events_learning_index(self._events)
 
-    def aggregate_by_smell_action(self) -> Dict[str, Dict[str, Any]]:
-        records = self.all()
-        sep = "|"
-        stats: Dict[str, Dict[str, Any]] = {}
-        for r in records:
-            for op in r.operations:
-                kind = op.get("kind", "unknown")
-                smell = op.get("smell_type") or "unknown"
-                key = f"{smell}{sep}{kind}"
-                by_key = stats.setdefault(
-                    key,
-                    {
-                        "total": 0,
-                        "success": 0,
-                        "fail": 0,
-                        "verify_success": 0,
-                        "verify_fail": 0,
-                        "not_applied": 0,
-                    },
-                )
-                by_key["total"] += 1
-                outcome = _resolve_learning_outcome(op, r.verify_success)
-                if outcome == "verify_success":
-                    by_key["verify_success"] += 1
-                    if _is_strong_refactor_code_smell_success(op):
-                        by_key["success"] += 1
-                elif outcome == "verify_fail":
-                    by_key["verify_fail"] += 1
-                    by_key["fail"] += 1
-                else:
-                    by_key["not_applied"] += 1
-        return stats
+    def aggregate_by_action_kind(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        return self.index().aggregate_by_action_kind(now)
+
+    def aggregate_by_smell_action(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Counts per smell|action; decayed sums are expressed at `now` (default: newest event)."""
+        return self.index().aggregate_by_smell_action(now)
 
 
 class FeedbackView:
@@ -16,6 +16,8 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
+from eurika.utils.fs import LOCK_FILE, file_lock
+
 
 EVENTS_FILE = "eurika_events.json"
 MAX_EVENTS = 500
@@ -104,15 +106,27 @@ class EventStore:
         output: Dict[str, Any],
         result: Optional[Any] = None,
     ) -> None:
-        """Append one event and persist. input/output are normalized to JSON-safe."""
+        """
+        Append one event and persist. input/output are normalized to JSON-safe.
+
+        Reloads under the store's advisory lock so events appended by a
+        concurrent eurika process are merged instead of overwritten, then
+        advances the operational metrics accumulator (patch_metrics.json).
+        """
         event = Event(
             type=type,
             input=_json_safe(input),
             output=_json_safe(output),
             result=result,
         )
-        self._events.append(event)
-        self._save()
+        from eurika.storage.operational_metrics import _stamp, record_event
+
+        with file_lock(self.storage_path.parent / LOCK_FILE):
+            self._load()
+            previous_stamp = _stamp(self.storage_path)
+            self._events.append(event)
+            self._save()
+            record_event(self.storage_path, previous_stamp, event.type, event.input, event.output)
 
     def all(self) -> List[Event]:
         """Return read-only snapshot of events (last MAX_EVENTS)."""
@@ -8,6 +8,7 @@ Learning from project A is considered when fixing project B (smell|action match)
 from __future__ import annotations
 
 import os
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -29,16 +30,6 @@ def _global_events_path() -> Optional[Path]:
     return root / "events.json"
 
 
-def _is_strong_refactor_code_smell_success(op: Dict[str, Any]) -> bool:
-    """Marker-only refactor_code_smell should not inflate success (same as event_views)."""
-    if (op.get("kind") or "") != "refactor_code_smell":
-        return True
-    diff = str(op.get("diff") or "")
-    if "# TODO (eurika): refactor " in diff:
-        return False
-    return True
-
-
 def append_learn_to_global(
     project_root: Path,
     modules: List[str],
@@ -69,30 +60,18 @@ def append_learn_to_global(
         pass
 
 
-def aggregate_global_by_smell_action() -> Dict[str, Dict[str, Any]]:
-    """Aggregate learning from global store by smell|action. Returns {} if disabled or empty."""
+def aggregate_global_by_smell_action(now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate learning from global store by smell|action. Returns {} if disabled or empty.
+
+    Decayed sums are expressed at `now` (default: the newest global event).
+    """
     path = _global_events_path()
     if path is None or not path.exists():
         return {}
     try:
-        from .events import EventStore
-        store = EventStore(storage_path=path)
-        stats: Dict[str, Dict[str, Any]] = {}
-        sep = "|"
-        for e in store.by_type("learn"):
-            ops = (e.input or {}).get("operations", [])
-            for op in ops:
-                kind = op.get("kind", "unknown")
-                smell = op.get("smell_type") or "unknown"
-                key = f"{smell}{sep}{kind}"
-                by_key = stats.setdefault(key, {"total": 0, "success": 0, "fail": 0})
-                by_key["total"] += 1
-                if e.result is True:
-                    if _is_strong_refactor_code_smell_success(op):
-                        by_key["success"] += 1
-                elif e.result is False:
-                    by_key["fail"] += 1
-        return stats
+        from .learning_index import events_file_learning_index
+        return events_file_learning_index(path).aggregate_by_smell_action(now)
     except Exception:
         return {}
 
@@ -103,12 +82,14 @@ def get_merged_learning_stats(project_root: Path) -> Dict[str, Dict[str, Any]]:
     Used when building patch plan — learning from other projects influences sorting/filtering.
     """
     from .memory import ProjectMemory
+    # One reference time for both stores, so their decayed sums are comparable.
+    now = time.time()
     local: Dict[str, Dict[str, Any]] = {}
     try:
-        local = ProjectMemory(project_root).learning.aggregate_by_smell_action()
+        local = ProjectMemory(project_root).learning.aggregate_by_smell_action(now)
     except Exception:
         pass
-    global_stats = aggregate_global_by_smell_action()
+    global_stats = aggregate_global_by_smell_action(now)
     return merge_learning_stats(local, global_stats)
 
 
@@ -119,21 +100,17 @@ def merge_learning_stats(
     """
     Merge local and global learning stats. Sum total/success/fail per smell|action key.
     Local and global contribute additively; more data improves confidence.
+    Time-decayed sums (decayed_success/decayed_total), when present, are summed too;
+    both inputs must be exported at the same `now` (see get_merged_learning_stats).
     """
     result: Dict[str, Dict[str, Any]] = {}
-    for key, rec in (local or {}).items():
-        result[key] = {
-            "total": int(rec.get("total", 0) or 0),
-            "success": int(rec.get("success", 0) or 0),
-            "fail": int(rec.get("fail", 0) or 0),
-        }
-    for key, rec in (global_stats or {}).items():
-        if key not in result:
-            result[key] = {"total": 0, "success": 0, "fail": 0}
-        result[key]["total"] += int(rec.get("total", 0) or 0)
-        result[key]["success"] += int(rec.get("success", 0) or 0)
-        result[key]["fail"] += int(rec.get("fail", 0) or 0)
+    for stats in (local or {}, global_stats or {}):
+        for key, rec in stats.items():
+            merged = result.setdefault(key, {"total": 0, "success": 0, "fail": 0})
+            merged["total"] += int(rec.get("total", 0) or 0)
+            merged["success"] += int(rec.get("success", 0) or 0)
+            merged["fail"] += int(rec.get("fail", 0) or 0)
+            for field in ("decayed_success", "decayed_total"):
+                if field in rec:
+                    merged[field] = round(merged.get(field, 0.0) + float(rec[field] or 0.0), 4)
     return result
-
-
-# TODO (eurika): refactor deep_nesting 'aggregate_global_by_smell_action' — consider extracting nested block
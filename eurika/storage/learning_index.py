@@ -0,0 +1,319 @@
+"""Unified learning backend: indexed outcome counters over learn records.
+
+LearningIndex folds learning records (operations, verify result, timestamp)
+into counters per action kind, smell|action pair and (smell, action, target)
+triple. Appends update the counters in place, so lookups are dict reads and
+nothing re-aggregates the whole history. Every counter also keeps an
+exponentially time-decayed success/total pair (half-life
+EURIKA_LEARNING_HALF_LIFE_DAYS, default 30) so stale outcomes fade.
+
+Both learning APIs are adapters over it:
+- eurika.storage.event_views.LearningView: learn events in .eurika/events.json
+  (also the global store, see global_memory);
+- architecture_learning.LearningStore: an append-only JSONL file.
+
+Indexes are cached per source and advanced with only the new records.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+SEP = "|"
+HALF_LIFE_ENV = "EURIKA_LEARNING_HALF_LIFE_DAYS"
+DEFAULT_HALF_LIFE_DAYS = 30.0
+
+Stamp = Optional[Tuple[int, int]]
+
+
+def half_life_seconds() -> float:
+    """Decay half-life from EURIKA_LEARNING_HALF_LIFE_DAYS (0 disables decay)."""
+    try:
+        days = float(os.environ.get(HALF_LIFE_ENV, "") or DEFAULT_HALF_LIFE_DAYS)
+    except ValueError:
+        days = DEFAULT_HALF_LIFE_DAYS
+    return max(days, 0.0) * 86400.0
+
+
+def _decay(elapsed: float, half_life: float) -> float:
+    if half_life <= 0 or elapsed <= 0:
+        return 1.0
+    return 0.5 ** (elapsed / half_life)
+
+
+def _resolve_learning_outcome(op: Dict[str, Any], verify_success: Optional[bool]) -> str:
+    """Resolve per-operation learning outcome for aggregation."""
+    outcome = str(op.get("execution_outcome") or "").strip()
+    if outcome in {"not_applied", "verify_success", "verify_fail"}:
+        return outcome
+    if op.get("applied") is False:
+        return "not_applied"
+    if verify_success is True:
+        return "verify_success"
+    if verify_success is False:
+        return "verify_fail"
+    return "not_applied"
+
+
+def _is_strong_refactor_code_smell_success(op: Dict[str, Any]) -> bool:
+    """Marker-only TODO refactor_code_smell ops should not inflate success."""
+    if (op.get("kind") or "") != "refactor_code_smell":
+        return True
+    diff = str(op.get("diff") or "")
+    if "# TODO (eurika): refactor " in diff:
+        return False
+    return True
+
+
+class OutcomeCounter:
+    """Outcome counts for one key plus a time-decayed success/total pair."""
+
+    __slots__ = (
+        "total",
+        "success",
+        "fail",
+        "verify_success",
+        "verify_fail",
+        "not_applied",
+        "decayed_success",
+        "decayed_total",
+        "as_of",
+    )
+
+    def __init__(self) -> None:
+        self.total = self.success = self.fail = 0
+        self.verify_success = self.verify_fail = self.not_applied = 0
+        # Decayed sums are expressed at time `as_of` (the newest sample seen).
+        self.decayed_success = self.decayed_total = 0.0
+        self.as_of = 0.0
+
+    def add(self, outcome: str, strong: bool, timestamp: float, half_life: float) -> None:
+        self.total += 1
+        won = 0.0
+        if outcome == "verify_success":
+            self.verify_success += 1
+            if strong:
+                self.success += 1
+                won = 1.0
+        elif outcome == "verify_fail":
+            self.verify_fail += 1
+            self.fail += 1
+        else:
+            self.not_applied += 1
+        if timestamp >= self.as_of:
+            scale = _decay(timestamp - self.as_of, half_life)
+            self.decayed_success = self.decayed_success * scale + won
+            self.decayed_total = self.decayed_total * scale + 1.0
+            self.as_of = timestamp
+        else:
+            weight = _decay(self.as_of - timestamp, half_life)
+            self.decayed_success += won * weight
+            self.decayed_total += weight
+
+    def success_rate(self, decayed: bool = True) -> float:
+        """Share of strong successes (decayed weights by default); 0.0 without data."""
+        if decayed:
+            # Both sums share one reference time, so the ratio does not depend on "now".
+            return self.decayed_success / self.decayed_total if self.decayed_total > 0 else 0.0
+        return self.success / self.total if self.total else 0.0
+
+    def as_dict(self, now: float, half_life: float) -> Dict[str, Any]:
+        """Counts plus decayed sums brought forward to `now` (summable across stores exported at the same `now`)."""
+        scale = _decay(now - self.as_of, half_life)
+        return {
+            "total": self.total,
+            "success": self.success,
+            "fail": self.fail,
+            "verify_success": self.verify_success,
+            "verify_fail": self.verify_fail,
+            "not_applied": self.not_applied,
+            "decayed_success": round(self.decayed_success * scale, 4),
+            "decayed_total": round(self.decayed_total * scale, 4),
+        }
+
+
+class LearningIndex:
+    """Outcome counters by action kind, smell|action and (smell, action, target)."""
+
+    def __init__(self, half_life: Optional[float] = None) -> None:
+        self.half_life = half_life_seconds() if half_life is None else half_life
+        self.records = 0
+        self.latest = 0.0
+        self.by_kind: Dict[str, OutcomeCounter] = {}
+        self.by_smell_action: Dict[str, OutcomeCounter] = {}
+        self.by_target: Dict[Tuple[str, str, str], OutcomeCounter] = {}
+
+    def add(self, operations: Iterable[Any], verify_success: Optional[bool], timestamp: float) -> None:
+        """Fold one learning record into the counters."""
+        self.records += 1
+        self.latest = max(self.latest, timestamp)
+        for op in operations or []:
+            if not isinstance(op, dict):
+                continue
+            kind = op.get("kind", "unknown")
+            smell = op.get("smell_type") or "unknown"
+            target = str(op.get("target_file") or "")
+            outcome = _resolve_learning_outcome(op, verify_success)
+            strong = _is_strong_refactor_code_smell_success(op)
+            for counters, key in (
+                (self.by_kind, kind),
+                (self.by_smell_action, f"{smell}{SEP}{kind}"),
+                (self.by_target, (smell, kind, target)),
+            ):
+                counter = counters.get(key)  # type: ignore[attr-defined]
+                if counter is None:
+                    counter = counters[key] = OutcomeCounter()  # type: ignore[index]
+                counter.add(outcome, strong, timestamp, self.half_life)
+
+    # --- O(1) lookups --------------------------------------------------------
+
+    def stats(self, smell_type: Optional[str], kind: str) -> Optional[OutcomeCounter]:
+        return self.by_smell_action.get(f"{smell_type or 'unknown'}{SEP}{kind}")
+
+    def target_stats(self, smell_type: Optional[str], kind: str, target_file: str) -> Optional[OutcomeCounter]:
+        return self.by_target.get((smell_type or "unknown", kind, target_file))
+
+    def success_rate(self, smell_type: Optional[str], kind: str, decayed: bool = True) -> float:
+        counter = self.stats(smell_type, kind)
+        return counter.success_rate(decayed) if counter is not None else 0.0
+
+    # --- aggregate views (LearningStore / LearningView shapes) ------------------
+
+    def _export(self, counters: Mapping[Any, OutcomeCounter], now: Optional[float]) -> Dict[str, Dict[str, Any]]:
+        now = self.latest if now is None else now
+        return {key: c.as_dict(now, self.half_life) for key, c in counters.items()}
+
+    def aggregate_by_action_kind(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        return self._export(self.by_kind, now)
+
+    def aggregate_by_smell_action(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        return self._export(self.by_smell_action, now)
+
+
+# --- cached indexes per source -------------------------------------------------
+
+# events path -> (file stamp or None, learn count, first ts, last ts, index)
+_events_cache: Dict[str, Tuple[Stamp, int, float, float, LearningIndex]] = {}
+# JSONL path -> (file stamp, consumed bytes, index)
+_file_cache: Dict[str, Tuple[Stamp, int, LearningIndex]] = {}
+_cache_lock = threading.Lock()
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _index_learn_events(key: str, learn: List[Any], stamp: Stamp) -> LearningIndex:
+    """Cached index for an ordered list of learn events; only new events are folded in."""
+    first = learn[0].timestamp if learn else 0.0
+    last = learn[-1].timestamp if learn else 0.0
+    half_life = half_life_seconds()
+    cached = _events_cache.get(key)
+    start = 0
+    index: Optional[LearningIndex] = None
+    if cached is not None and cached[4].half_life == half_life:
+        _, count, c_first, c_last, c_index = cached
+        # The log is append-only but trimmed to MAX_EVENTS: reuse only if the
+        # cached prefix is still at the same positions.
+        if count == 0 or (count <= len(learn) and learn[0].timestamp == c_first and learn[count - 1].timestamp == c_last):
+            index, start = c_index, count
+    if index is None:
+        index = LearningIndex(half_life)
+    for e in learn[start:]:
+        index.add((e.input or {}).get("operations", []), e.result, e.timestamp)
+    _events_cache[key] = (stamp, len(learn), first, last, index)
+    return index
+
+
+def events_learning_index(events: Any) -> LearningIndex:
+    """Index over the learn events currently held by an EventStore."""
+    key = str(Path(events.storage_path).resolve())
+    learn = events.by_type("learn")
+    with _cache_lock:
+        return _index_learn_events(key, learn, None)
+
+
+def events_file_learning_index(path: Path) -> LearningIndex:
+    """Index over the learn events in an events.json file; the file is not re-read while unchanged."""
+    path = Path(path).resolve()
+    key = str(path)
+    stamp = _stamp(path)
+    with _cache_lock:
+        cached = _events_cache.get(key)
+        if cached is not None and stamp is not None and cached[0] == stamp and cached[4].half_life == half_life_seconds():
+            return cached[4]
+        from .events import EventStore
+
+        return _index_learn_events(key, EventStore(storage_path=path).by_type("learn"), stamp)
+
+
+def _parse_lines(chunk: bytes) -> Iterable[Dict[str, Any]]:
+    for line in chunk.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(item, dict):
+            yield item
+
+
+def read_learning_log(path: Path, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    """Complete JSONL records from `offset`; returns (records, offset after the last full line)."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+    except OSError:
+        return [], offset
+    end = chunk.rfind(b"\n") + 1  # a half-written trailing line is left for the next read
+    return list(_parse_lines(chunk[:end])), offset + end
+
+
+def append_learning_log(path: Path, record: Mapping[str, Any]) -> None:
+    """Append one record as a single JSON line."""
+    line = json.dumps(dict(record), ensure_ascii=False, separators=(",", ":")) + "\n"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def file_learning_index(path: Path) -> LearningIndex:
+    """Index over a JSONL learning log; appended lines are read from the last consumed offset."""
+    path = Path(path).resolve()
+    key = str(path)
+    half_life = half_life_seconds()
+    with _cache_lock:
+        stamp = _stamp(path)
+        cached = _file_cache.get(key)
+        if cached is not None and cached[2].half_life == half_life:
+            c_stamp, offset, index = cached
+            if c_stamp == stamp:
+                return index
+            if stamp is None or c_stamp is None or stamp[1] < offset:
+                cached = None
+        else:
+            cached = None
+        if cached is None:
+            index, offset = LearningIndex(half_life), 0
+        records, offset = read_learning_log(path, offset)
+        for rec in records:
+            index.add(rec.get("operations", []), rec.get("verify_success"), float(rec.get("timestamp", 0.0) or 0.0))
+        _file_cache[key] = (stamp, offset, index)
+        return index
+
+
+def clear_learning_cache() -> None:
+    """Drop all cached indexes (tests, or after rewriting a store in place)."""
+    with _cache_lock:
+        _events_cache.clear()
+        _file_cache.clear()
@@ -9,7 +9,7 @@ Event as primary (ROADMAP 3.2.2): learning and feedback are views over EventStor
 - learning: view over events (type=learn)
 - feedback: view over events (type=feedback)
 - observations: scan observations (observations.json)
-- history: architecture evolution snapshots (history.json)
+- history: architecture evolution snapshots (history.jsonl + .idx)
 """
 
 from __future__ import annotations
@@ -98,7 +98,7 @@ class ProjectMemory:
 
     @property
     def history(self):
-        """Architecture evolution snapshots. File: .eurika/history.json."""
+        """Architecture evolution snapshots. File: .eurika/history.jsonl (+ .idx)."""
         if not hasattr(self, "_history"):
             self._history = _architecture_history(self.project_root)
         return self._history
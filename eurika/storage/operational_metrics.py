@@ -1,9 +1,247 @@
-"""Rolling operational metrics from patch events (ROADMAP 2.7.8)."""
+"""Rolling operational metrics from patch events (ROADMAP 2.7.8).
+
+PatchMetrics keeps a compact row per patch event (ops, modified, skipped,
+rollback, verify ms) in a ring buffer persisted to .eurika/patch_metrics.json,
+updated by EventStore.append_event as events are appended. Each window
+size in use keeps running sums plus a sorted list of verify durations
+(order statistics for the median), adjusted as rows enter and leave the
+window, so doctor, report, fix telemetry and the dashboard API read metrics
+without reloading the event log. The sidecar records the events file stamp
+and is re-stamped on every append; if the log was changed by another writer,
+rows are rebuilt from it once.
+"""
 
 from __future__ import annotations
 
+import json
+import os
+import threading
+from bisect import bisect_left, insort
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+from .paths import STORAGE_DIR, storage_path
+
+METRICS_FILE = "patch_metrics.json"
+METRICS_VERSION = 1
+# Same bound as the event log (MAX_EVENTS): no window can see more patch events.
+CAPACITY = 500
+
+# (operations_count, modified, skipped, rollback 0/1, verify_duration_ms or None)
+Row = Tuple[int, int, int, int, Optional[int]]
+Stamp = Optional[Tuple[int, int]]
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def patch_row(input: Mapping[str, Any], output: Mapping[str, Any]) -> Row:
+    """Compact metrics row for one patch event."""
+    ops = int(input.get("operations_count", 0) or 0)
+    modified = output.get("modified") or []
+    skipped = output.get("skipped") or []
+    ms = output.get("verify_duration_ms")
+    return (
+        ops,
+        len(modified) if isinstance(modified, list) else 0,
+        len(skipped) if isinstance(skipped, list) else 0,
+        1 if output.get("verify_success") is False else 0,
+        int(ms) if isinstance(ms, (int, float)) and not isinstance(ms, bool) and ms > 0 else None,
+    )
+
+
+def _median(values: List[int]) -> Optional[int]:
+    if not values:
+        return None
+    mid = len(values) // 2
+    return int(values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2)
+
+
+class _Window:
+    """Running sums and sorted verify durations over the last `size` rows."""
+
+    __slots__ = ("size", "count", "ops", "modified", "skipped", "rollbacks", "durations")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.count = self.ops = self.modified = self.skipped = self.rollbacks = 0
+        self.durations: List[int] = []
+
+    def add(self, row: Row) -> None:
+        self._apply(row, 1)
+        if row[4] is not None:
+            insort(self.durations, row[4])
+
+    def remove(self, row: Row) -> None:
+        self._apply(row, -1)
+        if row[4] is not None:
+            del self.durations[bisect_left(self.durations, row[4])]
+
+    def _apply(self, row: Row, sign: int) -> None:
+        self.count += sign
+        self.ops += sign * row[0]
+        self.modified += sign * row[1]
+        self.skipped += sign * row[2]
+        self.rollbacks += sign * row[3]
+
+
+class PatchMetrics:
+    """Ring buffer of patch rows with incrementally maintained rolling windows."""
+
+    def __init__(self, rows: Optional[List[Row]] = None, capacity: int = CAPACITY) -> None:
+        self.rows: Deque[Row] = deque(maxlen=capacity)
+        self._windows: Dict[int, _Window] = {}
+        for row in rows or []:
+            self.push(row)
+
+    def push(self, row: Row) -> None:
+        """Append one row, moving every tracked window forward."""
+        for size, win in self._windows.items():
+            if len(self.rows) >= size:
+                win.remove(self.rows[-size])
+        if self.rows.maxlen is not None and len(self.rows) == self.rows.maxlen:
+            self.rows.popleft()
+        self.rows.append(row)
+        for win in self._windows.values():
+            win.add(row)
+
+    def _window(self, size: int) -> _Window:
+        size = max(1, min(size, self.rows.maxlen or size))
+        win = self._windows.get(size)
+        if win is None:
+            win = _Window(size)
+            for row in list(self.rows)[-size:]:
+                win.add(row)
+            self._windows[size] = win
+        return win
+
+    def summary(self, window: int = 10) -> Optional[Dict[str, Any]]:
+        """Metrics over the last `window` patch runs; None when there are none."""
+        win = self._window(window)
+        if not win.count:
+            return None
+        return {
+            "runs_count": win.count,
+            "apply_rate": round(win.modified / win.ops, 4) if win.ops else 0.0,
+            "rollback_rate": round(win.rollbacks / win.count, 4),
+            "median_verify_time_ms": _median(win.durations),
+            "total_modified": win.modified,
+            "total_ops": win.ops,
+            "total_skipped": win.skipped,
+            "no_op_rate": round(win.skipped / win.ops, 4) if win.ops else 0.0,
+        }
+
+    def median_verify_time_ms(self, window: int = 10, extra: Optional[int] = None) -> Optional[int]:
+        """Median verify duration over the window, optionally including one more sample."""
+        durations = self._window(window).durations
+        if extra is not None:
+            durations = list(durations)
+            insort(durations, int(extra))
+        return _median(durations)
+
+
+# --- persistence ------------------------------------------------------------
+
+_cache: Dict[str, Tuple[Stamp, Stamp, PatchMetrics]] = {}
+_cache_lock = threading.Lock()
+
+
+def _metrics_path(events_path: Path) -> Path:
+    return events_path.with_name(METRICS_FILE)
+
+
+def _rows_from_events(project_root: Path) -> List[Row]:
+    from eurika.storage import ProjectMemory
+
+    events = ProjectMemory(project_root).events.by_type("patch")
+    return [patch_row(e.input or {}, e.output or {}) for e in events][-CAPACITY:]
+
+
+def _read_sidecar(path: Path, events_stamp: Stamp) -> Optional[List[Row]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != METRICS_VERSION:
+        return None
+    recorded = data.get("events_stamp")
+    if (tuple(recorded) if isinstance(recorded, list) else None) != events_stamp:
+        return None
+    return [tuple(r) for r in data.get("rows") or [] if isinstance(r, list) and len(r) == 5]  # type: ignore[misc]
+
+
+def _write_sidecar(path: Path, metrics: PatchMetrics, events_stamp: Stamp) -> Stamp:
+    payload = {"version": METRICS_VERSION, "events_stamp": events_stamp, "rows": list(metrics.rows)}
+    try:
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        return None
+    return _stamp(path)
+
+
+def patch_metrics(project_root: Path) -> PatchMetrics:
+    """Process-cached PatchMetrics for the project (reloaded when the log or sidecar change)."""
+    root = Path(project_root).resolve()
+    events_path = storage_path(root, "events")
+    sidecar = _metrics_path(events_path)
+    events_stamp, sidecar_stamp = _stamp(events_path), _stamp(sidecar)
+    key = str(events_path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == events_stamp and cached[1] == sidecar_stamp:
+            return cached[2]
+        rows = _read_sidecar(sidecar, events_stamp) if sidecar_stamp is not None else None
+        if rows is None:
+            rows = _rows_from_events(root)
+            events_stamp = _stamp(events_path)
+            if events_stamp is not None:
+                sidecar_stamp = _write_sidecar(sidecar, PatchMetrics(rows), events_stamp)
+        metrics = PatchMetrics(rows)
+        _cache[key] = (events_stamp, sidecar_stamp, metrics)
+        return metrics
+
+
+def record_event(
+    events_path: Path,
+    previous_stamp: Stamp,
+    type: str,
+    input: Mapping[str, Any],
+    output: Mapping[str, Any],
+) -> None:
+    """
+    Advance the accumulator after EventStore.append_event saved one event.
+
+    Called under the store lock. previous_stamp is the log stamp before the save:
+    state known to match it (in-process cache or sidecar) is advanced by one row
+    (patch events only) and re-stamped; otherwise rows are rebuilt from the log.
+    """
+    events_path = Path(events_path).resolve()
+    if events_path.parent.name != STORAGE_DIR:
+        return
+    key = str(events_path)
+    sidecar = _metrics_path(events_path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        metrics: Optional[PatchMetrics] = None
+        if cached is not None and cached[0] == previous_stamp and cached[1] == _stamp(sidecar):
+            metrics = cached[2]
+        else:
+            rows = _read_sidecar(sidecar, previous_stamp)
+            metrics = PatchMetrics(rows) if rows is not None else None
+        if metrics is None:
+            metrics = PatchMetrics(_rows_from_events(events_path.parent.parent))
+        elif type == "patch":
+            metrics.push(patch_row(input, output))
+        events_stamp = _stamp(events_path)
+        _cache[key] = (events_stamp, _write_sidecar(sidecar, metrics, events_stamp), metrics)
 
 
 def aggregate_operational_metrics(path: Path, window: int = 10) -> dict[str, Any] | None:
@@ -11,59 +249,9 @@ def aggregate_operational_metrics(path: Path, window: int = 10) -> dict[str, Any
     Aggregate apply-rate, rollback-rate, median verify time from last N patch events.
 
     Returns dict with: runs_count, apply_rate, rollback_rate, median_verify_time_ms,
-    total_modified, total_ops. Returns None if no patch events.
+    total_modified, total_ops (plus total_skipped, no_op_rate). Returns None if no patch events.
     """
     try:
-        from eurika.storage import ProjectMemory
-
-        memory = ProjectMemory(path)
-        events = memory.events.recent_events(limit=window, types=("patch",))
+        return patch_metrics(path).summary(window)
     except Exception:
         return None
-    if not events:
-        return None
-
-    total_ops = 0
-    total_modified = 0
-    rollback_count = 0
-    durations: list[int] = []
-
-    for e in events:
-        inp = getattr(e, "input", None) or {}
-        out = getattr(e, "output", None) or {}
-        ops = int(inp.get("operations_count", 0) or 0)
-        modified = out.get("modified") or []
-        mod_count = len(modified) if isinstance(modified, list) else 0
-        success = out.get("verify_success")
-        if success is False:
-            rollback_count += 1
-        total_ops += ops
-        total_modified += mod_count
-        ms = out.get("verify_duration_ms")
-        if isinstance(ms, (int, float)) and ms is not None and ms > 0:
-            durations.append(int(ms))
-
-    apply_rate = (total_modified / total_ops) if total_ops else 0.0
-    rollback_rate = rollback_count / len(events) if events else 0.0
-
-    median_ms: int | None = None
-    if durations:
-        durations.sort()
-        mid = len(durations) // 2
-        median_ms = int(
-            durations[mid]
-            if len(durations) % 2
-            else (durations[mid - 1] + durations[mid]) / 2
-        )
-
-    return {
-        "runs_count": len(events),
-        "apply_rate": round(apply_rate, 4),
-        "rollback_rate": round(rollback_rate, 4),
-        "median_verify_time_ms": median_ms,
-        "total_modified": total_modified,
-        "total_ops": total_ops,
-    }
-
-
-# TODO (eurika): refactor long_function 'aggregate_operational_metrics' — consider extracting helper
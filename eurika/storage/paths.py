@@ -17,6 +17,12 @@ FILES = {
     "learning": "learning.json",
     "feedback": "feedback.json",
     "observations": "observations.json",
+    "history": "history.jsonl",
+}
+
+# Stores whose consolidated format differs from the legacy one: legacy files are
+# copied to this name under .eurika/ and the store converts them on first open.
+LEGACY_IMPORT_NAMES = {
     "history": "history.json",
 }
 
@@ -43,12 +49,14 @@ def ensure_storage_dir(root: Path) -> None:
 
 def migrate_if_needed(root: Path, name: str) -> None:
     """
-    If consolidated path does not exist but legacy path does, copy legacy -> consolidated.
+    If consolidated path does not exist but legacy path does, copy legacy -> consolidated
+    (or -> its LEGACY_IMPORT_NAMES entry, for stores that convert the legacy format).
     Ensures .eurika/ directory exists.
     """
     root = Path(root).resolve()
     new_path = storage_path(root, name)
     legacy_path = root / LEGACY_FILES[name]
-    if not new_path.exists() and legacy_path.exists():
-        new_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(legacy_path, new_path)
+    target = new_path.with_name(LEGACY_IMPORT_NAMES[name]) if name in LEGACY_IMPORT_NAMES else new_path
+    if not new_path.exists() and not target.exists() and legacy_path.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(legacy_path, target)
@@ -1,16 +1,66 @@
-"""Session memory for hybrid approval decisions (ROADMAP 2.7.5)."""
+"""Session memory for hybrid approval decisions (ROADMAP 2.7.5).
+
+Stored in .eurika/session_memory.sqlite3 (stdlib sqlite3):
+
+- sessions / decisions: one row per session and per (session, operation key,
+  decision); rejections are looked up by session or by (target, kind) through
+  an index, and a session is upserted in a single transaction;
+- campaign_rejected / campaign_verify: cross-session campaign memory (capped
+  to the most recent _CAMPAIGN_*_MAX keys).
+
+Sessions untouched for longer than the TTL (EURIKA_SESSION_MEMORY_TTL_DAYS,
+default 30; 0 disables) are expired on write. A legacy session_memory.json is
+imported once and renamed to session_memory.json.migrated.
+
+Each SessionMemory keeps one connection: the schema and the legacy import run
+when it is first opened, and every later call only starts a transaction on it.
+"""
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+import sqlite3
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 _CAMPAIGN_VERIFY_FAIL_MAX = 20
 _CAMPAIGN_VERIFY_SUCCESS_MAX = 50
 _CAMPAIGN_REJECTED_MAX = 100
 
+TTL_ENV = "EURIKA_SESSION_MEMORY_TTL_DAYS"
+DEFAULT_TTL_DAYS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS decisions (
+    session_id TEXT NOT NULL REFERENCES sessions(session_id) ON DELETE CASCADE,
+    op_key TEXT NOT NULL,
+    target TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    PRIMARY KEY (session_id, decision, op_key)
+);
+CREATE INDEX IF NOT EXISTS decisions_target_kind ON decisions (target, kind, decision);
+CREATE TABLE IF NOT EXISTS campaign_rejected (
+    op_key TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS campaign_verify (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    op_key TEXT NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS campaign_verify_outcome ON campaign_verify (outcome, seq);
+"""
+
 
 def operation_key(op: dict[str, Any]) -> str:
     """Stable key for storing approval/rejection decisions across runs."""
@@ -20,35 +70,141 @@ def operation_key(op: dict[str, Any]) -> str:
     return f"{target}|{kind}|{location}"
 
 
+def _split_key(key: str) -> tuple[str, str]:
+    parts = key.split("|", 2)
+    return parts[0], (parts[1] if len(parts) > 1 else "")
+
+
+def _ttl_seconds() -> float:
+    try:
+        days = float(os.environ.get(TTL_ENV, str(DEFAULT_TTL_DAYS)))
+    except ValueError:
+        days = DEFAULT_TTL_DAYS
+    return max(0.0, days) * 86400.0
+
+
 @dataclass(slots=True)
 class SessionMemory:
     """Persistent store for per-session operation decisions."""
 
     project_root: Path
     path: Path = Path(".")
+    _conn: sqlite3.Connection | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         root = Path(self.project_root).resolve()
         self.project_root = root
-        self.path = root / ".eurika" / "session_memory.json"
+        self.path = root / ".eurika" / "session_memory.sqlite3"
 
-    def _load(self) -> dict[str, Any]:
-        if not self.path.exists():
-            return {"sessions": {}}
+    @property
+    def legacy_path(self) -> Path:
+        return self.path.with_name("session_memory.json")
+
+    # --- connection -------------------------------------------------------
+
+    @contextmanager
+    def _connect(self, *, write: bool = False) -> Iterator[sqlite3.Connection | None]:
+        """Connection in a transaction; None for reads when no store exists yet."""
+        if self._conn is None and not write and not self.path.exists() and not self.legacy_path.exists():
+            yield None
+            return
+        conn = self._open()
+        with conn:
+            yield conn
+
+    def _open(self) -> sqlite3.Connection:
+        """The instance's connection; schema and legacy import run once, on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            try:
+                conn.execute("PRAGMA foreign_keys = ON")
+                conn.executescript(_SCHEMA)
+                with conn:
+                    self._migrate_legacy(conn)
+            except BaseException:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the instance's connection (reopened on next use)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self) -> None:
         try:
-            return json.loads(self.path.read_text(encoding="utf-8"))
+            self.close()
         except Exception:
-            return {"sessions": {}}
+            pass
+
+    def _migrate_legacy(self, conn: sqlite3.Connection) -> None:
+        legacy = self.legacy_path
+        if not legacy.exists():
+            return
+        conn.execute("BEGIN IMMEDIATE")  # another process may be migrating the same file
+        if not legacy.exists():
+            return
+        try:
+            data = json.loads(legacy.read_text(encoding="utf-8"))
+        except Exception:
+            data = {}
+        data = data if isinstance(data, dict) else {}
+        now = time.time()
+        for session_id, session in (data.get("sessions") or {}).items():
+            if isinstance(session, dict):
+                _upsert_session(
+                    conn,
+                    str(session_id),
+                    now,
+                    approved=[str(k) for k in session.get("approved_keys") or []],
+                    rejected=[str(k) for k in session.get("rejected_keys") or []],
+                )
+        campaign = data.get("campaign") or {}
+        _add_campaign_rejected(conn, [str(k) for k in campaign.get("rejected_keys") or []])
+        _append_verify(conn, [str(k) for k in campaign.get("verify_fail_keys") or []], "fail")
+        _append_verify(conn, [str(k) for k in campaign.get("verify_success_keys") or []], "success")
+        try:
+            legacy.replace(legacy.with_name(legacy.name + ".migrated"))
+        except OSError:
+            pass
 
-    def _save(self, data: dict[str, Any]) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    # --- sessions ---------------------------------------------------------
 
     def rejected_keys(self, session_id: str) -> set[str]:
-        data = self._load()
-        session = (data.get("sessions") or {}).get(session_id) or {}
-        rejected = session.get("rejected_keys") or []
-        return {str(x) for x in rejected}
+        with self._connect() as conn:
+            if conn is None:
+                return set()
+            rows = conn.execute(
+                "SELECT op_key FROM decisions WHERE session_id = ? AND decision = 'rejected'",
+                (session_id,),
+            )
+            return {str(r[0]) for r in rows}
+
+    def is_rejected(self, session_id: str, op: dict[str, Any]) -> bool:
+        """Point lookup: was this operation rejected in the session?"""
+        with self._connect() as conn:
+            if conn is None:
+                return False
+            row = conn.execute(
+                "SELECT 1 FROM decisions WHERE session_id = ? AND decision = 'rejected' AND op_key = ?",
+                (session_id, operation_key(op)),
+            ).fetchone()
+            return row is not None
+
+    def rejected_sessions(self, target: str, kind: str) -> list[str]:
+        """Sessions that rejected any operation of `kind` on `target` (indexed lookup)."""
+        with self._connect() as conn:
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT DISTINCT session_id FROM decisions WHERE target = ? AND kind = ? AND decision = 'rejected' "
+                "ORDER BY session_id",
+                (target, kind),
+            )
+            return [str(r[0]) for r in rows]
 
     def record(
         self,
@@ -57,57 +213,72 @@ class SessionMemory:
         approved: list[dict[str, Any]],
         rejected: list[dict[str, Any]],
     ) -> None:
-        data = self._load()
-        sessions = data.setdefault("sessions", {})
-        session = sessions.setdefault(session_id, {"approved_keys": [], "rejected_keys": []})
-        approved_keys = set(str(x) for x in session.get("approved_keys", []))
-        rejected_keys = set(str(x) for x in session.get("rejected_keys", []))
-        approved_keys |= {operation_key(op) for op in approved}
-        rejected_keys |= {operation_key(op) for op in rejected}
-        session["approved_keys"] = sorted(approved_keys)
-        session["rejected_keys"] = sorted(rejected_keys)
-        campaign = data.setdefault("campaign", {"rejected_keys": [], "verify_fail_keys": []})
-        campaign_rej = set(campaign.get("rejected_keys") or [])
-        campaign_rej |= rejected_keys
-        campaign["rejected_keys"] = sorted(campaign_rej)[-_CAMPAIGN_REJECTED_MAX:]
-        self._save(data)
+        rejected_keys = [operation_key(op) for op in rejected]
+        with self._connect(write=True) as conn:
+            _upsert_session(
+                conn,
+                session_id,
+                time.time(),
+                approved=[operation_key(op) for op in approved],
+                rejected=rejected_keys,
+            )
+            _add_campaign_rejected(conn, rejected_keys)
+            self._expire(conn)
+
+    def expire_sessions(self, ttl_seconds: float | None = None) -> int:
+        """Drop sessions not updated within ttl_seconds (default: TTL env). Returns count removed."""
+        with self._connect(write=True) as conn:
+            return self._expire(conn, ttl_seconds)
+
+    def _expire(self, conn: sqlite3.Connection, ttl_seconds: float | None = None) -> int:
+        ttl = _ttl_seconds() if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return 0
+        cur = conn.execute("DELETE FROM sessions WHERE updated_at < ?", (time.time() - ttl,))
+        return int(cur.rowcount or 0)
+
+    # --- campaign ---------------------------------------------------------
 
     def record_verify_failure(self, operations: list[dict[str, Any]]) -> None:
         """Record op keys from a run that failed verify (ROADMAP 2.7.5)."""
-        data = self._load()
-        campaign = data.setdefault(
-            "campaign",
-            {"rejected_keys": [], "verify_fail_keys": [], "verify_success_keys": []},
-        )
-        fail_keys = list(campaign.get("verify_fail_keys") or [])
-        for op in operations:
-            fail_keys.append(operation_key(op))
-        campaign["verify_fail_keys"] = fail_keys[-(_CAMPAIGN_VERIFY_FAIL_MAX):]
-        self._save(data)
+        with self._connect(write=True) as conn:
+            _append_verify(conn, [operation_key(op) for op in operations], "fail")
 
     def record_verify_success(self, operations: list[dict[str, Any]]) -> None:
         """Record op keys from a run that passed verify (promotion candidates)."""
-        data = self._load()
-        campaign = data.setdefault(
-            "campaign",
-            {"rejected_keys": [], "verify_fail_keys": [], "verify_success_keys": []},
-        )
-        success_keys = list(campaign.get("verify_success_keys") or [])
-        for op in operations:
-            success_keys.append(operation_key(op))
-        campaign["verify_success_keys"] = success_keys[-(_CAMPAIGN_VERIFY_SUCCESS_MAX):]
-        self._save(data)
+        with self._connect(write=True) as conn:
+            _append_verify(conn, [operation_key(op) for op in operations], "success")
+
+    def campaign(self) -> dict[str, list[str]]:
+        """Campaign memory: rejected_keys (sorted), verify_fail_keys / verify_success_keys (oldest first)."""
+        with self._connect() as conn:
+            if conn is None:
+                return {"rejected_keys": [], "verify_fail_keys": [], "verify_success_keys": []}
+            rejected = sorted(str(r[0]) for r in conn.execute("SELECT op_key FROM campaign_rejected"))
+            return {
+                "rejected_keys": rejected,
+                "verify_fail_keys": _verify_keys(conn, "fail"),
+                "verify_success_keys": _verify_keys(conn, "success"),
+            }
+
+    def verify_fail_count(self, op: dict[str, Any]) -> int:
+        """How many recent verify failures are recorded for this operation."""
+        with self._connect() as conn:
+            if conn is None:
+                return 0
+            row = conn.execute(
+                "SELECT COUNT(*) FROM campaign_verify WHERE outcome = 'fail' AND op_key = ?",
+                (operation_key(op),),
+            ).fetchone()
+            return int(row[0])
 
     def campaign_whitelist_candidates(self, min_success: int = 2) -> set[str]:
         """Operation keys that are stable enough to consider for whitelist."""
         if min_success <= 0:
             return set()
-        data = self._load()
-        campaign = data.get("campaign") or {}
-        from collections import Counter
-
-        success_counts = Counter(str(k) for k in (campaign.get("verify_success_keys") or []))
-        fail_counts = Counter(str(k) for k in (campaign.get("verify_fail_keys") or []))
+        campaign = self.campaign()
+        success_counts = Counter(campaign["verify_success_keys"])
+        fail_counts = Counter(campaign["verify_fail_keys"])
         return {
             key
             for key, count in success_counts.items()
@@ -116,11 +287,64 @@ class SessionMemory:
 
     def campaign_keys_to_skip(self) -> set[str]:
         """Keys to skip based on campaign memory: rejected in any session or 2+ verify failures."""
-        data = self._load()
-        campaign = data.get("campaign") or {}
-        rej = set(campaign.get("rejected_keys") or [])
-        fail_keys = campaign.get("verify_fail_keys") or []
-        from collections import Counter
-        counts = Counter(fail_keys)
+        campaign = self.campaign()
+        counts = Counter(campaign["verify_fail_keys"])
         repeated_fail = {k for k, v in counts.items() if v >= 2}
-        return rej | repeated_fail
+        return set(campaign["rejected_keys"]) | repeated_fail
+
+
+def _upsert_session(
+    conn: sqlite3.Connection,
+    session_id: str,
+    updated_at: float,
+    *,
+    approved: Iterable[str],
+    rejected: Iterable[str],
+) -> None:
+    conn.execute(
+        "INSERT INTO sessions (session_id, updated_at) VALUES (?, ?) "
+        "ON CONFLICT(session_id) DO UPDATE SET updated_at = excluded.updated_at",
+        (session_id, updated_at),
+    )
+    rows = [(session_id, key, *_split_key(key), "approved") for key in approved]
+    rows += [(session_id, key, *_split_key(key), "rejected") for key in rejected]
+    conn.executemany(
+        "INSERT OR IGNORE INTO decisions (session_id, op_key, target, kind, decision) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def _add_campaign_rejected(conn: sqlite3.Connection, keys: list[str]) -> None:
+    if not keys:
+        return
+    seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM campaign_rejected").fetchone()[0]
+    conn.executemany(
+        "INSERT INTO campaign_rejected (op_key, seq) VALUES (?, ?) "
+        "ON CONFLICT(op_key) DO UPDATE SET seq = excluded.seq",
+        [(key, seq + i + 1) for i, key in enumerate(dict.fromkeys(keys))],
+    )
+    conn.execute(
+        "DELETE FROM campaign_rejected WHERE seq NOT IN "
+        "(SELECT seq FROM campaign_rejected ORDER BY seq DESC LIMIT ?)",
+        (_CAMPAIGN_REJECTED_MAX,),
+    )
+
+
+def _append_verify(conn: sqlite3.Connection, keys: list[str], outcome: str) -> None:
+    if not keys:
+        return
+    conn.executemany(
+        "INSERT INTO campaign_verify (op_key, outcome) VALUES (?, ?)",
+        [(key, outcome) for key in keys],
+    )
+    cap = _CAMPAIGN_VERIFY_FAIL_MAX if outcome == "fail" else _CAMPAIGN_VERIFY_SUCCESS_MAX
+    conn.execute(
+        "DELETE FROM campaign_verify WHERE outcome = ? AND seq NOT IN "
+        "(SELECT seq FROM campaign_verify WHERE outcome = ? ORDER BY seq DESC LIMIT ?)",
+        (outcome, outcome, cap),
+    )
+
+
+def _verify_keys(conn: sqlite3.Connection, outcome: str) -> list[str]:
+    rows = conn.execute("SELECT op_key FROM campaign_verify WHERE outcome = ? ORDER BY seq", (outcome,))
+    return [str(r[0]) for r in rows]
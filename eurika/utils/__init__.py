@@ -1,4 +1,4 @@
 """Utility helpers façade."""
 
-from . import fs, logging  # noqa: F401
+from . import config, fs, git_changes, logging  # noqa: F401
 
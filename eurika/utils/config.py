@@ -0,0 +1,247 @@
+"""Project settings: one typed, validated, cached view of eurika configuration.
+
+Layers, lowest to highest precedence:
+
+1. built-in defaults;
+2. pyproject.toml `[tool.eurika]` (parsed with tomllib, or tomli on Python < 3.11);
+3. `.eurika/config.json` (same keys, for per-checkout tweaks);
+4. environment variables (EURIKA_*);
+5. explicit overrides, e.g. CLI flags (None means "not given").
+
+Values are checked against SCHEMA; invalid or unknown entries are skipped
+and reported in Settings.problems instead of raising. load_settings caches
+per project root and reloads only when pyproject.toml or .eurika/config.json
+change (mtime/size) or a relevant environment variable does.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+try:  # Python 3.11+
+    import tomllib as _toml
+except ImportError:  # pragma: no cover - Python < 3.11
+    try:
+        import tomli as _toml  # type: ignore[no-redef]
+    except ImportError:
+        _toml = None  # type: ignore[assignment]
+
+CONFIG_FILE = "config.json"
+
+Stamp = Optional[Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Resolved eurika settings for one project."""
+
+    verify_cmd: Optional[str] = None
+    verify_timeout: int = 300
+    verify_shards: int = 1
+    verify_worker: bool = False
+    project_version: Optional[str] = None
+    sources: Dict[str, str] = field(default_factory=dict, compare=False)
+    problems: Tuple[str, ...] = field(default=(), compare=False)
+
+
+def _positive_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("expected an integer")
+    number = int(str(value).strip()) if isinstance(value, str) else int(value)
+    if number < 1:
+        raise ValueError("must be >= 1")
+    return number
+
+
+def _shards(value: Any) -> int:
+    if isinstance(value, str) and value.strip().lower() == "auto":
+        return os.cpu_count() or 1
+    return _positive_int(value)
+
+
+def _flag(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "yes", "on"):
+        return True
+    if text in ("", "0", "false", "no", "off"):
+        return False
+    raise ValueError("expected a boolean")
+
+
+def _command(value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        raise ValueError("expected a string")
+    return value.strip() or None
+
+
+# setting -> (validator/coercer, environment variable or None)
+SCHEMA: Dict[str, Tuple[Callable[[Any], Any], Optional[str]]] = {
+    "verify_cmd": (_command, None),
+    "verify_timeout": (_positive_int, "EURIKA_VERIFY_TIMEOUT"),
+    "verify_shards": (_shards, "EURIKA_VERIFY_SHARDS"),
+    "verify_worker": (_flag, "EURIKA_VERIFY_WORKER"),
+}
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _fallback_tables(text: str) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Scalar `key = value` lines of [tool.eurika] and [project] version, when no TOML parser is installed."""
+    table: Dict[str, Any] = {}
+    version: Optional[str] = None
+    section = None
+    for line in text.splitlines():
+        stripped = line.split("#", 1)[0].strip()
+        header = re.fullmatch(r"\[([^\]]+)\]", stripped)
+        if header:
+            section = header.group(1).strip()
+            continue
+        m = re.fullmatch(r"([A-Za-z_][\w-]*)\s*=\s*(.+)", stripped)
+        if not m:
+            continue
+        raw = m.group(2).strip()
+        quoted = raw[:1] in ("'", '"') and raw[-1:] == raw[:1]
+        if section == "project" and m.group(1) == "version" and quoted:
+            version = raw[1:-1]
+        if section != "tool.eurika":
+            continue
+        if quoted:
+            table[m.group(1)] = raw[1:-1]
+        elif raw in ("true", "false"):
+            table[m.group(1)] = raw == "true"
+        elif re.fullmatch(r"-?\d+", raw):
+            table[m.group(1)] = int(raw)
+    return table, version
+
+
+def _read_pyproject(path: Path, problems: List[str]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """([tool.eurika] table, [project] version)."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return {}, None
+    if _toml is None:
+        return _fallback_tables(text)
+    try:
+        data = _toml.loads(text)
+    except Exception as exc:  # tomllib.TOMLDecodeError
+        problems.append(f"pyproject.toml: {exc}")
+        return {}, None
+    tool = (data.get("tool") or {}).get("eurika") or {}
+    project = data.get("project") or {}
+    version = project.get("version") if isinstance(project, dict) else None
+    if not isinstance(tool, dict):
+        problems.append("pyproject.toml: [tool.eurika] is not a table")
+        tool = {}
+    return tool, version if isinstance(version, str) else None
+
+
+def _read_config_json(path: Path, problems: List[str]) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except OSError:
+        return {}
+    except ValueError as exc:
+        problems.append(f".eurika/{CONFIG_FILE}: {exc}")
+        return {}
+    if not isinstance(data, dict):
+        problems.append(f".eurika/{CONFIG_FILE}: expected an object")
+        return {}
+    return data
+
+
+def _apply_layer(
+    values: Dict[str, Any],
+    sources: Dict[str, str],
+    layer: Mapping[str, Any],
+    source: str,
+    problems: List[str],
+    *,
+    strict_keys: bool,
+) -> None:
+    for key, raw in layer.items():
+        spec = SCHEMA.get(key)
+        if spec is None:
+            if strict_keys:
+                problems.append(f"{source}: unknown setting {key!r}")
+            continue
+        if raw is None:
+            continue
+        try:
+            values[key] = spec[0](raw)
+        except (TypeError, ValueError) as exc:
+            problems.append(f"{source}: {key}={raw!r} ignored ({exc})")
+            continue
+        sources[key] = source
+
+
+def _env_layer() -> Dict[str, str]:
+    return {key: os.environ[env] for key, (_, env) in SCHEMA.items() if env and env in os.environ}
+
+
+def _build(root: Path, env: Mapping[str, str]) -> Settings:
+    problems: List[str] = []
+    values: Dict[str, Any] = {}
+    sources: Dict[str, str] = {}
+    tool, version = _read_pyproject(root / "pyproject.toml", problems)
+    _apply_layer(values, sources, tool, "pyproject.toml", problems, strict_keys=True)
+    from eurika.storage.paths import STORAGE_DIR
+
+    local = _read_config_json(root / STORAGE_DIR / CONFIG_FILE, problems)
+    _apply_layer(values, sources, local, f".eurika/{CONFIG_FILE}", problems, strict_keys=True)
+    _apply_layer(values, sources, env, "env", problems, strict_keys=False)
+    return Settings(project_version=version, sources=sources, problems=tuple(problems), **values)
+
+
+_cache: Dict[str, Tuple[Tuple[Stamp, Stamp, Tuple[Tuple[str, str], ...]], Settings]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_settings(project_root: Path, overrides: Optional[Mapping[str, Any]] = None) -> Settings:
+    """
+    Settings for project_root (cached; reloaded when config files or env change).
+
+    overrides (e.g. CLI flags) win over every other layer; None values are ignored.
+    """
+    from eurika.storage.paths import STORAGE_DIR
+
+    root = Path(project_root).resolve()
+    env = _env_layer()
+    key = (
+        _stamp(root / "pyproject.toml"),
+        _stamp(root / STORAGE_DIR / CONFIG_FILE),
+        tuple(sorted(env.items())),
+    )
+    with _cache_lock:
+        cached = _cache.get(str(root))
+        if cached is not None and cached[0] == key:
+            settings = cached[1]
+        else:
+            settings = _build(root, env)
+            _cache[str(root)] = (key, settings)
+    if not overrides or all(v is None for v in overrides.values()):
+        return settings
+    values: Dict[str, Any] = {}
+    sources = dict(settings.sources)
+    problems = list(settings.problems)
+    _apply_layer(values, sources, overrides, "override", problems, strict_keys=True)
+    return replace(settings, sources=sources, problems=tuple(problems), **values)
+
+
+def clear_settings_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
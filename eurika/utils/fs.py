@@ -1,6 +1,132 @@
-"""Filesystem utilities placeholder.
+"""Shared filesystem utilities.
 
-Currently Eurika uses ad-hoc filesystem helpers; this module exists as a
-target for future extraction of shared fs utilities.
+- project_lock / file_lock: advisory, thread-reentrant lock on
+  project_root/.eurika/.lock so concurrent eurika processes on one project
+  serialise writes to stores and backups.
+- new_run_id: collision-free, lexicographically sortable run identifiers.
 """
 
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import ContextManager, Dict, Iterator
+
+try:  # POSIX only; on other platforms locking degrades to in-process only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+LOCK_FILE = ".lock"
+STORAGE_DIR = ".eurika"
+
+_run_counter = itertools.count()
+_counter_lock = threading.Lock()
+
+_held_lock = threading.Lock()
+
+
+class _PathLock:
+    """Per-path state: a thread mutex around one shared flock'd fd.
+
+    flock is per open file description, so nested acquisitions in one thread
+    share a single fd instead of reopening; other threads wait on `mutex`.
+    """
+
+    __slots__ = ("mutex", "fd", "depth", "refs")
+
+    def __init__(self) -> None:
+        self.mutex = threading.RLock()
+        self.fd = -1
+        self.depth = 0  # nesting depth of the owning thread
+        self.refs = 0  # threads holding or waiting for this path (guarded by _held_lock)
+
+
+# lock path -> state; _held_lock guards only this bookkeeping, never a critical section.
+_held: Dict[str, _PathLock] = {}
+
+
+def new_run_id() -> str:
+    """
+    Return a unique, sortable run id: YYYYmmdd_HHMMSS_ffffff_<pid>_<counter>.
+
+    Microseconds + pid + per-process counter make ids unique across parallel
+    processes and rapid successive runs in one process.
+    """
+    with _counter_lock:
+        seq = next(_run_counter)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+    return f"{stamp}_{os.getpid()}_{seq:04d}"
+
+
+def lock_path(project_root: Path) -> Path:
+    """Return path of the project-wide advisory lock file."""
+    return Path(project_root).resolve() / STORAGE_DIR / LOCK_FILE
+
+
+def project_lock(project_root: Path) -> ContextManager[None]:
+    """Hold an exclusive advisory lock on project_root/.eurika/.lock."""
+    return file_lock(lock_path(project_root))
+
+
+def _acquire_fd(path: Path) -> int:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        return -1
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+    return fd
+
+
+def _release_fd(fd: int) -> None:
+    if fd < 0:
+        return
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive advisory flock on path (created if missing).
+
+    Excludes other processes (flock) and other threads of this process (a
+    per-path mutex); locks on different paths do not block each other. The
+    same thread may re-enter (nested calls reuse the held fd). Failing to
+    create the lock file (read-only tree) does not block the caller.
+    """
+    path = Path(path).resolve()
+    key = str(path)
+    with _held_lock:
+        entry = _held.get(key)
+        if entry is None:
+            entry = _held[key] = _PathLock()
+        entry.refs += 1
+    try:
+        with entry.mutex:
+            if entry.depth == 0:
+                entry.fd = _acquire_fd(path)
+            entry.depth += 1
+            try:
+                yield
+            finally:
+                entry.depth -= 1
+                if entry.depth == 0:
+                    fd, entry.fd = entry.fd, -1
+                    _release_fd(fd)
+    finally:
+        with _held_lock:
+            entry.refs -= 1
+            if entry.refs == 0:
+                del _held[key]
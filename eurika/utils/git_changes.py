@@ -0,0 +1,96 @@
+"""Git-aware change scoping.
+
+changed_python_files lists .py files that differ from a base ref (committed
+since the ref, staged, unstaged and untracked), relative to the project root.
+Deleted files are included so incremental self_map updates can drop them.
+
+Scoped commands (scan/fix/cycle --changed-since REF) restrict file-level work
+(smells, unused imports, planner ops) to this set; graph-level context still
+comes from the cached full self_map.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Set
+
+CHANGED_SINCE_ENV = "EURIKA_CHANGED_SINCE"
+_GIT_TIMEOUT = 30
+
+
+def _git_lines(root: Path, args: List[str]) -> Optional[List[str]]:
+    try:
+        r = subprocess.run(
+            ["git", *args],
+            cwd=str(root),
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if r.returncode != 0:
+        return None
+    return [line.strip() for line in r.stdout.splitlines() if line.strip()]
+
+
+def changed_python_files(project_root: Path, base_ref: str = "HEAD") -> Optional[List[str]]:
+    """
+    Sorted .py paths (relative POSIX, to project_root) changed since base_ref.
+
+    Covers base_ref..working tree (commits, staged and unstaged edits, deletions)
+    plus untracked, non-ignored files. Returns None if project_root is not in a
+    git work tree or base_ref does not resolve; callers then fall back to a full scan.
+    """
+    root = Path(project_root).resolve()
+    diffed = _git_lines(root, ["diff", "--name-only", "--relative", "--no-renames", base_ref, "--"])
+    if diffed is None:
+        return None
+    untracked = _git_lines(root, ["ls-files", "--others", "--exclude-standard"]) or []
+    return sorted({p for p in diffed + untracked if p.endswith(".py")})
+
+
+def changed_since_from_env() -> Optional[str]:
+    """Base ref from EURIKA_CHANGED_SINCE (set by --changed-since), or None."""
+    value = os.environ.get(CHANGED_SINCE_ENV, "").strip()
+    return value or None
+
+
+@contextmanager
+def changed_since_env(base_ref: Optional[str]) -> Iterator[None]:
+    """
+    Set EURIKA_CHANGED_SINCE to base_ref for the block, then restore the previous value.
+
+    No-op when base_ref is empty, so one project's --changed-since never leaks
+    into the next project or into the rest of the process.
+    """
+    if not base_ref:
+        yield
+        return
+    previous = os.environ.get(CHANGED_SINCE_ENV)
+    os.environ[CHANGED_SINCE_ENV] = base_ref
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(CHANGED_SINCE_ENV, None)
+        else:
+            os.environ[CHANGED_SINCE_ENV] = previous
+
+
+def resolve_scope(project_root: Path, base_ref: Optional[str] = None) -> Optional[Set[str]]:
+    """
+    File scope for base_ref (default: EURIKA_CHANGED_SINCE).
+
+    None means "no scoping" (no ref given, or git unavailable); an empty set
+    means "nothing changed".
+    """
+    ref = base_ref or changed_since_from_env()
+    if not ref:
+        return None
+    files = changed_python_files(project_root, ref)
+    return None if files is None else set(files)
@@ -2,14 +2,18 @@
 Observation Memory v0.1
 
 Stores scan observations. No agent_core dependency.
-Append-only. TTL/pruning. Optional file persistence.
+Append-only ring. TTL/pruning. Optional file persistence (base file + append-only segment).
 """
 
 import json
+import os
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from eurika.utils.fs import LOCK_FILE, file_lock
 
 
 @dataclass
@@ -31,10 +35,23 @@ class ObservationRecord:
 
 
 STORAGE_FILE = "eurika_observations.json"
+# Compact the append-only segment into the base file past this size.
+SEGMENT_COMPACT_BYTES = 256 * 1024
+
+
+def _segment_path(storage_path: Path) -> Path:
+    return storage_path.with_name(storage_path.name + ".segment")
 
 
 class ObservationMemory:
-    """Stores observations from scan/analyze. Persists to file if storage_path given."""
+    """
+    Stores observations from scan/analyze in a bounded ring (deque, newest last).
+
+    With storage_path, the base file holds a compacted {"records": [...]} snapshot
+    and new observations are appended as JSON lines to `<file>.segment`. The
+    segment is folded into the base once it outgrows SEGMENT_COMPACT_BYTES or
+    max_records lines, so a record costs one line write instead of a rewrite.
+    """
 
     def __init__(
         self,
@@ -42,38 +59,92 @@ class ObservationMemory:
         max_age_seconds: Optional[float] = None,
         storage_path: Optional[Path] = None,
     ):
-        self._records: List[ObservationRecord] = []
         self.max_records = max_records
         self.max_age_seconds = max_age_seconds
         self.storage_path = storage_path
+        self._records: Deque[ObservationRecord] = deque(maxlen=max(max_records, 0))
+        self._segment_lines = 0
         if storage_path:
             self._load()
 
-    def _load(self) -> None:
-        if not self.storage_path or not self.storage_path.exists():
-            return
+    def _read_disk(self) -> Tuple[List[ObservationRecord], int]:
+        """Base records plus segment records not yet compacted, in time order; (records, segment lines)."""
+        assert self.storage_path is not None
+        records: List[ObservationRecord] = []
         try:
             data = json.loads(self.storage_path.read_text(encoding="utf-8"))
-            self._records = [ObservationRecord.from_dict(r) for r in data.get("records", [])]
-        except (json.JSONDecodeError, OSError):
+            records = [ObservationRecord.from_dict(r) for r in data.get("records", [])]
+        except (json.JSONDecodeError, OSError, AttributeError):
             pass
+        # A crash between compaction steps can leave already-compacted lines behind.
+        # (Match by timestamp, not "newer than the base": a concurrent writer may
+        # append a record created just before another process compacted.)
+        compacted = {r.timestamp for r in records}
+        appended = False
+        lines = 0
+        try:
+            with open(_segment_path(self.storage_path), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        item = json.loads(line)
+                    except ValueError:
+                        continue
+                    lines += 1
+                    rec = ObservationRecord.from_dict(item)
+                    if rec.timestamp not in compacted:
+                        records.append(rec)
+                        appended = True
+        except OSError:
+            pass
+        if appended:
+            records.sort(key=lambda r: r.timestamp)
+        return records, lines
 
-    def _save(self) -> None:
+    def _load(self) -> None:
+        records, self._segment_lines = self._read_disk()
+        self._records.extend(records)
+
+    def _compact(self) -> None:
+        """Rewrite the base file from the current ring and drop the segment (caller holds the lock)."""
+        assert self.storage_path is not None
+        # Pick up observations appended by other ObservationMemory instances.
+        records, _ = self._read_disk()
+        self._records.clear()
+        self._records.extend(records)
+        self._prune()
+        data = {"records": [r.to_dict() for r in self._records]}
+        tmp = self.storage_path.with_name(f".{self.storage_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.storage_path)
+        _segment_path(self.storage_path).unlink(missing_ok=True)
+        self._segment_lines = 0
+
+    def _save(self, record: ObservationRecord) -> None:
         if not self.storage_path:
             return
+        segment = _segment_path(self.storage_path)
         try:
-            data = {"records": [r.to_dict() for r in self._records]}
-            self.storage_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            # Same lock as EventStore: another process must not append between
+            # compaction's read of the segment and its unlink.
+            with file_lock(self.storage_path.parent / LOCK_FILE):
+                with open(segment, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+                self._segment_lines += 1
+                if (
+                    not self.storage_path.exists()
+                    or self._segment_lines >= max(self.max_records, 1)
+                    or segment.stat().st_size >= SEGMENT_COMPACT_BYTES
+                ):
+                    self._compact()
         except OSError:
             pass
 
     def record_observation(self, trigger: str, observation: Dict[str, Any]) -> None:
         """Append observation. Prunes if limits exceeded. Saves to file if configured."""
-        self._records.append(
-            ObservationRecord(trigger=trigger, observation=observation)
-        )
+        record = ObservationRecord(trigger=trigger, observation=observation)
+        self._records.append(record)
         self._prune()
-        self._save()
+        self._save(record)
 
     def snapshot(self) -> List[ObservationRecord]:
         """Return read-only copy of records."""
@@ -81,14 +152,11 @@ class ObservationMemory:
         return list(self._records)
 
     def _prune(self) -> None:
+        # The deque bounds the count; records are in time order, so expired ones are at the left.
         if self.max_age_seconds is not None:
-            now = time.time()
-            self._records = [
-                r for r in self._records
-                if (now - r.timestamp) <= self.max_age_seconds
-            ]
-        while len(self._records) > self.max_records:
-            self._records.pop(0)
+            cutoff = time.time() - self.max_age_seconds
+            while self._records and self._records[0].timestamp < cutoff:
+                self._records.popleft()
 
     def __len__(self) -> int:
         return len(self._records)
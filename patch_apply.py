@@ -7,7 +7,8 @@ human-reviewable plan output only.
 
 Supports dry_run: when True, only reports what would be done; when False,
 appends content to files. When backup=True (default for apply), copies each
-file to .eurika_backups/<run_id>/ before modifying, so you can restore.
+file to .eurika_backups/<run_id>/ before modifying and journals every write
+(pre/post hash, created/modified), so you can restore exactly that run.
 
 v0.2: remove_cyclic_import — when op.kind is remove_cyclic_import and
 params.target_module is set, uses AST to remove the import instead of appending.
@@ -23,11 +24,12 @@ appends TODO comment via default append-diff path.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 from patch_apply_backup import (
     BACKUP_DIR,
+    WriteJournal,
+    file_hash,
     list_backups as _list_backups_impl,
     restore_backup as _restore_backup_impl,
     write_single_file_change as _write_single_file_change,
@@ -37,6 +39,7 @@ from patch_apply_handlers import (
     handle_fix_import,
     handle_non_default_kind,
 )
+from eurika.utils.fs import new_run_id, project_lock
 
 
 def apply_patch_plan(
@@ -61,17 +64,33 @@ def apply_patch_plan(
             "errors": [str],
             "backup_dir": str | None,   # set when backup was performed
         }
+
+    Non-dry runs hold the project lock (.eurika/.lock) so concurrent eurika
+    processes do not interleave writes or backups.
     """
     root = Path(project_root).resolve()
+    if dry_run:
+        return _apply_patch_plan(root, plan, dry_run, backup)
+    with project_lock(root):
+        return _apply_patch_plan(root, plan, dry_run, backup)
+
+
+def _apply_patch_plan(
+    root: Path,
+    plan: Dict[str, Any],
+    dry_run: bool,
+    backup: bool,
+) -> Dict[str, Any]:
     modified: List[str] = []
     skipped: List[str] = []
     skipped_reasons: Dict[str, str] = {}
     errors: List[str] = []
     backup_dir: str | None = None
-    run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    run_id = new_run_id()
 
     operations = plan.get("operations") or []
     do_backup = not dry_run and backup
+    journal = WriteJournal(root, run_id) if do_backup else None
 
     for op in operations:
         target_file = op.get("target_file") or ""
@@ -84,86 +103,100 @@ def apply_patch_plan(
             continue
 
         path = root / target_file
+        mark = len(modified)
+        pre_hash = file_hash(path) if journal is not None else None
+        try:
+            def _skip(reason: str) -> None:
+                skipped.append(target_file)
+                skipped_reasons[target_file] = reason
 
-        def _skip(reason: str) -> None:
-            skipped.append(target_file)
-            skipped_reasons[target_file] = reason
-
-        if handle_create_module_stub(
-            kind, path, target_file, content, dry_run, modified, _skip, errors
-        ):
-            continue
-
-        handled, backup_dir = handle_fix_import(
-            kind=kind,
-            root=root,
-            path=path,
-            target_file=target_file,
-            diff=diff,
-            dry_run=dry_run,
-            run_id=run_id,
-            backup_dir=backup_dir,
-            do_backup=do_backup,
-            modified=modified,
-            skip_cb=_skip,
-            errors=errors,
-        )
-        if handled:
-            continue
+            if handle_create_module_stub(
+                kind, path, target_file, content, dry_run, modified, _skip, errors
+            ):
+                continue
 
-        if not path.exists():
-            _skip("path not found")
-            continue
-        if not path.is_file():
-            _skip("path not a file")
-            continue
+            handled, backup_dir = handle_fix_import(
+                kind=kind,
+                root=root,
+                path=path,
+                target_file=target_file,
+                diff=diff,
+                dry_run=dry_run,
+                run_id=run_id,
+                backup_dir=backup_dir,
+                do_backup=do_backup,
+                modified=modified,
+                skip_cb=_skip,
+                errors=errors,
+            )
+            if handled:
+                continue
 
-        if dry_run:
-            modified.append(target_file)
-            continue
+            if not path.exists():
+                _skip("path not found")
+                continue
+            if not path.is_file():
+                _skip("path not a file")
+                continue
 
-        handled, backup_dir = handle_non_default_kind(
-            root=root,
-            path=path,
-            target_file=target_file,
-            kind=kind,
-            params=params,
-            run_id=run_id,
-            backup_dir=backup_dir,
-            do_backup=do_backup,
-            modified=modified,
-            skip_cb=_skip,
-            errors=errors,
-        )
-        if handled:
-            continue
+            if dry_run:
+                modified.append(target_file)
+                continue
 
-        # Default: append diff
-        content = path.read_text(encoding="utf-8")
-        # Skip if exact diff already present
-        if diff.strip() and diff.strip() in content:
-            _skip("diff already in content")
-            continue
-        # For architectural ops (refactor_module, split_module): skip if file already has
-        # "TODO: Refactor {target}" — prevents duplicate god_module TODOs. refactor_code_smell
-        # uses different format (# TODO (eurika): refactor long_function...) and may add multiple.
-        if kind in ("refactor_module", "split_module"):
-            marker = f"# TODO: Refactor {target_file}"
-            if marker in content:
-                _skip("architectural TODO already present")
+            handled, backup_dir = handle_non_default_kind(
+                root=root,
+                path=path,
+                target_file=target_file,
+                kind=kind,
+                params=params,
+                run_id=run_id,
+                backup_dir=backup_dir,
+                do_backup=do_backup,
+                modified=modified,
+                skip_cb=_skip,
+                errors=errors,
+            )
+            if handled:
                 continue
 
+            # Default: append diff
+            content = path.read_text(encoding="utf-8")
+            # Skip if exact diff already present
+            if diff.strip() and diff.strip() in content:
+                _skip("diff already in content")
+                continue
+            # For architectural ops (refactor_module, split_module): skip if file already has
+            # "TODO: Refactor {target}" — prevents duplicate god_module TODOs. refactor_code_smell
+            # uses different format (# TODO (eurika): refactor long_function...) and may add multiple.
+            if kind in ("refactor_module", "split_module"):
+                marker = f"# TODO: Refactor {target_file}"
+                if marker in content:
+                    _skip("architectural TODO already present")
+                    continue
+
+            try:
+                suffix = "\n" + diff
+                if not content.endswith("\n"):
+                    suffix = "\n" + suffix
+                backup_dir, changed = _write_single_file_change(
+                    root, path, target_file, content + suffix, run_id, backup_dir, do_backup
+                )
+                if changed:
+                    modified.append(target_file)
+            except Exception as e:
+                errors.append(f"{target_file}: {e}")
+        finally:
+            if journal is not None and len(modified) > mark:
+                journal.record(modified[mark:], {target_file: pre_hash})
+
+    if journal is not None:
         try:
-            suffix = "\n" + diff
-            if not content.endswith("\n"):
-                suffix = "\n" + suffix
-            backup_dir, changed = _write_single_file_change(
-                root, path, target_file, content + suffix, run_id, backup_dir, do_backup
-            )
-            if changed:
-                modified.append(target_file)
-        except Exception as e:
-            errors.append(f"{target_file}: {e}")
+            journal_dir = journal.save()
+        except OSError as e:
+            errors.append(f"write journal: {e}")
+            journal_dir = None
+        if backup_dir is None:
+            backup_dir = journal_dir
 
     # Deduplicate modified (same file can be touched by multiple ops, e.g. clean_imports + refactor)
     modified_unique = list(dict.fromkeys(modified))
@@ -192,15 +225,17 @@ def list_backups(project_root: Path) -> Dict[str, Any]:
 def restore_backup(
     project_root: Path,
     run_id: str | None = None,
+    force: bool = False,
 ) -> Dict[str, Any]:
     """
     Restore files from .eurika_backups/<run_id>/ to project root.
     If run_id is None, restores from the latest run (most recent by name).
+    Files edited since the run are reported in "conflicts" and kept unless force=True.
 
     Returns:
-        {"restored": [str], "errors": [str], "run_id": str | None}
+        {"restored": [str], "removed": [str], "conflicts": [str], "errors": [str], "run_id": str | None}
     """
-    return _restore_backup_impl(project_root, run_id)
+    return _restore_backup_impl(project_root, run_id, force)
 
 # TODO (eurika): refactor god_module patch_apply — extract handlers, introduce facade.
 
@@ -1,11 +1,90 @@
-"""Backup and file-write helpers for patch_apply."""
+"""Backup and file-write helpers for patch_apply.
+
+Each non-dry run keeps a write journal (.eurika_backups/<run_id>/.journal.json):
+one entry per touched file with its pre- and post-run sha256 and whether the
+run created, modified or deleted it. Rollback restores only files still at
+their post-run hash, removes only files the run created and reports the rest
+as conflicts. Runs without a journal (older backups) restore every backup file.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Iterable
+
+from eurika.utils.fs import project_lock
 
 BACKUP_DIR = ".eurika_backups"
+JOURNAL_FILE = ".journal.json"
+
+
+def file_hash(path: Path) -> str | None:
+    """sha256 of the file bytes; None when the file does not exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+class WriteJournal:
+    """Per-run record of files written by apply_patch_plan."""
+
+    def __init__(self, root: Path, run_id: str) -> None:
+        self.root = root
+        self.run_id = run_id
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def run_path(self) -> Path:
+        return self.root / BACKUP_DIR / self.run_id
+
+    def record(self, paths: Iterable[str], pre_hashes: Dict[str, str | None]) -> None:
+        """
+        Record post-write hashes for paths an operation reported as modified.
+
+        pre_hashes holds hashes taken before the operation; a path first seen
+        without one was created by it (handlers refuse to overwrite new files).
+        """
+        for rel in dict.fromkeys(paths):
+            post = file_hash(self.root / rel)
+            entry = self.entries.get(rel)
+            if entry is None:
+                pre = pre_hashes.get(rel)
+                if pre is None:
+                    status = "created"
+                elif post is None:
+                    status = "deleted"
+                else:
+                    status = "modified"
+                entry = self.entries[rel] = {"path": rel, "status": status, "pre_hash": pre}
+            elif post is None and entry["status"] == "modified":
+                entry["status"] = "deleted"
+            entry["post_hash"] = post
+
+    def save(self) -> str | None:
+        """Write the journal into the run's backup dir; returns the dir (None when empty)."""
+        if not self.entries:
+            return None
+        self.run_path.mkdir(parents=True, exist_ok=True)
+        path = self.run_path / JOURNAL_FILE
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        data = {"run_id": self.run_id, "files": list(self.entries.values())}
+        tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        return str(self.run_path)
+
+
+def load_journal(run_path: Path) -> list[Dict[str, Any]] | None:
+    """Journal entries of a backup run; None for runs recorded without a journal."""
+    try:
+        data = json.loads((run_path / JOURNAL_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    files = data.get("files") if isinstance(data, dict) else None
+    return [f for f in files if isinstance(f, dict) and f.get("path")] if isinstance(files, list) else None
 
 
 def backup_file(
@@ -16,13 +95,19 @@ def backup_file(
     backup_dir: str | None,
     do_backup: bool,
 ) -> str | None:
-    """Copy path to .eurika_backups/run_id/target_file if do_backup. Returns backup_dir."""
+    """
+    Copy path to .eurika_backups/run_id/target_file if do_backup. Returns backup_dir.
+
+    The first copy in a run wins, so a file touched by several operations is
+    restored to its pre-run content.
+    """
     if not do_backup:
         return backup_dir
     backup_root = root / BACKUP_DIR / run_id
     backup_path = backup_root / target_file
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
-    backup_path.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+    if not backup_path.exists():
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        backup_path.write_bytes(path.read_bytes())
     return str(backup_root) if backup_dir is None else backup_dir
 
 
@@ -89,15 +174,24 @@ def list_backups(project_root: Path) -> dict[str, Any]:
     return {"run_ids": run_ids, "backup_dir": str(backup_root)}
 
 
-def restore_backup(project_root: Path, run_id: str | None = None) -> dict[str, Any]:
+def restore_backup(project_root: Path, run_id: str | None = None, force: bool = False) -> dict[str, Any]:
     """
     Restore files from .eurika_backups/<run_id>/ to project root.
     If run_id is None, restores from the latest run (most recent by name).
 
+    Journaled runs touch only the run's own writes: files still at their
+    post-run hash are restored (created ones removed); files edited since are
+    left alone and listed in "conflicts" unless force=True.
+
     Returns:
-        {"restored": [str], "errors": [str], "run_id": str | None}
+        {"restored": [str], "removed": [str], "conflicts": [str], "errors": [str], "run_id": str | None}
     """
     root = Path(project_root).resolve()
+    with project_lock(root):
+        return _restore_backup(root, run_id, force)
+
+
+def _restore_backup(root: Path, run_id: str | None, force: bool = False) -> dict[str, Any]:
     backup_root = root / BACKUP_DIR
     restored: list[str] = []
     errors: list[str] = []
@@ -118,6 +212,10 @@ def restore_backup(project_root: Path, run_id: str | None = None) -> dict[str, A
         errors.append(f"Run not found: {run_id}")
         return {"restored": [], "errors": errors, "run_id": run_id}
 
+    journal = load_journal(run_path)
+    if journal is not None:
+        return _restore_journaled(root, run_path, run_id, journal, force)
+
     for backup_file_path in run_path.rglob("*"):
         if not backup_file_path.is_file():
             continue
@@ -131,3 +229,47 @@ def restore_backup(project_root: Path, run_id: str | None = None) -> dict[str, A
             errors.append(f"{rel}: {exc}")
 
     return {"restored": restored, "errors": errors, "run_id": run_id}
+
+
+def _restore_journaled(
+    root: Path,
+    run_path: Path,
+    run_id: str,
+    journal: list[Dict[str, Any]],
+    force: bool,
+) -> dict[str, Any]:
+    restored: list[str] = []
+    removed: list[str] = []
+    conflicts: list[str] = []
+    errors: list[str] = []
+    for entry in journal:
+        rel = str(entry["path"])
+        target = root / rel
+        current = file_hash(target)
+        if current == entry.get("pre_hash"):
+            continue  # already at pre-run state
+        if current != entry.get("post_hash"):
+            conflicts.append(rel)
+            if not force:
+                continue
+        try:
+            if entry.get("status") == "created":
+                target.unlink(missing_ok=True)
+                removed.append(rel)
+                continue
+            backup_path = run_path / rel
+            if not backup_path.is_file():
+                errors.append(f"{rel}: no backup in run {run_id}")
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(backup_path.read_bytes())
+            restored.append(rel)
+        except OSError as exc:
+            errors.append(f"{rel}: {exc}")
+    return {
+        "restored": restored,
+        "removed": removed,
+        "conflicts": conflicts,
+        "errors": errors,
+        "run_id": run_id,
+    }
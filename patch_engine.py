@@ -39,9 +39,9 @@ from patch_apply import apply_patch_plan as _apply_patch_plan
 from patch_apply import list_backups as _list_backups
 
 
-def rollback(project_root: Path, run_id: Optional[str] = None) -> Dict[str, Any]:
+def rollback(project_root: Path, run_id: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
     """Alias for rollback_patch."""
-    return rollback_patch(project_root, run_id)
+    return rollback_patch(project_root, run_id, force)
 
 def list_backups(project_root: Path) -> Dict[str, Any]:
     """List available backup run_ids in .eurika_backups/."""
@@ -4,6 +4,8 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from eurika.utils.config import Settings
+
 from patch_engine_apply_patch import apply_patch
 from patch_engine_apply_and_verify_helpers import (
     maybe_apply_py_compile_fallback,
@@ -22,10 +24,14 @@ def _run_verify_with_fallbacks(
     verify_cmd: Optional[str],
     retry_on_import_error: bool,
     auto_rollback: bool,
+    settings: Optional[Settings] = None,
 ) -> None:
     """Run verify, optional retry/compile fallback, and auto_rollback. Mutates report."""
     verify_started = time.perf_counter()
-    report["verify"] = verify_patch(root, timeout=verify_timeout, verify_cmd=verify_cmd)
+    # Only pass/fail (and the failing output) matter here: sharded runs may stop early.
+    report["verify"] = verify_patch(
+        root, timeout=verify_timeout, verify_cmd=verify_cmd, fail_fast=True, settings=settings
+    )
     maybe_retry_import_fix(
         root=root,
         report=report,
@@ -34,6 +40,7 @@ def _run_verify_with_fallbacks(
         retry_on_import_error=retry_on_import_error,
         apply_patch_fn=apply_patch,
         verify_patch_fn=verify_patch,
+        settings=settings,
     )
     maybe_apply_py_compile_fallback(
         root=root,
@@ -60,6 +67,7 @@ def apply_and_verify(
     verify_cmd: Optional[str] = None,
     auto_rollback: bool = True,
     retry_on_import_error: bool = True,
+    settings: Optional[Settings] = None,
 ) -> Dict[str, Any]:
     """
     Apply a patch plan and optionally run verify command. On verify failure, optionally
@@ -74,6 +82,7 @@ def apply_and_verify(
         verify_cmd: Override for verify command (e.g. "python manage.py test"); else use pyproject or pytest.
         auto_rollback: If True and verify fails (after retry if any), restore from backup (last run_id).
         retry_on_import_error: If True and verify fails with ModuleNotFoundError/ImportError, try fix and re-verify once.
+        settings: Already resolved project settings for verify (default: load_settings(project_root)).
 
     Returns:
         Report with keys: dry_run, modified, skipped, errors, backup_dir, run_id;
@@ -93,6 +102,7 @@ def apply_and_verify(
         verify_cmd=verify_cmd,
         retry_on_import_error=retry_on_import_error,
         auto_rollback=auto_rollback,
+        settings=settings,
     )
     return report
 
@@ -33,6 +33,7 @@ def maybe_retry_import_fix(
     retry_on_import_error: bool,
     apply_patch_fn: Callable[..., Dict[str, Any]],
     verify_patch_fn: Callable[..., Dict[str, Any]],
+    settings: Any = None,
 ) -> None:
     """Try auto-fix for import errors and re-run verify once."""
     if report["verify"]["success"] or not retry_on_import_error or not report.get("run_id"):
@@ -53,7 +54,7 @@ def maybe_retry_import_fix(
     fix_report = apply_patch_fn(root, fix_plan, backup=False)
     report["modified"] = report.get("modified", []) + fix_report.get("modified", [])
     report["fix_import_retry"] = {"applied": fix_report.get("modified", [])}
-    report["verify"] = verify_patch_fn(root, timeout=verify_timeout, verify_cmd=verify_cmd)
+    report["verify"] = verify_patch_fn(root, timeout=verify_timeout, verify_cmd=verify_cmd, settings=settings)
 
 
 def maybe_apply_py_compile_fallback(
@@ -97,6 +98,8 @@ def maybe_auto_rollback(
             "done": True,
             "run_id": report["run_id"],
             "restored": rollback_report.get("restored", []),
+            "removed": rollback_report.get("removed", []),
+            "conflicts": rollback_report.get("conflicts", []),
             "errors": rollback_report.get("errors", []),
             "trigger": "verify_failed",
         }
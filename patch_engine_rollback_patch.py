@@ -3,12 +3,14 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 from patch_apply import restore_backup
 
-def rollback_patch(project_root: Path, run_id: Optional[str]=None) -> Dict[str, Any]:
+def rollback_patch(project_root: Path, run_id: Optional[str]=None, force: bool=False) -> Dict[str, Any]:
     """
     Restore files from .eurika_backups to project root.
     If run_id is None, restores from the latest backup run.
+    Only the run's journaled writes are undone; files edited since are
+    reported in "conflicts" and left untouched unless force=True.
 
     Returns:
-        {"restored": [str], "errors": [str], "run_id": str | None}
+        {"restored": [str], "removed": [str], "conflicts": [str], "errors": [str], "run_id": str | None}
     """
-    return restore_backup(Path(project_root).resolve(), run_id=run_id)
\ No newline at end of file
+    return restore_backup(Path(project_root).resolve(), run_id=run_id, force=force)
\ No newline at end of file
@@ -1,48 +1,31 @@
 """Extracted from parent module to reduce complexity."""
-import os
-import re
 import shlex
 import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from eurika.utils.config import Settings, load_settings
+from patch_engine_verify_shards import run_sharded
+from patch_engine_verify_worker import pytest_args, run_in_worker
+
 
 def get_verify_timeout(project_root: Path, override: Optional[int] = None) -> int:
-    """Resolve verify timeout: override > EURIKA_VERIFY_TIMEOUT > pyproject [tool.eurika] verify_timeout > 300."""
+    """Resolve verify timeout: override > EURIKA_VERIFY_TIMEOUT > .eurika/config.json > pyproject [tool.eurika] verify_timeout > 300."""
     if override is not None and override > 0:
         return int(override)
-    env_val = os.environ.get("EURIKA_VERIFY_TIMEOUT")
-    if env_val is not None:
-        try:
-            return max(1, int(env_val.strip()))
-        except ValueError:
-            pass
-    pyproject = project_root / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            text = pyproject.read_text(encoding="utf-8")
-            m = re.search(r"verify_timeout\s*=\s*(\d+)", text)
-            if m:
-                return max(1, int(m.group(1)))
-        except (OSError, UnicodeDecodeError):
-            pass
-    return 300
+    return load_settings(project_root).verify_timeout
 
 
-def _get_verify_cmd(project_root: Path, override: Optional[str] = None) -> List[str]:
-    """Resolve verify command: override > pyproject.toml [tool.eurika] verify_cmd > default pytest."""
+def _get_verify_cmd(
+    project_root: Path, override: Optional[str] = None, settings: Optional[Settings] = None
+) -> List[str]:
+    """Resolve verify command: override > .eurika/config.json > pyproject.toml [tool.eurika] verify_cmd > default pytest."""
     if override is not None and override.strip():
         return shlex.split(override.strip())
-    pyproject = project_root / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            text = pyproject.read_text(encoding="utf-8")
-            m = re.search(r'verify_cmd\s*=\s*["\']([^"\']+)["\']', text)
-            if m:
-                return shlex.split(m.group(1).strip())
-        except (OSError, UnicodeDecodeError):
-            pass
+    configured = (settings or load_settings(project_root)).verify_cmd
+    if configured:
+        return shlex.split(configured)
     return [sys.executable, "-m", "pytest", "-q"]
 
 
@@ -65,37 +48,66 @@ def verify_patch(
     *,
     timeout: int = 120,
     verify_cmd: Optional[str] = None,
+    fail_fast: bool = False,
+    settings: Optional[Settings] = None,
 ) -> Dict[str, Any]:
     """
     Run verify command in project_root (default: pytest -q).
     verify_cmd overrides [tool.eurika] verify_cmd in pyproject.toml.
     For 'python -m py_compile' with no args, all project .py files are passed automatically.
+    Settings come from eurika.utils.config (pyproject, .eurika/config.json, env) unless the
+    caller passes the ones it already resolved (the fix cycle does).
+    With verify_shards=N (EURIKA_VERIFY_SHARDS), `python -m pytest` commands are split across N parallel
+    subprocesses by historical file duration (patch_engine_verify_shards); fail_fast stops
+    the other shards at the first failure. Otherwise, with verify_worker (EURIKA_VERIFY_WORKER=1), they run
+    in a warm per-project worker (patch_engine_verify_worker); anything else runs as a subprocess.
 
     Returns:
         {"success": bool, "returncode": int, "stdout": str, "stderr": str}
     """
     root = Path(project_root).resolve()
-    cmd = _get_verify_cmd(root, override=verify_cmd)
+    settings = settings or load_settings(root)
+    cmd = _get_verify_cmd(root, override=verify_cmd, settings=settings)
     cmd = _expand_py_compile_args(cmd, root)
+    shards = settings.verify_shards
+    if shards > 1 and pytest_args(cmd) is not None:
+        sharded = run_sharded(root, cmd, timeout, shards=shards, fail_fast=fail_fast)
+        if sharded is not None:
+            return sharded
+    warm = run_in_worker(root, cmd, timeout, settings=settings)
+    if warm is not None:
+        if warm.get("timeout"):
+            return _timeout_result(timeout, "", "")
+        return {
+            "success": warm["returncode"] == 0,
+            "returncode": warm["returncode"],
+            "stdout": warm["stdout"][-3000:],
+            "stderr": warm["stderr"][-3000:],
+            "warm_worker": True,
+        }
     try:
         proc = subprocess.run(cmd, cwd=root, capture_output=True, text=True, timeout=timeout)
     except subprocess.TimeoutExpired as e:
         stderr = (e.stderr or "") if isinstance(e.stderr, str) else ""
         stdout = (e.stdout or "") if isinstance(e.stdout, str) else ""
-        msg = f"verify command timed out after {timeout}s"
-        if stderr:
-            stderr = f"{stderr}\n{msg}"
-        else:
-            stderr = msg
-        return {
-            "success": False,
-            "returncode": -1,
-            "stdout": stdout[-3000:],
-            "stderr": stderr[-3000:],
-        }
+        return _timeout_result(timeout, stdout, stderr)
     return {
         "success": proc.returncode == 0,
         "returncode": proc.returncode,
         "stdout": (proc.stdout or "")[-3000:],
         "stderr": (proc.stderr or "")[-3000:],
     }
+
+
+def _timeout_result(timeout: int, stdout: str, stderr: str) -> Dict[str, Any]:
+    msg = f"verify command timed out after {timeout}s"
+    if stderr:
+        stderr = f"{stderr}\n{msg}"
+    else:
+        stderr = msg
+    return {
+        "success": False,
+        "returncode": -1,
+        "stdout": stdout[-3000:],
+        "stderr": stderr[-3000:],
+    }
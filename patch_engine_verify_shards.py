@@ -0,0 +1,372 @@
+"""Sharded parallel pytest runs for verify_patch (opt-in: verify_shards / EURIKA_VERIFY_SHARDS).
+
+Test files are partitioned across N concurrent `python -m pytest` subprocesses
+by their historical duration (longest first onto the least loaded shard).
+Durations come from each shard's JUnit XML and are kept in
+.eurika/verify_durations.json for the next run. Exit codes and output are
+merged; with fail_fast the remaining shards are stopped at the first failure.
+No pytest plugin (xdist or other) is needed.
+
+Test files are selected the way pytest would collect them: the project's
+pytest config (pytest.toml, pytest.ini, pyproject.toml, tox.ini, setup.cfg,
+same precedence as pytest) supplies testpaths, python_files and
+norecursedirs, and every shard is pinned to that file with -c. Runs that
+cannot be reproduced file-by-file (config above the project root, -c,
+--ignore, --pyargs, ...) are left to the single unsharded run.
+"""
+
+from __future__ import annotations
+
+import configparser
+import fnmatch
+import heapq
+import json
+import os
+import shlex
+import subprocess
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # Python 3.11+
+    import tomllib as _toml
+except ImportError:  # pragma: no cover - Python < 3.11
+    try:
+        import tomli as _toml  # type: ignore[no-redef]
+    except ImportError:
+        _toml = None  # type: ignore[assignment]
+
+DURATIONS_FILE = "verify_durations.json"
+OUTPUT_TAIL = 3000
+# pytest's "no tests collected" exit code: fine for one shard, not for all.
+NO_TESTS = 5
+# pytest's defaults for the ini options that decide which files are collected.
+DEFAULT_PYTHON_FILES = ["test_*.py", "*_test.py"]
+DEFAULT_NORECURSEDIRS = ["*.egg", ".*", "_darcs", "build", "CVS", "dist", "node_modules", "venv", "{arch}"]
+# Lookup order of pytest's locate_config.
+CONFIG_NAMES = ("pytest.toml", ".pytest.toml", "pytest.ini", ".pytest.ini", "pyproject.toml", "tox.ini", "setup.cfg")
+# Options whose effect on collection a per-file split cannot reproduce.
+_UNSHARDABLE_OPTIONS = ("-c", "--config-file", "--ignore", "--ignore-glob", "--pyargs", "--confcutdir", "--collect-in-virtualenv")
+
+
+class _UnreadableConfig(Exception):
+    """A pytest config file exists but cannot be parsed here (e.g. TOML without tomllib)."""
+
+
+def _ini_file_options(path: Path) -> Optional[Dict[str, Any]]:
+    """pytest options in one config file; None when the file holds no pytest configuration."""
+    if path.suffix in (".ini", ".cfg"):
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            parser.read(path, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError) as exc:
+            raise _UnreadableConfig(str(exc)) from exc
+        section = "tool:pytest" if path.suffix == ".cfg" else "pytest"
+        if parser.has_section(section):
+            return dict(parser.items(section))
+        # pytest.ini is the config even when it has no [pytest] section.
+        return {} if path.name in ("pytest.ini", ".pytest.ini") else None
+    if _toml is None:
+        raise _UnreadableConfig("no TOML parser")
+    try:
+        data = _toml.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, ValueError) as exc:
+        raise _UnreadableConfig(str(exc)) from exc
+    if path.name in ("pytest.toml", ".pytest.toml"):
+        table = data.get("pytest")
+        return dict(table) if isinstance(table, dict) else {}
+    tool = (data.get("tool") or {}).get("pytest")
+    if not isinstance(tool, dict):
+        return None
+    native = {k: v for k, v in tool.items() if k != "ini_options"}
+    if native:
+        return native
+    ini = tool.get("ini_options")
+    return dict(ini) if isinstance(ini, dict) else None
+
+
+def find_pytest_config(root: Path) -> Optional[Tuple[Path, Dict[str, Any]]]:
+    """(config file, its pytest options) as pytest resolves them when run from root; None if there is none."""
+    root = Path(root).resolve()
+    for base in (root, *root.parents):
+        for name in CONFIG_NAMES:
+            path = base / name
+            if path.is_file():
+                options = _ini_file_options(path)
+                if options is not None:
+                    return path, options
+    return None
+
+
+def _ini_list(options: Dict[str, Any], key: str, default: List[str]) -> List[str]:
+    """An "args"-type ini option: whitespace/shell-split string or TOML list."""
+    value = options.get(key)
+    if value is None:
+        return list(default)
+    if isinstance(value, str):
+        return shlex.split(value)
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    return list(default)
+
+
+def _matches(patterns: Sequence[str], path: Path) -> bool:
+    """pytest's fnmatch_ex: basename match, or a path-suffix match for patterns with a separator."""
+    for pattern in patterns:
+        if "/" not in pattern:
+            if fnmatch.fnmatch(path.name, pattern):
+                return True
+        elif fnmatch.fnmatch(path.as_posix(), pattern if pattern.startswith("/") else "*/" + pattern):
+            return True
+    return False
+
+
+def _walk_tests(base: Path, python_files: Sequence[str], norecursedirs: Sequence[str]) -> List[Path]:
+    if base.is_file():
+        # Files named on the command line are collected whatever python_files says.
+        return [base] if base.suffix == ".py" else []
+    found: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(base):
+        current = Path(dirpath)
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if d != "__pycache__"
+            and not _matches(norecursedirs, current / d)
+            and not (current / d / "pyvenv.cfg").is_file()  # pytest skips virtualenvs
+        )
+        found.extend(
+            current / name for name in sorted(filenames) if name.endswith(".py") and _matches(python_files, Path(name))
+        )
+    return found
+
+
+def split_pytest_args(root: Path, args: Sequence[str]) -> Tuple[List[str], List[Path]]:
+    """(options, path arguments): path arguments are those naming existing files or dirs."""
+    options: List[str] = []
+    paths: List[Path] = []
+    for arg in args:
+        if not arg.startswith("-") and "::" not in arg and (root / arg).exists():
+            paths.append((root / arg).resolve())
+        else:
+            options.append(arg)
+    return options, paths
+
+
+def _testpaths(root: Path, patterns: Sequence[str]) -> List[Path]:
+    found: List[Path] = []
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            found.extend(sorted(root.glob(pattern)))
+        elif (root / pattern).exists():
+            found.append(root / pattern)
+    return found
+
+
+def select_test_files(root: Path, paths: Sequence[Path], ini: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Root-relative test files pytest would collect under the given paths.
+
+    Without paths, ini's testpaths are used (pytest falls back to the root when
+    none of them exist); python_files and norecursedirs filter the walk.
+    """
+    ini = ini or {}
+    python_files = _ini_list(ini, "python_files", DEFAULT_PYTHON_FILES)
+    norecursedirs = _ini_list(ini, "norecursedirs", DEFAULT_NORECURSEDIRS)
+    bases = list(paths) or _testpaths(root, _ini_list(ini, "testpaths", [])) or [root]
+    files: List[str] = []
+    for base in bases:
+        for f in _walk_tests(base, python_files, norecursedirs):
+            try:
+                files.append(f.resolve().relative_to(root).as_posix())
+            except ValueError:
+                continue
+    return list(dict.fromkeys(files))
+
+
+def partition(files: Sequence[str], durations: Dict[str, float], shards: int) -> List[List[str]]:
+    """Longest-processing-time-first assignment of files to `shards` balanced bins."""
+    known = sorted(durations[f] for f in files if f in durations)
+    default = known[len(known) // 2] if known else 1.0
+    weighted = sorted(files, key=lambda f: (-durations.get(f, default), f))
+    # Ties (e.g. files measured at 0.0s) go to the bin with fewer files.
+    heap: List[Tuple[float, int, int]] = [(0.0, 0, i) for i in range(min(shards, len(files)))]
+    bins: List[List[str]] = [[] for _ in heap]
+    for f in weighted:
+        load, count, i = heapq.heappop(heap)
+        bins[i].append(f)
+        heapq.heappush(heap, (load + durations.get(f, default), count + 1, i))
+    return [b for b in bins if b]
+
+
+def _durations_path(root: Path) -> Path:
+    from eurika.storage.paths import STORAGE_DIR
+
+    return root / STORAGE_DIR / DURATIONS_FILE
+
+
+def load_durations(root: Path) -> Dict[str, float]:
+    try:
+        data = json.loads(_durations_path(root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    files = data.get("files") if isinstance(data, dict) else None
+    return {str(k): float(v) for k, v in (files or {}).items() if isinstance(v, (int, float))}
+
+
+def save_durations(root: Path, durations: Dict[str, float]) -> None:
+    path = _durations_path(root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": 1, "files": durations}, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _module_key(rel: str) -> str:
+    return rel[:-3].replace("/", ".") if rel.endswith(".py") else rel.replace("/", ".")
+
+
+def junit_file_times(xml_path: Path, files: Sequence[str]) -> Dict[str, float]:
+    """Per-file test time from JUnit XML (testcase classname is the dotted module path)."""
+    try:
+        tree = ET.parse(xml_path)
+    except (OSError, ET.ParseError):
+        return {}
+    by_module = sorted(((_module_key(f), f) for f in files), key=lambda kv: -len(kv[0]))
+    times: Dict[str, float] = {}
+    for case in tree.iter("testcase"):
+        classname = case.get("classname") or ""
+        try:
+            spent = float(case.get("time") or 0.0)
+        except ValueError:
+            continue
+        for module, rel in by_module:
+            if classname == module or classname.startswith(module + "."):
+                times[rel] = times.get(rel, 0.0) + spent
+                break
+    return times
+
+
+def _merge_returncode(codes: Sequence[Optional[int]]) -> int:
+    failures = [c for c in codes if c not in (0, NO_TESTS, None)]
+    if failures:
+        return 1 if 1 in failures else failures[0]
+    return NO_TESTS if codes and all(c == NO_TESTS for c in codes) else 0
+
+
+def _tail(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")[-OUTPUT_TAIL:]
+    except OSError:
+        return ""
+
+
+def run_sharded(
+    root: Path,
+    cmd: List[str],
+    timeout: int,
+    *,
+    shards: int,
+    fail_fast: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Run `python -m pytest` cmd across shards. Returns the verify payload (plus
+    "shards"), or None when fewer than two shards would be used.
+    """
+    if shards < 2:
+        return None
+    options, paths = split_pytest_args(root, cmd[3:])
+    if any(o == flag or o.startswith(flag + "=") for o in options for flag in _UNSHARDABLE_OPTIONS):
+        return None
+    try:
+        config = find_pytest_config(root)
+    except _UnreadableConfig:
+        return None
+    if config is not None:
+        if config[0].parent != root:
+            return None  # rootdir (and testpaths) would resolve outside the project
+        # Every shard reads the same config, whatever nested files its paths reach.
+        options += ["-c", str(config[0])]
+    if not any(o.startswith("--rootdir") for o in options):
+        # Stable node ids (and JUnit classnames) whatever files a shard gets.
+        options.append(f"--rootdir={root}")
+    files = select_test_files(root, paths, config[1] if config is not None else None)
+    if len(files) < 2:
+        return None
+    durations = load_durations(root)
+    bins = partition(files, durations, shards)
+    if len(bins) < 2:
+        return None
+    deadline = time.monotonic() + timeout
+    with tempfile.TemporaryDirectory(prefix="eurika-shards-") as tmp_dir:
+        tmp = Path(tmp_dir)
+        procs: List[Tuple[subprocess.Popen, Path, Path, Path]] = []
+        for i, shard in enumerate(bins):
+            out, err, xml = tmp / f"{i}.out", tmp / f"{i}.err", tmp / f"{i}.xml"
+            with open(out, "wb") as fo, open(err, "wb") as fe:
+                proc = subprocess.Popen(
+                    [*cmd[:3], *options, f"--junitxml={xml}", "-p", "no:cacheprovider", *shard],
+                    cwd=root,
+                    stdin=subprocess.DEVNULL,
+                    stdout=fo,
+                    stderr=fe,
+                )
+            procs.append((proc, out, err, xml))
+        codes: List[Optional[int]] = [None] * len(procs)
+        timed_out = stopped = False
+        while any(c is None for c in codes):
+            for i, (proc, *_rest) in enumerate(procs):
+                if codes[i] is None:
+                    codes[i] = proc.poll()
+            if fail_fast and _merge_returncode([c for c in codes if c is not None]) not in (0, NO_TESTS):
+                stopped = any(c is None for c in codes)
+                break
+            if time.monotonic() >= deadline:
+                timed_out = True
+                break
+            time.sleep(0.05)
+        for proc, *_rest in procs:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+        stdout_parts: List[str] = []
+        stderr_parts: List[str] = []
+        measured: Dict[str, float] = {}
+        for i, ((proc, out, err, xml), shard) in enumerate(zip(procs, bins)):
+            header = f"[shard {i + 1}/{len(procs)}: {len(shard)} files, exit {codes[i]}]"
+            stdout_parts.append(f"{header}\n{_tail(out)}")
+            err_text = _tail(err)
+            if err_text:
+                stderr_parts.append(f"{header}\n{err_text}")
+            if codes[i] is not None:
+                measured.update(junit_file_times(xml, shard))
+    if measured:
+        durations.update(measured)
+        save_durations(root, {f: round(t, 4) for f, t in durations.items()})
+    # Failing shards first: their output is what import-error parsing and humans need.
+    order = sorted(range(len(procs)), key=lambda i: codes[i] in (0, NO_TESTS, None))
+    stdout = "\n".join(stdout_parts[i] for i in order)
+    stderr = "\n".join(p for p in stderr_parts)
+    if timed_out:
+        msg = f"verify command timed out after {timeout}s"
+        return {
+            "success": False,
+            "returncode": -1,
+            "stdout": stdout[:OUTPUT_TAIL],
+            "stderr": f"{stderr}\n{msg}"[-OUTPUT_TAIL:] if stderr else msg,
+            "shards": len(procs),
+        }
+    returncode = _merge_returncode(codes)
+    return {
+        "success": returncode == 0,
+        "returncode": returncode,
+        "stdout": stdout[:OUTPUT_TAIL],
+        "stderr": stderr[-OUTPUT_TAIL:],
+        "shards": len(procs),
+        "stopped_early": stopped,
+    }
@@ -0,0 +1,317 @@
+"""Warm verification worker for verify_patch (opt-in: verify_worker / EURIKA_VERIFY_WORKER=1).
+
+A long-lived interpreter per project root imports pytest once and serves test
+runs over a pipe (one JSON line per request / reply). Each run is a fork of
+the worker, so it starts with pytest, its plugins and the third-party modules
+seen in earlier runs already imported. Project modules are never imported in
+the worker itself: every forked run imports them fresh, so patched files need
+no reload. The worker exits when a file it imported changed on disk; the
+caller then falls back to a cold subprocess (as it does for custom verify
+commands, platforms without fork, or any worker failure) and the next verify
+starts a new worker.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import selectors
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from eurika.utils.config import Settings
+
+OUTPUT_TAIL = 3000
+
+
+def worker_enabled(root: Path, settings: Optional["Settings"] = None) -> bool:
+    """True when the verify_worker setting (EURIKA_VERIFY_WORKER) is on and the platform can fork."""
+    if settings is None:
+        from eurika.utils.config import load_settings
+
+        settings = load_settings(root)
+    return settings.verify_worker and hasattr(os, "fork")
+
+
+def pytest_args(cmd: List[str]) -> Optional[List[str]]:
+    """Arguments after `-m pytest` when cmd runs pytest on this interpreter; else None."""
+    if len(cmd) < 3 or cmd[1:3] != ["-m", "pytest"]:
+        return None
+    exe = shutil.which(cmd[0]) or cmd[0]
+    try:
+        if Path(exe).resolve() != Path(sys.executable).resolve():
+            return None
+    except OSError:
+        return None
+    return cmd[3:]
+
+
+# --- client side ---------------------------------------------------------------
+
+
+class VerifyWorker:
+    """Handle to one worker process serving a project root."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.proc: Optional[subprocess.Popen] = None
+        self.lock = threading.Lock()
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self) -> None:
+        self.proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--serve"],
+            cwd=self.root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            start_new_session=True,  # the forked test run shares the group: one kill ends both
+        )
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (OSError, AttributeError):
+            proc.kill()
+        proc.wait()
+
+    def run(self, args: List[str], timeout: int) -> Dict[str, Any]:
+        """
+        Dispatch one pytest run. Returns the reply dict, {"timeout": True} when
+        the deadline passed (worker killed), or {} when the worker is unusable.
+        """
+        if not self.alive():
+            self.start()
+        assert self.proc is not None and self.proc.stdin is not None and self.proc.stdout is not None
+        request = {"args": args, "cwd": str(self.root), "env": dict(os.environ)}
+        try:
+            self.proc.stdin.write(json.dumps(request) + "\n")
+            self.proc.stdin.flush()
+        except OSError:
+            self.close()
+            return {}
+        with selectors.DefaultSelector() as sel:
+            sel.register(self.proc.stdout, selectors.EVENT_READ)
+            if not sel.select(timeout):
+                self.close()
+                return {"timeout": True}
+        line = self.proc.stdout.readline()
+        try:
+            reply = json.loads(line) if line else {}
+        except ValueError:
+            reply = {}
+        if not isinstance(reply, dict) or "returncode" not in reply:
+            self.close()
+            return {}
+        return reply
+
+
+_workers: Dict[str, VerifyWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def run_in_worker(
+    root: Path, cmd: List[str], timeout: int, *, settings: Optional["Settings"] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Run the verify command in the project's warm worker.
+
+    Returns {"returncode", "stdout", "stderr"} or {"timeout": True}; None when
+    the worker is disabled, not applicable to cmd, or must be restarted (the
+    caller then runs the cold subprocess).
+    """
+    if not worker_enabled(root, settings):
+        return None
+    args = pytest_args(cmd)
+    if args is None:
+        return None
+    key = str(root)
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is None:
+            worker = _workers[key] = VerifyWorker(root)
+    with worker.lock:
+        try:
+            reply = worker.run(args, timeout)
+        except OSError:
+            worker.close()
+            return None
+        if reply.get("restart"):
+            worker.close()
+    if reply.get("timeout"):
+        return reply
+    if "returncode" not in reply:
+        return None
+    return {k: reply[k] for k in ("returncode", "stdout", "stderr")}
+
+
+def shutdown_workers() -> None:
+    """Stop all workers started by this process."""
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(shutdown_workers)
+
+
+# --- worker side -----------------------------------------------------------------
+
+
+def _is_external(file: Optional[str], root: str) -> bool:
+    """Module file outside the project (or inside a virtualenv kept under it)."""
+    if not file:
+        return False
+    path = os.path.realpath(file)
+    if "site-packages" in path or "dist-packages" in path:
+        return True
+    return not (path == root or path.startswith(root + os.sep))
+
+
+def _module_files() -> Dict[str, Optional[int]]:
+    files: Dict[str, Optional[int]] = {}
+    for mod in list(sys.modules.values()):
+        file = getattr(mod, "__file__", None)
+        if isinstance(file, str) and file not in files:
+            try:
+                files[file] = os.stat(file).st_mtime_ns
+            except OSError:
+                files[file] = None
+    return files
+
+
+def _changed(files: Dict[str, Optional[int]]) -> bool:
+    for file, mtime in files.items():
+        try:
+            current: Optional[int] = os.stat(file).st_mtime_ns
+        except OSError:
+            current = None
+        if current != mtime:
+            return True
+    return False
+
+
+def _tail(path: str) -> str:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read()[-OUTPUT_TAIL:]
+    except OSError:
+        return ""
+
+
+def _child(req: Dict[str, Any], out: str, err: str, mods: str) -> None:
+    """Forked test run: never returns."""
+    code = 3
+    try:
+        os.chdir(req["cwd"])
+        os.environ.clear()
+        os.environ.update(req.get("env") or {})
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        sys.stdin = open(os.devnull, encoding="utf-8")
+        for fd, path in ((1, out), (2, err)):
+            os.dup2(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), fd)
+        import pytest
+
+        sys.argv = ["pytest", *req["args"]]
+        code = int(pytest.main(list(req["args"])))
+        root = os.path.realpath(req["cwd"])
+        external = sorted(
+            {
+                name.partition(".")[0]
+                for name, mod in list(sys.modules.items())
+                if _is_external(getattr(mod, "__file__", None), root)
+            }
+        )
+        with open(mods, "w", encoding="utf-8") as f:
+            json.dump(external, f)
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def _warm(names: List[str]) -> None:
+    from importlib import import_module
+
+    for name in names:
+        if name in sys.modules or name in ("__main__", "conftest"):
+            continue
+        try:
+            import_module(name)
+        except BaseException:
+            pass
+
+
+def _serve_one(req: Dict[str, Any], files: Dict[str, Optional[int]]) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="eurika-verify-") as tmp:
+        out, err, mods = (os.path.join(tmp, n) for n in ("stdout", "stderr", "modules.json"))
+        pid = os.fork()
+        if pid == 0:
+            _child(req, out, err, mods)
+        _, status = os.waitpid(pid, 0)
+        reply: Dict[str, Any] = {
+            "returncode": os.waitstatus_to_exitcode(status),
+            "stdout": _tail(out),
+            "stderr": _tail(err),
+        }
+        try:
+            with open(mods, encoding="utf-8") as f:
+                new = [n for n in json.load(f) if n not in sys.modules]
+        except (OSError, ValueError):
+            new = []
+    if new:
+        _warm(new)
+        files.update(_module_files())
+        # Forking is only safe while the worker stays single-threaded.
+        if threading.active_count() > 1:
+            reply["restart"] = True
+    return reply
+
+
+def serve() -> None:
+    """Worker loop: one JSON request per stdin line, one JSON reply per stdout line."""
+    # Like `python -m pytest`: the project root, not this file's directory, leads sys.path.
+    sys.path[0] = os.getcwd()
+    import pytest  # noqa: F401  (warm import shared by every forked run)
+
+    # Replies get a private copy of stdout; stray prints (warm imports) go to devnull.
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    files = _module_files()
+    for line in sys.stdin:
+        try:
+            req = json.loads(line)
+        except ValueError:
+            continue
+        reply: Dict[str, Any] = {"restart": True} if _changed(files) else _serve_one(req, files)
+        channel.write(json.dumps(reply) + "\n")
+        channel.flush()
+        if reply.get("restart"):
+            return
+
+
+if __name__ == "__main__" and sys.argv[1:] == ["--serve"]:
+    serve()
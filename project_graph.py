@@ -53,9 +53,14 @@ class ProjectGraph:
 
     @classmethod
     def from_self_map(cls, self_map: Dict) -> 'ProjectGraph':
+        file_nodes = [Path(m['path']).as_posix() for m in self_map.get('modules', [])]
+        return cls(file_nodes, cls.resolve_edges(self_map))
+
+    @staticmethod
+    def resolve_edges(self_map: Dict) -> Dict[str, List[str]]:
+        """Resolve self_map import names to project-file edges (src file -> dst files)."""
         modules = self_map.get('modules', [])
         deps = self_map.get('dependencies', {})
-        file_nodes = [Path(m['path']).as_posix() for m in modules]
         module_to_file: Dict[str, str] = {}
         for m in modules:
             p = Path(m['path'])
@@ -68,7 +73,7 @@ class ProjectGraph:
                 if not dst_file:
                     continue
                 proj_edges.setdefault(src_file, []).append(dst_file)
-        return cls(file_nodes, proj_edges)
+        return proj_edges
 
     def fan_in_out(self) -> Dict[str, Tuple[int, int]]:
         fan_out: Dict[str, int] = {n: len(self.edges.get(n, [])) for n in self.nodes}
@@ -27,37 +27,15 @@ def _fmt_delta(current: float | None, baseline: float | None) -> str:
 
 def _aggregate_recent_no_op_apply(path: Path, window: int = 10) -> dict[str, Any] | None:
     """Best-effort baseline from recent patch events for no_op/apply rates."""
-    try:
-        from eurika.storage import ProjectMemory
-
-        memory = ProjectMemory(path)
-        events = memory.events.recent_events(limit=window, types=("patch",))
-    except Exception:
-        return None
-    if not events:
-        return None
-
-    total_ops = 0
-    total_modified = 0
-    total_skipped = 0
-    for e in events:
-        inp = getattr(e, 'input', None) or {}
-        out = getattr(e, 'output', None) or {}
-        ops = int(inp.get('operations_count', 0) or 0)
-        modified = out.get('modified') or []
-        skipped = out.get('skipped') or []
-        total_ops += ops
-        if isinstance(modified, list):
-            total_modified += len(modified)
-        if isinstance(skipped, list):
-            total_skipped += len(skipped)
+    from eurika.storage import aggregate_operational_metrics
 
-    if total_ops <= 0:
+    metrics = aggregate_operational_metrics(path, window=window)
+    if not metrics or metrics['total_ops'] <= 0:
         return None
     return {
-        'runs_count': len(events),
-        'apply_rate': round(total_modified / total_ops, 4),
-        'no_op_rate': round(total_skipped / total_ops, 4),
+        'runs_count': metrics['runs_count'],
+        'apply_rate': metrics['apply_rate'],
+        'no_op_rate': metrics['no_op_rate'],
     }
 
 def format_report_snapshot(path: Path) -> str:
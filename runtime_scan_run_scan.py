@@ -6,19 +6,29 @@ from code_awareness import CodeAwareness
 from eurika.core.pipeline import run_full_analysis
 from eurika.storage import ProjectMemory
 from report.architecture_report import render_full_architecture_report
+from eurika.utils.git_changes import resolve_scope
 from report.ux import format_observation, format_observation_md, should_use_color
 
-def run_scan(path: Path, *, format: str='text', color: Optional[bool]=None) -> int:
-    """Scan project, print report, update architecture artifacts and memory."""
+def run_scan(path: Path, *, format: str='text', color: Optional[bool]=None, sharded: bool=False, changed_since: Optional[str]=None) -> int:
+    """Scan project, print report, update architecture artifacts and memory.
+
+    sharded=True additionally writes per-package self_map shards (monorepos).
+    changed_since=REF (or EURIKA_CHANGED_SINCE) limits file-level analysis to files
+    changed since the git ref; their self_map entries are merged into the cached map.
+    """
     use_color = should_use_color(color)
-    analyzer = CodeAwareness(path)
-    observation = analyzer.analyze_project()
+    scope = resolve_scope(path, changed_since)
+    if scope is not None:
+        print(f"Scoped scan: {len(scope)} changed Python file(s)")
+    analyzer = CodeAwareness(path, scope=scope)
+    # self_map is streamed to disk by write_self_map below, not kept in the observation.
+    observation = analyzer.analyze_project(include_self_map=False)
     if format == 'markdown':
         report = format_observation_md(observation)
     else:
         report = format_observation(observation, use_color=use_color)
     print(report)
-    analyzer.write_self_map(path)
+    analyzer.write_self_map(path, sharded=sharded)
     print(f"self_map.json written to {path / 'self_map.json'}")
     snapshot = run_full_analysis(path)
     arch_report = render_full_architecture_report(snapshot, format=format, use_color=use_color)
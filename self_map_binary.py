@@ -0,0 +1,262 @@
+"""
+Compact binary self_map container (stdlib-only).
+
+self_map.json stays the interchange format; this is a companion cache for
+large projects where re-parsing the JSON on every command is expensive.
+
+Layout (little-endian):
+
+    header   MAGIC, version, counts, source stamp (size, mtime_ns of the JSON
+             it was derived from) and section offsets
+    strings  index of (offset, length) u32 pairs + one UTF-8 blob; module
+             paths, function/class names and import names are interned once
+    names    flat u32 array of string ids (functions, classes, import targets)
+    modules  fixed records: path, lines, functions span, classes span, extras
+    deps     fixed records: source path, targets span (into names)
+    meta     JSON blob with the remaining top-level keys (summary, ...)
+
+SelfMapReader mmaps the file and decodes lazily, so consumers can read only
+module paths and edges (graph building) without touching function/class
+lists or the summary.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"EKSM"
+VERSION = 1
+BINARY_FILENAME = "self_map.bin"
+NO_STRING = 0xFFFFFFFF
+
+# magic, version, n_strings, n_names, n_modules, n_deps,
+# source_size, source_mtime_ns, strings_off, blob_off, names_off,
+# modules_off, deps_off, meta_off, meta_len
+_HEADER = struct.Struct("<4sHIIIIQqQQQQQQQ")
+_STRING = struct.Struct("<II")
+_MODULE = struct.Struct("<IIIIIII")  # path, lines, fn_start, fn_n, cls_start, cls_n, extras
+_DEP = struct.Struct("<III")  # src, start, count
+_U32 = struct.Struct("<I")
+
+_MODULE_KEYS = ("path", "lines", "functions", "classes")
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = len(self.values)
+            self.ids[value] = sid
+            self.values.append(value)
+        return sid
+
+
+def default_binary_path(self_map_path: Path) -> Path:
+    """Companion location for a self_map.json: <dir>/.eurika/self_map.bin."""
+    return Path(self_map_path).parent / ".eurika" / BINARY_FILENAME
+
+
+def _source_stamp(source: Optional[Path]) -> Tuple[int, int]:
+    if source is None:
+        return 0, 0
+    try:
+        st = Path(source).stat()
+    except OSError:
+        return 0, 0
+    return st.st_size, st.st_mtime_ns
+
+
+def encode_self_map(self_map: Dict[str, Any], source: Optional[Path] = None) -> bytes:
+    """Encode a self_map dict into the compact container."""
+    strings = _StringTable()
+    names: List[int] = []
+    module_rows: List[Tuple[int, ...]] = []
+    for m in self_map.get("modules", []):
+        fn_start = len(names)
+        names.extend(strings.intern(str(f)) for f in m.get("functions", []))
+        cls_start = len(names)
+        names.extend(strings.intern(str(c)) for c in m.get("classes", []))
+        extras = {k: v for k, v in m.items() if k not in _MODULE_KEYS}
+        extras_id = strings.intern(json.dumps(extras, ensure_ascii=False)) if extras else NO_STRING
+        module_rows.append((
+            strings.intern(str(m.get("path", ""))),
+            int(m.get("lines", 0)),
+            fn_start,
+            cls_start - fn_start,
+            cls_start,
+            len(names) - cls_start,
+            extras_id,
+        ))
+    dep_rows: List[Tuple[int, int, int]] = []
+    for src, targets in (self_map.get("dependencies") or {}).items():
+        start = len(names)
+        names.extend(strings.intern(str(t)) for t in targets)
+        dep_rows.append((strings.intern(str(src)), start, len(names) - start))
+    meta = {k: v for k, v in self_map.items() if k not in ("modules", "dependencies")}
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+
+    encoded = [s.encode("utf-8") for s in strings.values]
+    index = bytearray()
+    pos = 0
+    for raw in encoded:
+        index += _STRING.pack(pos, len(raw))
+        pos += len(raw)
+    blob = b"".join(encoded)
+    names_bytes = struct.pack(f"<{len(names)}I", *names)
+    modules_bytes = b"".join(_MODULE.pack(*row) for row in module_rows)
+    deps_bytes = b"".join(_DEP.pack(*row) for row in dep_rows)
+
+    strings_off = _HEADER.size
+    blob_off = strings_off + len(index)
+    names_off = blob_off + len(blob)
+    modules_off = names_off + len(names_bytes)
+    deps_off = modules_off + len(modules_bytes)
+    meta_off = deps_off + len(deps_bytes)
+    size, mtime_ns = _source_stamp(source)
+    header = _HEADER.pack(
+        MAGIC, VERSION, len(encoded), len(names), len(module_rows), len(dep_rows),
+        size, mtime_ns, strings_off, blob_off, names_off, modules_off, deps_off,
+        meta_off, len(meta_bytes),
+    )
+    return b"".join((header, bytes(index), blob, names_bytes, modules_bytes, deps_bytes, meta_bytes))
+
+
+def write_self_map_binary(
+    self_map: Dict[str, Any],
+    path: Path,
+    source: Optional[Path] = None,
+) -> Path:
+    """Write self_map in compact form (temp file + atomic rename). source stamps freshness."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(encode_self_map(self_map, source=source))
+    os.replace(tmp, path)
+    return path
+
+
+class SelfMapReader:
+    """
+    Lazy, mmap-backed reader for the compact self_map container.
+
+    Strings are decoded on first access; graph consumers can use
+    module_paths() + dependencies() without materialising anything else.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            try:
+                self._buf: Any = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file cannot be mmapped
+                self._buf = b""
+        if len(self._buf) < _HEADER.size:
+            raise ValueError(f"not a compact self_map: {self.path}")
+        (
+            magic, version, self.n_strings, self.n_names, self.n_modules, self.n_deps,
+            self.source_size, self.source_mtime_ns, self._strings_off, self._blob_off,
+            self._names_off, self._modules_off, self._deps_off, self._meta_off, self._meta_len,
+        ) = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a compact self_map (v{VERSION}): {self.path}")
+        self._strings: Dict[int, str] = {}
+
+    def close(self) -> None:
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+
+    def __enter__(self) -> "SelfMapReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def is_fresh_for(self, source: Path) -> bool:
+        """True if this container was derived from source in its current state."""
+        size, mtime_ns = _source_stamp(source)
+        return (size, mtime_ns) == (self.source_size, self.source_mtime_ns) and size > 0
+
+    def string(self, sid: int) -> str:
+        value = self._strings.get(sid)
+        if value is None:
+            off, length = _STRING.unpack_from(self._buf, self._strings_off + sid * _STRING.size)
+            start = self._blob_off + off
+            value = bytes(self._buf[start:start + length]).decode("utf-8")
+            self._strings[sid] = value
+        return value
+
+    def _names(self, start: int, count: int) -> List[str]:
+        ids = struct.unpack_from(f"<{count}I", self._buf, self._names_off + start * 4)
+        return [self.string(i) for i in ids]
+
+    def _module_row(self, index: int) -> Tuple[int, ...]:
+        return _MODULE.unpack_from(self._buf, self._modules_off + index * _MODULE.size)
+
+    def module_paths(self) -> List[str]:
+        """Paths of all modules, in scan order."""
+        return [self.string(row[0]) for row in _MODULE.iter_unpack(self._module_bytes())]
+
+    def _module_bytes(self) -> bytes:
+        return bytes(self._buf[self._modules_off:self._modules_off + self.n_modules * _MODULE.size])
+
+    def module(self, index: int) -> Dict[str, Any]:
+        """Decode one module record into the self_map.json dict shape."""
+        path_id, lines, fn_start, fn_n, cls_start, cls_n, extras_id = self._module_row(index)
+        mod: Dict[str, Any] = {
+            "path": self.string(path_id),
+            "lines": lines,
+            "functions": self._names(fn_start, fn_n),
+            "classes": self._names(cls_start, cls_n),
+        }
+        if extras_id != NO_STRING:
+            mod.update(json.loads(self.string(extras_id)))
+        return mod
+
+    def iter_modules(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self.n_modules):
+            yield self.module(i)
+
+    def dependencies(self) -> Dict[str, List[str]]:
+        """Source path -> imported internal module names."""
+        raw = bytes(self._buf[self._deps_off:self._deps_off + self.n_deps * _DEP.size])
+        return {self.string(src): self._names(start, count) for src, start, count in _DEP.iter_unpack(raw)}
+
+    def meta(self) -> Dict[str, Any]:
+        """Remaining top-level keys (summary, ...)."""
+        return json.loads(bytes(self._buf[self._meta_off:self._meta_off + self._meta_len]).decode("utf-8"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialise the full self_map dict (same shape as self_map.json)."""
+        data: Dict[str, Any] = {"modules": list(self.iter_modules()), "dependencies": self.dependencies()}
+        data.update(self.meta())
+        return data
+
+
+def is_binary_self_map(path: Path) -> bool:
+    """True if path starts with the compact container magic."""
+    try:
+        with Path(path).open("rb") as fh:
+            return fh.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def fresh_binary_for(self_map_path: Path) -> Optional[Path]:
+    """Return companion container for self_map_path if it exists and is up to date."""
+    candidate = default_binary_path(self_map_path)
+    if not candidate.is_file():
+        return None
+    try:
+        with SelfMapReader(candidate) as reader:
+            return candidate if reader.is_fresh_for(self_map_path) else None
+    except (OSError, ValueError, struct.error):
+        return None
@@ -7,6 +7,12 @@ Thin layer responsible for:
 - reading self_map.json from disk;
 - building ProjectGraph from a self_map path.
 
+Both accept the compact container (self_map_binary) directly, and prefer a
+fresh .eurika/self_map.bin companion over re-parsing the JSON when building
+the graph (only module paths and edges are decoded); without one, the JSON is
+streamed (self_map_stream) for the same two fields. A shard manifest
+(self_map_shards) is accepted too; the graph is then assembled from shards.
+
 Keeps file-system concerns separate from ProjectGraph model.
 """
 
@@ -15,14 +21,38 @@ from pathlib import Path
 from typing import Dict
 
 from project_graph import ProjectGraph
+from self_map_binary import SelfMapReader, fresh_binary_for, is_binary_self_map
+from self_map_shards import build_graph_from_shards, fresh_manifest_for, is_shard_manifest, load_shards
+from self_map_stream import iter_self_map_dependencies, iter_self_map_modules
 
 
 def load_self_map(path: Path) -> Dict:
-    """Load self_map.json from the given path."""
+    """Load self_map.json (or a compact self_map container) from the given path."""
+    if is_binary_self_map(path):
+        with SelfMapReader(path) as reader:
+            return reader.to_dict()
+    if is_shard_manifest(path):
+        return load_shards(path)
     return json.loads(path.read_text(encoding="utf-8"))
 
 
 def build_graph_from_self_map(path: Path) -> ProjectGraph:
     """Convenience helper: load self_map and build a ProjectGraph."""
-    return ProjectGraph.from_self_map(load_self_map(path))
+    if is_shard_manifest(path):
+        return build_graph_from_shards(path)
+    binary = path if is_binary_self_map(path) else fresh_binary_for(path)
+    if binary is not None:
+        with SelfMapReader(binary) as reader:
+            return ProjectGraph.from_self_map({
+                "modules": [{"path": p} for p in reader.module_paths()],
+                "dependencies": reader.dependencies(),
+            })
+    manifest = fresh_manifest_for(path)
+    if manifest is not None:
+        return build_graph_from_shards(manifest)
+    # Only paths and edges are needed: stream them instead of loading the whole map.
+    return ProjectGraph.from_self_map({
+        "modules": [{"path": m["path"]} for m in iter_self_map_modules(path) if "path" in m],
+        "dependencies": dict(iter_self_map_dependencies(path)),
+    })
 
@@ -0,0 +1,228 @@
+"""
+Sharded self_map for monorepos.
+
+Sharding mode writes one self_map shard per top-level package (files in the
+project root go to the "_root" shard) under .eurika/self_map_shards/, plus a
+small manifest.json with:
+
+- per-shard content hash, file name and module paths;
+- cross-shard file edges and the derived shard neighbour table;
+- the remaining top-level self_map keys (summary, ...);
+- a stamp of the self_map.json the shards were derived from.
+
+Import names are resolved to file edges with the project-wide module table at
+write time, so a shard is self-contained for graph building. Unchanged shards
+(same hash) are neither rewritten nor re-parsed: parsed shards are cached in
+process by content hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from project_graph import ProjectGraph
+
+SHARDS_DIR = Path(".eurika") / "self_map_shards"
+MANIFEST_FILE = "manifest.json"
+ROOT_SHARD = "_root"
+MANIFEST_VERSION = 1
+_CACHE_SIZE = 256
+
+# shard content hash -> parsed shard dict
+_SHARD_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def shard_of(path: str) -> str:
+    """Shard name for a module path: its top-level directory, or _root."""
+    parts = Path(path).as_posix().split("/")
+    return parts[0] if len(parts) > 1 else ROOT_SHARD
+
+
+def default_manifest_path(self_map_path: Path) -> Path:
+    """Manifest location for the shards of a self_map.json."""
+    return Path(self_map_path).parent / SHARDS_DIR / MANIFEST_FILE
+
+
+def _digest(data: Any) -> str:
+    raw = json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def split_self_map(self_map: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, Any]], List[List[str]]]:
+    """
+    Split self_map into shards keyed by top-level package.
+
+    Returns (shards, cross_edges). Each shard has modules, dependencies and
+    resolved file edges for its own sources; cross_edges lists [src, dst]
+    file pairs that leave the source shard.
+    """
+    edges = ProjectGraph.resolve_edges(self_map)
+    shards: Dict[str, Dict[str, Any]] = {}
+
+    def _shard(name: str) -> Dict[str, Any]:
+        return shards.setdefault(name, {"modules": [], "dependencies": {}, "edges": {}})
+
+    for m in self_map.get("modules", []):
+        _shard(shard_of(m["path"]))["modules"].append(m)
+    for src, targets in (self_map.get("dependencies") or {}).items():
+        _shard(shard_of(src))["dependencies"][src] = targets
+    cross: List[List[str]] = []
+    for src, dsts in edges.items():
+        src_shard = shard_of(src)
+        _shard(src_shard)["edges"][src] = dsts
+        cross.extend([src, dst] for dst in dsts if shard_of(dst) != src_shard)
+    return shards, cross
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+    return json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+
+
+def is_shard_manifest(path: Path) -> bool:
+    return Path(path).name == MANIFEST_FILE and Path(path).parent.name == SHARDS_DIR.name
+
+
+def write_sharded_self_map(
+    self_map: Dict[str, Any],
+    project_root: Path,
+    source: Optional[Path] = None,
+) -> Path:
+    """
+    Write shards + manifest under project_root/.eurika/self_map_shards/.
+
+    Shards whose content hash matches the previous manifest are not rewritten;
+    shards that disappeared are removed. Returns the manifest path.
+    """
+    out_dir = Path(project_root) / SHARDS_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_FILE
+    previous: Dict[str, Any] = {}
+    if manifest_path.exists():
+        try:
+            previous = load_manifest(manifest_path).get("shards") or {}
+        except (OSError, ValueError):
+            previous = {}
+
+    shards, cross = split_self_map(self_map)
+    entries: Dict[str, Dict[str, Any]] = {}
+    for name in sorted(shards):
+        shard = shards[name]
+        digest = _digest(shard)
+        filename = f"{name}.json"
+        shard_path = out_dir / filename
+        prev = previous.get(name) or {}
+        if prev.get("hash") != digest or not shard_path.exists():
+            _atomic_write(shard_path, json.dumps(shard, ensure_ascii=False))
+        entries[name] = {
+            "file": filename,
+            "hash": digest,
+            "modules": [m["path"] for m in shard["modules"]],
+        }
+    for name, prev in previous.items():
+        if name not in entries:
+            (out_dir / prev.get("file", f"{name}.json")).unlink(missing_ok=True)
+
+    neighbors: Dict[str, Set[str]] = {name: set() for name in entries}
+    for src, dst in cross:
+        a, b = shard_of(src), shard_of(dst)
+        neighbors.setdefault(a, set()).add(b)
+        neighbors.setdefault(b, set()).add(a)
+    stamp = {"size": 0, "mtime_ns": 0}
+    if source is not None and Path(source).exists():
+        st = Path(source).stat()
+        stamp = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source": stamp,
+        "shards": entries,
+        "cross_edges": cross,
+        "neighbors": {k: sorted(v) for k, v in sorted(neighbors.items())},
+        "meta": {k: v for k, v in self_map.items() if k not in ("modules", "dependencies")},
+    }
+    _atomic_write(manifest_path, json.dumps(manifest, indent=2, ensure_ascii=False))
+    return manifest_path
+
+
+def fresh_manifest_for(self_map_path: Path) -> Optional[Path]:
+    """Return the shard manifest for self_map_path if it exists and is up to date."""
+    manifest_path = default_manifest_path(self_map_path)
+    if not manifest_path.is_file():
+        return None
+    try:
+        stamp = load_manifest(manifest_path).get("source") or {}
+        st = Path(self_map_path).stat()
+    except (OSError, ValueError):
+        return None
+    if (stamp.get("size"), stamp.get("mtime_ns")) != (st.st_size, st.st_mtime_ns):
+        return None
+    return manifest_path
+
+
+def _load_shard(manifest_path: Path, entry: Dict[str, Any]) -> Dict[str, Any]:
+    digest = entry.get("hash", "")
+    cached = _SHARD_CACHE.get(digest)
+    if cached is not None:
+        _SHARD_CACHE.move_to_end(digest)
+        return cached
+    shard = json.loads((Path(manifest_path).parent / entry["file"]).read_text(encoding="utf-8"))
+    _SHARD_CACHE[digest] = shard
+    if len(_SHARD_CACHE) > _CACHE_SIZE:
+        _SHARD_CACHE.popitem(last=False)
+    return shard
+
+
+def _selected(manifest: Dict[str, Any], names: Optional[Iterable[str]]) -> List[str]:
+    shards = manifest.get("shards") or {}
+    if names is None:
+        return sorted(shards)
+    return [n for n in names if n in shards]
+
+
+def load_shards(manifest_path: Path, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Assemble a self_map dict from all shards (or only the given shard names)."""
+    manifest = load_manifest(manifest_path)
+    data: Dict[str, Any] = {"modules": [], "dependencies": {}}
+    for name in _selected(manifest, names):
+        shard = _load_shard(manifest_path, manifest["shards"][name])
+        data["modules"].extend(shard["modules"])
+        data["dependencies"].update(shard["dependencies"])
+    data.update(manifest.get("meta") or {})
+    return data
+
+
+def build_graph_from_shards(manifest_path: Path, names: Optional[Iterable[str]] = None) -> ProjectGraph:
+    """Build ProjectGraph from pre-resolved shard edges (all shards or a subset)."""
+    manifest = load_manifest(manifest_path)
+    nodes: List[str] = []
+    edges: Dict[str, List[str]] = {}
+    for name in _selected(manifest, names):
+        entry = manifest["shards"][name]
+        shard = _load_shard(manifest_path, entry)
+        nodes.extend(entry.get("modules") or [m["path"] for m in shard["modules"]])
+        edges.update(shard["edges"])
+    return ProjectGraph(nodes, edges)
+
+
+def shards_for_module(manifest: Dict[str, Any], module_path: str) -> List[str]:
+    """Shard containing module_path plus every shard it shares a cross edge with."""
+    home = shard_of(module_path)
+    return [home] + [n for n in (manifest.get("neighbors") or {}).get(home, []) if n != home]
+
+
+def manifest_module_paths(manifest: Dict[str, Any]) -> List[str]:
+    """All module paths listed in the manifest (no shard is read)."""
+    paths: List[str] = []
+    for entry in (manifest.get("shards") or {}).values():
+        paths.extend(entry.get("modules") or [])
+    return paths
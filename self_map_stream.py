@@ -0,0 +1,219 @@
+"""
+Streaming self_map.json writer and reader (bounded memory).
+
+SelfMapWriter emits modules one at a time as they are analysed, into a temp
+file next to the target that is renamed into place on close (readers never
+see a half-written map). Dependencies are spooled to a second temp file and
+appended after the modules; the summary is accumulated on the way. The
+output is byte-identical to json.dumps(self_map, indent=2, ensure_ascii=False).
+
+iter_self_map_modules / iter_self_map_dependencies walk the top-level
+"modules" array / "dependencies" object of a self_map.json incrementally
+(json.JSONDecoder.raw_decode over a growing read buffer), so consumers can
+iterate modules without materialising the whole document. The compact
+container (self_map_binary) is accepted too.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from self_map_binary import SelfMapReader, is_binary_self_map
+
+CHUNK_SIZE = 1 << 16
+_INDENT = "  "
+_WHITESPACE = " \t\r\n"
+
+
+def _nested(value: Any, level: int) -> str:
+    """json.dumps(indent=2) of value as it appears `level` levels deep."""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + _INDENT * level)
+
+
+class SelfMapWriter:
+    """Incremental self_map.json writer (temp file + atomic rename)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self._out: IO[str] = open(self.tmp, "w", encoding="utf-8")
+        self._deps: IO[str] = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._out.write("{\n" + _INDENT + '"modules": [')
+        self.files = 0
+        self.total_lines = 0
+        self.dependency_count = 0
+
+    def __enter__(self) -> "SelfMapWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_module(self, module: Dict[str, Any]) -> None:
+        self._out.write(("," if self.files else "") + "\n" + _INDENT * 2 + _nested(module, 2))
+        self.files += 1
+        self.total_lines += int(module.get("lines", 0) or 0)
+
+    def add_dependencies(self, source: str, targets: List[str]) -> None:
+        prefix = "," if self.dependency_count else ""
+        self._deps.write(f"{prefix}\n{_INDENT * 2}{json.dumps(source, ensure_ascii=False)}: {_nested(targets, 2)}")
+        self.dependency_count += 1
+
+    def summary(self) -> Dict[str, int]:
+        return {"files": self.files, "total_lines": self.total_lines}
+
+    def close(self) -> Path:
+        """Finish the document and move it into place."""
+        out = self._out
+        out.write(("\n" + _INDENT + "]," if self.files else "],") + "\n" + _INDENT + '"dependencies": {')
+        self._deps.seek(0)
+        shutil.copyfileobj(self._deps, out)
+        self._deps.close()
+        out.write(("\n" + _INDENT + "}," if self.dependency_count else "},") + "\n")
+        out.write(_INDENT + '"summary": ' + _nested(self.summary(), 1) + "\n}")
+        out.close()
+        os.replace(self.tmp, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Drop the partial output; the previous self_map.json (if any) stays."""
+        self._out.close()
+        self._deps.close()
+        self.tmp.unlink(missing_ok=True)
+
+
+class _JsonStream:
+    """Pull-style access to a JSON text: top-level structure walked, values decoded one at a time."""
+
+    def __init__(self, f: IO[str]) -> None:
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        # Grow geometrically so re-decoding a value split across reads stays linear.
+        data = self.f.read(max(CHUNK_SIZE, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos] if self.pos < len(self.buf) else ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"self_map stream: expected {char!r}, found {found[:1]!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer end may continue in the next chunk.
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def members(self) -> Iterator[Any]:
+        """Elements of the array (or (key, value) pairs of the object) at the cursor."""
+        opener = self.peek()
+        if opener not in ("[", "{"):
+            raise ValueError(f"self_map stream: expected a container, found {opener[:1]!r}")
+        closer = "]" if opener == "[" else "}"
+        self.pos += 1
+        if self.peek() == closer:
+            self.pos += 1
+            return
+        while True:
+            if closer == "]":
+                yield self.value()
+            else:
+                key = self.value()
+                self.expect(":")
+                yield key, self.value()
+            sep = self.peek()
+            self.pos += 1
+            if sep == closer:
+                return
+            if sep != ",":
+                raise ValueError(f"self_map stream: expected ',' or {closer!r}, found {sep[:1]!r}")
+
+
+def _iter_top_level(path: Path, key: str) -> Iterator[Any]:
+    """Members of top-level `key`; values of other keys before it are decoded and dropped."""
+    with open(path, encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            name = stream.value()
+            stream.expect(":")
+            if name == key:
+                yield from stream.members()
+                return
+            stream.value()
+            if stream.peek() != ",":
+                stream.expect("}")
+                return
+            stream.pos += 1
+
+
+def iter_self_map_modules(path: Path) -> Iterator[Dict[str, Any]]:
+    """Module records of a self_map (JSON or compact container), one at a time."""
+    if is_binary_self_map(path):
+        with SelfMapReader(path) as reader:
+            yield from reader.iter_modules()
+        return
+    for module in _iter_top_level(Path(path), "modules"):
+        if isinstance(module, dict):
+            yield module
+
+
+def iter_self_map_dependencies(path: Path) -> Iterator[Tuple[str, List[str]]]:
+    """(source file, import targets) pairs of a self_map (JSON or compact container)."""
+    if is_binary_self_map(path):
+        with SelfMapReader(path) as reader:
+            yield from reader.dependencies().items()
+        return
+    for source, targets in _iter_top_level(Path(path), "dependencies"):
+        yield source, list(targets or [])
+
+
+def write_self_map_stream(
+    path: Path,
+    modules: Iterator[Dict[str, Any]],
+    dependencies: Optional[Iterator[Tuple[str, List[str]]]] = None,
+) -> Path:
+    """Write a self_map from iterables without holding it in memory."""
+    with SelfMapWriter(path) as writer:
+        for module in modules:
+            writer.add_module(module)
+        for source, targets in dependencies or ():
+            writer.add_dependencies(source, targets)
+    return writer.path
@@ -241,3 +241,41 @@ def test_policy_whitelist_allows_auto_for_known_target(tmp_path: Path) -> None:
     out = evaluate_operation(op, config=cfg, index=1, seen_files=set(), project_root=tmp_path)
     assert out.decision == "allow"
     assert "whitelisted target" in out.reason
+
+
+def test_evaluate_operations_matches_single_op_and_loads_context_once(tmp_path: Path, monkeypatch) -> None:
+    """Batch evaluation gives per-op results while reading campaign memory and whitelist once."""
+    from eurika.agent import policy as policy_mod
+    from eurika.agent.policy import PolicyContext, evaluate_operations
+    from eurika.storage import SessionMemory
+
+    cfg = PolicyConfig(mode="auto", max_ops=100, max_files=2, allow_test_files=False, auto_apply_max_risk="high")
+    failing = {"kind": "split_module", "target_file": "x.py", "smell_type": "god_module", "params": {"location": "f"}}
+    SessionMemory(tmp_path).record_verify_failure([failing, failing])
+    wl_path = tmp_path / ".eurika" / "operation_whitelist.json"
+    wl_path.write_text(
+        json.dumps({"operations": [{"kind": "extract_class", "target_file": "w.py", "allow_in_auto": True}]}),
+        encoding="utf-8",
+    )
+    ops = [
+        failing,
+        {"kind": "extract_class", "target_file": "w.py", "smell_type": "god_class"},
+        {"kind": "remove_unused_import", "target_file": "a.py"},
+        {"kind": "remove_unused_import", "target_file": "b.py"},
+    ]
+    expected = []
+    seen: set[str] = set()
+    for idx, op in enumerate(ops, start=1):
+        res = evaluate_operation(op, config=cfg, index=idx, seen_files=seen, project_root=tmp_path)
+        expected.append((res.decision, res.reason))
+        if res.decision == "allow":
+            seen.add(op["target_file"])
+
+    loads: list[Path] = []
+    real_load = policy_mod._load_operation_whitelist
+    monkeypatch.setattr(policy_mod, "_load_operation_whitelist", lambda root: loads.append(root) or real_load(root))
+    results = evaluate_operations(ops, PolicyContext.load(tmp_path), config=cfg)
+    assert [(r.decision, r.reason) for r in results] == expected
+    assert [d for d, _ in expected] == ["deny", "allow", "allow", "deny"]
+    assert "file scope limit" in expected[3][1]
+    assert loads == [tmp_path]
@@ -294,6 +294,38 @@ def test_get_code_smell_operations_long_function_extract_block_fallback(tmp_path
     assert block_ops[0].get("smell_type") == "long_function"
 
 
+def test_get_code_smell_operations_skipped_nested_falls_back_to_extract_block(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """A skipped extract_nested candidate must not claim its span: the block fallback still runs."""
+    import eurika.api.ops as ops_mod
+
+    code = (
+        "def long_foo(x):\n"
+        "    def inner(v):\n"
+        "        w = v + 1\n"
+        "        return w\n"
+        "    result = inner(x)\n"
+        "    if x > 0:\n"
+        "        a = x + 1\n"
+        "        b = a * 2\n"
+        "        c = b + x\n"
+        "        d = c * 2\n"
+        "        e = d + 1\n"
+        "        result = e\n"
+        + "    result += 1\n" * 45
+        + "    return result\n"
+    )
+    (tmp_path / "mixed.py").write_text(code, encoding="utf-8")
+    monkeypatch.setattr(ops_mod, "_should_try_extract_nested", lambda stats: True)
+    monkeypatch.setattr(ops_mod, "_should_skip_extract_nested_candidate", lambda rel, name: True)
+    ops = get_code_smell_operations(tmp_path)
+    mine = [o for o in ops if o.get("target_file") == "mixed.py"]
+    assert not any(o.get("kind") == "extract_nested_function" for o in mine)
+    block_ops = [o for o in mine if o.get("kind") == "extract_block_to_helper"]
+    assert block_ops and block_ops[0].get("smell_type") == "long_function"
+
+
 def test_get_code_smell_operations_returns_extract_block_for_deep_nesting(tmp_path: Path) -> None:
     """With hybrid mode (default), deep_nesting gets extract_block_to_helper when block is extractable."""
     # Need depth > 4 for CodeAwareness to flag deep_nesting; 5 nested ifs
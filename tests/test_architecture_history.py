@@ -96,3 +96,63 @@ def test_evolution_report_from_eurika_evolution_history(tmp_path):
     assert "Potential regressions:" in report
     assert "Maturity" in report
 
+
+
+def test_history_migrates_legacy_json_and_appends_rows(tmp_path):
+    """Legacy {"history": [...]} file is converted to history.jsonl + index and kept as .migrated."""
+    import json
+    legacy_path = tmp_path / "history.json"
+    history_path = tmp_path / "history.jsonl"
+    legacy = {"history": [
+        {"timestamp": 1.0, "modules": 3, "dependencies": 2, "cycles": 0, "max_degree": 2, "total_smells": 0, "smell_counts": {}},
+        {"timestamp": 2.0, "modules": 5, "dependencies": 4, "cycles": 1, "max_degree": 3, "total_smells": 1, "smell_counts": {"hub": 1}},
+    ]}
+    legacy_text = json.dumps(legacy, indent=2)
+    legacy_path.write_text(legacy_text, encoding="utf-8")
+    h = ArchitectureHistory(storage_path=history_path)
+    assert not legacy_path.exists()
+    assert (tmp_path / "history.json.migrated").read_text(encoding="utf-8") == legacy_text
+    assert [p.modules for p in h._points] == [3, 5]
+    assert h.trend(window=5)["complexity"] == "increasing"
+    assert any("Cycles increased" in r for r in h.detect_regressions(window=5))
+    lines = history_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2 and json.loads(lines[1])["smell_counts"] == {"hub": 1}
+
+    g = make_linear_graph(3)
+    h.append(g, [], {"system": {"modules": 3, "dependencies": 2, "cycles": 0}})
+    reopened = ArchitectureHistory(storage_path=history_path)
+    assert [p.modules for p in reopened.points(2)] == [5, 3]
+    assert reopened.trend(window=2)["complexity"] == "decreasing"
+
+
+def test_history_index_rebuilt_when_out_of_sync(tmp_path):
+    """A missing or stale side index is rebuilt from the rows."""
+    history_path = tmp_path / "history.json"
+    h = ArchitectureHistory(storage_path=history_path)
+    g = make_linear_graph(3)
+    for _ in range(3):
+        h.append(g, [], {"system": {"modules": 3, "dependencies": 2, "cycles": 0}})
+    h.index_path.unlink()
+    assert len(ArchitectureHistory(storage_path=history_path)._points) == 3
+    h.index_path.write_bytes(h.index_path.read_bytes()[:10])
+    assert len(ArchitectureHistory(storage_path=history_path).points(2)) == 2
+
+
+def test_git_commit_read_without_subprocess(tmp_path, monkeypatch):
+    """HEAD is resolved from .git files (loose and packed refs), never via subprocess."""
+    import subprocess
+    from eurika.evolution.history import _get_git_commit
+
+    def _no_subprocess(*a, **k):
+        raise AssertionError("subprocess used")
+
+    monkeypatch.setattr(subprocess, "run", _no_subprocess)
+    git = tmp_path / ".git"
+    (git / "refs" / "heads").mkdir(parents=True)
+    (git / "HEAD").write_text("ref: refs/heads/main\n")
+    (git / "packed-refs").write_text("# pack-refs with: peeled\n" + "a" * 40 + " refs/heads/main\n")
+    assert _get_git_commit(tmp_path) == "a" * 12
+    (git / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+    assert _get_git_commit(tmp_path) == "b" * 12
+    (git / "HEAD").write_text("c" * 40 + "\n")
+    assert _get_git_commit(tmp_path) == "c" * 12
@@ -38,4 +38,58 @@ def test_learning_store_tracks_not_applied_outcome(tmp_path: Path) -> None:
     assert stats['extract_nested_function']['total'] == 1
     assert stats['extract_nested_function']['not_applied'] == 1
     assert stats['extract_nested_function']['success'] == 0
-    assert stats['extract_nested_function']['fail'] == 0
\ No newline at end of file
+    assert stats['extract_nested_function']['fail'] == 0
+
+
+def test_learning_store_is_append_only_and_migrates_legacy(tmp_path: Path) -> None:
+    """Legacy JSON is imported once; appends add one JSONL line and advance the cached index."""
+    import json
+    legacy = tmp_path / 'architecture_learning.json'
+    legacy.write_text(json.dumps({'learning': [{'timestamp': 1.0, 'project_root': '', 'modules': [], 'operations': [{'kind': 'refactor_module', 'smell_type': 'god_module', 'target_file': 'a.py'}], 'risks': [], 'verify_success': True}]}), encoding='utf-8')
+    store = LearningStore(storage_path=legacy)
+    assert not legacy.exists()
+    assert (tmp_path / 'architecture_learning.json.migrated').exists()
+    index = store.index()
+    assert index.by_smell_action['god_module|refactor_module'].total == 1
+    store.append(project_root=tmp_path, modules=['a.py'], operations=[{'kind': 'refactor_module', 'smell_type': 'god_module', 'target_file': 'a.py'}], risks=[], verify_success=False)
+    assert len(store.log_path.read_text(encoding='utf-8').splitlines()) == 2
+    assert store.index() is index
+    counter = index.target_stats('god_module', 'refactor_module', 'a.py')
+    assert (counter.total, counter.success, counter.fail) == (2, 1, 1)
+    assert [r.verify_success for r in LearningStore(storage_path=legacy).all()] == [True, False]
+
+
+def test_learning_index_decays_old_outcomes() -> None:
+    """Recent outcomes outweigh old ones in the decayed rate; raw counts are unchanged."""
+    from eurika.storage.learning_index import LearningIndex
+    day = 86400.0
+    index = LearningIndex(half_life=10 * day)
+    op = {'kind': 'split_module', 'smell_type': 'god_module', 'target_file': 'a.py'}
+    for i in range(3):
+        index.add([op], False, i * day)
+    index.add([op], True, 100 * day)
+    assert index.success_rate('god_module', 'split_module', decayed=False) == 0.25
+    assert index.success_rate('god_module', 'split_module') > 0.99
+    stats = index.aggregate_by_smell_action()['god_module|split_module']
+    assert (stats['total'], stats['success'], stats['fail']) == (4, 1, 3)
+    assert stats['decayed_success'] == 1.0
+    index.add([op], False, 50 * day)  # out-of-order sample weighs by its age
+    assert 0.5 < index.success_rate('god_module', 'split_module') < 0.99
+
+
+def test_learning_view_index_advances_incrementally(tmp_path: Path, monkeypatch) -> None:
+    """ProjectMemory.learning folds only new learn events into the cached index."""
+    from eurika.storage import ProjectMemory
+    from eurika.storage import learning_index
+    memory = ProjectMemory(tmp_path)
+    op = {'kind': 'remove_unused_import', 'smell_type': 'unknown', 'target_file': 'a.py'}
+    memory.learning.append(project_root=tmp_path, modules=['a.py'], operations=[op], risks=[], verify_success=True)
+    index = memory.learning.index()
+    added: list = []
+    real_add = learning_index.LearningIndex.add
+    monkeypatch.setattr(learning_index.LearningIndex, 'add', lambda self, *a: (added.append(a), real_add(self, *a)))
+    memory.learning.append(project_root=tmp_path, modules=['a.py'], operations=[op], risks=[], verify_success=False)
+    stats = memory.learning.aggregate_by_smell_action()['unknown|remove_unused_import']
+    assert memory.learning.index() is index
+    assert len(added) == 1
+    assert (stats['total'], stats['success'], stats['fail']) == (2, 1, 1)
@@ -196,3 +196,60 @@ def test_undo_campaign_checkpoint_collects_mixed_rollback_errors(tmp_path: Path)
     assert out.get("status") == "undone"
     errs = out.get("errors") or []
     assert "restore failed" in [str(x) for x in errs]
+
+
+def _completed_checkpoint(root: Path, target: str) -> str:
+    from eurika.storage.campaign_checkpoint import attach_run_to_checkpoint, create_campaign_checkpoint
+
+    cid = create_campaign_checkpoint(root, operations=[{"target_file": target}])["checkpoint_id"]
+    attach_run_to_checkpoint(root, cid, run_id=f"run-{target}", verify_success=True, modified=[target])
+    return cid
+
+
+def test_campaign_checkpoint_lookups_read_only_index(tmp_path: Path, monkeypatch) -> None:
+    import eurika.storage.campaign_checkpoint as cc
+
+    ids = [_completed_checkpoint(tmp_path, f"m{i}.py") for i in range(4)]
+    session = cc.create_campaign_checkpoint(tmp_path, operations=[{"target_file": "s.py"}], session_id="sess")
+    loaded: list[str] = []
+    real_load = cc._load_json
+
+    def recording_load(path: Path):
+        loaded.append(path.name)
+        return real_load(path)
+
+    monkeypatch.setattr(cc, "_load_json", recording_load)
+    listed = cc.list_campaign_checkpoints(tmp_path, limit=3)
+    assert [r["checkpoint_id"] for r in listed["checkpoints"]] == [session["checkpoint_id"], ids[3], ids[2]]
+    assert cc.latest_campaign_checkpoint(tmp_path)["checkpoint_id"] == session["checkpoint_id"]
+    assert cc._latest_checkpoint_path_for_session(tmp_path, "sess").stem == session["checkpoint_id"]
+    assert set(loaded) == {"campaign_checkpoints.index.json"}
+
+
+def test_campaign_checkpoint_index_rebuilt_after_external_change(tmp_path: Path) -> None:
+    from eurika.storage.campaign_checkpoint import _checkpoints_dir, list_campaign_checkpoints
+
+    _completed_checkpoint(tmp_path, "a.py")
+    legacy = _checkpoints_dir(tmp_path) / "legacy_1.json"
+    legacy.write_text(json.dumps({"checkpoint_id": "legacy_1", "status": "completed", "run_ids": ["r9"]}), encoding="utf-8")
+    rows = list_campaign_checkpoints(tmp_path)["checkpoints"]
+    assert rows[0]["checkpoint_id"] == "legacy_1"
+    assert rows[0]["run_ids"] == ["r9"]
+    assert len(rows) == 2
+
+
+def test_campaign_checkpoint_retention_prunes_oldest_finished(tmp_path: Path, monkeypatch) -> None:
+    from eurika.storage.campaign_checkpoint import (
+        KEEP_ENV,
+        _checkpoints_dir,
+        create_campaign_checkpoint,
+        list_campaign_checkpoints,
+    )
+
+    monkeypatch.setenv(KEEP_ENV, "3")
+    pending = create_campaign_checkpoint(tmp_path, operations=[{"target_file": "p.py"}])["checkpoint_id"]
+    ids = [_completed_checkpoint(tmp_path, f"m{i}.py") for i in range(4)]
+    remaining = {r["checkpoint_id"] for r in list_campaign_checkpoints(tmp_path)["checkpoints"]}
+    assert pending in remaining
+    assert remaining == {pending, ids[2], ids[3]}
+    assert {p.stem for p in _checkpoints_dir(tmp_path).glob("*.json")} == remaining
@@ -40,3 +40,58 @@ def test_load_environment_overrides_llm_keys_from_dotenv(tmp_path: Path, monkeyp
     assert os.environ["OPENAI_MODEL"] == "project-model"
     assert os.environ["OPENAI_BASE_URL"] == "http://127.0.0.1:11434/v1"
     assert os.environ["OLLAMA_OPENAI_MODEL"] == "project-ollama-model"
+
+
+def _importtime(*argv: str) -> dict[str, int]:
+    """Run the CLI under `python -X importtime`; map module -> cumulative import time (us)."""
+    import subprocess
+    import sys
+
+    root = Path(__file__).resolve().parents[1]
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(root / "eurika_cli.py"), *argv],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+# Generous wall-clock guard; the module checks below are the precise regression test.
+STARTUP_BUDGET_US = 250_000
+HEAVY_MODULES = ("cli.core_handlers", "cli.agent_handlers", "cli.orchestrator", "eurika.storage", "eurika.reasoning", "eurika.refactor", "eurika.api", "patch_engine", "runtime_scan")
+
+
+@pytest.mark.parametrize("argv", [("--version",), ("help",), ("agent", "--help")])
+def test_cli_startup_imports_no_handlers(argv: tuple[str, ...]) -> None:
+    """Trivial commands stay within the startup budget and import no handler modules."""
+    times = _importtime(*argv)
+    loaded = [m for m in times if m in HEAVY_MODULES or m.startswith(tuple(f"{h}." for h in HEAVY_MODULES))]
+    assert loaded == []
+    assert times.get("cli.wiring", 0) < STARTUP_BUDGET_US
+
+
+def test_cli_dispatch_imports_only_the_command_module() -> None:
+    """Resolving a core command's handler loads its module, not the agent handlers."""
+    import subprocess
+    import sys
+
+    from cli.handlers import HANDLER_MODULES
+    from cli.wiring.dispatch import AGENT_COMMANDS, COMMANDS
+
+    assert set(COMMANDS.values()) | set(AGENT_COMMANDS.values()) <= set(HANDLER_MODULES)
+    code = (
+        "import sys; from cli.handlers import load_handler; load_handler('handle_scan'); "
+        "print('cli.core_handlers' in sys.modules, 'cli.agent_handlers' in sys.modules)"
+    )
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, timeout=60)
+    assert out.stdout.split() == ["True", "False"], out.stderr[-2000:]
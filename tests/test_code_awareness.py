@@ -0,0 +1,37 @@
+"""Tests for CodeAwareness self_map building (module index, internal deps)."""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from code_awareness import CodeAwareness
+
+
+def _project(tmp_path: Path) -> Path:
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "sub" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "sub" / "leaf.py").write_text("x = 1\n")
+    (tmp_path / "venv").mkdir()
+    (tmp_path / "venv" / "lib.py").write_text("")
+    (tmp_path / "app.py").write_text("import os\nimport pkg.sub.leaf\nfrom helpers import h\nimport lib\n")
+    (tmp_path / "helpers.py").write_text("def h():\n    return 1\n")
+    return tmp_path
+
+
+def test_build_module_index_lists_top_level_modules(tmp_path: Path) -> None:
+    index = CodeAwareness(_project(tmp_path)).build_module_index()
+    assert index == {"pkg": "pkg/__init__.py", "app": "app.py", "helpers": "helpers.py"}
+
+
+def test_build_self_map_resolves_imports_without_stat(tmp_path: Path, monkeypatch) -> None:
+    """Internal imports are resolved against the in-memory index (no Path.exists per import)."""
+    analyzer = CodeAwareness(_project(tmp_path))
+    calls = []
+    real_exists = Path.exists
+    monkeypatch.setattr(Path, "exists", lambda self: calls.append(self) or real_exists(self))
+    self_map = analyzer.build_self_map()
+    assert self_map["dependencies"]["app.py"] == ["pkg.sub.leaf", "helpers"]
+    assert calls == []
@@ -0,0 +1,137 @@
+"""Tests for eurika.utils.config (layered, cached project settings)."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from eurika.utils.config import clear_settings_cache, load_settings
+
+
+def _write_pyproject(root: Path, body: str) -> None:
+    (root / "pyproject.toml").write_text(body, encoding="utf-8")
+
+
+def test_settings_layers_pyproject_config_env_and_overrides(tmp_path: Path, monkeypatch) -> None:
+    """defaults < [tool.eurika] < .eurika/config.json < env < overrides; multi-line values parse."""
+    monkeypatch.delenv("EURIKA_VERIFY_TIMEOUT", raising=False)
+    monkeypatch.delenv("EURIKA_VERIFY_SHARDS", raising=False)
+    monkeypatch.delenv("EURIKA_VERIFY_WORKER", raising=False)
+    clear_settings_cache()
+    _write_pyproject(
+        tmp_path,
+        '[project]\nname = "demo"\nversion = "1.2.3"\ndependencies = [\n  "a",\n  "b",\n]\n\n'
+        '[tool.eurika]\nverify_cmd = """\npython -m pytest -q tests\n"""\nverify_timeout = 40\nverify_shards = 2\n',
+    )
+    s = load_settings(tmp_path)
+    assert s.project_version == "1.2.3"
+    assert s.verify_cmd == "python -m pytest -q tests"
+    assert (s.verify_timeout, s.verify_shards, s.verify_worker) == (40, 2, False)
+    assert s.problems == ()
+    assert load_settings(tmp_path) is s  # cached while nothing changed
+
+    (tmp_path / ".eurika").mkdir()
+    (tmp_path / ".eurika" / "config.json").write_text(
+        json.dumps({"verify_timeout": 50, "verify_worker": True, "bogus": 1}), encoding="utf-8"
+    )
+    s = load_settings(tmp_path)
+    assert (s.verify_timeout, s.verify_worker) == (50, True)
+    assert s.sources["verify_timeout"] == ".eurika/config.json"
+    assert any("bogus" in p for p in s.problems)
+
+    monkeypatch.setenv("EURIKA_VERIFY_TIMEOUT", "60")
+    monkeypatch.setenv("EURIKA_VERIFY_SHARDS", "zero")
+    s = load_settings(tmp_path)
+    assert s.verify_timeout == 60
+    assert s.verify_shards == 2  # invalid env value is reported and ignored
+    assert any(p.startswith("env: verify_shards") for p in s.problems)
+
+    s = load_settings(tmp_path, overrides={"verify_timeout": 5, "verify_cmd": None})
+    assert s.verify_timeout == 5 and s.verify_cmd == "python -m pytest -q tests"
+
+
+def test_settings_reload_on_pyproject_change(tmp_path: Path, monkeypatch) -> None:
+    """A changed pyproject.toml (mtime/size) invalidates the cached settings."""
+    monkeypatch.delenv("EURIKA_VERIFY_TIMEOUT", raising=False)
+    clear_settings_cache()
+    _write_pyproject(tmp_path, "[tool.eurika]\nverify_timeout = 7\n")
+    assert load_settings(tmp_path).verify_timeout == 7
+    _write_pyproject(tmp_path, "[tool.eurika]\nverify_timeout = 120\n")
+    st = (tmp_path / "pyproject.toml").stat()
+    os.utime(tmp_path / "pyproject.toml", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_settings(tmp_path).verify_timeout == 120
+
+
+def test_verify_cmd_from_pyproject_is_split(tmp_path: Path, monkeypatch) -> None:
+    """_get_verify_cmd reads the configured command through the settings loader."""
+    from patch_engine_verify_patch import _get_verify_cmd, get_verify_timeout
+
+    monkeypatch.delenv("EURIKA_VERIFY_TIMEOUT", raising=False)
+    clear_settings_cache()
+    assert _get_verify_cmd(tmp_path) == [sys.executable, "-m", "pytest", "-q"]
+    _write_pyproject(tmp_path, "[tool.eurika]\nverify_cmd = 'python -m py_compile x.py'\n")
+    assert _get_verify_cmd(tmp_path) == ["python", "-m", "py_compile", "x.py"]
+    assert _get_verify_cmd(tmp_path, override="make test") == ["make", "test"]
+    assert get_verify_timeout(tmp_path) == 300
+    assert get_verify_timeout(tmp_path, override=9) == 9
+
+
+def test_fix_apply_stage_threads_one_settings_to_verify(tmp_path: Path, monkeypatch) -> None:
+    """The cycle's Settings reach verify_patch as-is; nothing below re-resolves them."""
+    import patch_engine_verify_patch
+    from cli.orchestration.apply_stage import execute_fix_apply_stage
+    from cli.orchestration.models import FixCycleContext
+    from patch_engine import apply_and_verify
+    from patch_engine_verify_patch import verify_patch
+
+    monkeypatch.delenv("EURIKA_VERIFY_TIMEOUT", raising=False)
+    clear_settings_cache()
+    _write_pyproject(tmp_path, f"[tool.eurika]\nverify_cmd = '{sys.executable} -c pass'\nverify_timeout = 33\n")
+    settings = FixCycleContext(path=tmp_path, verify_timeout=44).settings()
+    assert (settings.verify_timeout, settings.verify_cmd) == (44, f"{sys.executable} -c pass")
+
+    def no_reload(*_a, **_k):
+        raise AssertionError("settings resolved again")
+
+    monkeypatch.setattr(patch_engine_verify_patch, "load_settings", no_reload)
+    seen = {}
+
+    def fake_verify(root, **kwargs):
+        seen.update(kwargs)
+        return verify_patch(root, **kwargs)
+
+    monkeypatch.setattr("patch_engine_apply_and_verify.verify_patch", fake_verify)
+    report, _, _ = execute_fix_apply_stage(
+        tmp_path,
+        {"operations": []},
+        [],
+        session_id=None,
+        quiet=True,
+        verify_cmd=None,
+        verify_timeout=None,
+        settings=settings,
+        backup_dir=".eurika_backups",
+        apply_and_verify=apply_and_verify,
+        run_scan=lambda *_a: 0,
+        build_snapshot_from_self_map=lambda *_a: {},
+        diff_architecture_snapshots=lambda *_a: {},
+        metrics_from_graph=lambda *_a: {},
+        rollback_patch=lambda *_a: {},
+        result=type("R", (), {"output": {"policy_decisions": []}})(),
+    )
+    assert seen["settings"] is settings and seen["timeout"] == 44
+    assert report["verify"]["success"] is True
+
+
+def test_doctor_reports_config_problems(tmp_path: Path) -> None:
+    """Ignored settings are listed by doctor instead of being dropped silently."""
+    from cli.orchestration.doctor import run_doctor_cycle
+
+    clear_settings_cache()
+    _write_pyproject(tmp_path, "[tool.eurika]\nverify_timeout = 'soon'\n")
+    (tmp_path / "self_map.json").write_text(
+        json.dumps({"modules": [{"path": "a.py", "lines": 1}], "dependencies": {}, "summary": {"files": 1, "total_lines": 1}}),
+        encoding="utf-8",
+    )
+    out = run_doctor_cycle(tmp_path, window=3, no_llm=True, online=False)
+    assert any("verify_timeout" in p for p in out.get("config_problems", []))
@@ -41,3 +41,27 @@ def test_build_context_sources_collects_campaign_and_tests(tmp_path: Path) -> No
     assert "tests/test_a.py" in (by_target.get("a.py") or {}).get("related_tests", [])
     assert "c.py" in (by_target.get("a.py") or {}).get("neighbor_modules", [])
 
+
+
+def test_build_context_sources_reads_self_map_and_tests_once(tmp_path: Path, monkeypatch) -> None:
+    deps = {f"m{i}.py": ["shared"] for i in range(40)}
+    deps["shared"] = ["m0.py"]
+    (tmp_path / "self_map.json").write_text(json.dumps({"modules": [], "dependencies": deps}), encoding="utf-8")
+    (tmp_path / "tests").mkdir()
+    for i in range(40):
+        (tmp_path / "tests" / f"test_m{i}.py").write_text("", encoding="utf-8")
+
+    reads: list[str] = []
+    walks: list[str] = []
+    real_read, real_rglob = Path.read_text, Path.rglob
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: reads.append(self.name) or real_read(self, *a, **k))
+    monkeypatch.setattr(Path, "rglob", lambda self, pat: walks.append(pat) or real_rglob(self, pat))
+
+    ops = [{"target_file": f"m{i}.py", "kind": "clean"} for i in range(40)] + [{"target_file": "shared"}]
+    by_target = build_context_sources(tmp_path, ops)["by_target"]
+    assert reads.count("self_map.json") == 1
+    assert walks == ["test_*.py"]
+    related = by_target["m1.py"]["related_tests"]
+    assert len(related) == 3 and all(Path(p).stem.startswith("test_m1") for p in related)
+    assert by_target["m0.py"]["neighbor_modules"] == ["shared"]
+    assert by_target["shared"]["neighbor_modules"] == ["m0.py", "m1.py", "m2.py", "m3.py", "m4.py"]
@@ -0,0 +1,96 @@
+"""Tests for CycleContext (one pipeline computation shared across fix-cycle stages)."""
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import architecture_pipeline
+from agent_core import InputEvent
+from agent_core_arch_review import ArchReviewAgentCore
+from code_awareness import CodeAwareness
+from core.cycle_context import CycleContext
+from eurika.api import get_patch_plan
+from eurika.core.pipeline import run_full_analysis
+
+
+def _project(tmp_path: Path) -> Path:
+    (tmp_path / "a.py").write_text("import b\n\ndef a():\n    return b.b()\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("import c\n\ndef b():\n    return c.c()\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("def c():\n    return 1\n", encoding="utf-8")
+    CodeAwareness(tmp_path).write_self_map(tmp_path, compact=False)
+    return tmp_path
+
+
+def _count_builds(monkeypatch) -> list:
+    calls: list = []
+    real = architecture_pipeline._build_graph_and_summary_from_self_map
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(architecture_pipeline, "_build_graph_and_summary_from_self_map", counting)
+    return calls
+
+
+def test_stages_share_one_structure_build(tmp_path: Path, monkeypatch) -> None:
+    root = _project(tmp_path)
+    calls = _count_builds(monkeypatch)
+    ctx = CycleContext(root, window=3)
+    with ctx.activate():
+        snapshot = run_full_analysis(root)  # scan stage: appends history
+        result = ArchReviewAgentCore(project_root=root, context=ctx).handle(
+            InputEvent(type="arch_review", payload={"path": str(root), "window": 3}, source="test")
+        )
+        plan = get_patch_plan(root, window=3)
+    assert len(calls) == 1
+    assert result.success is True
+    assert plan is not None
+    assert sorted(snapshot.graph.nodes) == ["a.py", "b.py", "c.py"]
+    assert result.output["summary"] is snapshot.summary
+    assert result.output["history"]["evolution_report"] == snapshot.history["evolution_report"]
+
+
+def test_matches_uncached_results(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    plain = get_patch_plan(root, window=3)
+    with_ctx = get_patch_plan(root, window=3, context=CycleContext(root, window=3))
+    assert plain == with_ctx
+
+
+def test_self_map_change_invalidates(tmp_path: Path, monkeypatch) -> None:
+    root = _project(tmp_path)
+    calls = _count_builds(monkeypatch)
+    ctx = CycleContext(root)
+    first = ctx.graph
+    assert ctx.graph is first and len(calls) == 1
+    (root / "d.py").write_text("import a\n", encoding="utf-8")
+    CodeAwareness(root).write_self_map(root, compact=False)
+    st = (root / "self_map.json").stat()
+    os.utime(root / "self_map.json", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert "d.py" in ctx.graph.nodes
+    assert len(calls) == 2
+    ctx.invalidate()
+    ctx.summary
+    assert len(calls) == 3
+
+
+def test_history_info_refreshes_after_append(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    ctx = CycleContext(root)
+    before = ctx.history_info()
+    assert ctx.history_info() is before
+    run_full_analysis(root, context=ctx)
+    assert ctx.history_info() is not before
+
+
+def test_current_is_scoped_to_root_and_block(tmp_path: Path) -> None:
+    ctx = CycleContext(tmp_path)
+    assert CycleContext.current(tmp_path) is None
+    with ctx.activate():
+        assert CycleContext.current(tmp_path) is ctx
+        assert CycleContext.current(tmp_path / "other") is None
+    assert CycleContext.current(tmp_path) is None
@@ -64,3 +64,73 @@ def test_diff_snapshots_and_diff_to_text(tmp_path: Path) -> None:
     text = diff_to_text(diff)
     assert "ARCHITECTURE EVOLUTION REPORT" in text
     assert "Structural changes" in text or "modules added" in text
+
+
+def test_build_snapshot_persists_and_reuses_by_content_hash(tmp_path: Path, monkeypatch) -> None:
+    """Second build of an unchanged self_map comes from the on-disk cache, not recomputation."""
+    import eurika.evolution.diff as diff_mod
+
+    (tmp_path / ".eurika").mkdir()
+    path = tmp_path / "main.json"
+    _write_self_map(path, ["a.py", "b.py", "c.py"], {"a.py": ["b"], "c.py": ["a", "b"]})
+    first = build_snapshot(path)
+    cache_file = tmp_path / ".eurika" / "snapshots" / f"{first.content_hash}.json"
+    assert cache_file.exists()
+
+    diff_mod._SNAPSHOT_MEMO.clear()
+    monkeypatch.setattr(diff_mod, "_compute_snapshot", lambda *a: (_ for _ in ()).throw(AssertionError("recomputed")))
+    cached = build_snapshot(path)
+    assert cached.modules == first.modules
+    assert cached.fan == first.fan
+    assert cached.edges == first.edges
+    assert [s.type for s in cached.smells] == [s.type for s in first.smells]
+    assert cached.summary["maturity"] == first.summary["maturity"]
+
+
+def test_snapshot_cache_stays_in_project_and_is_pruned(tmp_path: Path, monkeypatch) -> None:
+    """No cache dir is created next to a loose self_map; the project cache keeps the newest entries."""
+    import eurika.evolution.diff as diff_mod
+
+    loose = tmp_path / "loose"
+    loose.mkdir()
+    _write_self_map(loose / "self_map.json", ["a.py"], {})
+    build_snapshot(loose / "self_map.json")
+    assert [p.name for p in loose.iterdir()] == ["self_map.json"]
+
+    (tmp_path / ".eurika").mkdir()
+    monkeypatch.setenv(diff_mod.SNAPSHOT_CACHE_KEEP_ENV, "2")
+    for i in range(4):
+        path = tmp_path / f"self_map_{i}.json"
+        _write_self_map(path, [f"m{j}.py" for j in range(i + 1)], {})
+        build_snapshot(path)
+    assert len(list((tmp_path / ".eurika" / "snapshots").glob("*.json"))) == 2
+
+
+def test_snapshot_cache_key_includes_detector_version(tmp_path: Path, monkeypatch) -> None:
+    """A changed detector version yields a different cache key (stale snapshots are not reused)."""
+    import eurika.evolution.diff as diff_mod
+
+    path = tmp_path / "self_map.json"
+    _write_self_map(path, ["a.py"], {})
+    before = diff_mod.self_map_content_hash(path)
+    monkeypatch.setattr(diff_mod, "_DETECTOR_VERSION", "other")
+    assert diff_mod.self_map_content_hash(path) != before
+
+
+def test_diff_snapshots_reports_edge_changes(tmp_path: Path) -> None:
+    """Structural diff includes dependency edges added/removed (sorted merge)."""
+    from eurika.evolution.diff import diff_edge_sets
+
+    assert diff_edge_sets([("a", "b"), ("a", "c"), ("b", "c")], [("a", "c"), ("b", "d"), ("c", "a")]) == (
+        [("b", "d"), ("c", "a")],
+        [("a", "b"), ("b", "c")],
+    )
+    old_path = tmp_path / "old.json"
+    new_path = tmp_path / "new.json"
+    _write_self_map(old_path, ["a.py", "b.py"], {"a.py": ["b"]})
+    _write_self_map(new_path, ["a.py", "b.py"], {"b.py": ["a"]})
+    diff = diff_snapshots(build_snapshot(old_path), build_snapshot(new_path))
+    assert diff["structures"]["edges_added"] == [["b.py", "a.py"]]
+    assert diff["structures"]["edges_removed"] == [["a.py", "b.py"]]
+    assert diff["centrality_shifts"]
+    assert "dependencies added: 1" in diff_to_text(diff)
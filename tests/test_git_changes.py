@@ -0,0 +1,124 @@
+"""Tests for git-aware change scoping (eurika.utils.git_changes)."""
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from cli.orchestration.prepare import prepend_fix_operations
+from code_awareness import CodeAwareness
+from eurika.api import get_clean_imports_operations
+from eurika.utils.git_changes import CHANGED_SINCE_ENV, changed_python_files, resolve_scope
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=root, check=True, capture_output=True,
+    )
+
+
+def _repo(tmp_path: Path) -> Path:
+    (tmp_path / "a.py").write_text("import os\n\ndef a():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("import sys\nimport a\n\ndef b():\n    return a.a()\n", encoding="utf-8")
+    (tmp_path / "gone.py").write_text("def g():\n    return 0\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("x\n", encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    return tmp_path
+
+
+def test_changed_python_files_covers_edits_new_and_deleted(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    assert changed_python_files(root, "HEAD") == []
+    (root / "b.py").write_text("import sys\n\ndef b():\n    return 2\n", encoding="utf-8")
+    (root / "new.py").write_text("def n():\n    return 3\n", encoding="utf-8")
+    (root / "gone.py").unlink()
+    (root / "README.md").write_text("y\n", encoding="utf-8")
+    assert changed_python_files(root, "HEAD") == ["b.py", "gone.py", "new.py"]
+
+
+def test_changed_python_files_outside_git_or_bad_ref(tmp_path: Path) -> None:
+    assert changed_python_files(tmp_path, "HEAD") is None
+    root = _repo(tmp_path)
+    assert changed_python_files(root, "no-such-ref") is None
+
+
+def test_resolve_scope_reads_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _repo(tmp_path)
+    monkeypatch.delenv(CHANGED_SINCE_ENV, raising=False)
+    assert resolve_scope(root) is None
+    monkeypatch.setenv(CHANGED_SINCE_ENV, "HEAD")
+    (root / "a.py").write_text("import os\n\ndef a():\n    return 5\n", encoding="utf-8")
+    assert resolve_scope(root) == {"a.py"}
+
+
+def test_scoped_self_map_merges_into_cached_map(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    CodeAwareness(root).write_self_map(root, compact=False)
+    (root / "b.py").write_text("def b():\n    return 2\n\ndef extra():\n    return 3\n", encoding="utf-8")
+    (root / "gone.py").unlink()
+    scoped = CodeAwareness(root, scope=changed_python_files(root, "HEAD"))
+    assert [p.name for p in scoped.scan_python_files()] == ["b.py"]
+    data = scoped.build_self_map()
+    paths = [m["path"] for m in data["modules"]]
+    assert paths == ["a.py", "b.py"]
+    b = next(m for m in data["modules"] if m["path"] == "b.py")
+    assert b["functions"] == ["b", "extra"]
+    assert "b.py" not in data["dependencies"]
+    cached = json.loads((root / "self_map.json").read_text(encoding="utf-8"))
+    assert "gone.py" in [m["path"] for m in cached["modules"]]
+
+
+def test_clean_imports_and_planner_ops_are_scoped(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    root = _repo(tmp_path)
+    assert {op["target_file"] for op in get_clean_imports_operations(root)} == {"a.py", "b.py"}
+    (root / "b.py").write_text("import sys\nimport a\n\ndef b():\n    return a.a() + 1\n", encoding="utf-8")
+    monkeypatch.setenv(CHANGED_SINCE_ENV, "HEAD")
+    assert [op["target_file"] for op in get_clean_imports_operations(root)] == ["b.py"]
+    planner_ops = [
+        {"target_file": "a.py", "kind": "refactor_module", "diff": "x"},
+        {"target_file": "b.py", "kind": "refactor_module", "diff": "y"},
+    ]
+    plan, ops = prepend_fix_operations(
+        root, {"operations": planner_ops}, planner_ops, no_clean_imports=False, no_code_smells=True
+    )
+    assert [(op["target_file"], op["kind"]) for op in ops] == [
+        ("b.py", "remove_unused_import"),
+        ("b.py", "refactor_module"),
+    ]
+    assert plan["operations"] == ops
+
+
+@pytest.mark.parametrize("handler_name, runner", [
+    ("handle_fix", "cli.agent_handlers.handle_agent_cycle"),
+    ("handle_cycle", "cli.agent_handlers._run_cycle_with_mode"),
+])
+def test_changed_since_does_not_leak_past_the_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, handler_name: str, runner: str
+) -> None:
+    """--changed-since scopes each project's cycle only; the previous env value is restored."""
+    from types import SimpleNamespace
+
+    import cli.core_handlers as core_handlers
+
+    seen = []
+    monkeypatch.setattr(runner, lambda *a, **k: seen.append(os.environ.get(CHANGED_SINCE_ENV)) or 0)
+    monkeypatch.delenv(CHANGED_SINCE_ENV, raising=False)
+    args = SimpleNamespace(path=tmp_path, changed_since="main")
+    assert getattr(core_handlers, handler_name)(args) == 0
+    assert seen == ["main"]
+    assert CHANGED_SINCE_ENV not in os.environ
+    monkeypatch.setenv(CHANGED_SINCE_ENV, "HEAD~1")
+    getattr(core_handlers, handler_name)(args)
+    assert os.environ[CHANGED_SINCE_ENV] == "HEAD~1"
@@ -62,4 +62,23 @@ def test_append_noop_when_disabled(tmp_path: Path) -> None:
         append_learn_to_global(project_root=tmp_path, modules=['x.py'], operations=[], risks=[], verify_success=True)
         assert aggregate_global_by_smell_action() == {}
     finally:
-        del os.environ['EURIKA_DISABLE_GLOBAL_MEMORY']
\ No newline at end of file
+        del os.environ['EURIKA_DISABLE_GLOBAL_MEMORY']
+
+
+def test_merge_decays_stores_at_shared_now() -> None:
+    """A stale local store is decayed relative to a fresh global one before summing."""
+    from eurika.storage.global_memory import merge_learning_stats
+    from eurika.storage.learning_index import LearningIndex
+    day = 86400.0
+    op = {'kind': 'remove_unused_import', 'smell_type': 'unknown', 'target_file': 'a.py'}
+    stale, fresh = LearningIndex(half_life=day), LearningIndex(half_life=day)
+    stale.add([op], True, 1000.0)
+    fresh.add([op], False, 1000.0 + 2 * day)
+    now = 1000.0 + 2 * day
+    merged = merge_learning_stats(stale.aggregate_by_smell_action(now), fresh.aggregate_by_smell_action(now))
+    rec = merged['unknown|remove_unused_import']
+    assert rec['total'] == 2 and rec['success'] == 1
+    assert rec['decayed_success'] == 0.25  # two half-lives old
+    assert rec['decayed_total'] == 1.25
+    # Exported at their own latest times, the stale success would count at full weight.
+    assert stale.aggregate_by_smell_action()['unknown|remove_unused_import']['decayed_success'] == 1.0
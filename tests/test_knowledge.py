@@ -219,4 +219,198 @@ def test_fetch_html_cleanup() -> None:
     text = "Python 3.12 documentation Skip Navigation What's New in Python 3.12 Summary New syntax."
     trimmed = _trim_doc_boilerplate(text)
     assert trimmed.startswith("What's New") or trimmed.startswith('Summary') or 'New syntax' in trimmed
-    assert 'Python 3.12 documentation' not in trimmed
\ No newline at end of file
+    assert 'Python 3.12 documentation' not in trimmed
+
+class _SlowDocsServer:
+    """Local http.server stand-in for curated docs: /<delay_ms>/<name> answers after delay, counts hits."""
+
+    def __init__(self) -> None:
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        hits: list = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                import time
+                hits.append(self.path)
+                delay_ms = int(self.path.strip('/').split('/')[0])
+                time.sleep(delay_ms / 1000)
+                body = f'<html><body><p>Doc page {self.path}</p></body></html>'.encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.hits = hits
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_composite_queries_providers_concurrently() -> None:
+    """Two 300ms providers finish in well under the serial 600ms; fragment order follows providers."""
+    import time
+    server = _SlowDocsServer()
+    try:
+        composite = CompositeKnowledgeProvider([
+            OfficialDocsProvider(topic_urls={'python_3_12': f'{server.base}/300/docs'}),
+            ReleaseNotesProvider(topic_urls={'python_3_12': f'{server.base}/300/notes'}),
+        ])
+        start = time.perf_counter()
+        k = composite.query('python_3_12')
+        elapsed = time.perf_counter() - start
+    finally:
+        server.close()
+    assert elapsed < 0.55
+    assert [f['title'].split(']')[0] for f in k.fragments] == ['[official_docs', '[release_notes']
+    assert 'timed_out' not in k.meta
+
+
+def test_composite_deadline_skips_slow_provider() -> None:
+    """A provider slower than the deadline is dropped and reported in meta."""
+    import time
+    server = _SlowDocsServer()
+    try:
+        composite = CompositeKnowledgeProvider([
+            LocalKnowledgeProvider(),
+            PEPProvider(topic_urls={'pep_8': f'{server.base}/0/pep8'}),
+            ReleaseNotesProvider(topic_urls={'pep_8': f'{server.base}/2000/slow'}),
+        ], timeout=0.5)
+        start = time.perf_counter()
+        k = composite.query('pep_8')
+        elapsed = time.perf_counter() - start
+    finally:
+        server.close()
+    assert elapsed < 1.5
+    assert len(k.fragments) == 1 and k.fragments[0]['title'].startswith('[pep]')
+    assert k.meta['timed_out'] == ['ReleaseNotesProvider']
+
+
+def test_composite_query_many_keeps_topic_order() -> None:
+    a = LocalKnowledgeProvider()
+    a._cache = {'x': [{'title': 'X', 'content': 'x'}], 'y': [{'title': 'Y', 'content': 'y'}]}
+    results = CompositeKnowledgeProvider([a, StaticAnalyzerProvider()]).query_many(['y', 'x', 'z'])
+    assert [k.topic for k in results] == ['y', 'x', 'z']
+    assert [len(k.fragments) for k in results] == [1, 1, 0]
+    assert results[0].fragments[0]['title'] == '[local] Y'
+
+
+def test_composite_empty_jobs_with_timeout() -> None:
+    """No topics or no providers with a deadline set: empty result, no zero-worker pool."""
+    assert CompositeKnowledgeProvider([LocalKnowledgeProvider(None)], timeout=30).query_many([]) == []
+    k = CompositeKnowledgeProvider([], timeout=30).query('x')
+    assert k.is_empty() and k.meta == {'providers': 0}
+
+
+def test_composite_failing_provider_is_skipped() -> None:
+    """A provider raising does not sink the other providers' fragments."""
+
+    class Broken(KnowledgeProvider):
+        def query(self, topic: str) -> StructuredKnowledge:
+            raise RuntimeError('boom')
+
+    a = LocalKnowledgeProvider()
+    a._cache = {'x': [{'title': 'X', 'content': 'x'}]}
+    for timeout in (None, 5):
+        k = CompositeKnowledgeProvider([Broken(), a], timeout=timeout).query('x')
+        assert [f['title'] for f in k.fragments] == ['[local] X']
+        assert k.meta['failed'] == ['Broken']
+    assert CompositeKnowledgeProvider([Broken()]).query('x').meta['failed'] == ['Broken']
+
+
+
+class _Sleepy(KnowledgeProvider):
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def query(self, topic: str) -> StructuredKnowledge:
+        import time
+        time.sleep(self.seconds)
+        return StructuredKnowledge(topic=topic, source='sleepy', fragments=[{'title': 'T', 'content': topic}])
+
+
+def test_composite_deadline_counts_from_job_start() -> None:
+    """Jobs queued behind others on a small pool are not reported as timed out before they run."""
+    k = CompositeKnowledgeProvider([_Sleepy(0.15), _Sleepy(0.15), _Sleepy(0.15)], max_workers=1, timeout=0.4).query('x')
+    assert len(k.fragments) == 3
+    assert 'timed_out' not in k.meta and 'skipped' not in k.meta
+
+
+def test_composite_reports_jobs_that_never_started() -> None:
+    """When every worker is stuck past its deadline, queued providers are skipped, not timed out."""
+
+    class Fast(_Sleepy):
+        pass
+
+    k = CompositeKnowledgeProvider([_Sleepy(1.0), Fast(0.0)], max_workers=1, timeout=0.2).query('x')
+    assert k.meta['timed_out'] == ['_Sleepy']
+    assert k.meta['skipped'] == ['Fast']
+
+
+def test_rate_limit_sleeps_outside_lock() -> None:
+    """A throttled fetch does not hold the shared lock while it waits for its slot."""
+    import threading
+    import time
+    from eurika.knowledge import base
+
+    base._last_fetch_time = time.time()
+    waiter = threading.Thread(target=base._rate_limit_fetch, args=(0.5,))
+    waiter.start()
+    time.sleep(0.05)
+    try:
+        assert base._rate_limit_lock.acquire(timeout=0.1)
+        base._rate_limit_lock.release()
+    finally:
+        waiter.join()
+    base._last_fetch_time = 0.0
+
+def test_url_cache_served_from_memory(tmp_path) -> None:
+    """After the first fetch the entry is served from the in-process LRU; editing the file invalidates it."""
+    import os
+    server = _SlowDocsServer()
+    try:
+        p = OfficialDocsProvider(topic_urls={'python_3_12': f'{server.base}/0/whatsnew'}, cache_dir=tmp_path)
+        first = p.query('python_3_12')
+        with patch('eurika.knowledge.base.Path.read_text', side_effect=AssertionError('disk read')):
+            second = p.query('python_3_12')
+        assert len(server.hits) == 1
+    finally:
+        server.close()
+    assert first.fragments == second.fragments
+    cache_file = next(tmp_path.glob('official_docs_*.json'))
+    data = json.loads(cache_file.read_text(encoding='utf-8'))
+    data['content'] = 'Edited on disk'
+    cache_file.write_text(json.dumps(data), encoding='utf-8')
+    st = cache_file.stat()
+    os.utime(cache_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert p.query('python_3_12').fragments[0]['content'] == 'Edited on disk'
+
+
+def test_file_backed_providers_reload_on_change(tmp_path: Path) -> None:
+    """Local/OSS providers re-read their file only when its mtime/size changes."""
+    import os
+    from eurika.knowledge import OSSPatternProvider
+    local_file = tmp_path / 'knowledge.json'
+    local_file.write_text(json.dumps({'topics': {'t': [{'title': 'old', 'content': ''}]}}), encoding='utf-8')
+    lib = tmp_path / 'pattern_library.json'
+    lib.write_text(json.dumps({'hub': [{'project': 'p', 'module': 'm.py', 'hint': 'split'}]}), encoding='utf-8')
+    local = LocalKnowledgeProvider(cache_path=local_file)
+    oss = OSSPatternProvider(lib)
+    assert local.query('t').fragments[0]['title'] == 'old'
+    assert oss.query('hub').fragments[0]['title'] == 'p: m.py'
+    with patch('eurika.learning.pattern_library.load_pattern_library', side_effect=AssertionError('reloaded')):
+        assert oss.query('hub').fragments[0]['title'] == 'p: m.py'
+    local_file.write_text(json.dumps({'topics': {'t': [{'title': 'new', 'content': ''}]}}), encoding='utf-8')
+    lib.write_text(json.dumps({'hub': [{'project': 'q', 'module': 'n.py', 'hint': 'split'}]}), encoding='utf-8')
+    for f in (local_file, lib):
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert local.query('t').fragments[0]['title'] == 'new'
+    assert oss.query('hub').fragments[0]['title'] == 'q: n.py'
@@ -0,0 +1,85 @@
+"""Tests for MinHash/LSH near-duplicate detection (eurika.analysis.near_duplicates)."""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from code_awareness import CodeAwareness
+from eurika.analysis.near_duplicates import (
+    NUM_PERM,
+    NearDuplicateIndex,
+    code_tokens,
+    estimated_similarity,
+    lsh_bands,
+    minhash_signature,
+    shingles,
+)
+
+BASE = '''def {name}(items, limit):
+    """Collect totals."""
+    total = 0
+    seen = []
+    for item in items:
+        if item in seen:
+            continue
+        seen.append(item)
+        total += item * 2
+        if total > limit:
+            break
+    return total, seen
+'''
+
+TWEAKED = BASE.replace("total += item * 2", "total += item * 3  # tweak")
+
+OTHER = '''def render(rows):
+    out = []
+    for row in rows:
+        line = ", ".join(str(cell) for cell in row)
+        out.append("[" + line + "]")
+        print(line)
+    header = "rows=%d" % len(rows)
+    return header + "\\n".join(out)
+'''
+
+
+def test_signature_similarity_tracks_edits() -> None:
+    """Identical bodies agree fully; tweaked copies stay close; unrelated code is far."""
+    sig = lambda src, name=None: minhash_signature(shingles(code_tokens(src, name)))
+    a = sig(BASE.format(name="f"), "f")
+    b = sig(BASE.format(name="g"), "g")
+    c = sig(TWEAKED.format(name="h"), "h")
+    d = sig(OTHER, "render")
+    assert len(a) == NUM_PERM
+    assert estimated_similarity(a, b) == 1.0
+    assert estimated_similarity(a, c) >= 0.6
+    assert estimated_similarity(a, d) < 0.3
+
+
+def test_lsh_bands_partition_signature() -> None:
+    bands, rows = lsh_bands(0.8)
+    assert bands * rows == NUM_PERM
+    assert (1.0 / bands) ** (1.0 / rows) <= 0.8
+
+
+def test_index_clusters_only_similar_functions() -> None:
+    index = NearDuplicateIndex(threshold=0.6)
+    index.add_source(BASE.format(name="f"), "f", mask_name="f")
+    index.add_source(TWEAKED.format(name="g"), "g", mask_name="g")
+    index.add_source(OTHER, "render", mask_name="render")
+    clusters = index.clusters()
+    assert len(clusters) == 1
+    assert sorted(clusters[0]["members"]) == ["f", "g"]
+    assert 0.6 <= clusters[0]["similarity"] <= 1.0
+
+
+def test_find_duplicates_reports_near_clones(tmp_path: Path) -> None:
+    """CodeAwareness.find_duplicates catches a renamed, tweaked copy across files."""
+    (tmp_path / "a.py").write_text(BASE.format(name="collect"))
+    (tmp_path / "b.py").write_text(TWEAKED.format(name="gather") + "\n\n" + OTHER)
+    dups = CodeAwareness(tmp_path).find_duplicates(threshold=0.6)
+    assert len(dups) == 1
+    assert dups[0]["count"] == 2
+    assert {loc["function"] for loc in dups[0]["locations"]} == {"collect", "gather"}
+    assert CodeAwareness(tmp_path).find_duplicates(threshold=1.0) == []
@@ -52,3 +52,72 @@ def test_aggregate_operational_metrics_from_events(tmp_path: Path) -> None:
     assert m["apply_rate"] == pytest.approx(0.3)
     assert m["rollback_rate"] == pytest.approx(1 / 3, rel=0.01)
     assert m["median_verify_time_ms"] == 1000
+
+
+def test_patch_metrics_windows_match_recompute() -> None:
+    """Incremental windows (sums + sorted durations) equal a from-scratch recompute, across ring overflow."""
+    import random
+
+    from eurika.storage.operational_metrics import PatchMetrics, _median
+
+    rng = random.Random(7)
+    metrics = PatchMetrics(capacity=25)
+    rows = []
+    for i in range(60):
+        row = (rng.randint(0, 6), rng.randint(0, 4), rng.randint(0, 2), rng.randint(0, 1), rng.choice([None, rng.randint(1, 900)]))
+        rows.append(row)
+        metrics.push(row)
+        if i == 5:
+            metrics.summary(3), metrics.summary(10), metrics.summary(25)  # start tracking early
+    for window in (3, 10, 25, 40):
+        tail = rows[-min(window, 25):]
+        got = metrics.summary(window)
+        ops = sum(r[0] for r in tail)
+        assert got["runs_count"] == len(tail)
+        assert got["total_ops"] == ops
+        assert got["total_modified"] == sum(r[1] for r in tail)
+        assert got["rollback_rate"] == round(sum(r[3] for r in tail) / len(tail), 4)
+        assert got["median_verify_time_ms"] == _median(sorted(r[4] for r in tail if r[4] is not None))
+
+
+def test_operational_metrics_served_without_reloading_event_log(tmp_path: Path, monkeypatch) -> None:
+    """Appends advance patch_metrics.json; consumers (even in a fresh process) do not parse events.json."""
+    from eurika.storage import aggregate_operational_metrics, operational_metrics
+    from eurika.storage.event_engine import event_engine
+    from eurika.storage.events import EventStore
+
+    store = event_engine(tmp_path)
+    store.append_event("patch", {"operations_count": 4}, {"modified": ["a.py"], "verify_duration_ms": 300})
+    store.append_event("scan", {"path": "."}, {"files": 3})
+    store.append_event("patch", {"operations_count": 1}, {"modified": ["b.py"], "verify_success": False, "verify_duration_ms": 100})
+    assert (tmp_path / ".eurika" / "patch_metrics.json").exists()
+
+    monkeypatch.setattr(EventStore, "_load", lambda self: (_ for _ in ()).throw(AssertionError("event log reloaded")))
+    first = aggregate_operational_metrics(tmp_path, window=10)
+    operational_metrics._cache.clear()
+    fresh = aggregate_operational_metrics(tmp_path, window=10)
+    assert first == fresh
+    assert fresh["runs_count"] == 2 and fresh["total_ops"] == 5 and fresh["total_modified"] == 2
+    assert fresh["rollback_rate"] == 0.5
+    assert fresh["median_verify_time_ms"] == 200
+
+
+def test_operational_metrics_rebuilt_after_external_log_write(tmp_path: Path) -> None:
+    """A log written behind the accumulator's back (older eurika, manual edit) is re-read once."""
+    import json
+    import os
+
+    from eurika.storage import aggregate_operational_metrics
+    from eurika.storage.event_engine import event_engine
+
+    store = event_engine(tmp_path)
+    store.append_event("patch", {"operations_count": 2}, {"modified": ["a.py"]})
+    assert aggregate_operational_metrics(tmp_path)["runs_count"] == 1
+    log = tmp_path / ".eurika" / "events.json"
+    data = json.loads(log.read_text(encoding="utf-8"))
+    data["events"].append({"type": "patch", "input": {"operations_count": 3}, "output": {"modified": []}, "timestamp": 1.0})
+    log.write_text(json.dumps(data), encoding="utf-8")
+    st = log.stat()
+    os.utime(log, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    m = aggregate_operational_metrics(tmp_path)
+    assert m["runs_count"] == 2 and m["total_ops"] == 5
@@ -263,4 +263,48 @@ def test_restore_backup(tmp_path: Path) -> None:
     assert report['errors'] == []
     assert 'f.py' in report['restored']
     assert report['run_id'] is not None
-    assert (tmp_path / 'f.py').read_text() == 'v1\n'
\ No newline at end of file
+    assert (tmp_path / 'f.py').read_text() == 'v1\n'
+
+def test_apply_patch_plan_run_ids_do_not_collide(tmp_path: Path) -> None:
+    """Back-to-back runs within one second get distinct, sortable run_ids and backup dirs."""
+    (tmp_path / 'g.py').write_text('v1\n')
+    run_ids = []
+    for i in range(3):
+        plan = {'operations': [{'target_file': 'g.py', 'kind': 'refactor_module', 'diff': f'# step {i}\n'}]}
+        report = apply_patch_plan(tmp_path, plan, dry_run=False, backup=True)
+        run_ids.append(report['run_id'])
+    assert len(set(run_ids)) == 3
+    assert run_ids == sorted(run_ids)
+    assert list_backups(tmp_path)['run_ids'] == run_ids
+    report = restore_backup(tmp_path, run_id=run_ids[0])
+    assert report['conflicts'] == ['g.py']  # later runs edited it since
+    report = restore_backup(tmp_path, run_id=run_ids[0], force=True)
+    assert (tmp_path / 'g.py').read_text() == 'v1\n'
+
+
+def test_restore_backup_uses_write_journal(tmp_path: Path) -> None:
+    """Rollback undoes only the run's writes: created files removed, later edits kept as conflicts."""
+    import json
+    (tmp_path / 'a.py').write_text('a = 1\n')
+    (tmp_path / 'b.py').write_text('b = 1\n')
+    plan = {'operations': [
+        {'target_file': 'a.py', 'kind': 'refactor_module', 'diff': '# one\n'},
+        {'target_file': 'a.py', 'kind': 'refactor_code_smell', 'diff': '# two\n'},
+        {'target_file': 'b.py', 'kind': 'refactor_module', 'diff': '# b\n'},
+        {'target_file': 'pkg/new.py', 'kind': 'create_module_stub', 'content': 'x = 1\n'},
+    ]}
+    report = apply_patch_plan(tmp_path, plan, dry_run=False, backup=True)
+    run_path = tmp_path / '.eurika_backups' / report['run_id']
+    journal = {f['path']: f for f in json.loads((run_path / '.journal.json').read_text())['files']}
+    assert journal['a.py']['status'] == 'modified'
+    assert journal['pkg/new.py']['status'] == 'created' and journal['pkg/new.py']['pre_hash'] is None
+    (tmp_path / 'b.py').write_text('b = 2  # edited by hand\n')
+    rb = restore_backup(tmp_path, run_id=report['run_id'])
+    assert rb['restored'] == ['a.py']
+    assert rb['removed'] == ['pkg/new.py']
+    assert rb['conflicts'] == ['b.py']
+    assert (tmp_path / 'a.py').read_text() == 'a = 1\n'  # pre-run content despite two ops
+    assert (tmp_path / 'b.py').read_text() == 'b = 2  # edited by hand\n'
+    assert not (tmp_path / 'pkg' / 'new.py').exists()
+    again = restore_backup(tmp_path, run_id=report['run_id'])
+    assert again['restored'] == [] and again['removed'] == []
@@ -1,5 +1,10 @@
 """Tests for patch_engine (apply_patch, verify_patch, rollback_patch, apply_and_verify, list_backups)."""
+import os
+import sys
 from pathlib import Path
+
+import pytest
+
 from patch_engine import (
     apply_patch,
     apply_and_verify,
@@ -191,4 +196,76 @@ def test_apply_and_verify_timeout_triggers_rollback(tmp_path: Path) -> None:
     assert report["verify"]["success"] is False
     assert report["verify"]["returncode"] == -1
     assert report.get("rollback", {}).get("done") is True
-    assert (tmp_path / "a.py").read_text(encoding="utf-8") == "x = 1\n"
\ No newline at end of file
+    assert (tmp_path / "a.py").read_text(encoding="utf-8") == "x = 1\n"
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='warm worker needs fork')
+def test_verify_patch_warm_worker_sees_edits_and_times_out(tmp_path: Path, monkeypatch) -> None:
+    """EURIKA_VERIFY_WORKER runs pytest in a warm worker; edited modules are imported fresh."""
+    from patch_engine_verify_worker import _workers, shutdown_workers
+    monkeypatch.setenv('EURIKA_VERIFY_WORKER', '1')
+    (tmp_path / 'm.py').write_text('def f():\n    return 1\n', encoding='utf-8')
+    (tmp_path / 'test_m.py').write_text('from m import f\n\ndef test_f():\n    assert f() == 1\n', encoding='utf-8')
+    try:
+        first = verify_patch(tmp_path, timeout=60)
+        assert first['success'] is True and first.get('warm_worker') is True
+        proc = _workers[str(tmp_path.resolve())].proc
+        (tmp_path / 'm.py').write_text('def f():\n    return 2\n', encoding='utf-8')
+        second = verify_patch(tmp_path, timeout=60)
+        assert second['success'] is False and second.get('warm_worker') is True
+        assert _workers[str(tmp_path.resolve())].proc is proc  # same worker, fresh project import
+        (tmp_path / 'test_m.py').write_text('import time\n\ndef test_slow():\n    time.sleep(30)\n', encoding='utf-8')
+        slow = verify_patch(tmp_path, timeout=1)
+        assert slow['returncode'] == -1 and 'timed out' in slow['stderr']
+        assert proc.poll() is not None
+        custom = verify_patch(tmp_path, timeout=10, verify_cmd='python -c "print(1)"')
+        assert custom['success'] is True and 'warm_worker' not in custom
+    finally:
+        shutdown_workers()
+
+
+def test_verify_patch_shards_by_duration_and_merges(tmp_path: Path, monkeypatch) -> None:
+    """EURIKA_VERIFY_SHARDS runs test files in parallel shards, records durations, merges exit codes."""
+    import json
+    from patch_engine_verify_shards import partition
+    assert partition(['a', 'b', 'c', 'd'], {'a': 4.0, 'b': 3.0, 'c': 2.0, 'd': 1.0}, 2) == [['a', 'd'], ['b', 'c']]
+    assert partition(['a', 'b', 'c'], {'a': 0.0, 'b': 0.0, 'c': 0.0}, 2) == [['a', 'c'], ['b']]
+    monkeypatch.setenv('EURIKA_VERIFY_SHARDS', '2')
+    tests = tmp_path / 'tests'
+    tests.mkdir()
+    for name in ('a', 'b', 'c'):
+        (tests / f'test_{name}.py').write_text(f'def test_{name}():\n    assert True\n', encoding='utf-8')
+    out = verify_patch(tmp_path, timeout=60)
+    assert out['success'] is True and out['shards'] == 2
+    durations = json.loads((tmp_path / '.eurika' / 'verify_durations.json').read_text(encoding='utf-8'))['files']
+    assert set(durations) == {'tests/test_a.py', 'tests/test_b.py', 'tests/test_c.py'}
+    (tests / 'test_b.py').write_text('def test_b():\n    assert 1 == 2\n', encoding='utf-8')
+    failed = verify_patch(tmp_path, timeout=60, fail_fast=True)
+    assert failed['success'] is False and failed['returncode'] == 1
+    assert 'test_b' in failed['stdout'].split('[shard', 2)[1]  # failing shard output comes first
+
+
+def test_verify_shards_follow_pytest_ini_options(tmp_path: Path, monkeypatch) -> None:
+    """Sharded selection honours testpaths / python_files / norecursedirs and pins shards to the config."""
+    from patch_engine_verify_shards import find_pytest_config, run_sharded, select_test_files
+    monkeypatch.setenv('EURIKA_VERIFY_SHARDS', '2')
+    (tmp_path / 'pytest.ini').write_text('[pytest]\ntestpaths = checks\npython_files = check_*.py\nnorecursedirs = fixtures .*\n', encoding='utf-8')
+    (tmp_path / 'checks' / 'fixtures').mkdir(parents=True)
+    (tmp_path / 'tests').mkdir()
+    for name in ('a', 'b'):
+        (tmp_path / 'checks' / f'check_{name}.py').write_text(f'def test_{name}():\n    assert True\n', encoding='utf-8')
+    (tmp_path / 'checks' / 'fixtures' / 'check_x.py').write_text('def test_x():\n    assert False\n', encoding='utf-8')
+    (tmp_path / 'tests' / 'test_outside.py').write_text('def test_outside():\n    assert False\n', encoding='utf-8')
+    config = find_pytest_config(tmp_path)
+    assert config is not None and config[0] == (tmp_path / 'pytest.ini').resolve()
+    assert select_test_files(tmp_path.resolve(), [], config[1]) == ['checks/check_a.py', 'checks/check_b.py']
+    out = verify_patch(tmp_path, timeout=60)
+    assert out['success'] is True and out['shards'] == 2
+    # Options a per-file split cannot reproduce leave the run unsharded.
+    cmd = [sys.executable, '-m', 'pytest', '-q', '--ignore=checks/check_a.py']
+    assert run_sharded(tmp_path.resolve(), cmd, 60, shards=2) is None
+
+    (tmp_path / 'pytest.ini').unlink()
+    (tmp_path / 'pyproject.toml').write_text("[tool.pytest.ini_options]\ntestpaths = ['tests']\n", encoding='utf-8')
+    config = find_pytest_config(tmp_path)
+    assert config is not None and select_test_files(tmp_path.resolve(), [], config[1]) == ['tests/test_outside.py']
@@ -0,0 +1,66 @@
+"""Tests for eurika.refactor.suggestions (shared-parse, memoised extract suggestions)."""
+from pathlib import Path
+
+from eurika.refactor import suggestions as suggestions_mod
+from eurika.refactor.extract_function import suggest_extract_block, suggest_extract_nested_function
+from eurika.refactor.suggestions import SuggestionService
+
+_CODE = """
+def outer(x):
+    if x > 0:
+        if x < 10:
+            a = x + 1
+            b = a * 2
+            c = b + x
+            d = c * 2
+            e = d + 1
+
+    def helper(p, q):
+        s = p + q
+        return s
+
+    return helper(x, 1)
+"""
+
+
+def test_service_matches_file_based_helpers(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text(_CODE)
+    service = SuggestionService()
+    assert service.extract_nested(path, "outer") == suggest_extract_nested_function(path, "outer")
+    assert service.extract_block(path, "outer") == suggest_extract_block(path, "outer")
+    assert service.extract_block(path, "missing") is None
+
+
+def test_service_parses_each_file_once(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text(_CODE)
+    service = SuggestionService()
+    first = service.parsed(path)
+    monkeypatch.setattr(Path, "read_text", lambda *a, **k: (_ for _ in ()).throw(AssertionError("re-read")))
+    assert service.parsed(path) is first
+    assert service.extract_nested(path, "outer") is not None
+
+
+def test_service_drops_overlapping_suggestions(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text(_CODE)
+    service = SuggestionService()
+    assert service.extract_block(path, "outer") is not None
+    assert service.extract_block(path, "outer") is not None  # offered, not yet claimed
+    service.claim(path)
+    assert service.extract_block(path, "outer") is None  # same block already claimed
+    assert service.extract_nested(path, "outer") is not None  # disjoint span
+
+
+def test_memo_keyed_by_content_hash(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text(_CODE)
+    suggestions_mod._SUGGESTION_MEMO.clear()
+    SuggestionService().extract_nested(path, "outer")
+    assert len(suggestions_mod._SUGGESTION_MEMO) == 1
+    SuggestionService().extract_nested(path, "outer")
+    assert len(suggestions_mod._SUGGESTION_MEMO) == 1
+    path.write_text(_CODE.replace("s = p + q", "s = p - q"))
+    SuggestionService().extract_nested(path, "outer")
+    assert len(suggestions_mod._SUGGESTION_MEMO) == 2
@@ -78,3 +78,65 @@ def f() -> Bar:
     f.write_text(code)
     result = remove_unused_imports(f)
     assert result is None  # Bar import must be kept
+
+
+_DETECT_CASES = {
+    "unused.py": "import os\nimport sys as system\nfrom a import b, c\nprint(c)\n",
+    "clean.py": "import os\nprint(os.getcwd())\n",
+    "star.py": "from x import *\nfrom __future__ import annotations\n",
+    "nested.py": "def f():\n    import json\n    return 1\n",
+    "typing_only.py": "from typing import TYPE_CHECKING\nif TYPE_CHECKING:\n    from x import Y\n",
+    "exported.py": "from x import Y\n__all__ = ['Y']\n",
+}
+
+
+def test_unused_import_names_agrees_with_transformer(tmp_path: Path) -> None:
+    """unused_import_names is non-empty exactly when remove_unused_imports rewrites."""
+    import ast
+
+    from eurika.refactor.remove_unused_import import unused_import_names
+
+    for name, code in _DETECT_CASES.items():
+        f = tmp_path / name
+        f.write_text(code)
+        detected = unused_import_names(ast.parse(code))
+        assert bool(detected) == (remove_unused_imports(f) is not None), name
+    assert unused_import_names(ast.parse(_DETECT_CASES["unused.py"])) == ["os", "system", "b"]
+
+
+def test_find_unused_imports_uses_stamp_index(tmp_path: Path, monkeypatch) -> None:
+    """Unchanged files are answered from .eurika/unused_imports.json without parsing."""
+    from eurika.refactor import unused_import_index
+    from eurika.refactor.unused_import_index import INDEX_FILE, find_unused_imports
+
+    for name, code in _DETECT_CASES.items():
+        (tmp_path / name).write_text(code)
+    rels = sorted(_DETECT_CASES)
+    first = find_unused_imports(tmp_path, rels)
+    assert set(first) == {"unused.py", "nested.py"}
+    assert (tmp_path / INDEX_FILE).is_file()
+
+    parsed: list[str] = []
+    real_detect = unused_import_index._detect
+    monkeypatch.setattr(unused_import_index, "_detect", lambda p: parsed.append(p) or real_detect(p))
+    assert find_unused_imports(tmp_path, rels) == first
+    assert parsed == []
+
+    (tmp_path / "clean.py").write_text("import os\nimport re\nprint(os.getcwd())\n")
+    (tmp_path / "nested.py").unlink()
+    again = find_unused_imports(tmp_path, rels)
+    assert [Path(p).name for p in parsed] == ["clean.py"]
+    assert again == {"clean.py": ["re"], "unused.py": ["os", "system", "b"]}
+
+
+def test_find_unused_imports_process_pool(tmp_path: Path) -> None:
+    """workers > 1 fans out large batches across processes with the same result."""
+    from eurika.refactor.unused_import_index import find_unused_imports
+
+    rels = []
+    for i in range(140):
+        rel = f"m{i:03d}.py"
+        (tmp_path / rel).write_text("import os\n" if i % 7 == 0 else "import os\nos.sep\n")
+        rels.append(rel)
+    result = find_unused_imports(tmp_path, rels, workers=2)
+    assert sorted(result) == [r for i, r in enumerate(rels) if i % 7 == 0]
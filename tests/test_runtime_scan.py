@@ -29,7 +29,7 @@ def test_run_scan_on_minimal_project(tmp_path: Path):
 
     # Check that artifacts were created (.eurika/ for memory, self_map in root)
     assert (project_root / "self_map.json").exists()
-    assert (project_root / ".eurika" / "history.json").exists()
+    assert (project_root / ".eurika" / "history.jsonl").exists()
     assert (project_root / ".eurika" / "observations.json").exists()
 
 
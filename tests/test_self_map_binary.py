@@ -0,0 +1,62 @@
+"""Tests for the compact binary self_map container (self_map_binary)."""
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from code_awareness import CodeAwareness
+from self_map_binary import SelfMapReader, default_binary_path, fresh_binary_for, write_self_map_binary
+from self_map_io import build_graph_from_self_map, load_self_map
+
+SELF_MAP = {
+    "modules": [
+        {"path": "a.py", "lines": 10, "functions": ["f", "g"], "classes": []},
+        {"path": "pkg/b.py", "lines": 5, "functions": ["f"], "classes": ["B"], "role": "core"},
+        {"path": "c.py", "lines": 3, "functions": [], "classes": []},
+    ],
+    "dependencies": {"a.py": ["pkg.b"], "c.py": ["a", "pkg"]},
+    "summary": {"files": 3, "total_lines": 18},
+}
+
+
+def test_binary_roundtrip_matches_json_shape(tmp_path: Path) -> None:
+    """to_dict() reproduces the original self_map, including extra module keys."""
+    path = write_self_map_binary(SELF_MAP, tmp_path / "self_map.bin")
+    with SelfMapReader(path) as reader:
+        assert reader.n_modules == 3
+        assert reader.module_paths() == ["a.py", "pkg/b.py", "c.py"]
+        assert reader.module(1) == SELF_MAP["modules"][1]
+        assert reader.dependencies() == SELF_MAP["dependencies"]
+        assert reader.to_dict() == SELF_MAP
+    assert load_self_map(path) == SELF_MAP
+
+
+def test_graph_from_binary_equals_graph_from_json(tmp_path: Path) -> None:
+    """build_graph_from_self_map gives the same graph for JSON and the compact container."""
+    json_path = tmp_path / "self_map.json"
+    json_path.write_text(json.dumps(SELF_MAP), encoding="utf-8")
+    bin_path = write_self_map_binary(SELF_MAP, tmp_path / "self_map.bin")
+    g_json = build_graph_from_self_map(json_path)
+    g_bin = build_graph_from_self_map(bin_path)
+    assert g_json.nodes == g_bin.nodes
+    assert g_json.edges == g_bin.edges
+
+
+def test_companion_used_only_while_fresh(tmp_path: Path) -> None:
+    """Stale companion (JSON rewritten after it) is ignored."""
+    (tmp_path / "a.py").write_text("import b\n")
+    (tmp_path / "b.py").write_text("x = 1\n")
+    json_path = CodeAwareness(tmp_path).write_self_map(tmp_path)
+    assert default_binary_path(json_path).exists()
+    assert fresh_binary_for(json_path) == default_binary_path(json_path)
+    data = json.loads(json_path.read_text())
+    data["dependencies"] = {}
+    json_path.write_text(json.dumps(data))
+    st = json_path.stat()
+    os.utime(json_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert fresh_binary_for(json_path) is None
+    assert build_graph_from_self_map(json_path).edges["a.py"] == []
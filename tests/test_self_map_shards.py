@@ -0,0 +1,117 @@
+"""Tests for sharded self_map (self_map_shards)."""
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from code_awareness import CodeAwareness
+from project_graph import ProjectGraph
+from self_map_io import build_graph_from_self_map, load_self_map
+from self_map_shards import (
+    build_graph_from_shards,
+    default_manifest_path,
+    fresh_manifest_for,
+    load_manifest,
+    load_shards,
+    shards_for_module,
+    write_sharded_self_map,
+)
+
+SELF_MAP = {
+    "modules": [
+        {"path": "main.py", "lines": 3, "functions": [], "classes": []},
+        {"path": "alpha/core.py", "lines": 5, "functions": ["f"], "classes": []},
+        {"path": "alpha/util.py", "lines": 5, "functions": [], "classes": []},
+        {"path": "beta/api.py", "lines": 5, "functions": [], "classes": []},
+        {"path": "gamma/tool.py", "lines": 5, "functions": [], "classes": []},
+    ],
+    "dependencies": {
+        "main.py": ["core.run"],
+        "alpha/core.py": ["util"],
+        "beta/api.py": ["core", "util"],
+    },
+    "summary": {"files": 5, "total_lines": 23},
+}
+
+
+def test_shards_assemble_same_graph_and_self_map(tmp_path: Path) -> None:
+    """Graph and self_map assembled from shards equal the unsharded ones."""
+    manifest_path = write_sharded_self_map(SELF_MAP, tmp_path)
+    manifest = load_manifest(manifest_path)
+    assert sorted(manifest["shards"]) == ["_root", "alpha", "beta", "gamma"]
+    assert ["beta/api.py", "alpha/core.py"] in manifest["cross_edges"]
+    expected = ProjectGraph.from_self_map(SELF_MAP)
+    graph = build_graph_from_self_map(manifest_path)
+    assert graph.nodes == expected.nodes
+    assert graph.edges == expected.edges
+    loaded = load_self_map(manifest_path)
+    assert sorted(m["path"] for m in loaded["modules"]) == sorted(m["path"] for m in SELF_MAP["modules"])
+    assert loaded["dependencies"] == SELF_MAP["dependencies"]
+    assert loaded["summary"] == SELF_MAP["summary"]
+
+
+def test_module_scope_loads_only_neighbour_shards(tmp_path: Path) -> None:
+    """A module's scope is its shard plus shards it shares edges with."""
+    manifest_path = write_sharded_self_map(SELF_MAP, tmp_path)
+    manifest = load_manifest(manifest_path)
+    scope = shards_for_module(manifest, "alpha/core.py")
+    assert scope[0] == "alpha"
+    assert set(scope) == {"alpha", "_root", "beta"}
+    graph = build_graph_from_shards(manifest_path, scope)
+    assert "gamma/tool.py" not in graph.nodes
+    fan = graph.fan_in_out()
+    full_fan = ProjectGraph.from_self_map(SELF_MAP).fan_in_out()
+    assert fan["alpha/core.py"] == full_fan["alpha/core.py"]
+    assert set(load_shards(manifest_path, ["gamma"])["dependencies"]) == set()
+
+
+def test_unchanged_shards_are_not_rewritten(tmp_path: Path) -> None:
+    """Rewriting with one package changed touches only that shard file."""
+    manifest_path = write_sharded_self_map(SELF_MAP, tmp_path)
+    shard_dir = manifest_path.parent
+    before = {p.name: p.stat().st_mtime_ns for p in shard_dir.glob("*.json")}
+    changed = json.loads(json.dumps(SELF_MAP))
+    changed["modules"][4]["lines"] = 50
+    write_sharded_self_map(changed, tmp_path)
+    after = {p.name: p.stat().st_mtime_ns for p in shard_dir.glob("*.json")}
+    assert after["alpha.json"] == before["alpha.json"]
+    assert after["gamma.json"] != before["gamma.json"]
+
+
+def test_scan_writes_fresh_shards(tmp_path: Path) -> None:
+    """write_self_map(sharded=True) writes a manifest stamped with self_map.json."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "app.py").write_text("import pkg\n")
+    path = CodeAwareness(tmp_path).write_self_map(tmp_path, sharded=True)
+    assert fresh_manifest_for(path) == default_manifest_path(path)
+    path.write_text(path.read_text() + "\n")
+    assert fresh_manifest_for(path) is None
+
+
+def test_explain_on_sharded_map_skips_full_analysis(tmp_path: Path, monkeypatch) -> None:
+    """explain reads only neighbour shards: no full analysis, plan built from the same scoped graph."""
+    import eurika.api as api
+    import eurika.core.pipeline as pipeline
+
+    (tmp_path / "a.py").write_text("import b\n")
+    (tmp_path / "b.py").write_text("import a\n")
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "__init__.py").write_text("")
+    (tmp_path / "other" / "tool.py").write_text("x = 1\n")
+    CodeAwareness(tmp_path).write_self_map(tmp_path, sharded=True)
+
+    def full(*_a, **_k):
+        raise AssertionError("full-project analysis on a sharded map")
+
+    monkeypatch.setattr(pipeline, "run_full_analysis", full)
+    monkeypatch.setattr(api, "get_patch_plan", full)
+    text, err = api.explain_module(tmp_path, "a.py")
+    assert err is None
+    assert "MODULE EXPLANATION: a.py" in text
+    assert "cyclic_dependency" in text
+    assert "[remove_cyclic_import] Remove import of b from a.py" in text
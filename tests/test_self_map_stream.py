@@ -0,0 +1,65 @@
+"""Tests for the streaming self_map writer / reader (self_map_stream)."""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import self_map_stream
+from code_awareness import CodeAwareness
+from self_map_binary import default_binary_path
+from self_map_io import load_self_map
+from self_map_stream import SelfMapWriter, iter_self_map_dependencies, iter_self_map_modules, write_self_map_stream
+
+SELF_MAP = {
+    "modules": [
+        {"path": "a.py", "lines": 10, "functions": ["f", "g"], "classes": []},
+        {"path": "pkg/b.py", "lines": 5, "functions": ["é"], "classes": ["B"], "role": {"weight": 1.5e3, "hub": True, "x": None}},
+    ],
+    "dependencies": {"a.py": ["pkg.b"], "pkg/b.py": []},
+    "summary": {"files": 2, "total_lines": 15},
+}
+
+
+@pytest.mark.parametrize("self_map", [SELF_MAP, {"modules": [], "dependencies": {}, "summary": {"files": 0, "total_lines": 0}}])
+def test_stream_writer_matches_json_dump_and_reads_back(tmp_path: Path, monkeypatch, self_map: dict) -> None:
+    """Streamed output equals json.dumps(indent=2); readers decode it across tiny read chunks."""
+    monkeypatch.setattr(self_map_stream, "CHUNK_SIZE", 5)
+    path = write_self_map_stream(tmp_path / "self_map.json", iter(self_map["modules"]), iter(self_map["dependencies"].items()))
+    assert path.read_text(encoding="utf-8") == json.dumps(self_map, indent=2, ensure_ascii=False)
+    assert list(iter_self_map_modules(path)) == self_map["modules"]
+    assert dict(iter_self_map_dependencies(path)) == self_map["dependencies"]
+    # Key order does not matter to the reader.
+    reordered = tmp_path / "other.json"
+    reordered.write_text(json.dumps({"summary": {"files": 123456}, "dependencies": self_map["dependencies"], "modules": self_map["modules"]}), encoding="utf-8")
+    assert list(iter_self_map_modules(reordered)) == self_map["modules"]
+
+
+def test_stream_writer_abort_keeps_previous_file(tmp_path: Path) -> None:
+    """An exception while writing leaves the old self_map.json and no temp file."""
+    path = tmp_path / "self_map.json"
+    path.write_text('{"modules": []}', encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with SelfMapWriter(path) as writer:
+            writer.add_module(SELF_MAP["modules"][0])
+            raise RuntimeError("scan failed")
+    assert path.read_text(encoding="utf-8") == '{"modules": []}'
+    assert [p.name for p in tmp_path.iterdir()] == ["self_map.json"]
+
+
+def test_write_self_map_streams_same_document(tmp_path: Path) -> None:
+    """CodeAwareness.write_self_map output (and its compact companion) equals build_self_map()."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    (tmp_path / "pkg" / "core.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "main.py").write_text("from pkg import core\n\nclass App:\n    pass\n", encoding="utf-8")
+    analyzer = CodeAwareness(tmp_path)
+    path = analyzer.write_self_map(tmp_path)
+    expected = analyzer.build_self_map()
+    assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=2, ensure_ascii=False)
+    assert load_self_map(default_binary_path(path)) == expected
+    assert "self_map" not in analyzer.analyze_project(include_self_map=False)
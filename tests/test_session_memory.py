@@ -67,3 +67,76 @@ def test_campaign_whitelist_candidates_excludes_repeated_fail(tmp_path: Path) ->
     mem.record_verify_failure([op])
     mem.record_verify_failure([op])
     assert operation_key(op) not in mem.campaign_whitelist_candidates()
+
+
+def test_session_memory_point_lookups_by_op_and_target_kind(tmp_path: Path) -> None:
+    mem = SessionMemory(tmp_path)
+    op = {"target_file": "b.py", "kind": "split_module", "params": {"location": "g"}}
+    mem.record("s1", approved=[], rejected=[op])
+    mem.record("s2", approved=[op], rejected=[])
+    mem.record("s3", approved=[], rejected=[dict(op, params={"location": "h"})])
+    assert mem.is_rejected("s1", op) is True
+    assert mem.is_rejected("s2", op) is False
+    assert mem.rejected_sessions("b.py", "split_module") == ["s1", "s3"]
+    assert mem.rejected_sessions("b.py", "extract_class") == []
+
+
+def test_session_memory_upsert_merges_and_ttl_expires(tmp_path: Path, monkeypatch) -> None:
+    import time as _time
+
+    from eurika.storage import session_memory as sm
+
+    mem = SessionMemory(tmp_path)
+    a = {"target_file": "a.py", "kind": "k", "params": {}}
+    b = {"target_file": "b.py", "kind": "k", "params": {}}
+    mem.record("old", approved=[], rejected=[a])
+    mem.record("old", approved=[], rejected=[b])
+    assert mem.rejected_keys("old") == {operation_key(a), operation_key(b)}
+    real_time = _time.time
+    monkeypatch.setattr(sm.time, "time", lambda: real_time() + 40 * 86400)
+    mem.record("new", approved=[], rejected=[])
+    assert mem.rejected_keys("old") == set()
+    assert mem.rejected_sessions("a.py", "k") == []
+    # campaign memory outlives expired sessions
+    assert operation_key(a) in mem.campaign_keys_to_skip()
+
+
+def test_session_memory_imports_legacy_json(tmp_path: Path) -> None:
+    import json
+
+    legacy = tmp_path / ".eurika" / "session_memory.json"
+    legacy.parent.mkdir()
+    legacy.write_text(
+        json.dumps(
+            {
+                "sessions": {"s1": {"approved_keys": [], "rejected_keys": ["x.py|split_module|"]}},
+                "campaign": {"rejected_keys": ["x.py|split_module|"], "verify_fail_keys": ["y.py|k|", "y.py|k|"]},
+            }
+        ),
+        encoding="utf-8",
+    )
+    mem = SessionMemory(tmp_path)
+    assert mem.rejected_keys("s1") == {"x.py|split_module|"}
+    assert mem.campaign_keys_to_skip() == {"x.py|split_module|", "y.py|k|"}
+    assert not legacy.exists()
+    assert SessionMemory(tmp_path).verify_fail_count({"target_file": "y.py", "kind": "k"}) == 2
+
+
+def test_session_memory_opens_one_connection_per_instance(tmp_path: Path, monkeypatch) -> None:
+    """Schema setup and the legacy check run once; later calls reuse the connection."""
+    from eurika.storage import session_memory as sm
+
+    opened = []
+    real_connect = sm.sqlite3.connect
+    monkeypatch.setattr(sm.sqlite3, "connect", lambda *a, **k: opened.append(a) or real_connect(*a, **k))
+    mem = SessionMemory(tmp_path)
+    assert mem.rejected_keys("s1") == set()  # no store yet: nothing opened
+    assert opened == []
+    op = {"target_file": "a.py", "kind": "k", "params": {}}
+    mem.record("s1", approved=[], rejected=[op])
+    mem.record_verify_failure([op])
+    assert mem.is_rejected("s1", op)
+    assert mem.verify_fail_count(op) == 1
+    assert len(opened) == 1
+    mem.close()
+    assert SessionMemory(tmp_path).rejected_keys("s1") == {operation_key(op)}
@@ -88,4 +88,14 @@ def test_event_store_recent_events(tmp_path: Path) -> None:
     patch_learn = store.recent_events(limit=5, types=("patch", "learn"))
     assert len(patch_learn) == 2
     assert patch_learn[0].type == "learn"
-    assert patch_learn[1].type == "patch"
\ No newline at end of file
+    assert patch_learn[1].type == "patch"
+
+def test_event_store_merges_concurrent_appends(tmp_path: Path) -> None:
+    """Two stores on one file (e.g. two processes) do not overwrite each other's events."""
+    path = tmp_path / EVENTS_FILE
+    first = EventStore(storage_path=path)
+    second = EventStore(storage_path=path)
+    first.append_event('scan', {}, {'n': 1})
+    second.append_event('patch', {}, {'n': 2})
+    types = [e.type for e in EventStore(storage_path=path).all()]
+    assert types == ['scan', 'patch']
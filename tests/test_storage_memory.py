@@ -1,4 +1,5 @@
 """Tests for eurika.storage.ProjectMemory facade."""
+import os
 from pathlib import Path
 
 import pytest
@@ -35,6 +36,52 @@ def test_project_memory_observations(tmp_path: Path) -> None:
     assert snap[0].trigger == 'scan'
     assert (tmp_path / '.eurika' / 'observations.json').exists()
 
+def test_observation_memory_ring_and_segment(tmp_path: Path) -> None:
+    """Observations append to a segment, compact every max_records lines and reload bounded."""
+    from observation_memory import ObservationMemory
+    path = tmp_path / 'observations.json'
+    segment = tmp_path / 'observations.json.segment'
+    mem = ObservationMemory(max_records=3, storage_path=path)
+    mem.record_observation('scan', {'n': 0})  # no base yet: compacted immediately
+    assert path.exists() and not segment.exists()
+    base = path.read_text(encoding='utf-8')
+    mem.record_observation('scan', {'n': 1})
+    mem.record_observation('scan', {'n': 2})
+    assert path.read_text(encoding='utf-8') == base
+    assert len(segment.read_text(encoding='utf-8').splitlines()) == 2
+    reloaded = ObservationMemory(max_records=3, storage_path=path)
+    assert [r.observation['n'] for r in reloaded.snapshot()] == [0, 1, 2]
+    mem.record_observation('watch', {'n': 3})  # third segment line: compacted
+    assert not segment.exists()
+    mem.record_observation('watch', {'n': 4})
+    mem.record_observation('watch', {'n': 5})
+    assert [r.observation['n'] for r in ObservationMemory(max_records=3, storage_path=path).snapshot()] == [3, 4, 5]
+    assert len(mem) == 3
+
+def _record_many(path: str, tag: str, count: int) -> None:
+    import observation_memory
+    observation_memory.SEGMENT_COMPACT_BYTES = 1  # compact after every append
+    mem = observation_memory.ObservationMemory(max_records=200, storage_path=Path(path))
+    for i in range(count):
+        mem.record_observation('scan', {'tag': tag, 'n': i})
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork')
+def test_observation_memory_concurrent_processes_lose_nothing(tmp_path: Path) -> None:
+    """Appends and compactions from two processes are serialised by the storage-dir lock."""
+    import multiprocessing
+    from observation_memory import ObservationMemory
+    path = tmp_path / 'observations.json'
+    ctx = multiprocessing.get_context('fork')
+    procs = [ctx.Process(target=_record_many, args=(str(path), tag, 25)) for tag in 'ab']
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+    seen = {(r.observation['tag'], r.observation['n']) for r in ObservationMemory(max_records=200, storage_path=path).snapshot()}
+    assert seen == {(tag, i) for tag in 'ab' for i in range(25)}
+
 def test_project_memory_history(tmp_path: Path) -> None:
     """ProjectMemory(path).history exposes ArchitectureHistory API."""
     memory = ProjectMemory(tmp_path)
@@ -82,4 +129,14 @@ def test_migration_from_legacy_path(tmp_path: Path, store_name: str) -> None:
     else:
         memory.events.append_event("scan", {}, {}, result=True)
         assert len(memory.events.all()) >= 1
-        assert consolidated.exists()
\ No newline at end of file
+        assert consolidated.exists()
+
+def test_history_migration_from_legacy_root_file(tmp_path: Path) -> None:
+    """Root architecture_history.json is imported into .eurika/history.jsonl once."""
+    legacy = tmp_path / LEGACY_FILES["history"]
+    legacy.write_text('{"history": [{"timestamp": 1, "modules": 4}]}', encoding="utf-8")
+    assert [p.modules for p in ProjectMemory(tmp_path).history.points()] == [4]
+    assert storage_path(tmp_path, "history").exists()
+    assert (tmp_path / ".eurika" / "history.json.migrated").exists()
+    assert [p.modules for p in ProjectMemory(tmp_path).history.points()] == [4]
+    assert not (tmp_path / ".eurika" / "history.json").exists()
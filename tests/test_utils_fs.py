@@ -0,0 +1,82 @@
+"""Tests for eurika.utils.fs (file_lock, new_run_id)."""
+
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from eurika.utils import fs
+from eurika.utils.fs import file_lock, new_run_id
+
+
+def _hold_and_log(lock: str, log: str, tag: str) -> None:
+    with file_lock(Path(lock)):
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(f"{tag}+\n")
+        time.sleep(0.3)
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(f"{tag}-\n")
+
+
+def test_file_lock_reentrant_in_same_thread(tmp_path: Path) -> None:
+    """Nested acquisition by one thread does not deadlock and releases fully."""
+    lock = tmp_path / ".lock"
+    with file_lock(lock):
+        with file_lock(lock):
+            assert fs._held[str(lock.resolve())].depth == 2
+    assert str(lock.resolve()) not in fs._held
+
+
+def test_file_lock_excludes_other_threads_per_path(tmp_path: Path) -> None:
+    """Another thread waits for the same path but not for a different one."""
+    events: list = []
+    release = threading.Event()
+
+    def holder() -> None:
+        with file_lock(tmp_path / "a.lock"):
+            events.append("held")
+            release.wait(5)
+        events.append("released")
+
+    t = threading.Thread(target=holder)
+    t.start()
+    while "held" not in events:
+        time.sleep(0.01)
+    with file_lock(tmp_path / "b.lock"):  # unrelated path: no waiting
+        events.append("other")
+    def waiter_body() -> None:
+        with file_lock(tmp_path / "a.lock"):
+            events.append("acquired")
+
+    waiter = threading.Thread(target=waiter_body, daemon=True)
+    waiter.start()
+    time.sleep(0.1)
+    assert "acquired" not in events
+    release.set()
+    t.join(5)
+    waiter.join(5)
+    assert events[:2] == ["held", "other"] and events.index("released") < events.index("acquired")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork") or fs.fcntl is None, reason="needs fork and flock")
+def test_file_lock_excludes_other_processes(tmp_path: Path) -> None:
+    """Two processes never hold the lock at the same time."""
+    ctx = multiprocessing.get_context("fork")
+    log = tmp_path / "log"
+    procs = [ctx.Process(target=_hold_and_log, args=(str(tmp_path / ".lock"), str(log), tag)) for tag in "ab"]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(10)
+        assert p.exitcode == 0
+    lines = log.read_text(encoding="utf-8").split()
+    assert len(lines) == 4
+    assert lines[0][0] == lines[1][0] and lines[2][0] == lines[3][0]  # no interleaving
+
+
+def test_new_run_id_unique() -> None:
+    """Run ids from one process never collide."""
+    assert len({new_run_id() for _ in range(200)}) == 200